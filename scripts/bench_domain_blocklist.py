@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark domain blocklist lookup: legacy linear suffix scan vs reversed-label trie.
+
+Builds a seeded synthetic discovery sweep of N AU domains (default 100k): a mix
+of unblocked SMB-looking names, blocked entries, their www./sub-domains and
+near misses. Times:
+
+  legacy — the pre-trie is_blocked tail: exact check, then
+           any(d.endswith("." + b) for b in BLOCKED_DOMAINS)
+  trie   — domain_blocklist.is_blocked_many (reversed-label trie, batch dedup)
+
+Reports wall time, domains/s and the number of verdicts that differ (expected 0).
+
+Usage:
+    python scripts/bench_domain_blocklist.py
+    python scripts/bench_domain_blocklist.py --domains 20000 --seed 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.utils.domain_blocklist import (  # noqa: E402
+    _GOVERNMENT_RE,
+    BLOCKED_DOMAINS,
+    is_au_domain,
+    is_blocked_many,
+)
+
+WORDS = ["acme", "sydney", "dental", "plumbing", "coastal", "metro", "bright", "north", "smile"]
+
+
+def legacy_is_blocked(domain: str | None) -> bool:
+    if not domain:
+        return True
+    d = domain.lower().strip()
+    if not d or not is_au_domain(d) or _GOVERNMENT_RE.search(d):
+        return True
+    if d.removeprefix("www.") in BLOCKED_DOMAINS or d in BLOCKED_DOMAINS:
+        return True
+    return any(d.endswith("." + blocked) for blocked in BLOCKED_DOMAINS)
+
+
+def synthetic_domains(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    blocked = sorted(b for b in BLOCKED_DOMAINS if is_au_domain(b))
+    domains = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.8:
+            name = "".join(rng.sample(WORDS, rng.randint(1, 3))) + str(rng.randint(0, 999))
+            domains.append(name + ".com.au")
+        elif roll < 0.9:
+            domains.append(rng.choice(blocked))
+        elif roll < 0.95:
+            domains.append(rng.choice(["www.", "shop.", "book.www."]) + rng.choice(blocked))
+        else:
+            domains.append("my" + rng.choice(blocked))
+    return domains
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--domains", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=12)
+    args = parser.parse_args()
+
+    domains = synthetic_domains(args.domains, args.seed)
+    print(f"blocked entries: {len(BLOCKED_DOMAINS)}  domains: {len(domains)}")
+
+    t0 = time.perf_counter()
+    legacy = [legacy_is_blocked(d) for d in domains]
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    mask, _ = is_blocked_many(domains)
+    trie_s = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(legacy, mask, strict=True) if a != b)
+    print(f"{'mode':8} {'seconds':>9} {'domains/s':>12}")
+    print(f"{'legacy':8} {legacy_s:>9.2f} {len(domains) / legacy_s:>12,.0f}")
+    print(f"{'trie':8} {trie_s:>9.2f} {len(domains) / trie_s:>12,.0f}")
+    print(f"speedup: {legacy_s / trie_s:.1f}x  mismatched verdicts: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
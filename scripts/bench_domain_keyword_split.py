@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark domain keyword segmentation: legacy sorted-scan vs Aho-Corasick automaton.
+
+Builds a seeded synthetic fixture of N domains (default 100k) from au_lexicon
+terms, separator noise and AU TLDs, then times:
+
+  legacy    — the pre-automaton _semantic_split: sort the whole lexicon by
+              length and str.find every term on every recursive call
+  automaton — keyword_automaton.LEXICON_AUTOMATON.segment (one scan per part)
+
+Both run on the same domain parts (TLD-stripped, hyphen/underscore split, as
+in FreeEnrichment._extract_domain_keywords). Reports wall time, domains/s and
+the number of parts whose segmentation differs (expected 0).
+
+Usage:
+    python scripts/bench_domain_keyword_split.py
+    python scripts/bench_domain_keyword_split.py --domains 20000 --seed 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.pipeline.keyword_automaton import LEXICON_AUTOMATON, LEXICON_TERMS  # noqa: E402
+
+TLDS = [".com.au", ".net.au", ".org.au", ".com", ".au"]
+NOISE = ["co", "hq", "bros", "one", "best", "pro", "xyz", "the", "and", "at"]
+
+
+def legacy_split(text: str, known_terms: frozenset[str]) -> list[str]:
+    """The pre-automaton _semantic_split, verbatim except for a deterministic
+    leftmost tie-break between equal-length terms."""
+    if len(text) < 3:
+        return []
+    matches = []
+    for term in sorted(known_terms, key=len, reverse=True):
+        idx = text.find(term)
+        if idx >= 0:
+            matches.append((idx, term))
+    if not matches:
+        return [text]
+    idx, term = min(matches, key=lambda m: (-len(m[1]), m[0]))
+    before = text[:idx]
+    after = text[idx + len(term) :]
+    result = []
+    if before and len(before) >= 3:
+        result.extend(legacy_split(before, known_terms))
+    result.append(term)
+    if after and len(after) >= 3:
+        result.extend(legacy_split(after, known_terms))
+    return result
+
+
+def synthetic_domains(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    terms = sorted(LEXICON_TERMS)
+    domains = []
+    for _ in range(count):
+        pieces = [rng.choice(terms) for _ in range(rng.randint(1, 3))]
+        if rng.random() < 0.5:
+            pieces.insert(rng.randint(0, len(pieces)), rng.choice(NOISE))
+        sep = rng.choice(["", "", "", "-", "_"])
+        domains.append(sep.join(pieces) + rng.choice(TLDS))
+    return domains
+
+
+def domain_parts(domain: str) -> list[str]:
+    d = domain.lower()
+    for suffix in TLDS:
+        if d.endswith(suffix):
+            d = d[: -len(suffix)]
+            break
+    return [p for p in re.split(r"[-_]", d) if len(p) > 3]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--domains", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    domains = synthetic_domains(args.domains, args.seed)
+    parts = [p for d in domains for p in domain_parts(d)]
+    print(f"lexicon terms: {len(LEXICON_TERMS)}  domains: {len(domains)}  parts: {len(parts)}")
+
+    t0 = time.perf_counter()
+    legacy = [legacy_split(p, LEXICON_TERMS) for p in parts]
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fast = [LEXICON_AUTOMATON.segment(p) for p in parts]
+    fast_s = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(legacy, fast, strict=True) if a != b)
+    print(f"{'mode':10} {'seconds':>9} {'domains/s':>12}")
+    print(f"{'legacy':10} {legacy_s:>9.2f} {len(domains) / legacy_s:>12,.0f}")
+    print(f"{'automaton':10} {fast_s:>9.2f} {len(domains) / fast_s:>12,.0f}")
+    print(f"speedup: {legacy_s / fast_s:.1f}x  mismatched parts: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
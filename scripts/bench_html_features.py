@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""Benchmark homepage feature extraction: legacy per-signal passes vs single-pass extractor.
+
+Runs over a corpus of saved homepages (``--corpus DIR``, every *.html file) or,
+by default, a seeded synthetic set of AU SMB-style pages (WordPress/Shopify/Wix
+markup, tracker and ad-tag snippets, JSON-LD LocalBusiness blocks, AU phone
+numbers, padded with inline script/style bulk). Times:
+
+  legacy — what one scraped page used to cost: FreeEnrichment._extract_cms,
+           _extract_tech_stack, _extract_trackers, _extract_emails,
+           _extract_jsonld_address, _detect_ad_tags, HttpxScraper
+           _extract_contact_data + title regex, and
+           WebsiteIntelligenceEngine._extract_visible_text (copied below as
+           they were before html_features)
+  single — html_features.extract_html_features once, every signal read off
+           the result
+
+Reports wall time, pages/s, MB/s and per-signal mismatches (expected 0 on
+well-formed pages; the extractor caps pages at MAX_HTML_BYTES and skips tags
+inside <script>, so malformed pages may differ).
+
+Usage:
+    python scripts/bench_html_features.py
+    python scripts/bench_html_features.py --pages 500 --seed 3
+    python scripts/bench_html_features.py --corpus ~/au_smb_homepages
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.utils.html_features import (  # noqa: E402
+    AW_TAG_RE,
+    CMS_PATTERNS,
+    EMAIL_RE,
+    GADS_RMK_RE,
+    GENERIC_EMAIL_LOCALS,
+    LANDLINE_RE,
+    LINKEDIN_RE,
+    META_PIXEL_RE,
+    MOBILE_AU_RE,
+    MOBILE_INT_RE,
+    PLACEHOLDER_EMAIL_RE,
+    TECH_PATTERNS,
+    TRACKER_CHECKS,
+    extract_html_features,
+)
+
+# ── Legacy implementations (pre-html_features) ──────────────────────────────
+
+
+def legacy_cms(html: str) -> str | None:
+    gen = re.search(
+        r'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)', html, re.IGNORECASE
+    )
+    if not gen:
+        gen = re.search(
+            r'content=["\']([^"\']*(?:wordpress|shopify|squarespace|wix|webflow|ghost|drupal)[^"\']*)["\']',
+            html,
+            re.IGNORECASE,
+        )
+    if gen:
+        val = gen.group(1).lower()
+        for kw in ("wordpress", "shopify", "squarespace", "wix", "webflow", "ghost", "drupal"):
+            if kw in val:
+                return kw
+    for pattern, cms in CMS_PATTERNS.items():
+        if pattern in html:
+            return cms
+    return None
+
+
+def legacy_tech(html: str) -> list[str]:
+    srcs = re.findall(r'<script[^>]+src=["\']([^"\']+)["\']', html, re.IGNORECASE)
+    src_text = " ".join(srcs).lower()
+    inline = html.lower()
+    techs: list[str] = []
+    for pattern, tech in TECH_PATTERNS.items():
+        if (pattern in src_text or pattern in inline) and tech not in techs:
+            techs.append(tech)
+    return techs
+
+
+def legacy_trackers(html: str) -> list[str]:
+    lower = html.lower()
+    return [name for patterns, name in TRACKER_CHECKS if any(p in lower for p in patterns)]
+
+
+def legacy_emails(html: str) -> list[str]:
+    emails = {
+        m.lower() for m in re.findall(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", html)
+    }
+    result = sorted(emails)
+    specific = [e for e in result if not any(e.startswith(g + "@") for g in ("noreply", "info"))]
+    return specific if specific else result
+
+
+def legacy_jsonld(html: str) -> dict | None:
+    blocks = re.findall(
+        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+        html,
+        re.IGNORECASE | re.DOTALL,
+    )
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except (json.JSONDecodeError, ValueError):
+            continue
+        if isinstance(data, dict) and "@graph" in data:
+            items = data["@graph"]
+        elif isinstance(data, list):
+            items = data
+        else:
+            items = [data]
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("address"), dict):
+                a = item["address"]
+                return {
+                    "street": a.get("streetAddress"),
+                    "suburb": a.get("addressLocality"),
+                    "state": a.get("addressRegion"),
+                    "postcode": a.get("postalCode"),
+                }
+    return None
+
+
+def legacy_ad_tags(html: str) -> dict[str, bool]:
+    gads = bool(AW_TAG_RE.search(html)) or bool(GADS_RMK_RE.search(html))
+    meta = bool(META_PIXEL_RE.search(html))
+    return {"has_google_ads_tag": gads, "has_meta_pixel": meta, "has_any_ad_tag": gads or meta}
+
+
+def legacy_contact(html: str) -> dict[str, Any]:
+    clean = re.compile(r"[\s.\-]")
+    contact: dict[str, Any] = {
+        "company_email": None,
+        "company_phone": None,
+        "company_mobile": None,
+        "linkedin_company": None,
+        "linkedin_dm": None,
+        "dm_email": None,
+        "dm_email_verified": False,
+        "dm_mobile": None,
+    }
+    m = MOBILE_INT_RE.search(html)
+    if m:
+        contact["company_mobile"] = "0" + clean.sub("", m.group(0))[3:]
+    else:
+        m = MOBILE_AU_RE.search(html)
+        if m:
+            contact["company_mobile"] = clean.sub("", m.group(0))
+    m = LANDLINE_RE.search(html)
+    if m:
+        contact["company_phone"] = clean.sub("", m.group(0))
+    for email in EMAIL_RE.findall(html):
+        local = email.split("@")[0].lower()
+        if (
+            local not in GENERIC_EMAIL_LOCALS
+            and not email.endswith((".png", ".jpg", ".gif"))
+            and not PLACEHOLDER_EMAIL_RE.search(email)
+        ):
+            contact["company_email"] = email.lower()
+            break
+    for m in LINKEDIN_RE.finditer(html):
+        url = "https://www." + m.group(0)
+        if "/in/" in url and not contact["linkedin_dm"]:
+            contact["linkedin_dm"] = url
+        elif "/company/" in url and not contact["linkedin_company"]:
+            contact["linkedin_company"] = url
+    return contact
+
+
+def legacy_title(html: str) -> str | None:
+    m = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
+    return m.group(1).strip() if m else None
+
+
+def legacy_visible_text(html: str, max_chars: int = 3000) -> str:
+    title = legacy_title(html) or ""
+    meta = re.search(
+        r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)', html, re.IGNORECASE
+    ) or re.search(
+        r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']description["\']', html, re.IGNORECASE
+    )
+    description = meta.group(1).strip() if meta else ""
+    h1 = re.search(r"<h1[^>]*>(.*?)</h1>", html, re.IGNORECASE | re.DOTALL)
+    first_h1 = re.sub(r"<[^>]+>", "", h1.group(1)).strip() if h1 else ""
+    clean = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
+    clean = re.sub(r"<style[^>]*>.*?</style>", "", clean, flags=re.DOTALL | re.IGNORECASE)
+    clean = re.sub(r"<head[^>]*>.*?</head>", "", clean, flags=re.DOTALL | re.IGNORECASE)
+    clean = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", clean)).strip()
+    parts = []
+    if title:
+        parts.append(f"Title: {title}")
+    if description:
+        parts.append(f"Description: {description}")
+    if first_h1:
+        parts.append(f"H1: {first_h1}")
+    return "\n".join([*parts, "", "Page text:", clean[:max_chars]])
+
+
+def legacy_all(html: str) -> dict[str, Any]:
+    return {
+        "cms": legacy_cms(html),
+        "tech": legacy_tech(html),
+        "trackers": legacy_trackers(html),
+        "emails": legacy_emails(html),
+        "address": legacy_jsonld(html),
+        "ad_tags": legacy_ad_tags(html),
+        "title": legacy_title(html),
+        "contact": legacy_contact(html),
+        "visible_text": legacy_visible_text(html),
+    }
+
+
+def single_all(html: str) -> dict[str, Any]:
+    f = extract_html_features(html)
+    return {
+        "cms": f.cms,
+        "tech": f.tech_stack,
+        "trackers": f.trackers,
+        "emails": f.contact_emails(),
+        "address": f.jsonld_address,
+        "ad_tags": f.ad_tags(),
+        "title": f.title,
+        "contact": f.contact_data(),
+        "visible_text": f.visible_text(3000),
+    }
+
+
+# ── Synthetic corpus ─────────────────────────────────────────────────────────
+
+TRADES = ["Dental", "Plumbing", "Physio", "Electrical", "Accounting", "Cafe", "Landscaping"]
+SUBURBS = [("Pymble", "NSW", "2073"), ("Melton", "VIC", "3337"), ("Toowong", "QLD", "4066")]
+CMS_HEAD = [
+    '<meta name="generator" content="WordPress 6.4.2">'
+    '<link rel="stylesheet" href="/wp-content/themes/astra/style.css">',
+    '<script src="//cdn.shopify.com/s/files/1/theme.js"></script>',
+    '<meta name="generator" content="Wix.com Website Builder">',
+    '<link rel="stylesheet" href="/assets/bootstrap.min.css">',
+]
+TAGS = [
+    "<script>gtag('config', 'AW-987654321');</script>",
+    "<script>!function(f){f.fbq=function(){}}(window);fbq('init','123');</script>"
+    '<script src="https://connect.facebook.net/en_US/fbevents.js"></script>',
+    '<script async src="https://www.googletagmanager.com/gtag/js?id=G-ABC123"></script>',
+    '<script src="https://static.hotjar.com/c/hotjar-1.js"></script>',
+    "",
+]
+
+
+def synthetic_page(rng: random.Random) -> str:
+    trade = rng.choice(TRADES)
+    suburb, state, postcode = rng.choice(SUBURBS)
+    name = f"{suburb} {trade}"
+    slug = name.lower().replace(" ", "")
+    jsonld = json.dumps(
+        {
+            "@context": "https://schema.org",
+            "@type": "LocalBusiness",
+            "name": name,
+            "address": {
+                "streetAddress": f"{rng.randint(1, 300)} Main Rd",
+                "addressLocality": suburb,
+                "addressRegion": state,
+                "postalCode": postcode,
+            },
+        }
+    )
+    bulk_js = "var cfg=" + json.dumps({f"k{i}": "x" * 40 for i in range(rng.randint(50, 400))})
+    bulk_css = " ".join(f".c{i}{{margin:{i}px}}" for i in range(rng.randint(100, 800)))
+    paragraphs = "".join(
+        f"<p>Our {trade.lower()} team has served {suburb} for {rng.randint(2, 40)} years. "
+        f"Book online or call us today.</p>"
+        for _ in range(rng.randint(5, 40))
+    )
+    return (
+        f"<!DOCTYPE html><html lang='en-AU'><head><meta charset='utf-8'>"
+        f"<title>{name} | {trade} in {suburb} {state}</title>"
+        f'<meta name="description" content="Trusted {trade.lower()} in {suburb}, {state}.">'
+        f"{rng.choice(CMS_HEAD)}{rng.choice(TAGS)}{rng.choice(TAGS)}"
+        f"<style>{bulk_css}</style><script>{bulk_js}</script>"
+        f'<script type="application/ld+json">{jsonld}</script></head>'
+        f"<body><header><nav><a href='/about'>About</a></nav></header>"
+        f"<h1>{name}</h1>{paragraphs}"
+        f"<p>Phone: 0{rng.choice('2378')} {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}"
+        f" Mobile: 04{rng.randint(10, 99)} {rng.randint(100, 999)} {rng.randint(100, 999)}</p>"
+        f"<a href='mailto:info@{slug}.com.au'>info@{slug}.com.au</a> "
+        f"bookings@{slug}.com.au"
+        f"<a href='https://www.linkedin.com/company/{slug}'>LinkedIn</a>"
+        f"<footer>&copy; {name} Pty Ltd</footer></body></html>"
+    )
+
+
+def load_corpus(corpus: Path | None, pages: int, seed: int) -> list[str]:
+    if corpus is not None:
+        return [p.read_text(errors="replace") for p in sorted(corpus.glob("*.html"))]
+    rng = random.Random(seed)
+    return [synthetic_page(rng) for _ in range(pages)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--corpus", type=Path, default=None, help="directory of saved *.html")
+    parser.add_argument("--pages", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus, args.pages, args.seed)
+    if not pages:
+        parser.error(f"no *.html files in {args.corpus}")
+    mb = sum(len(p) for p in pages) / 1e6
+    print(f"pages: {len(pages)}  corpus: {mb:.1f} MB")
+
+    t0 = time.perf_counter()
+    legacy = [legacy_all(p) for p in pages]
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    single = [single_all(p) for p in pages]
+    single_s = time.perf_counter() - t0
+
+    mismatches: dict[str, int] = {}
+    for a, b in zip(legacy, single, strict=True):
+        for key in a:
+            if a[key] != b[key]:
+                mismatches[key] = mismatches.get(key, 0) + 1
+
+    print(f"{'mode':8} {'seconds':>9} {'pages/s':>10} {'MB/s':>8}")
+    for mode, secs in (("legacy", legacy_s), ("single", single_s)):
+        print(f"{mode:8} {secs:>9.2f} {len(pages) / secs:>10,.0f} {mb / secs:>8.1f}")
+    print(f"speedup: {legacy_s / single_s:.1f}x  mismatches: {mismatches or 0}")
+
+
+if __name__ == "__main__":
+    main()
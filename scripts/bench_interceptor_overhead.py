@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Benchmark dispatcher interceptor overhead: legacy per-call clients vs shared gate.
+
+Drives ``interceptor_proxy.intercept_request`` end to end against a live
+Valkey (VALKEY_URL / REDIS_URL, default redis://127.0.0.1:6379/0) and an
+in-process stub LiteLLM that answers instantly, so the measured latency is
+the interceptor's own overhead. Reports p50/p99/mean per mode:
+
+  legacy — spend GET, rate INCR + EXPIRE and accrue INCRBY each on a
+           freshly-built client that is aclose()d after the call, plus a new
+           httpx.AsyncClient (new TCP connection) for every forward
+  shared — one EVAL (GATE_LUA) + INCRBY on the long-lived gate client and
+           the persistent keep-alive LiteLLM client
+
+Synthetic tenants use a ``bench-`` prefix; their spend/rl keys are deleted
+after every run.
+
+Usage:
+    python scripts/bench_interceptor_overhead.py
+    python scripts/bench_interceptor_overhead.py --requests 5000 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+import src.dispatcher.interceptor_proxy as ip  # noqa: E402
+from src.dispatcher.valkey_pool import get_valkey_client, tenant_rl_key  # noqa: E402
+
+STUB_BODY = json.dumps(
+    {
+        "id": "bench",
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        "cost_cents_aud": 1,
+    }
+).encode()
+
+
+# ─── Stub LiteLLM ────────────────────────────────────────────────────────────
+
+
+async def _serve_litellm(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal HTTP/1.1 keep-alive responder: read one request, return STUB_BODY."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(STUB_BODY)).encode() + b"\r\n\r\n" + STUB_BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+# ─── Legacy path (pre-gate behaviour, reproduced for comparison) ─────────────
+
+
+async def _legacy_check_gate(tenant_id: str, tier: str) -> ip.GateCheck:
+    budget = ip.SPEND_BUDGET_AUD_CENTS.get(tier, 0)
+    client = get_valkey_client()
+    try:
+        raw = await client.get(ip._spend_key(tenant_id))
+        spent = int(raw) if raw is not None else 0
+    finally:
+        await client.aclose()
+    if spent >= budget:
+        return ip.GateCheck(spend_ok=False, spent_cents=spent, rate_ok=False, count=0)
+
+    limit = ip.RATE_LIMIT_PER_MINUTE.get(tier, 0)
+    bucket_start = int(time.time()) // ip.RATE_WINDOW_SECONDS * ip.RATE_WINDOW_SECONDS
+    key = tenant_rl_key(tenant_id, bucket_start)
+    client = get_valkey_client()
+    try:
+        count = int(await client.incr(key))
+        if count == 1:
+            await client.expire(key, ip.RATE_WINDOW_SECONDS)
+    finally:
+        await client.aclose()
+    return ip.GateCheck(
+        spend_ok=True, spent_cents=spent, rate_ok=limit > 0 and count <= limit, count=count
+    )
+
+
+async def _legacy_accrue_spend(tenant_id: str, cost_cents_aud: int) -> None:
+    if cost_cents_aud <= 0:
+        return
+    client = get_valkey_client()
+    try:
+        await client.incrby(ip._spend_key(tenant_id), cost_cents_aud)
+    finally:
+        await client.aclose()
+
+
+async def _legacy_forward(payload: dict, http_client: httpx.AsyncClient | None = None) -> dict:
+    url = os.environ.get(ip.LITELLM_URL_ENV, ip.DEFAULT_LITELLM_URL)
+    async with httpx.AsyncClient(timeout=ip.LITELLM_TIMEOUT_SECONDS) as client:
+        resp = await client.post(url, json=payload)
+        resp.raise_for_status()
+        return resp.json()
+
+
+# ─── Runner ──────────────────────────────────────────────────────────────────
+
+
+async def _no_insert(_row: dict) -> None:
+    return None
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+async def run_mode(mode: str, requests: int, concurrency: int, tenants: int) -> list[float]:
+    originals = (ip._check_gate, ip._accrue_spend, ip._forward_to_litellm)
+    if mode == "legacy":
+        ip._check_gate = _legacy_check_gate
+        ip._accrue_spend = _legacy_accrue_spend
+        ip._forward_to_litellm = _legacy_forward
+    else:
+        await ip.open_clients()
+
+    run = uuid.uuid4().hex[:8]
+    tenant_ids = [f"bench-{run}-{i}" for i in range(tenants)]
+    samples: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        body = {
+            "tenant_id": tenant_ids[i % tenants],
+            "prompt": "bench",
+            "max_tokens": 16,
+            "model": "claude-sonnet-4-6",
+            "tier": "enterprise",
+        }
+        async with sem:
+            t0 = time.perf_counter()
+            decision = await ip.intercept_request(body, insert_fn=_no_insert)
+            samples.append((time.perf_counter() - t0) * 1000)
+        if decision.decision != "allow":
+            raise RuntimeError(f"unexpected decision {decision.decision}: {decision.reason}")
+
+    try:
+        await asyncio.gather(*(one(i) for i in range(requests)))
+    finally:
+        ip._check_gate, ip._accrue_spend, ip._forward_to_litellm = originals
+        if mode == "shared":
+            await ip.close_clients()
+        client = get_valkey_client()
+        try:
+            keys = [k async for k in client.scan_iter(match=f"*:bench-{run}-*")]
+            if keys:
+                await client.delete(*keys)
+        finally:
+            await client.aclose()
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=100)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(_serve_litellm, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    os.environ[ip.LITELLM_URL_ENV] = f"http://127.0.0.1:{port}/v1/chat/completions"
+
+    print(f"{'mode':8} {'n':>6} {'p50 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+    async with server:
+        for mode in ("legacy", "shared"):
+            await run_mode(mode, args.warmup, args.concurrency, args.tenants)
+            samples = await run_mode(mode, args.requests, args.concurrency, args.tenants)
+            print(
+                f"{mode:8} {len(samples):>6} {_percentile(samples, 50):>9.3f} "
+                f"{_percentile(samples, 99):>9.3f} {statistics.fmean(samples):>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark LeadPoolService.bulk_create: per-row path vs bulk_upsert.
+
+Runs each size twice against a local Postgres with the lead_pool schema:
+once into an empty range (all inserts) and once over the same emails (all
+updates). Synthetic rows use the reserved ``@bench.invalid`` domain and are
+deleted after every run.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://localhost/agency_os \\
+        python scripts/bench_lead_pool_bulk_upsert.py
+    python scripts/bench_lead_pool_bulk_upsert.py --sizes 1000 10000 100000 --legacy-max 10000
+
+The per-row path issues ~2 statements per lead, so it is skipped above
+--legacy-max rows (100k rows takes tens of minutes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.services.lead_pool_service import LeadPoolService  # noqa: E402
+
+BENCH_DOMAIN = "bench.invalid"
+
+
+def synthetic_leads(count: int, run: str) -> list[dict[str, Any]]:
+    """Generate enrichment-shaped rows with unique emails."""
+    return [
+        {
+            "email": f"lead{i}.{run}@{BENCH_DOMAIN}",
+            "email_status": "verified" if i % 3 else "guessed",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "title": "Director" if i % 2 else "Owner",
+            "company_name": f"Bench Co {i % 997}",
+            "company_domain": f"benchco{i % 997}.com.au",
+            "company_industry": "Marketing",
+            "company_employee_count": 10 + i % 90,
+            "company_country": "Australia",
+            "departments": ["Marketing"],
+            "enrichment_data": {"source": "bench", "i": i},
+        }
+        for i in range(count)
+    ]
+
+
+async def time_run(sessionmaker, leads: list[dict[str, Any]], bulk: bool) -> tuple[float, int, int]:
+    """Run bulk_create once and return (seconds, created, updated)."""
+    async with sessionmaker() as session:
+        service = LeadPoolService(session)
+        started = time.perf_counter()
+        created, updated = await service.bulk_create(leads, bulk=bulk)
+        return time.perf_counter() - started, created, updated
+
+
+async def cleanup(sessionmaker) -> None:
+    async with sessionmaker() as session:
+        await session.execute(
+            text("DELETE FROM lead_pool WHERE email LIKE :pattern"),
+            {"pattern": f"%@{BENCH_DOMAIN}"},
+        )
+        await session.commit()
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--legacy-max", type=int, default=10000)
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL", ""))
+    args = parser.parse_args()
+
+    if not args.dsn:
+        print("DATABASE_URL not set (expects postgresql+asyncpg://...)", file=sys.stderr)
+        return 2
+
+    engine = create_async_engine(args.dsn.replace("postgresql://", "postgresql+asyncpg://", 1))
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    print(f"{'rows':>8} {'mode':>8} {'phase':>7} {'seconds':>9} {'rows/s':>10} created/updated")
+    try:
+        await cleanup(sessionmaker)
+        for size in args.sizes:
+            modes = [("bulk", True)]
+            if size <= args.legacy_max:
+                modes.insert(0, ("per-row", False))
+            for mode, bulk in modes:
+                leads = synthetic_leads(size, run=f"{mode}{size}")
+                for phase in ("insert", "update"):
+                    seconds, created, updated = await time_run(sessionmaker, leads, bulk)
+                    print(
+                        f"{size:>8} {mode:>8} {phase:>7} {seconds:>9.2f} "
+                        f"{size / seconds:>10.0f} {created}/{updated}"
+                    )
+                await cleanup(sessionmaker)
+    finally:
+        await cleanup(sessionmaker)
+        await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark single-text TEI embeds: direct TEIClient vs EmbeddingService.
+
+Starts a local fake TEI server (POST /embed) that models a single model worker:
+each request holds the worker for a fixed overhead plus a per-text cost, so
+one-item requests queue behind each other the way they do on the sidecar.
+N threads then embed distinct texts one at a time, as concurrent
+ValkeyClient.semantic_cache_key() / AtomStore.retrieve_top_k() callers do.
+
+Reports, per mode:
+
+  direct    — TEIClient.embed([text]) per call (one POST per text)
+  coalesced — EmbeddingService.embed_array([text]) per call, cold cache
+  warm      — the coalesced pass repeated on the same service (LRU hits)
+
+Usage:
+    python scripts/bench_tei_coalescing.py
+    python scripts/bench_tei_coalescing.py --threads 32 --texts-per-thread 50
+    python scripts/bench_tei_coalescing.py --request-ms 4 --per-text-us 150 --window-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.keiracom_system.embeddings.embedding_service import EmbeddingService  # noqa: E402
+from src.keiracom_system.embeddings.tei_client import (  # noqa: E402
+    DEFAULT_MODEL_DIM,
+    TEIClient,
+)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # default 5 resets connections under the direct fan-out
+
+
+class FakeTEI:
+    """Local /embed server with a serialised worker and request counter."""
+
+    def __init__(self, request_ms: float, per_text_us: float, dim: int = DEFAULT_MODEL_DIM):
+        self.requests = 0
+        self.texts = 0
+        worker = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                inputs = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["inputs"]
+                with worker:
+                    fake.requests += 1
+                    fake.texts += len(inputs)
+                    time.sleep(request_ms / 1000 + per_text_us * len(inputs) / 1e6)
+                vectors = [[(len(t) % 7) / 7.0] * dim for t in inputs]
+                body = json.dumps(vectors).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                pass
+
+        self._server = _Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.texts = 0
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def run(embed_one: Callable[[str], object], threads: int, per_thread: int) -> float:
+    """Each thread embeds its own distinct texts one at a time. Returns seconds."""
+    barrier = threading.Barrier(threads + 1)
+
+    def _worker(tid: int) -> None:
+        barrier.wait()
+        for i in range(per_thread):
+            embed_one(f"tenant query {tid}-{i}")
+
+    pool = [threading.Thread(target=_worker, args=(t,)) for t in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--texts-per-thread", type=int, default=25)
+    parser.add_argument("--request-ms", type=float, default=3.0, help="fake TEI per-request cost")
+    parser.add_argument("--per-text-us", type=float, default=100.0, help="fake TEI per-text cost")
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args()
+
+    tei = FakeTEI(args.request_ms, args.per_text_us)
+    client = TEIClient(base_url=tei.url)
+    service = EmbeddingService(client, max_batch=args.max_batch, window_ms=args.window_ms)
+    total = args.threads * args.texts_per_thread
+
+    rows = []
+    for mode, embed_one in (
+        ("direct", lambda text: client.embed([text])),
+        ("coalesced", lambda text: service.embed_array([text])),
+        ("warm", lambda text: service.embed_array([text])),
+    ):
+        tei.reset()
+        seconds = run(embed_one, args.threads, args.texts_per_thread)
+        rows.append((mode, seconds, tei.requests, tei.texts))
+    service.close()
+    tei.close()
+
+    print(
+        f"{args.threads} threads x {args.texts_per_thread} texts; fake TEI "
+        f"{args.request_ms}ms/request + {args.per_text_us}us/text; "
+        f"window={args.window_ms}ms max_batch={args.max_batch}"
+    )
+    print(f"{'mode':<10} {'texts/s':>10} {'seconds':>9} {'TEI POSTs':>10} {'mean batch':>11}")
+    for mode, seconds, requests, texts in rows:
+        mean = f"{texts / requests:.1f}" if requests else "-"
+        print(f"{mode:<10} {total / seconds:>10.0f} {seconds:>9.3f} {requests:>10} {mean:>11}")
+    print(f"speedup coalesced vs direct: {rows[0][1] / rows[1][1]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Benchmark the Valkey semantic cache key: legacy SHA bucket vs LSH multi-probe.
+
+For every recorded query pair (a, b) the pair's first query is written through
+ValkeyClient.set_semantic() and the second is looked up with get_semantic(),
+against an in-memory Valkey stand-in. Reports, per scheme:
+
+  dup hit rate    — near-duplicate pairs where b is served a's cached result
+  false hit rate  — non-duplicate pairs where b is (wrongly) served a's result
+  same bucket     — pairs whose queries share a bucket without probing
+
+Input: JSONL, one pair per line:
+    {"a": "query text", "b": "query text", "duplicate": true}
+Optional "emb_a"/"emb_b" lists carry recorded embeddings; otherwise texts are
+embedded through the TEI sidecar at TEI_URL (default http://embed:80).
+
+Usage:
+    python scripts/bench_valkey_lsh_hit_rate.py --pairs recorded_pairs.jsonl
+    python scripts/bench_valkey_lsh_hit_rate.py --synthetic 2000
+    python scripts/bench_valkey_lsh_hit_rate.py --pairs p.jsonl --min-similarity 0.9 --probes 24
+
+--synthetic N generates N pairs of 384-dim vectors offline: half near
+duplicates (cosine ~0.93-0.99) and half unrelated-but-same-domain queries
+(cosine ~0.55-0.85, the BGE-small range for different tool queries).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.keiracom_system.cache import semantic_lsh  # noqa: E402
+from src.keiracom_system.cache.constants import (  # noqa: E402
+    EMBEDDING_BUCKET_COUNT,
+    EMBEDDING_LSH_MAX_PROBES,
+    SEMANTIC_CACHE_MIN_SIMILARITY,
+)
+from src.keiracom_system.cache.valkey_client import ValkeyClient  # noqa: E402
+from src.keiracom_system.embeddings.tei_client import TEIClient, _HTTPResponse  # noqa: E402
+
+DIM = 384
+
+
+class _MemoryValkey:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.store.get(k) for k in keys]
+
+    def set(self, key: str, value: str | bytes) -> None:
+        self.store[key] = value if isinstance(value, bytes) else value.encode("utf-8")
+
+    def setex(self, key: str, time: int, value: str | bytes) -> None:
+        self.set(key, value)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+
+def _table_tei(table: dict[str, list[float]]) -> TEIClient:
+    """TEIClient that answers /embed from a text -> embedding table."""
+
+    def post(url: str, payload: dict[str, Any], timeout: float) -> _HTTPResponse:
+        return _HTTPResponse(200, json.dumps([table[t] for t in payload["inputs"]]).encode())
+
+    def get(url: str, timeout: float) -> _HTTPResponse:
+        return _HTTPResponse(200, b'{"status":"ok"}')
+
+    return TEIClient(http_get=get, http_post=post)
+
+
+def _legacy_bucket(embedding: list[float]) -> int:
+    """The pre-LSH scheme: SHA-256 of the packed floats, modulo bucket count."""
+    digest = hashlib.sha256(struct.pack(f"{len(embedding)}f", *embedding)).digest()
+    return int.from_bytes(digest[:4], byteorder="big") % EMBEDDING_BUCKET_COUNT
+
+
+def _unit(vec: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vec))
+    return [x / norm for x in vec]
+
+
+def _at_cosine(base: list[float], target: float, rng: random.Random) -> list[float]:
+    """Unit vector at exactly `target` cosine to unit vector `base`."""
+    noise = [rng.gauss(0.0, 1.0) for _ in base]
+    dot = sum(n * b for n, b in zip(noise, base, strict=True))
+    ortho = _unit([n - dot * b for n, b in zip(noise, base, strict=True)])
+    sin = math.sqrt(1.0 - target * target)
+    return [target * b + sin * o for b, o in zip(base, ortho, strict=True)]
+
+
+def synthetic_pairs(count: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    # Tool queries share a domain direction, so unrelated queries are still
+    # correlated — the regime that makes a bare bucket collision dangerous.
+    domain = _unit([rng.gauss(0.0, 1.0) for _ in range(DIM)])
+    pairs = []
+    for i in range(count):
+        a = _at_cosine(domain, rng.uniform(0.75, 0.9), rng)
+        duplicate = i % 2 == 0
+        target = rng.uniform(0.93, 0.99) if duplicate else rng.uniform(0.55, 0.85)
+        b = _at_cosine(a, target, rng)
+        pairs.append({"a": f"a{i}", "b": f"b{i}", "emb_a": a, "emb_b": b, "duplicate": duplicate})
+    return pairs
+
+
+def load_pairs(path: Path) -> list[dict[str, Any]]:
+    pairs = [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    missing = [p for p in pairs if "emb_a" not in p or "emb_b" not in p]
+    if missing:
+        tei = TEIClient(base_url=os.environ.get("TEI_URL", "http://embed:80"))
+        for pair in missing:
+            pair["emb_a"], pair["emb_b"] = tei.embed([pair["a"], pair["b"]])
+    return pairs
+
+
+def run(pairs: list[dict[str, Any]], probes: int, min_similarity: float) -> dict[str, Any]:
+    table: dict[str, list[float]] = {}
+    for i, pair in enumerate(pairs):
+        table[f"{i}:a"], table[f"{i}:b"] = pair["emb_a"], pair["emb_b"]
+    client = ValkeyClient(
+        redis_client=_MemoryValkey(), tei_client=_table_tei(table), tenant_id="bench"
+    )
+    counts = {"dup": 0, "nondup": 0, "lsh_dup_hits": 0, "lsh_false_hits": 0}
+    counts.update({"legacy_dup_hits": 0, "legacy_false_hits": 0, "same_bucket_dup": 0})
+    for i, pair in enumerate(pairs):
+        kind = "dup" if pair["duplicate"] else "nondup"
+        counts[kind] += 1
+        args = {"pair": i}
+        write = client.semantic_cache_key(tool_name="bench", args=args, query_text=f"{i}:a")
+        read = client.semantic_cache_key(
+            tool_name="bench", args=args, query_text=f"{i}:b", max_probes=probes
+        )
+        client.set_semantic(write, b"cached")
+        hit = client.get_semantic(read, min_similarity=min_similarity) is not None
+        legacy_hit = _legacy_bucket(pair["emb_a"]) == _legacy_bucket(pair["emb_b"])
+        if kind == "dup":
+            counts["lsh_dup_hits"] += hit
+            counts["legacy_dup_hits"] += legacy_hit
+            counts["same_bucket_dup"] += write.key == read.key
+        else:
+            counts["lsh_false_hits"] += hit
+            counts["legacy_false_hits"] += legacy_hit
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pairs", type=Path, help="recorded query pairs (JSONL)")
+    source.add_argument("--synthetic", type=int, metavar="N", help="generate N synthetic pairs")
+    parser.add_argument("--probes", type=int, default=EMBEDDING_LSH_MAX_PROBES)
+    parser.add_argument("--min-similarity", type=float, default=SEMANTIC_CACHE_MIN_SIMILARITY)
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.pairs) if args.pairs else synthetic_pairs(args.synthetic)
+    c = run(pairs, args.probes, args.min_similarity)
+    dup, nondup = max(c["dup"], 1), max(c["nondup"], 1)
+    print(f"pairs: {c['dup']} duplicate / {c['nondup']} non-duplicate")
+    print(f"probes={args.probes} min_similarity={args.min_similarity}")
+    print(f"{'scheme':<22} {'dup hit rate':>13} {'false hit rate':>15}")
+    print(
+        f"{'legacy sha bucket':<22} {c['legacy_dup_hits'] / dup:>13.1%} "
+        f"{c['legacy_false_hits'] / nondup:>15.1%}"
+    )
+    print(
+        f"{'lsh + multi-probe':<22} {c['lsh_dup_hits'] / dup:>13.1%} "
+        f"{c['lsh_false_hits'] / nondup:>15.1%}"
+    )
+    print(f"lsh same-bucket (no probing) dup rate: {c['same_bucket_dup'] / dup:.1%}")
+    print(f"semantic_lsh bits: {semantic_lsh.bits_for(EMBEDDING_BUCKET_COUNT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
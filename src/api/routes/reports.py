@@ -1139,16 +1139,31 @@ async def get_pool_analytics(
     """
     from sqlalchemy import text
 
-    # Get pool status distribution
-    status_query = text("""
+    # One pass over lead_pool for the status, industry and email status
+    # distributions (grouping sets), and one over lead_assignments for tiers
+    # and the average score.
+    pool_query = text("""
         SELECT
+            GROUPING(pool_status) = 0 AS by_status,
+            GROUPING(company_industry) = 0 AS by_industry,
             pool_status,
+            COALESCE(company_industry, 'Unknown') as industry,
+            COALESCE(email_status, 'unknown') as email_status,
             COUNT(*) as count
         FROM lead_pool
-        GROUP BY pool_status
+        GROUP BY GROUPING SETS ((pool_status), (company_industry), (email_status))
     """)
-    result = await db.execute(status_query)
-    status_counts = {row.pool_status: row.count for row in result.fetchall()}
+    result = await db.execute(pool_query)
+    status_counts: dict[str, int] = {}
+    industry_counts: list[tuple[str, int]] = []
+    email_status_distribution: dict[str, int] = {}
+    for row in result.fetchall():
+        if row.by_status:
+            status_counts[row.pool_status] = row.count
+        elif row.by_industry:
+            industry_counts.append((row.industry, row.count))
+        else:
+            email_status_distribution[row.email_status] = row.count
 
     total = sum(status_counts.values())
     available = status_counts.get("available", 0)
@@ -1156,50 +1171,29 @@ async def get_pool_analytics(
     converted = status_counts.get("converted", 0)
     bounced = status_counts.get("bounced", 0)
 
-    # Get tier distribution from lead_assignments (where ALS scoring happens)
+    # Industry distribution (top 10)
+    industry_counts.sort(key=lambda item: item[1], reverse=True)
+    industry_distribution = dict(industry_counts[:10])
+
+    # Tier distribution and average score from lead_assignments (where ALS scoring happens)
     tier_query = text("""
         SELECT
             COALESCE(als_tier, 'unscored') as tier,
-            COUNT(*) as count
+            COUNT(*) as count,
+            SUM(als_score) as score_sum,
+            COUNT(als_score) as scored
         FROM lead_assignments
         GROUP BY als_tier
     """)
     result = await db.execute(tier_query)
-    tier_distribution = {row.tier: row.count for row in result.fetchall()}
-
-    # Get industry distribution (top 10)
-    industry_query = text("""
-        SELECT
-            COALESCE(company_industry, 'Unknown') as industry,
-            COUNT(*) as count
-        FROM lead_pool
-        GROUP BY company_industry
-        ORDER BY COUNT(*) DESC
-        LIMIT 10
-    """)
-    result = await db.execute(industry_query)
-    industry_distribution = {row.industry: row.count for row in result.fetchall()}
-
-    # Get email status distribution
-    email_query = text("""
-        SELECT
-            COALESCE(email_status, 'unknown') as status,
-            COUNT(*) as count
-        FROM lead_pool
-        GROUP BY email_status
-    """)
-    result = await db.execute(email_query)
-    email_status_distribution = {row.status: row.count for row in result.fetchall()}
-
-    # Get average propensity score from lead_assignments (where scoring happens)
-    avg_query = text("""
-        SELECT AVG(als_score) as avg_score
-        FROM lead_assignments
-        WHERE als_score IS NOT NULL
-    """)
-    result = await db.execute(avg_query)
-    row = result.fetchone()
-    avg_propensity_score = round(float(row.avg_score), 1) if row and row.avg_score else None
+    tier_distribution: dict[str, int] = {}
+    score_sum = 0.0
+    scored = 0
+    for row in result.fetchall():
+        tier_distribution[row.tier] = row.count
+        score_sum += float(row.score_sum or 0)
+        scored += row.scored or 0
+    avg_propensity_score = round(score_sum / scored, 1) if scored and score_sum else None
 
     return PoolAnalytics(
         total_leads=total,
@@ -1859,55 +1853,48 @@ async def get_client_campaigns_performance(
     campaigns_result = await db.execute(campaigns_stmt)
     campaigns = campaigns_result.scalars().all()
 
-    performance_items = []
-
-    for campaign in campaigns:
-        # Get total leads for this campaign
-        leads_count_stmt = select(func.count(Lead.id)).where(
-            and_(
-                Lead.campaign_id == campaign.id,
-                Lead.deleted_at.is_(None),
+    campaign_ids = [campaign.id for campaign in campaigns]
+    lead_totals: dict[UUID, int] = {}
+    lead_counts: dict[tuple[UUID, str], int] = {}
+    if campaign_ids:
+        # Total leads per campaign (one grouped query for all campaigns)
+        leads_count_stmt = (
+            select(Lead.campaign_id, func.count(Lead.id))
+            .where(
+                and_(
+                    Lead.campaign_id.in_(campaign_ids),
+                    Lead.deleted_at.is_(None),
+                )
             )
+            .group_by(Lead.campaign_id)
         )
         leads_result = await db.execute(leads_count_stmt)
-        total_leads = leads_result.scalar() or 0
-
-        # Get activity counts within date range
-        # Contacted = distinct leads with 'sent' action
-        contacted_stmt = select(func.count(distinct(Activity.lead_id))).where(
-            and_(
-                Activity.campaign_id == campaign.id,
-                Activity.action == "sent",
-                func.date(Activity.created_at) >= start_date,
-                func.date(Activity.created_at) <= end_date,
+        lead_totals = {row[0]: row[1] for row in leads_result.all()}
+
+        # Distinct leads per campaign and action within date range:
+        # contacted = 'sent', replied = 'replied', converted = 'converted'
+        activity_stmt = (
+            select(Activity.campaign_id, Activity.action, func.count(distinct(Activity.lead_id)))
+            .where(
+                and_(
+                    Activity.campaign_id.in_(campaign_ids),
+                    Activity.action.in_(("sent", "replied", "converted")),
+                    func.date(Activity.created_at) >= start_date,
+                    func.date(Activity.created_at) <= end_date,
+                )
             )
+            .group_by(Activity.campaign_id, Activity.action)
         )
-        contacted_result = await db.execute(contacted_stmt)
-        contacted = contacted_result.scalar() or 0
+        activity_result = await db.execute(activity_stmt)
+        lead_counts = {(row[0], row[1]): row[2] for row in activity_result.all()}
 
-        # Replied = distinct leads with 'replied' action
-        replied_stmt = select(func.count(distinct(Activity.lead_id))).where(
-            and_(
-                Activity.campaign_id == campaign.id,
-                Activity.action == "replied",
-                func.date(Activity.created_at) >= start_date,
-                func.date(Activity.created_at) <= end_date,
-            )
-        )
-        replied_result = await db.execute(replied_stmt)
-        replied = replied_result.scalar() or 0
+    performance_items = []
 
-        # Converted = distinct leads with 'converted' action
-        converted_stmt = select(func.count(distinct(Activity.lead_id))).where(
-            and_(
-                Activity.campaign_id == campaign.id,
-                Activity.action == "converted",
-                func.date(Activity.created_at) >= start_date,
-                func.date(Activity.created_at) <= end_date,
-            )
-        )
-        converted_result = await db.execute(converted_stmt)
-        converted = converted_result.scalar() or 0
+    for campaign in campaigns:
+        total_leads = lead_totals.get(campaign.id, 0)
+        contacted = lead_counts.get((campaign.id, "sent"), 0)
+        replied = lead_counts.get((campaign.id, "replied"), 0)
+        converted = lead_counts.get((campaign.id, "converted"), 0)
 
         # Calculate rates
         reply_rate = round((replied / contacted * 100), 2) if contacted > 0 else 0.0
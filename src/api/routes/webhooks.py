@@ -11,6 +11,7 @@ DEPENDENCIES:
   - src/integrations/unipile.py (migrated from heyreach.py)
   - src/integrations/vapi.py
   - src/services/email_events_service.py
+  - src/services/webhook_event_queue.py (queue ingest mode)
   - src/services/linkedin_connection_service.py (for account webhooks)
   - src/services/unsubscribe_token_service.py (Directive 057)
   - src/models/lead.py
@@ -52,6 +53,7 @@ from src.services.email_events_service import (
     parse_smartlead_webhook,
 )
 from src.services.linkedin_connection_service import linkedin_connection_service
+from src.services.webhook_event_queue import apply_email_event, enqueue_webhook_event
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
@@ -651,6 +653,11 @@ async def smartlead_events_webhook(
             detail="Invalid webhook signature",
         )
 
+    if settings.webhook_ingest_mode == "queue":
+        # Ack fast; webhook-event-drain-flow processes the event in a batch.
+        queue_id = await enqueue_webhook_event(db, "smartlead", payload)
+        return {"status": "queued", "queue_id": queue_id}
+
     try:
         # Parse webhook payload
         parsed = parse_smartlead_webhook(payload)
@@ -673,54 +680,10 @@ async def smartlead_events_webhook(
         # Process based on event type
         event_type = parsed["event_type"]
 
-        if event_type == "opened":
-            await email_service.record_open(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                device_info=parsed.get("device_info"),
-                geo_info=parsed.get("geo_info"),
-                provider="smartlead",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
+        if event_type != "replied":
+            await apply_email_event(email_service, "smartlead", parsed, activity.id)
 
-        elif event_type == "clicked":
-            await email_service.record_click(
-                activity_id=activity.id,
-                clicked_url=parsed.get("clicked_url", ""),
-                event_at=parsed.get("event_at"),
-                device_info=parsed.get("device_info"),
-                geo_info=parsed.get("geo_info"),
-                provider="smartlead",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "bounced":
-            await email_service.record_bounce(
-                activity_id=activity.id,
-                bounce_type=parsed.get("bounce_type", "hard"),
-                event_at=parsed.get("event_at"),
-                provider="smartlead",
-                provider_event_id=parsed.get("provider_event_id"),
-                raw_payload=parsed.get("raw"),
-            )
-
-        elif event_type == "unsubscribed":
-            await email_service.record_unsubscribe(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                provider="smartlead",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "complained":
-            await email_service.record_complaint(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                provider="smartlead",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "replied":
+        else:
             # Forward to closer engine for intent classification
             lead = await find_lead_by_email(db, parsed.get("lead_email", ""))
             if lead:
@@ -811,6 +774,11 @@ async def salesforge_events_webhook(
             detail="Invalid webhook signature",
         )
 
+    if settings.webhook_ingest_mode == "queue":
+        # Ack fast; webhook-event-drain-flow processes the event in a batch.
+        queue_id = await enqueue_webhook_event(db, "salesforge", payload)
+        return {"status": "queued", "queue_id": queue_id}
+
     try:
         # Parse webhook payload
         parsed = parse_salesforge_webhook(payload)
@@ -833,54 +801,10 @@ async def salesforge_events_webhook(
         # Process based on event type
         event_type = parsed["event_type"]
 
-        if event_type == "opened":
-            await email_service.record_open(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                device_info=parsed.get("device_info"),
-                geo_info=parsed.get("geo_info"),
-                provider="salesforge",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "clicked":
-            await email_service.record_click(
-                activity_id=activity.id,
-                clicked_url=parsed.get("clicked_url", ""),
-                event_at=parsed.get("event_at"),
-                device_info=parsed.get("device_info"),
-                geo_info=parsed.get("geo_info"),
-                provider="salesforge",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "bounced":
-            await email_service.record_bounce(
-                activity_id=activity.id,
-                bounce_type=parsed.get("bounce_type", "hard"),
-                event_at=parsed.get("event_at"),
-                provider="salesforge",
-                provider_event_id=parsed.get("provider_event_id"),
-                raw_payload=parsed.get("raw"),
-            )
+        if event_type != "replied":
+            await apply_email_event(email_service, "salesforge", parsed, activity.id)
 
-        elif event_type == "unsubscribed":
-            await email_service.record_unsubscribe(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                provider="salesforge",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "complained":
-            await email_service.record_complaint(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                provider="salesforge",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "replied":
+        else:
             # Forward to closer engine
             lead = await find_lead_by_email(db, parsed.get("lead_email", ""))
             if lead:
@@ -989,6 +913,11 @@ async def resend_events_webhook(
             detail="Invalid webhook signature",
         )
 
+    if settings.webhook_ingest_mode == "queue":
+        # Ack fast; webhook-event-drain-flow processes the event in a batch.
+        queue_id = await enqueue_webhook_event(db, "resend", payload)
+        return {"status": "queued", "queue_id": queue_id}
+
     try:
         # Parse webhook payload
         parsed = parse_resend_webhook(payload)
@@ -1011,56 +940,10 @@ async def resend_events_webhook(
         # Process based on event type
         event_type = parsed["event_type"]
 
-        if event_type == "opened":
-            await email_service.record_open(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                device_info=parsed.get("device_info"),
-                geo_info=parsed.get("geo_info"),
-                provider="resend",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "clicked":
-            await email_service.record_click(
-                activity_id=activity.id,
-                clicked_url=parsed.get("clicked_url", ""),
-                event_at=parsed.get("event_at"),
-                device_info=parsed.get("device_info"),
-                geo_info=parsed.get("geo_info"),
-                provider="resend",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "bounced":
-            await email_service.record_bounce(
-                activity_id=activity.id,
-                bounce_type=parsed.get("bounce_type", "hard"),
-                event_at=parsed.get("event_at"),
-                provider="resend",
-                provider_event_id=parsed.get("provider_event_id"),
-                raw_payload=parsed.get("raw"),
-            )
-
-        elif event_type == "complained":
-            await email_service.record_complaint(
-                activity_id=activity.id,
-                event_at=parsed.get("event_at"),
-                provider="resend",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
-
-        elif event_type == "delivered":
-            # Just record the event, don't need special handling
-            await email_service.record_event(
-                activity_id=activity.id,
-                event_type="delivered",
-                event_at=parsed.get("event_at"),
-                provider="resend",
-                provider_event_id=parsed.get("provider_event_id"),
-            )
+        if event_type != "replied":
+            await apply_email_event(email_service, "resend", parsed, activity.id)
 
-        elif event_type == "replied":
+        else:
             # Forward to closer engine for intent classification and ALS score update
             lead = await find_lead_by_email(db, parsed.get("lead_email", ""))
             if lead:
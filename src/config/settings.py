@@ -100,6 +100,20 @@ class Settings(BaseSettings):
         default=7776000, description="Default cache TTL (90 days in seconds)"
     )
     redis_cache_version: str = Field(default="v1", description="Cache key version prefix")
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Serve AnthropicClient.complete(cache=True) temperature-0 calls from cache",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60, description="TTL for cached LLM completions (7 days)"
+    )
+    llm_cache_max_entries: int = Field(
+        default=50_000, description="Max cached LLM completions per tier (LRU eviction)"
+    )
+    llm_cache_sqlite_path: str = Field(
+        default="/tmp/agency_os_llm_response_cache.sqlite3",
+        description="On-disk LLM cache used when Redis is unreachable",
+    )
 
     # === Backend API Base URL ===
     base_url: str = Field(
@@ -132,6 +146,13 @@ class Settings(BaseSettings):
     anthropic_daily_spend_limit: float = Field(
         default=50.0, description="Daily AI spend limit in AUD"
     )
+    anthropic_batch_api_base: str = Field(
+        default="",
+        description=(
+            "Message Batches API root override (e.g. a local stub server); "
+            "empty uses https://api.anthropic.com/v1"
+        ),
+    )
 
     # === SDK Brain (Claude Agent SDK) ===
     sdk_brain_enabled: bool = Field(
@@ -355,6 +376,13 @@ class Settings(BaseSettings):
     smartlead_webhook_secret: str = Field(default="", description="Smartlead webhook HMAC secret")
     salesforge_webhook_secret: str = Field(default="", description="Salesforge webhook HMAC secret")
     resend_webhook_secret: str = Field(default="", description="Resend/Svix webhook secret")
+    webhook_ingest_mode: str = Field(
+        default="inline",
+        description=(
+            "Email engagement webhooks: 'inline' processes each event in the request; "
+            "'queue' verifies, enqueues to webhook_event_queue and returns 200 at once"
+        ),
+    )
 
     # === Campaign Activation Guard ===
     campaign_activation_enabled: bool = Field(
@@ -282,6 +282,90 @@ STAGE_PARALLELISM: dict[str, StageConfig] = {
         "safety_margin": 0.33,
         "notes": "LEGACY key. Migrate callers to stage_7_classify.",
     },
+    # ── PIPELINE F v2.1 COHORT RUNNER ─────────────────────────────────────
+    # src/orchestration/cohort_runner.py. Barrier mode runs each stage over the
+    # whole cohort with this concurrency; streaming mode gives each stage this
+    # many workers and an input queue of the same size.
+    "cohort_stage2_verify": {
+        "stage_name": "Cohort Stage 2 — VERIFY: run_serp_verify (5 SERP queries/domain)",
+        "concurrency": 30,
+        "provider": "dataforseo",
+        "provider_ceiling": 30,
+        "safety_margin": 1.0,
+        "notes": "Shares DFS ceiling with other DFS stages when streaming.",
+    },
+    "cohort_stage3_identify": {
+        "stage_name": "Cohort Stage 3 — IDENTIFY: Gemini F3a identity + DM",
+        "concurrency": 20,
+        "provider": "gemini",
+        "provider_ceiling": 30,
+        "safety_margin": 0.67,
+        "notes": "Drops enterprise/chain and no-DM domains.",
+    },
+    "cohort_stage4_signal": {
+        "stage_name": "Cohort Stage 4 — SIGNAL: DFS signal bundle (10 endpoints)",
+        "concurrency": 20,
+        "provider": "dataforseo",
+        "provider_ceiling": 30,
+        "safety_margin": 0.67,
+        "notes": "Shares DFS ceiling. Persists bundle to BU.",
+    },
+    "cohort_stage5_score": {
+        "stage_name": "Cohort Stage 5 — SCORE: prospect scorer + BU persist",
+        "concurrency": 50,
+        "provider": "asyncpg_local",
+        "provider_ceiling": 50,
+        "safety_margin": 1.0,
+        "notes": "Pure scoring logic; concurrency bounds the BU upsert.",
+    },
+    "cohort_stage6_enrich": {
+        "stage_name": "Cohort Stage 6 — ENRICH: historical rank (composite >= 60)",
+        "concurrency": 10,
+        "provider": "dataforseo",
+        "provider_ceiling": 30,
+        "safety_margin": 0.33,
+        "notes": "Gated inside wrapper.",
+    },
+    "cohort_stage7_analyse": {
+        "stage_name": "Cohort Stage 7 — ANALYSE: Gemini F3b",
+        "concurrency": 20,
+        "provider": "gemini",
+        "provider_ceiling": 30,
+        "safety_margin": 0.67,
+        "notes": "Grounding off. Shares Gemini ceiling with Stage 3 when streaming.",
+    },
+    "cohort_stage8_contact": {
+        "stage_name": "Cohort Stage 8 — CONTACT: verify fills + contact waterfall",
+        "concurrency": 15,
+        "provider": "contactout",
+        "provider_ceiling": 20,
+        "safety_margin": 0.75,
+        "notes": "ContactOut is the bottleneck; Leadmagic/BD fallbacks run inside the waterfall.",
+    },
+    "cohort_stage9_social": {
+        "stage_name": "Cohort Stage 9 — SOCIAL: Bright Data LinkedIn posts",
+        "concurrency": 10,
+        "provider": "bright_data",
+        "provider_ceiling": 100,
+        "safety_margin": 0.1,
+        "notes": "Gated on verified LinkedIn URL.",
+    },
+    "cohort_stage10_vr_msg": {
+        "stage_name": "Cohort Stage 10 — VR+MSG: enhanced VR + messaging",
+        "concurrency": 10,
+        "provider": "gemini",
+        "provider_ceiling": 30,
+        "safety_margin": 0.33,
+        "notes": "Gated on email found.",
+    },
+    "cohort_stage11_card": {
+        "stage_name": "Cohort Stage 11 — CARD: assemble lead card",
+        "concurrency": 50,
+        "provider": "local",
+        "provider_ceiling": 50,
+        "safety_margin": 1.0,
+        "notes": "Pure logic.",
+    },
     "dfs_global": {
         "stage_name": "Global DFS Semaphore",
         "concurrency": 28,
@@ -293,6 +377,29 @@ STAGE_PARALLELISM: dict[str, StageConfig] = {
 }
 
 
+# ── ADAPTIVE PROVIDER LIMITS ─────────────────────────────────────────────
+# src/utils/adaptive_limiter.py. One AIMD limiter per provider gates every
+# outbound request to it, across all stages. The ceiling is the provider's
+# provider_ceiling above; these are the starting limit, the floor it never
+# backs off below, and how far p95 latency may rise over its baseline before
+# the limiter treats it as congestion. Grounded and ungrounded Gemini calls
+# share one limiter, hence the wider latency tolerance.
+ADAPTIVE_CONCURRENCY: dict[str, dict[str, int | float]] = {
+    "dataforseo": {"initial": 28, "floor": 4, "latency_tolerance": 2.0},
+    "gemini": {"initial": 20, "floor": 4, "latency_tolerance": 3.0},
+}
+
+
+def get_provider_ceiling(provider: str) -> int:
+    """Return the highest provider_ceiling configured for ``provider``. Raises KeyError if unknown."""
+    ceilings = [
+        c["provider_ceiling"] for c in STAGE_PARALLELISM.values() if c["provider"] == provider
+    ]
+    if not ceilings:
+        raise KeyError(f"Provider '{provider}' not in parallelism config.")
+    return max(ceilings)
+
+
 def get_parallelism(stage_key: str) -> int:
     """Return concurrency limit for a pipeline stage. Raises KeyError if unknown."""
     if stage_key not in STAGE_PARALLELISM:
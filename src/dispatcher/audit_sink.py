@@ -0,0 +1,408 @@
+"""Background audit sink — batched, spill-safe writer for dispatcher audit rows.
+
+The interceptor (``interceptor_events``) and spend tracker
+(``infra_spend_metrics``) used to write one audit row per model call inline in
+the request path. An ``AuditSink`` moves that off the hot path:
+
+  - ``enqueue(row)`` is synchronous and never blocks: the row lands in a
+    bounded in-memory queue.
+  - One worker task drains the queue and calls the sink's ``flush_fn`` with a
+    multi-row batch every ``batch_rows`` rows or ``flush_interval_ms``
+    milliseconds, whichever comes first.
+  - If ``flush_fn`` raises a transient error (DB unreachable) the batch is
+    spilled to a local JSONL segment file under ``spill_dir``. A full queue
+    spills the overflow row the same way, so nothing is dropped while the DB
+    is degraded.
+  - If it raises a permanent error (see ``is_permanent_error`` — e.g. an FK
+    violation on ``tenant_id``) the batch is retried row by row: good rows are
+    written and each row that still fails permanently is appended to the
+    dead-letter file ``spill_dir/dead_letter/<name>.jsonl`` instead of being
+    spilled, so one bad row can never wedge the spill queue.
+  - After the next successful flush (or every ``replay_interval_s`` while
+    idle) spilled segments are replayed oldest-first and deleted once written.
+
+``metrics()`` reports queue depth, flush latency and row counters for the
+dispatcher health endpoint. Audit is best-effort by design: no sink failure
+ever propagates to the caller of ``enqueue``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SPILL_DIR_ENV = "DISPATCHER_AUDIT_SPILL_DIR"
+DEFAULT_SPILL_DIR = Path("/tmp/keiracom_audit_spill")
+DEFAULT_BATCH_ROWS = 200
+DEFAULT_FLUSH_INTERVAL_MS = 250
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_REPLAY_INTERVAL_S = 5.0
+DEAD_LETTER_SUBDIR = "dead_letter"
+# SQLSTATE classes that fail the same way on every retry: data exception (22),
+# integrity constraint violation (23), syntax error / undefined object (42).
+PERMANENT_SQLSTATE_CLASSES = frozenset({"22", "23", "42"})
+
+FlushFn = Callable[[list[dict[str, Any]]], Awaitable[None]]
+
+
+def default_spill_dir() -> Path:
+    return Path(os.environ.get(SPILL_DIR_ENV) or DEFAULT_SPILL_DIR)
+
+
+def is_permanent_error(exc: BaseException) -> bool:
+    """True when re-sending the same rows can never succeed.
+
+    asyncpg exposes the Postgres SQLSTATE as ``sqlstate``, PostgREST's
+    ``APIError`` as ``code``. Rows that cannot be serialised at all
+    (TypeError/KeyError/ValueError from the flush_fn) are permanent too.
+    Everything else — connection resets, timeouts, 5xx — is transient.
+    """
+    code = getattr(exc, "sqlstate", None) or getattr(exc, "code", None)
+    if isinstance(code, str) and len(code) == 5:
+        return code[:2] in PERMANENT_SQLSTATE_CLASSES
+    return isinstance(exc, TypeError | KeyError | ValueError)
+
+
+class AuditSink:
+    """Bounded queue + background batch writer with JSONL spill/replay."""
+
+    def __init__(
+        self,
+        name: str,
+        flush_fn: FlushFn,
+        *,
+        spill_dir: Path | None = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        replay_interval_s: float = DEFAULT_REPLAY_INTERVAL_S,
+        is_permanent: Callable[[BaseException], bool] = is_permanent_error,
+    ) -> None:
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be >= 1, got {batch_rows}")
+        if max_queue < 1:
+            raise ValueError(f"max_queue must be >= 1, got {max_queue}")
+        self.name = name
+        self._flush_fn = flush_fn
+        self._spill_dir = spill_dir or default_spill_dir()
+        self._batch_rows = batch_rows
+        self._flush_interval_s = flush_interval_ms / 1000
+        self._max_queue = max_queue
+        self._replay_interval_s = replay_interval_s
+        self._is_permanent = is_permanent
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue)
+        # Rows taken off the queue but not yet written — flushed or spilled by
+        # stop() if the worker is cancelled mid-batch.
+        self._pending: list[dict[str, Any]] = []
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._spill_seq = 0
+        self._last_replay_attempt = 0.0
+
+        self.rows_enqueued = 0
+        self.rows_flushed = 0
+        self.rows_spilled = 0
+        self.rows_replayed = 0
+        self.rows_dead_lettered = 0
+        self.flushes = 0
+        self.flush_failures = 0
+        self.last_flush_ms: float | None = None
+        self.max_flush_ms = 0.0
+        self._flush_ms_total = 0.0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, row: dict[str, Any]) -> None:
+        """Queue one row for the next batch. Never blocks, never raises.
+
+        Starts the worker lazily when called inside a running loop without a
+        prior ``start()`` (scripts/tests that mount the router directly).
+        """
+        self.rows_enqueued += 1
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self._spill([row])
+        with contextlib.suppress(RuntimeError):  # no running loop — stays queued
+            self.start()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the drain worker on the running loop. Idempotent."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        if self._loop is not None and self._loop is not loop:
+            # asyncio.Queue binds to the first loop that waits on it; carry
+            # buffered rows over to a fresh queue on the new loop.
+            fresh: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self._max_queue)
+            while not self._queue.empty():
+                fresh.put_nowait(self._queue.get_nowait())
+            self._queue = fresh
+        self._loop = loop
+        self._task = loop.create_task(self._run(), name=f"audit-sink-{self.name}")
+
+    async def stop(self) -> None:
+        """Cancel the worker, then write everything still buffered.
+
+        Rows that cannot be flushed are spilled, so a shutdown while the DB is
+        down loses nothing — they replay on the next process start.
+        """
+        if self._task is not None and self._loop is asyncio.get_running_loop():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        rows = self._pending
+        self._pending = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        for i in range(0, len(rows), self._batch_rows):
+            await self._flush(rows[i : i + self._batch_rows])
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        await self._replay()
+        while True:
+            got_rows = await self._collect()
+            if got_rows:
+                batch = self._pending
+                ok = await self._flush(batch)
+                self._pending = []
+                if ok:
+                    await self._replay()
+            elif time.monotonic() - self._last_replay_attempt >= self._replay_interval_s:
+                await self._replay()
+
+    async def _collect(self) -> bool:
+        """Fill ``self._pending`` up to ``batch_rows`` or until the flush
+        window closes. Returns False if the queue stayed empty for a whole
+        replay interval (idle tick)."""
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout=self._replay_interval_s)
+        except TimeoutError:
+            return False
+        self._pending.append(first)
+        deadline = time.monotonic() + self._flush_interval_s
+        while len(self._pending) < self._batch_rows:
+            while len(self._pending) < self._batch_rows and not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+            remaining = deadline - time.monotonic()
+            if len(self._pending) >= self._batch_rows or remaining <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except TimeoutError:
+                break
+            self._pending.append(row)
+        return True
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> bool:
+        """Write one batch; spill what failed transiently. Returns True when
+        nothing had to be spilled."""
+        if not batch:
+            return True
+        _, unsent = await self._write(batch)
+        if unsent:
+            self._spill(unsent)
+            return False
+        return True
+
+    async def _write(self, rows: list[dict[str, Any]]) -> tuple[int, list[dict[str, Any]]]:
+        """Send ``rows``; return (rows written, rows left unsent).
+
+        A permanent batch failure is retried row by row and rows that still
+        fail permanently are dead-lettered. A transient failure stops the
+        write: that row and everything after it come back unsent for the
+        caller to spill (flush) or keep in its segment (replay).
+        """
+        exc = await self._send(rows)
+        if exc is None:
+            return len(rows), []
+        if not self._is_permanent(exc):
+            self._log_transient(len(rows), exc)
+            return 0, rows
+        if len(rows) == 1:
+            self._dead_letter(rows, exc)
+            return 0, []
+        written = 0
+        for i, row in enumerate(rows):
+            exc = await self._send([row])
+            if exc is None:
+                written += 1
+            elif self._is_permanent(exc):
+                self._dead_letter([row], exc)
+            else:
+                self._log_transient(len(rows) - i, exc)
+                return written, rows[i:]
+        return written, []
+
+    async def _send(self, rows: list[dict[str, Any]]) -> Exception | None:
+        """One ``flush_fn`` call. Returns the exception instead of raising."""
+        start = time.perf_counter()
+        try:
+            await self._flush_fn(rows)
+        except Exception as exc:  # noqa: BLE001 — audit must not break the hot path
+            self.flush_failures += 1
+            return exc
+        self._record_flush(len(rows), (time.perf_counter() - start) * 1000)
+        return None
+
+    def _log_transient(self, rows: int, exc: Exception) -> None:
+        logger.warning(
+            "audit sink %s write of %d rows failed — keeping them for replay (non-fatal): %s",
+            self.name,
+            rows,
+            exc,
+        )
+
+    def _record_flush(self, rows: int, elapsed_ms: float) -> None:
+        self.flushes += 1
+        self.rows_flushed += rows
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._flush_ms_total += elapsed_ms
+
+    # ------------------------------------------------------------------
+    # Spill / replay
+    # ------------------------------------------------------------------
+
+    def _segments(self) -> list[Path]:
+        if not self._spill_dir.is_dir():
+            return []
+        return sorted(self._spill_dir.glob(f"{self.name}-*.jsonl"))
+
+    def _spill(self, rows: list[dict[str, Any]]) -> None:
+        """Append ``rows`` as a new JSONL segment. Names sort in write order."""
+        self._spill_seq += 1
+        path = self._spill_dir / f"{self.name}-{time.time_ns():020d}-{self._spill_seq:06d}.jsonl"
+        try:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as fh:
+                for row in rows:
+                    fh.write(json.dumps(row, default=str) + "\n")
+        except OSError as exc:
+            logger.error(
+                "audit sink %s spill of %d rows to %s failed — rows lost: %s",
+                self.name,
+                len(rows),
+                path,
+                exc,
+            )
+            return
+        self.rows_spilled += len(rows)
+
+    def _dead_letter(self, rows: list[Any], exc: BaseException) -> None:
+        """Append rows that can never be written, with the error, to
+        ``spill_dir/dead_letter/<name>.jsonl`` for manual inspection."""
+        path = self._spill_dir / DEAD_LETTER_SUBDIR / f"{self.name}.jsonl"
+        error = f"{type(exc).__name__}: {exc}"
+        failed_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        logger.error(
+            "audit sink %s dead-lettering %d rows (permanent failure): %s",
+            self.name,
+            len(rows),
+            error,
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as fh:
+                for row in rows:
+                    entry = {"failed_at": failed_at, "error": error, "row": row}
+                    fh.write(json.dumps(entry, default=str) + "\n")
+        except OSError as oserr:
+            logger.error(
+                "audit sink %s dead-letter write to %s failed — rows lost: %s",
+                self.name,
+                path,
+                oserr,
+            )
+            return
+        self.rows_dead_lettered += len(rows)
+
+    async def _replay(self) -> None:
+        """Re-send spilled segments oldest-first; stop at the first transient
+        failure.
+
+        A segment is deleted once every row is written or dead-lettered, so a
+        permanently bad row never blocks the segments behind it. If a
+        transient failure interrupts it, the unsent remainder is rewritten in
+        place so replayed rows are not sent twice.
+        """
+        self._last_replay_attempt = time.monotonic()
+        for path in self._segments():
+            try:
+                lines = path.read_text(encoding="utf-8").splitlines()
+            except OSError as exc:
+                logger.warning("audit sink %s cannot read %s: %s", self.name, path, exc)
+                return
+            rows: list[dict[str, Any]] = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except ValueError as exc:
+                    self._dead_letter([line], exc)
+            replayed = 0
+            for i in range(0, len(rows), self._batch_rows):
+                written, unsent = await self._write(rows[i : i + self._batch_rows])
+                replayed += written
+                self.rows_replayed += written
+                if unsent:
+                    tmp = path.with_suffix(".tmp")
+                    tmp.write_text(
+                        "".join(
+                            json.dumps(r, default=str) + "\n"
+                            for r in unsent + rows[i + self._batch_rows :]
+                        ),
+                        encoding="utf-8",
+                    )
+                    tmp.replace(path)
+                    return
+            path.unlink(missing_ok=True)
+            logger.info("audit sink %s replayed %d spilled rows from %s", self.name, replayed, path)
+
+    # ------------------------------------------------------------------
+    # Observability
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        """Counters + gauges for the dispatcher health endpoint."""
+        return {
+            "name": self.name,
+            "running": self._task is not None and not self._task.done(),
+            "queue_depth": self._queue.qsize(),
+            "queue_max": self._max_queue,
+            "rows_enqueued": self.rows_enqueued,
+            "rows_flushed": self.rows_flushed,
+            "rows_spilled": self.rows_spilled,
+            "rows_replayed": self.rows_replayed,
+            "rows_dead_lettered": self.rows_dead_lettered,
+            "spill_segments": len(self._segments()),
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "mean_flush_ms": self._flush_ms_total / self.flushes if self.flushes else None,
+        }
+
+
+__all__ = ["AuditSink", "FlushFn", "default_spill_dir", "is_permanent_error"]
@@ -7,6 +7,13 @@ Sits in front of LiteLLM (port 4000). On every model call:
   4. If all pass: forward to LiteLLM, log allow event
   5. If any fail: reject with structured error, log denial
 
+Steps 2 + 3 run as ONE atomic Lua call (``GATE_LUA``) — a single Valkey
+round trip on a long-lived client bound to the KEI-117A pool. The LiteLLM
+forward reuses one persistent ``httpx.AsyncClient`` opened/closed by the
+dispatcher lifespan (``open_clients`` / ``close_clients``) instead of a
+fresh client + connection per request. Audit rows go to a background
+``AuditSink`` that batches multi-row ``interceptor_events`` inserts.
+
 Acceptance (Linear KEI-210):
   - interceptor_proxy.py in src/dispatcher/ ✓
   - GET /interceptor/health → 200 OK
@@ -18,6 +25,7 @@ Acceptance (Linear KEI-210):
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import logging
 import os
@@ -29,7 +37,9 @@ from typing import Any, Final
 import httpx
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
+from redis.asyncio import Redis
 
+from src.dispatcher.audit_sink import AuditSink
 from src.dispatcher.governance_proxy import ProxyDecision, evaluate
 from src.dispatcher.valkey_pool import (
     get_valkey_client,
@@ -73,6 +83,27 @@ SPEND_NAMESPACE_PREFIX: Final = "spend"
 RATE_WINDOW_SECONDS: Final = 60
 LITELLM_URL_ENV: Final = "LITELLM_URL"
 DEFAULT_LITELLM_URL: Final = "http://127.0.0.1:4000/v1/chat/completions"
+LITELLM_TIMEOUT_SECONDS: Final = 30.0
+# Persistent forward pool — sized for concurrent model calls across the fleet.
+LITELLM_MAX_CONNECTIONS: Final = 100
+LITELLM_MAX_KEEPALIVE: Final = 20
+
+# Spend + rate gate in one atomic round trip.
+#   KEYS[1] = spend:<tenant>:<YYYY-MM>   KEYS[2] = rl:<tenant>:<window_start>
+#   ARGV[1] = spend budget (cents)       ARGV[2] = window TTL (seconds)
+# Returns {spent, count}. count = 0 means the spend check denied and the rate
+# bucket was NOT touched (a spend denial never consumes rate-limit budget).
+GATE_LUA: Final = """
+local spent = tonumber(redis.call('GET', KEYS[1]) or '0')
+if spent >= tonumber(ARGV[1]) then
+  return {spent, 0}
+end
+local count = redis.call('INCR', KEYS[2])
+if count == 1 then
+  redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return {spent, count}
+"""
 
 # Bounded-spawn discipline hook (Agency_OS-gcpm / Audit RED-7).
 # Off by default; production startup wires the enforcer accessor below.
@@ -205,48 +236,132 @@ def _spend_key(tenant_id: str, now: dt.datetime | None = None) -> str:
     return f"{SPEND_NAMESPACE_PREFIX}:{tenant_id}:{ts.strftime('%Y-%m')}"
 
 
-async def _check_spend_budget(tenant_id: str, tier: str) -> tuple[bool, int]:
-    """Return (allowed, spent_cents). Reads the monthly cumulative spend
-    counter from Valkey; missing key counts as 0. Caller is responsible for
-    incrementing after a successful forward via ``_accrue_spend``."""
-    budget = SPEND_BUDGET_AUD_CENTS.get(tier, 0)
-    client = get_valkey_client()
+# Long-lived hot-path clients. The Valkey client is bound to the process-wide
+# KEI-117A pool and never closed per request; the LiteLLM client is owned by
+# the dispatcher lifespan (lazy-created on first forward when no lifespan ran,
+# e.g. scripts and tests that mount the router directly).
+_valkey_client: Redis | None = None
+_http_client: httpx.AsyncClient | None = None
+_events_sink: AuditSink | None = None
+
+
+def _gate_client() -> Redis:
+    global _valkey_client  # noqa: PLW0603
+    if _valkey_client is None:
+        _valkey_client = get_valkey_client()
+    return _valkey_client
+
+
+def _http2_available() -> bool:
+    """httpx only negotiates HTTP/2 when the optional ``h2`` package is present."""
     try:
-        raw = await client.get(_spend_key(tenant_id))
-        spent = int(raw) if raw is not None else 0
-    finally:
-        await client.aclose()
-    return (spent < budget, spent)
+        import h2  # noqa: F401, PLC0415
+    except ImportError:
+        return False
+    return True
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    # HTTP/2 is negotiated via ALPN on https LiteLLM endpoints; the default
+    # loopback http:// URL stays on pooled keep-alive HTTP/1.1.
+    return httpx.AsyncClient(
+        timeout=LITELLM_TIMEOUT_SECONDS,
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=LITELLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LITELLM_MAX_KEEPALIVE,
+        ),
+    )
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    global _http_client  # noqa: PLW0603
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _new_http_client()
+    return _http_client
+
+
+def events_sink() -> AuditSink:
+    """Background writer for ``interceptor_events`` rows."""
+    global _events_sink  # noqa: PLW0603
+    if _events_sink is None:
+        _events_sink = AuditSink("interceptor_events", _insert_events)
+    return _events_sink
+
+
+async def open_clients() -> None:
+    """Lifespan startup: create the shared LiteLLM client + Valkey gate client
+    and start the ``interceptor_events`` audit sink.
+
+    Neither client opens a socket here — connections are minted on first use
+    and then kept alive for the life of the process.
+    """
+    _shared_http_client()
+    _gate_client()
+    events_sink().start()
+
+
+async def close_clients() -> None:
+    """Lifespan shutdown: drain the audit sink, close the shared LiteLLM
+    client and drop the Valkey client reference (the KEI-117A pool itself
+    outlives the interceptor)."""
+    global _http_client, _valkey_client  # noqa: PLW0603
+    if _events_sink is not None:
+        await _events_sink.stop()
+    if _http_client is not None:
+        try:
+            await _http_client.aclose()
+        except Exception as exc:  # noqa: BLE001 — teardown must not raise
+            logger.warning("interceptor http client aclose failed (non-fatal): %s", exc)
+        _http_client = None
+    _valkey_client = None
+
+
+@dataclass(frozen=True)
+class GateCheck:
+    """Result of the combined spend + rate-limit gate."""
+
+    spend_ok: bool
+    spent_cents: int
+    rate_ok: bool
+    count: int
+
 
+async def _check_gate(tenant_id: str, tier: str) -> GateCheck:
+    """Spend budget + per-minute rate limit in one atomic Valkey round trip.
 
-async def _check_rate_limit(tenant_id: str, tier: str) -> tuple[bool, int]:
-    """Return (allowed, count). Increments the per-minute bucket and applies
-    a 60s TTL on first write so old buckets auto-evict. Uses KEI-117A
-    ``tenant_rl_key`` so the namespace stays canonical."""
+    Reads the monthly cumulative spend counter (missing key counts as 0); if
+    the tenant is under budget, INCRs the KEI-117A ``tenant_rl_key`` bucket
+    and applies the 60s TTL on first write so old buckets auto-evict. A
+    spend denial leaves the rate bucket untouched. Caller increments spend
+    after a successful forward via ``_accrue_spend``.
+    """
+    budget = SPEND_BUDGET_AUD_CENTS.get(tier, 0)
     limit = RATE_LIMIT_PER_MINUTE.get(tier, 0)
-    if limit <= 0:
-        return (False, 0)
     bucket_start = int(time.time()) // RATE_WINDOW_SECONDS * RATE_WINDOW_SECONDS
-    key = tenant_rl_key(tenant_id, bucket_start)
-    client = get_valkey_client()
-    try:
-        count = await client.incr(key)
-        if count == 1:
-            await client.expire(key, RATE_WINDOW_SECONDS)
-    finally:
-        await client.aclose()
-    return (int(count) <= limit, int(count))
+    spent, count = await _gate_client().eval(
+        GATE_LUA,
+        2,
+        _spend_key(tenant_id),
+        tenant_rl_key(tenant_id, bucket_start),
+        budget,
+        RATE_WINDOW_SECONDS,
+    )
+    spent, count = int(spent), int(count)
+    spend_ok = spent < budget
+    return GateCheck(
+        spend_ok=spend_ok,
+        spent_cents=spent,
+        rate_ok=spend_ok and limit > 0 and count <= limit,
+        count=count,
+    )
 
 
 async def _accrue_spend(tenant_id: str, cost_cents_aud: int) -> None:
     """Bump the monthly spend counter after a successful forward."""
     if cost_cents_aud <= 0:
         return
-    client = get_valkey_client()
-    try:
-        await client.incrby(_spend_key(tenant_id), cost_cents_aud)
-    finally:
-        await client.aclose()
+    await _gate_client().incrby(_spend_key(tenant_id), cost_cents_aud)
 
 
 async def _log_event(
@@ -261,8 +376,8 @@ async def _log_event(
     insert_fn: Any | None = None,
 ) -> None:
     """Best-effort audit insert. ``insert_fn`` is injected for tests; real
-    callers leave it None and we'll resolve a Supabase client lazily so the
-    import surface doesn't pull supabase into unit tests."""
+    callers leave it None and the row is queued on the background audit sink,
+    which batches it into a multi-row Supabase insert off the request path."""
     row = {
         "id": str(uuid.uuid4()),
         "tenant_id": tenant_id,
@@ -273,32 +388,40 @@ async def _log_event(
         "output_tokens": output_tokens,
         "cost_cents_aud": cost_cents_aud,
         "latency_ms": latency_ms,
+        # Stamped here, not by the column default — the sink may write the
+        # row later (batch window, or replay after a spill).
+        "created_at": dt.datetime.now(dt.UTC).isoformat(),
     }
+    if insert_fn is None:
+        events_sink().enqueue(row)
+        return
     try:
-        if insert_fn is not None:
-            await insert_fn(row)
-            return
-        from src.integrations.supabase import get_supabase_service_client
-
-        client = get_supabase_service_client()
-        client.table("interceptor_events").insert(row).execute()
+        await insert_fn(row)
     except Exception as exc:  # noqa: BLE001 — audit must not break the hot path
         logger.warning("interceptor_events insert failed (non-fatal): %s", exc)
 
 
+async def _insert_events(rows: list[dict]) -> None:
+    """Audit-sink flush: one multi-row ``interceptor_events`` insert. The
+    Supabase client is synchronous, so it runs off the event loop. Raises on
+    failure so the sink spills the batch."""
+    from src.integrations.supabase import get_supabase_service_client
+
+    def _insert() -> None:
+        client = get_supabase_service_client()
+        client.table("interceptor_events").insert(rows).execute()
+
+    await asyncio.to_thread(_insert)
+
+
 async def _forward_to_litellm(payload: dict, http_client: httpx.AsyncClient | None = None) -> dict:
     """POST to LiteLLM and return the parsed JSON response. The client is
-    injectable for tests."""
+    injectable for tests; by default the shared keep-alive client is used."""
     url = os.environ.get(LITELLM_URL_ENV, DEFAULT_LITELLM_URL)
-    owns_client = http_client is None
-    client = http_client or httpx.AsyncClient(timeout=30.0)
-    try:
-        resp = await client.post(url, json=payload)
-        resp.raise_for_status()
-        return resp.json()
-    finally:
-        if owns_client:
-            await client.aclose()
+    client = http_client or _shared_http_client()
+    resp = await client.post(url, json=payload)
+    resp.raise_for_status()
+    return resp.json()
 
 
 # ---------------------------------------------------------------------------
@@ -370,8 +493,8 @@ async def intercept_request(
             payload={"error": "bounded_spawn_violation", "reason": bs_violation},
         )
 
-    spend_ok, _ = await _check_spend_budget(tenant_id, tier)
-    if not spend_ok:
+    gate = await _check_gate(tenant_id, tier)
+    if not gate.spend_ok:
         await _log_event(
             tenant_id,
             "deny_spend",
@@ -391,8 +514,7 @@ async def intercept_request(
             payload={"error": "spend_budget_exceeded", "tier": tier},
         )
 
-    rate_ok, _ = await _check_rate_limit(tenant_id, tier)
-    if not rate_ok:
+    if not gate.rate_ok:
         await _log_event(
             tenant_id,
             "deny_rate_limit",
@@ -541,9 +663,13 @@ async def forward(body: dict) -> JSONResponse:
 
 
 __all__ = [
+    "GateCheck",
     "InterceptorDecision",
     "RATE_LIMIT_PER_MINUTE",
     "SPEND_BUDGET_AUD_CENTS",
+    "close_clients",
+    "events_sink",
     "intercept_request",
+    "open_clients",
     "router",
 ]
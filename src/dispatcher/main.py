@@ -41,11 +41,14 @@ from src.dispatcher.concurrency_cap import N_TOTAL, ConcurrencyDecision, Concurr
 from src.dispatcher.container_lifecycle import ContainerStartupError, DockerUnavailableError
 from src.dispatcher.cost_breaker import BreakerDecision, CostBreaker
 from src.dispatcher.idempotency import IdempotencyDecision, IdempotencyGate
+from src.dispatcher.interceptor_proxy import close_clients as close_interceptor_clients
+from src.dispatcher.interceptor_proxy import events_sink as interceptor_events_sink
+from src.dispatcher.interceptor_proxy import open_clients as open_interceptor_clients
 from src.dispatcher.interceptor_proxy import router as interceptor_router
 from src.dispatcher.physical_ceiling import check_physical_ceiling
 from src.dispatcher.reaper import Reaper, _list_tmux_sessions
 from src.dispatcher.session_manager import Backend, SessionManager
-from src.dispatcher.spend_tracker import get_spend
+from src.dispatcher.spend_tracker import get_spend, spend_sink, start_audit_sink, stop_audit_sink
 from src.dispatcher.tmux_lifecycle import (
     SessionHandle,
     SessionStartupError,
@@ -653,13 +656,17 @@ async def _lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     _component_status["auth_minter"] = "ok"
     logger.info("KEI-213 auth_minter: DISPATCHER_JWT_SECRET present")
 
-    # Step 2 — interceptor_proxy (router already included; mark ready)
+    # Step 2 — interceptor_proxy (router already included; open the shared
+    # LiteLLM keep-alive client + Valkey gate client, then mark ready)
+    await open_interceptor_clients()
     _component_status["interceptor_proxy"] = "ok"
-    logger.info("KEI-213 interceptor_proxy: router mounted")
+    logger.info("KEI-213 interceptor_proxy: router mounted, shared clients open")
 
-    # Step 3 — spend_tracker (env confirmed by _validate_envs above)
+    # Step 3 — spend_tracker (env confirmed by _validate_envs above); start the
+    # batched infra_spend_metrics writer
+    await start_audit_sink()
     _component_status["spend_tracker"] = "ok"
-    logger.info("KEI-213 spend_tracker: SUPABASE_DB_DSN present")
+    logger.info("KEI-213 spend_tracker: SUPABASE_DB_DSN present, audit sink started")
 
     # Step 4 — watchdog background task
     _watchdog = Watchdog()
@@ -715,6 +722,8 @@ async def _lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
             task.cancel()
         await asyncio.gather(*background_tasks, return_exceptions=True)
         logger.info("KEI-213 dispatcher: background tasks cancelled cleanly")
+        await close_interceptor_clients()
+        await stop_audit_sink()
 
 
 # ---------------------------------------------------------------------------
@@ -755,6 +764,12 @@ async def dispatcher_health() -> dict[str, Any]:
 
     overall = "ok" if all(v == "ok" for v in _component_status.values()) else "degraded"
     result: dict[str, Any] = {"status": overall, "components": dict(_component_status)}
+    # Background audit writers — queue depth + flush latency. Spilled rows are
+    # not a health failure (they replay on DB recovery), so these stay advisory.
+    result["audit"] = {
+        "interceptor_events": interceptor_events_sink().metrics(),
+        "infra_spend_metrics": spend_sink().metrics(),
+    }
     # Raw supervisor snapshots — surfaces watchdog/reaper tracked counts so a
     # caller can see whether the supervisor loops track live work.
     if _watchdog is not None and _reaper is not None:
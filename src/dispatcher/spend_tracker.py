@@ -3,9 +3,11 @@
 Called by ``interceptor_proxy`` (KEI-210) on every model-call completion.
 Each ``record()`` call:
 
-1. Writes one row to ``public.infra_spend_metrics`` (Supabase) for billing
-   and audit. Fail-open: the Valkey side still runs even if the SQL leg
-   raises — counters must stay accurate for budget enforcement.
+1. Queues one row for ``public.infra_spend_metrics`` (Supabase) for billing
+   and audit. A background ``AuditSink`` writes queued rows as multi-row
+   inserts and spills them to local JSONL while the DB is unreachable.
+   Fail-open: the Valkey side never waits on the SQL leg — counters must
+   stay accurate for budget enforcement.
 2. Increments Valkey counters ``spend:<tenant_id>:daily`` and
    ``spend:<tenant_id>:monthly`` using ``INCRBY``. TTLs are set on the
    first write so the bucket auto-evicts at midnight UTC (daily) and
@@ -36,6 +38,7 @@ import time
 from datetime import UTC, datetime, timedelta
 from typing import Literal
 
+from src.dispatcher.audit_sink import AuditSink
 from src.dispatcher.valkey_pool import get_valkey_client
 
 logger = logging.getLogger(__name__)
@@ -168,41 +171,83 @@ async def _write_spend_row(
     cost_cents_aud: int,
     metadata: dict,
 ) -> bool:
-    """Insert one row into ``public.infra_spend_metrics``. Fail-open
-    (returns False on failure but never raises) so Valkey counters stay
+    """Queue one ``public.infra_spend_metrics`` row on the background audit
+    sink, which batches it into a multi-row insert. Fail-open (returns False
+    when the SQL leg is not configured, never raises) so Valkey counters stay
     accurate even when the SQL leg is degraded.
     """
-    dsn = os.environ.get(SUPABASE_DSN_ENV)
-    if not dsn:
+    if not os.environ.get(SUPABASE_DSN_ENV):
         logger.warning("SUPABASE_DB_DSN unset — skipping infra_spend_metrics write")
         return False
+    spend_sink().enqueue(
+        {
+            "tenant_id": tenant_id,
+            "callsign": callsign,
+            "model": model,
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "cost_cents_aud": cost_cents_aud,
+            "metadata": metadata,
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+    )
+    return True
+
+
+async def _insert_spend_rows(rows: list[dict]) -> None:
+    """Audit-sink flush: insert a batch into ``public.infra_spend_metrics``
+    with one ``INSERT ... SELECT FROM unnest(...)`` statement. Raises on
+    failure so the sink spills the batch for replay."""
+    import asyncpg  # noqa: PLC0415 — optional in some test envs
+
+    dsn = os.environ[SUPABASE_DSN_ENV].replace(_ASYNCPG_DSN_PREFIX, "")
+    conn = await asyncpg.connect(dsn)
     try:
-        import asyncpg  # noqa: PLC0415 — optional in some test envs
+        await conn.execute(
+            """
+            INSERT INTO public.infra_spend_metrics
+                (tenant_id, callsign, model, tokens_in, tokens_out,
+                 cost_cents_aud, metadata, created_at)
+            SELECT t, c, m, ti, tout, cc, md::jsonb, ca::timestamptz
+            FROM unnest(
+                $1::integer[], $2::text[], $3::text[], $4::integer[],
+                $5::integer[], $6::bigint[], $7::text[], $8::text[]
+            ) AS u(t, c, m, ti, tout, cc, md, ca)
+            """,
+            [r["tenant_id"] for r in rows],
+            [r["callsign"] for r in rows],
+            [r["model"] for r in rows],
+            [r["tokens_in"] for r in rows],
+            [r["tokens_out"] for r in rows],
+            [r["cost_cents_aud"] for r in rows],
+            [json.dumps(r["metadata"]) for r in rows],
+            [r["created_at"] for r in rows],
+        )
+    finally:
+        await conn.close()
 
-        dsn = dsn.replace(_ASYNCPG_DSN_PREFIX, "")
-        conn = await asyncpg.connect(dsn)
-        try:
-            await conn.execute(
-                """
-                INSERT INTO public.infra_spend_metrics
-                    (tenant_id, callsign, model, tokens_in, tokens_out,
-                     cost_cents_aud, metadata)
-                VALUES ($1, $2, $3, $4, $5, $6, $7::jsonb)
-                """,
-                tenant_id,
-                callsign,
-                model,
-                tokens_in,
-                tokens_out,
-                cost_cents_aud,
-                json.dumps(metadata),
-            )
-        finally:
-            await conn.close()
-        return True
-    except Exception as exc:  # noqa: BLE001 — Supabase degraded
-        logger.warning("infra_spend_metrics insert failed (non-fatal): %s", exc)
-        return False
+
+_spend_sink: AuditSink | None = None
+
+
+def spend_sink() -> AuditSink:
+    """Background writer for ``infra_spend_metrics`` rows."""
+    global _spend_sink  # noqa: PLW0603
+    if _spend_sink is None:
+        _spend_sink = AuditSink("infra_spend_metrics", _insert_spend_rows)
+    return _spend_sink
+
+
+async def start_audit_sink() -> None:
+    """Lifespan startup: start the ``infra_spend_metrics`` writer (replays
+    any rows spilled by a previous process)."""
+    spend_sink().start()
+
+
+async def stop_audit_sink() -> None:
+    """Lifespan shutdown: flush (or spill) every queued spend row."""
+    if _spend_sink is not None:
+        await _spend_sink.stop()
 
 
 async def _write_budget_warn_audit(
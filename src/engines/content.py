@@ -12,6 +12,7 @@ TASK: ENG-011, POOL-010
 DEPENDENCIES:
   - src/engines/base.py
   - src/integrations/anthropic.py
+  - src/integrations/anthropic_batch.py
   - src/models/lead.py
   - src/models/campaign.py
 RULES APPLIED:
@@ -25,12 +26,18 @@ PHASE 24A CHANGES:
   - Added generate_linkedin_for_pool for pool LinkedIn
   - Added generate_voice_for_pool for pool voice scripts
   - Pool methods work with dict data instead of Lead model
+  - generate_pool_content_batch runs email/SMS/LinkedIn pool generation
+    through the Message Batches API (resumable by batch id)
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 from uuid import UUID
 
+import httpx
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -48,6 +55,7 @@ from src.engines.smart_prompts import (
     generate_priority_guidance,
 )
 from src.exceptions import AISpendLimitError, ValidationError
+from src.integrations import anthropic_batch
 from src.integrations.anthropic import AnthropicClient, get_anthropic_client
 
 logger = logging.getLogger(__name__)
@@ -1125,56 +1133,93 @@ Return as JSON with: {{"opening": "...", "value_prop": "...", "cta": "..."}}"""
             EngineResult with email content
         """
         try:
-            # Build full pool lead context using Smart Prompt system
-            lead_context = await build_full_pool_lead_context(db, lead_pool_id, client_id)
+            prepared = await self._prepare_pool_email(
+                db, lead_pool_id, campaign_name, template, tone, client_id
+            )
+            if isinstance(prepared, EngineResult):
+                return prepared
 
-            if not lead_context:
-                return EngineResult.fail(
-                    error="Lead not found in pool",
-                    metadata={"lead_pool_id": str(lead_pool_id)},
-                )
+            # Generate content via AI
+            result = await self.anthropic.complete(**prepared["call"])
+            return await self._finish_pool_email(prepared, result)
 
-            # Validate minimum data
-            person = lead_context.get("person", {})
-            company = lead_context.get("company", {})
-            if not person.get("first_name") or not company.get("name"):
-                return EngineResult.fail(
-                    error="Lead must have at least first_name and company for personalization",
-                    metadata={"lead_pool_id": str(lead_pool_id)},
-                )
+        except AISpendLimitError as e:
+            return EngineResult.fail(
+                error=f"AI spend limit exceeded: {str(e)}",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+        except Exception as e:
+            return EngineResult.fail(
+                error=str(e),
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
 
-            # Get client proof points if client_id provided
-            proof_points = {}
-            if client_id:
-                proof_points = await build_client_proof_points(db, client_id)
+    async def _prepare_pool_email(
+        self,
+        db: AsyncSession,
+        lead_pool_id: UUID,
+        campaign_name: str,
+        template: str | None = None,
+        tone: str = "professional",
+        client_id: UUID | None = None,
+    ) -> dict[str, Any] | EngineResult[dict[str, Any]]:
+        """
+        Build the Smart Prompt request for a pool lead email.
 
-            # Format for prompt
-            lead_context_str = format_lead_context_for_prompt(lead_context)
-            proof_points_str = format_proof_points_for_prompt(proof_points)
+        Returns:
+            Prepared request ({"call": complete() kwargs, plus the context the
+            fact-check and fallback need}), or a failed EngineResult
+        """
+        # Build full pool lead context using Smart Prompt system
+        lead_context = await build_full_pool_lead_context(db, lead_pool_id, client_id)
 
-            # Build campaign context
-            campaign_context = f"""**Campaign:** {campaign_name}
+        if not lead_context:
+            return EngineResult.fail(
+                error="Lead not found in pool",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+        # Validate minimum data
+        person = lead_context.get("person", {})
+        company = lead_context.get("company", {})
+        if not person.get("first_name") or not company.get("name"):
+            return EngineResult.fail(
+                error="Lead must have at least first_name and company for personalization",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+        # Get client proof points if client_id provided
+        proof_points = {}
+        if client_id:
+            proof_points = await build_client_proof_points(db, client_id)
+
+        # Format for prompt
+        lead_context_str = format_lead_context_for_prompt(lead_context)
+        proof_points_str = format_proof_points_for_prompt(proof_points)
+
+        # Build campaign context
+        campaign_context = f"""**Campaign:** {campaign_name}
 **Tone:** {tone}
 {f"**Template Guidance:** {template}" if template else ""}"""
 
-            # Generate priority guidance for the prompt
-            priority_guidance_str = generate_priority_guidance(lead_context)
+        # Generate priority guidance for the prompt
+        priority_guidance_str = generate_priority_guidance(lead_context)
 
-            # Extract and format social posts
-            social_posts = lead_context.get("social_posts", {})
-            social_posts_str = format_social_posts_for_prompt(social_posts)
+        # Extract and format social posts
+        social_posts = lead_context.get("social_posts", {})
+        social_posts_str = format_social_posts_for_prompt(social_posts)
 
-            # Use Smart Email Prompt
-            prompt = SMART_EMAIL_PROMPT.format(
-                lead_context=lead_context_str,
-                proof_points=proof_points_str,
-                campaign_context=campaign_context,
-                priority_guidance=priority_guidance_str,
-                social_post_hooks=social_posts_str,
-            )
+        # Use Smart Email Prompt
+        prompt = SMART_EMAIL_PROMPT.format(
+            lead_context=lead_context_str,
+            proof_points=proof_points_str,
+            campaign_context=campaign_context,
+            priority_guidance=priority_guidance_str,
+            social_post_hooks=social_posts_str,
+        )
 
-            # System prompt (Item 41: Conservative instructions)
-            system = """You are an expert B2B sales copywriter. Generate cold emails that feel personal and human.
+        # System prompt (Item 41: Conservative instructions)
+        system = """You are an expert B2B sales copywriter. Generate cold emails that feel personal and human.
 
 CRITICAL RULES:
 1. ONLY reference facts explicitly provided in the lead context
@@ -1185,45 +1230,159 @@ CRITICAL RULES:
 
 Return valid JSON only with "subject" and "body" keys."""
 
-            # Generate content via AI
-            result = await self.anthropic.complete(
-                prompt=prompt,
-                system=system,
-                max_tokens=800,
-                temperature=0.7,
+        return {
+            "call": {
+                "prompt": prompt,
+                "system": system,
+                "max_tokens": 800,
+                "temperature": 0.7,
+            },
+            "lead_pool_id": lead_pool_id,
+            "campaign_name": campaign_name,
+            "tone": tone,
+            "lead_context": lead_context,
+            "proof_points": proof_points,
+        }
+
+    async def _finish_pool_email(
+        self,
+        prepared: dict[str, Any],
+        result: dict[str, Any],
+    ) -> EngineResult[dict[str, Any]]:
+        """
+        Parse, fact-check and, if needed, regenerate or fall back for one email.
+
+        Shared by generate_email_for_pool and generate_pool_content_batch.
+
+        Args:
+            prepared: Output of _prepare_pool_email
+            result: complete()-shaped generation result
+
+        Returns:
+            EngineResult with email content
+        """
+        lead_pool_id = prepared["lead_pool_id"]
+        campaign_name = prepared["campaign_name"]
+        tone = prepared["tone"]
+        lead_context = prepared["lead_context"]
+        proof_points = prepared["proof_points"]
+        prompt = prepared["call"]["prompt"]
+        system = prepared["call"]["system"]
+
+        # Parse JSON from response
+        import json
+
+        try:
+            content = result["content"]
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0]
+            elif "```" in content:
+                content = content.split("```")[1].split("```")[0]
+
+            generated = json.loads(content.strip())
+            subject = generated.get("subject", "")
+            body = generated.get("body", "")
+            generation_cost = result["cost_aud"]
+            total_cost = generation_cost
+
+            # ============================================
+            # ITEM 40: FACT-CHECK GATE (Pool Leads)
+            # ============================================
+            fact_check = await self._fact_check_content(
+                subject=subject,
+                body=body,
+                lead_context=lead_context,
             )
+            total_cost += fact_check.get("cost_aud", 0)
 
-            # Parse JSON from response
-            import json
+            # HIGH risk = immediate safe fallback
+            if fact_check["verdict"] == "FAIL" and fact_check.get("risk_level") == "HIGH":
+                logger.warning(
+                    f"Fact-check HIGH risk for pool lead {lead_pool_id}: {fact_check.get('unsupported_claims', [])}"
+                )
+                fallback = self._generate_safe_fallback(lead_context, campaign_name)
+                return EngineResult.ok(
+                    data={
+                        "subject": fallback["subject"],
+                        "body": fallback["body"],
+                        "lead_pool_id": str(lead_pool_id),
+                        "campaign_name": campaign_name,
+                        "personalization_used": ["first_name", "company"],
+                    },
+                    metadata={
+                        "cost_aud": total_cost,
+                        "tone": tone,
+                        "source": "lead_pool",
+                        "safe_fallback": True,
+                        "fact_check_failed": True,
+                    },
+                )
 
-            try:
-                content = result["content"]
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0]
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0]
+            # MEDIUM risk = regenerate once
+            if fact_check["verdict"] == "FAIL" and fact_check.get("risk_level") == "MEDIUM":
+                logger.info(f"Fact-check MEDIUM risk, regenerating for pool lead {lead_pool_id}")
 
-                generated = json.loads(content.strip())
-                subject = generated.get("subject", "")
-                body = generated.get("body", "")
-                generation_cost = result["cost_aud"]
-                total_cost = generation_cost
+                retry_prompt = (
+                    prompt
+                    + f"""
 
-                # ============================================
-                # ITEM 40: FACT-CHECK GATE (Pool Leads)
-                # ============================================
-                fact_check = await self._fact_check_content(
+## WARNING: Previous attempt had unsupported claims
+The following claims were NOT in the source data - do NOT include them:
+{chr(10).join(f"- {claim}" for claim in fact_check.get("unsupported_claims", []))}
+
+Generate a new email that ONLY uses verified facts from the lead context."""
+                )
+
+                retry_result = await self.anthropic.complete(
+                    prompt=retry_prompt,
+                    system=system,
+                    max_tokens=800,
+                    temperature=0.5,
+                )
+                total_cost += retry_result["cost_aud"]
+
+                # Parse retry result with error handling (G2 fix)
+                try:
+                    retry_content = retry_result["content"]
+                    if "```json" in retry_content:
+                        retry_content = retry_content.split("```json")[1].split("```")[0]
+                    elif "```" in retry_content:
+                        retry_content = retry_content.split("```")[1].split("```")[0]
+
+                    retry_generated = json.loads(retry_content.strip())
+                    subject = retry_generated.get("subject", "")
+                    body = retry_generated.get("body", "")
+                except (json.JSONDecodeError, IndexError) as e:
+                    # Retry JSON parsing failed - use safe fallback
+                    logger.warning(f"Retry JSON parse failed for pool lead {lead_pool_id}: {e}")
+                    fallback = self._generate_safe_fallback(lead_context, campaign_name)
+                    return EngineResult.ok(
+                        data={
+                            "subject": fallback["subject"],
+                            "body": fallback["body"],
+                            "lead_pool_id": str(lead_pool_id),
+                            "campaign_name": campaign_name,
+                            "personalization_used": ["first_name", "company"],
+                        },
+                        metadata={
+                            "cost_aud": total_cost,
+                            "tone": tone,
+                            "source": "lead_pool",
+                            "safe_fallback": True,
+                            "fact_check_retried": True,
+                            "retry_json_parse_failed": True,
+                        },
+                    )
+
+                retry_fact_check = await self._fact_check_content(
                     subject=subject,
                     body=body,
                     lead_context=lead_context,
                 )
-                total_cost += fact_check.get("cost_aud", 0)
+                total_cost += retry_fact_check.get("cost_aud", 0)
 
-                # HIGH risk = immediate safe fallback
-                if fact_check["verdict"] == "FAIL" and fact_check.get("risk_level") == "HIGH":
-                    logger.warning(
-                        f"Fact-check HIGH risk for pool lead {lead_pool_id}: {fact_check.get('unsupported_claims', [])}"
-                    )
+                if retry_fact_check["verdict"] == "FAIL":
+                    logger.warning(f"Fact-check failed twice for pool lead {lead_pool_id}")
                     fallback = self._generate_safe_fallback(lead_context, campaign_name)
                     return EngineResult.ok(
                         data={
@@ -1238,146 +1397,50 @@ Return valid JSON only with "subject" and "body" keys."""
                             "tone": tone,
                             "source": "lead_pool",
                             "safe_fallback": True,
+                            "fact_check_retried": True,
                             "fact_check_failed": True,
                         },
                     )
 
-                # MEDIUM risk = regenerate once
-                if fact_check["verdict"] == "FAIL" and fact_check.get("risk_level") == "MEDIUM":
-                    logger.info(
-                        f"Fact-check MEDIUM risk, regenerating for pool lead {lead_pool_id}"
-                    )
-
-                    retry_prompt = (
-                        prompt
-                        + f"""
-
-## WARNING: Previous attempt had unsupported claims
-The following claims were NOT in the source data - do NOT include them:
-{chr(10).join(f"- {claim}" for claim in fact_check.get("unsupported_claims", []))}
-
-Generate a new email that ONLY uses verified facts from the lead context."""
-                    )
-
-                    retry_result = await self.anthropic.complete(
-                        prompt=retry_prompt,
-                        system=system,
-                        max_tokens=800,
-                        temperature=0.5,
-                    )
-                    total_cost += retry_result["cost_aud"]
-
-                    # Parse retry result with error handling (G2 fix)
-                    try:
-                        retry_content = retry_result["content"]
-                        if "```json" in retry_content:
-                            retry_content = retry_content.split("```json")[1].split("```")[0]
-                        elif "```" in retry_content:
-                            retry_content = retry_content.split("```")[1].split("```")[0]
-
-                        retry_generated = json.loads(retry_content.strip())
-                        subject = retry_generated.get("subject", "")
-                        body = retry_generated.get("body", "")
-                    except (json.JSONDecodeError, IndexError) as e:
-                        # Retry JSON parsing failed - use safe fallback
-                        logger.warning(f"Retry JSON parse failed for pool lead {lead_pool_id}: {e}")
-                        fallback = self._generate_safe_fallback(lead_context, campaign_name)
-                        return EngineResult.ok(
-                            data={
-                                "subject": fallback["subject"],
-                                "body": fallback["body"],
-                                "lead_pool_id": str(lead_pool_id),
-                                "campaign_name": campaign_name,
-                                "personalization_used": ["first_name", "company"],
-                            },
-                            metadata={
-                                "cost_aud": total_cost,
-                                "tone": tone,
-                                "source": "lead_pool",
-                                "safe_fallback": True,
-                                "fact_check_retried": True,
-                                "retry_json_parse_failed": True,
-                            },
-                        )
-
-                    retry_fact_check = await self._fact_check_content(
-                        subject=subject,
-                        body=body,
-                        lead_context=lead_context,
-                    )
-                    total_cost += retry_fact_check.get("cost_aud", 0)
-
-                    if retry_fact_check["verdict"] == "FAIL":
-                        logger.warning(f"Fact-check failed twice for pool lead {lead_pool_id}")
-                        fallback = self._generate_safe_fallback(lead_context, campaign_name)
-                        return EngineResult.ok(
-                            data={
-                                "subject": fallback["subject"],
-                                "body": fallback["body"],
-                                "lead_pool_id": str(lead_pool_id),
-                                "campaign_name": campaign_name,
-                                "personalization_used": ["first_name", "company"],
-                            },
-                            metadata={
-                                "cost_aud": total_cost,
-                                "tone": tone,
-                                "source": "lead_pool",
-                                "safe_fallback": True,
-                                "fact_check_retried": True,
-                                "fact_check_failed": True,
-                            },
-                        )
-
-                # Fact-check passed
-                return EngineResult.ok(
-                    data={
-                        "subject": subject,
-                        "body": body,
-                        "lead_pool_id": str(lead_pool_id),
-                        "campaign_name": campaign_name,
-                        "personalization_used": self._extract_personalization_fields(lead_context),
-                    },
-                    metadata={
-                        "cost_aud": total_cost,
-                        "input_tokens": result["input_tokens"],
-                        "output_tokens": result["output_tokens"],
-                        "tone": tone,
-                        "source": "lead_pool",
-                        "smart_prompt": True,
-                        "has_proof_points": proof_points.get("available", False),
-                        "fact_check_verdict": fact_check["verdict"],
-                        "fact_check_risk": fact_check.get("risk_level", "LOW"),
-                    },
-                )
-            except json.JSONDecodeError:
-                logger.warning(f"JSON parse failed for pool lead {lead_pool_id}")
-                fallback = self._generate_safe_fallback(lead_context, campaign_name)
-                return EngineResult.ok(
-                    data={
-                        "subject": fallback["subject"],
-                        "body": fallback["body"],
-                        "lead_pool_id": str(lead_pool_id),
-                        "campaign_name": campaign_name,
-                        "personalization_used": ["first_name", "company"],
-                    },
-                    metadata={
-                        "cost_aud": result["cost_aud"],
-                        "tone": tone,
-                        "source": "lead_pool",
-                        "safe_fallback": True,
-                        "json_parse_failed": True,
-                    },
-                )
-
-        except AISpendLimitError as e:
-            return EngineResult.fail(
-                error=f"AI spend limit exceeded: {str(e)}",
-                metadata={"lead_pool_id": str(lead_pool_id)},
+            # Fact-check passed
+            return EngineResult.ok(
+                data={
+                    "subject": subject,
+                    "body": body,
+                    "lead_pool_id": str(lead_pool_id),
+                    "campaign_name": campaign_name,
+                    "personalization_used": self._extract_personalization_fields(lead_context),
+                },
+                metadata={
+                    "cost_aud": total_cost,
+                    "input_tokens": result["input_tokens"],
+                    "output_tokens": result["output_tokens"],
+                    "tone": tone,
+                    "source": "lead_pool",
+                    "smart_prompt": True,
+                    "has_proof_points": proof_points.get("available", False),
+                    "fact_check_verdict": fact_check["verdict"],
+                    "fact_check_risk": fact_check.get("risk_level", "LOW"),
+                },
             )
-        except Exception as e:
-            return EngineResult.fail(
-                error=str(e),
-                metadata={"lead_pool_id": str(lead_pool_id)},
+        except json.JSONDecodeError:
+            logger.warning(f"JSON parse failed for pool lead {lead_pool_id}")
+            fallback = self._generate_safe_fallback(lead_context, campaign_name)
+            return EngineResult.ok(
+                data={
+                    "subject": fallback["subject"],
+                    "body": fallback["body"],
+                    "lead_pool_id": str(lead_pool_id),
+                    "campaign_name": campaign_name,
+                    "personalization_used": ["first_name", "company"],
+                },
+                metadata={
+                    "cost_aud": result["cost_aud"],
+                    "tone": tone,
+                    "source": "lead_pool",
+                    "safe_fallback": True,
+                    "json_parse_failed": True,
+                },
             )
 
     async def generate_sms_for_pool(
@@ -1402,26 +1465,52 @@ Generate a new email that ONLY uses verified facts from the lead context."""
             EngineResult with SMS content
         """
         try:
-            pool_lead = await self._get_pool_lead(db, lead_pool_id)
-            if not pool_lead:
-                return EngineResult.fail(
-                    error="Lead not found in pool",
-                    metadata={"lead_pool_id": str(lead_pool_id)},
-                )
+            prepared = await self._prepare_pool_sms(db, lead_pool_id, campaign_name, template)
+            if isinstance(prepared, EngineResult):
+                return prepared
 
-            first_name = pool_lead.get("first_name")
-            if not first_name:
-                return EngineResult.fail(
-                    error="Lead must have first_name for personalization",
-                    metadata={"lead_pool_id": str(lead_pool_id)},
-                )
+            result = await self.anthropic.complete(**prepared["call"])
+            return await self._finish_pool_sms(prepared, result)
 
-            system = """You are an expert at writing concise, effective SMS messages.
+        except AISpendLimitError as e:
+            return EngineResult.fail(
+                error=f"AI spend limit exceeded: {str(e)}",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+        except Exception as e:
+            return EngineResult.fail(
+                error=str(e),
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+    async def _prepare_pool_sms(
+        self,
+        db: AsyncSession,
+        lead_pool_id: UUID,
+        campaign_name: str,
+        template: str | None = None,
+    ) -> dict[str, Any] | EngineResult[dict[str, Any]]:
+        """Build the SMS request for a pool lead, or a failed EngineResult."""
+        pool_lead = await self._get_pool_lead(db, lead_pool_id)
+        if not pool_lead:
+            return EngineResult.fail(
+                error="Lead not found in pool",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+        first_name = pool_lead.get("first_name")
+        if not first_name:
+            return EngineResult.fail(
+                error="Lead must have first_name for personalization",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+        system = """You are an expert at writing concise, effective SMS messages.
 SMS messages MUST be under 160 characters.
 Be direct and personable.
 Include a clear call to action."""
 
-            prompt = f"""Generate a personalized SMS for:
+        prompt = f"""Generate a personalized SMS for:
 
 - Name: {first_name}
 - Company: {pool_lead.get("company_name", "their company")}
@@ -1431,42 +1520,41 @@ Campaign: {campaign_name}
 
 Return ONLY the SMS text (max 160 characters). No JSON, no formatting."""
 
-            result = await self.anthropic.complete(
-                prompt=prompt,
-                system=system,
-                max_tokens=100,
-                temperature=0.7,
-            )
-
-            message = result["content"].strip()
-            if len(message) > 160:
-                message = message[:157] + "..."
-
-            return EngineResult.ok(
-                data={
-                    "message": message,
-                    "lead_pool_id": str(lead_pool_id),
-                    "campaign_name": campaign_name,
-                },
-                metadata={
-                    "cost_aud": result["cost_aud"],
-                    "input_tokens": result["input_tokens"],
-                    "output_tokens": result["output_tokens"],
-                    "length": len(message),
-                    "source": "lead_pool",
-                },
-            )
+        return {
+            "call": {
+                "prompt": prompt,
+                "system": system,
+                "max_tokens": 100,
+                "temperature": 0.7,
+            },
+            "lead_pool_id": lead_pool_id,
+            "campaign_name": campaign_name,
+        }
 
-        except AISpendLimitError as e:
-            return EngineResult.fail(
-                error=f"AI spend limit exceeded: {str(e)}",
-                metadata={"lead_pool_id": str(lead_pool_id)},
-            )
-        except Exception as e:
-            return EngineResult.fail(
-                error=str(e),
-                metadata={"lead_pool_id": str(lead_pool_id)},
-            )
+    async def _finish_pool_sms(
+        self,
+        prepared: dict[str, Any],
+        result: dict[str, Any],
+    ) -> EngineResult[dict[str, Any]]:
+        """Trim a generated SMS to 160 characters and wrap it in an EngineResult."""
+        message = result["content"].strip()
+        if len(message) > 160:
+            message = message[:157] + "..."
+
+        return EngineResult.ok(
+            data={
+                "message": message,
+                "lead_pool_id": str(prepared["lead_pool_id"]),
+                "campaign_name": prepared["campaign_name"],
+            },
+            metadata={
+                "cost_aud": result["cost_aud"],
+                "input_tokens": result["input_tokens"],
+                "output_tokens": result["output_tokens"],
+                "length": len(message),
+                "source": "lead_pool",
+            },
+        )
 
     async def generate_linkedin_for_pool(
         self,
@@ -1492,32 +1580,61 @@ Return ONLY the SMS text (max 160 characters). No JSON, no formatting."""
             EngineResult with LinkedIn message
         """
         try:
-            pool_lead = await self._get_pool_lead(db, lead_pool_id)
-            if not pool_lead:
-                return EngineResult.fail(
-                    error="Lead not found in pool",
-                    metadata={"lead_pool_id": str(lead_pool_id)},
-                )
+            prepared = await self._prepare_pool_linkedin(
+                db, lead_pool_id, campaign_name, template, message_type
+            )
+            if isinstance(prepared, EngineResult):
+                return prepared
 
-            first_name = pool_lead.get("first_name")
-            if not first_name:
-                return EngineResult.fail(
-                    error="Lead must have first_name for personalization",
-                    metadata={"lead_pool_id": str(lead_pool_id)},
-                )
+            result = await self.anthropic.complete(**prepared["call"])
+            return await self._finish_pool_linkedin(prepared, result)
 
-            if message_type == "connection":
-                system = """You are an expert at writing LinkedIn connection requests.
+        except AISpendLimitError as e:
+            return EngineResult.fail(
+                error=f"AI spend limit exceeded: {str(e)}",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+        except Exception as e:
+            return EngineResult.fail(
+                error=str(e),
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+    async def _prepare_pool_linkedin(
+        self,
+        db: AsyncSession,
+        lead_pool_id: UUID,
+        campaign_name: str,
+        template: str | None = None,
+        message_type: str = "connection",
+    ) -> dict[str, Any] | EngineResult[dict[str, Any]]:
+        """Build the LinkedIn request for a pool lead, or a failed EngineResult."""
+        pool_lead = await self._get_pool_lead(db, lead_pool_id)
+        if not pool_lead:
+            return EngineResult.fail(
+                error="Lead not found in pool",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+        first_name = pool_lead.get("first_name")
+        if not first_name:
+            return EngineResult.fail(
+                error="Lead must have first_name for personalization",
+                metadata={"lead_pool_id": str(lead_pool_id)},
+            )
+
+        if message_type == "connection":
+            system = """You are an expert at writing LinkedIn connection requests.
 Connection requests are limited to 300 characters.
 Be professional but personable."""
-                max_length = 300
-            else:
-                system = """You are an expert at writing LinkedIn InMail messages.
+            max_length = 300
+        else:
+            system = """You are an expert at writing LinkedIn InMail messages.
 Keep messages under 200 words.
 Be professional and value-focused."""
-                max_length = 1000
+            max_length = 1000
 
-            prompt = f"""Generate a personalized LinkedIn {message_type} message for:
+        prompt = f"""Generate a personalized LinkedIn {message_type} message for:
 
 - Name: {first_name} {pool_lead.get("last_name", "")}
 - Title: {pool_lead.get("title", "")}
@@ -1528,43 +1645,225 @@ Campaign: {campaign_name}
 
 Return ONLY the message text. No JSON, no formatting."""
 
-            result = await self.anthropic.complete(
-                prompt=prompt,
-                system=system,
-                max_tokens=400,
-                temperature=0.7,
-            )
+        return {
+            "call": {
+                "prompt": prompt,
+                "system": system,
+                "max_tokens": 400,
+                "temperature": 0.7,
+            },
+            "lead_pool_id": lead_pool_id,
+            "campaign_name": campaign_name,
+            "message_type": message_type,
+            "max_length": max_length,
+        }
 
-            message = result["content"].strip()
-            if len(message) > max_length:
-                message = message[: max_length - 3] + "..."
+    async def _finish_pool_linkedin(
+        self,
+        prepared: dict[str, Any],
+        result: dict[str, Any],
+    ) -> EngineResult[dict[str, Any]]:
+        """Trim a generated LinkedIn message to its type's limit and wrap it."""
+        max_length = prepared["max_length"]
+        message = result["content"].strip()
+        if len(message) > max_length:
+            message = message[: max_length - 3] + "..."
+
+        return EngineResult.ok(
+            data={
+                "message": message,
+                "message_type": prepared["message_type"],
+                "lead_pool_id": str(prepared["lead_pool_id"]),
+                "campaign_name": prepared["campaign_name"],
+            },
+            metadata={
+                "cost_aud": result["cost_aud"],
+                "input_tokens": result["input_tokens"],
+                "output_tokens": result["output_tokens"],
+                "length": len(message),
+                "source": "lead_pool",
+            },
+        )
 
-            return EngineResult.ok(
-                data={
-                    "message": message,
-                    "message_type": message_type,
-                    "lead_pool_id": str(lead_pool_id),
-                    "campaign_name": campaign_name,
-                },
-                metadata={
-                    "cost_aud": result["cost_aud"],
-                    "input_tokens": result["input_tokens"],
-                    "output_tokens": result["output_tokens"],
-                    "length": len(message),
-                    "source": "lead_pool",
-                },
-            )
+    # ============================================
+    # Bulk pool generation (Message Batches API)
+    # ============================================
 
-        except AISpendLimitError as e:
-            return EngineResult.fail(
-                error=f"AI spend limit exceeded: {str(e)}",
-                metadata={"lead_pool_id": str(lead_pool_id)},
-            )
-        except Exception as e:
+    async def generate_pool_content_batch(
+        self,
+        db: AsyncSession,
+        channel: str,
+        items: list[dict[str, Any]],
+        batch_id: str | None = None,
+        model: str = "claude-3-5-haiku-20241022",
+        poll_interval: float = anthropic_batch.POLL_INTERVAL_S,
+        max_wait_s: float = anthropic_batch.POLL_MAX_S,
+        concurrency: int = 8,
+        on_submitted: Callable[[str], Awaitable[None]] | None = None,
+        on_result: Callable[[str, EngineResult], Awaitable[None]] | None = None,
+    ) -> EngineResult[dict[str, Any]]:
+        """
+        Generate pool content for many assignments through one Message Batch.
+
+        Prompts are built exactly as in generate_{channel}_for_pool and each
+        result goes through the same parse/fact-check/fallback path; only the
+        first generation moves to the batch (half price, no per-lead round
+        trip). Requests the batch did not complete fall back to complete().
+
+        Resuming: persist the id passed to ``on_submitted`` and call again with
+        the same items and ``batch_id`` to collect results without resubmitting.
+        Spend is booked once per batch result, so a resume that collects
+        results an earlier run already settled does not bill them again (their
+        ``cost_aud`` is 0.0). Batch HTTP failures return a failed result whose
+        metadata says whether the batch can be resumed.
+
+        Args:
+            db: Database session (passed by caller)
+            channel: "email", "sms" or "linkedin"
+            items: One dict per assignment: ``assignment_id`` plus the keyword
+                arguments of the matching single-lead method (minus ``db``)
+            batch_id: Existing batch to resume instead of submitting
+            model: Model for the batch and for interactive fallbacks
+            poll_interval: Seconds between status polls
+            max_wait_s: Give up waiting after this long (batch keeps running)
+            concurrency: Results finished (fact-checked) at once
+            on_submitted: Awaited with the new batch id before polling
+            on_result: Awaited with (assignment_id, EngineResult) per assignment
+
+        Returns:
+            EngineResult with {"batch_id", "channel", "results": {assignment_id: EngineResult}}
+        """
+        stages = {
+            "email": (self._prepare_pool_email, self._finish_pool_email),
+            "sms": (self._prepare_pool_sms, self._finish_pool_sms),
+            "linkedin": (self._prepare_pool_linkedin, self._finish_pool_linkedin),
+        }
+        if channel not in stages:
             return EngineResult.fail(
-                error=str(e),
-                metadata={"lead_pool_id": str(lead_pool_id)},
+                error=f"Unsupported batch channel: {channel}",
+                metadata={"channel": channel},
             )
+        prepare, finish = stages[channel]
+
+        results: dict[str, EngineResult] = {}
+
+        async def record(custom_id: str, result: EngineResult) -> None:
+            results[custom_id] = result
+            if on_result is not None:
+                await on_result(custom_id, result)
+
+        # Prompts are built serially: they share the caller's session
+        prepared: dict[str, dict[str, Any]] = {}
+        for item in items:
+            kwargs = dict(item)
+            custom_id = str(kwargs.pop("assignment_id"))
+            try:
+                outcome = await prepare(db, **kwargs)
+            except Exception as e:
+                outcome = EngineResult.fail(
+                    error=str(e),
+                    metadata={"lead_pool_id": str(kwargs.get("lead_pool_id"))},
+                )
+            if isinstance(outcome, EngineResult):
+                await record(custom_id, outcome)
+            else:
+                prepared[custom_id] = outcome
+
+        resumed = batch_id is not None
+        if prepared and batch_id is None:
+            requests = {
+                custom_id: self.anthropic.message_params(**p["call"], model=model)
+                for custom_id, p in prepared.items()
+            }
+            try:
+                await self.anthropic.check_batch_budget(list(requests.values()))
+            except AISpendLimitError as e:
+                return EngineResult.fail(
+                    error=f"AI spend limit exceeded: {str(e)}",
+                    metadata={"channel": channel, "requests": len(requests)},
+                )
+            try:
+                batch_id = await asyncio.to_thread(
+                    anthropic_batch.create_batch,
+                    [{"custom_id": cid, "params": params} for cid, params in requests.items()],
+                    model,
+                )
+            except (anthropic_batch.AnthropicBatchError, httpx.HTTPError, ValueError) as e:
+                return EngineResult.fail(
+                    error=f"Batch submission failed: {e}",
+                    metadata={"batch_id": None, "channel": channel, "resumable": False},
+                )
+            if on_submitted is not None:
+                await on_submitted(batch_id)
+
+        entries: dict[str, dict[str, Any]] = {}
+        if prepared:
+            deadline = time.monotonic() + max_wait_s
+            try:
+                while True:
+                    status = await asyncio.to_thread(anthropic_batch.poll_batch, batch_id)
+                    if status.get("processing_status") in anthropic_batch.TERMINAL_STATUSES:
+                        break
+                    if time.monotonic() > deadline:
+                        return EngineResult.fail(
+                            error=f"Batch {batch_id} still {status.get('processing_status')}",
+                            metadata={"batch_id": batch_id, "channel": channel, "resumable": True},
+                        )
+                    await asyncio.sleep(poll_interval)
+                for entry in await asyncio.to_thread(anthropic_batch.get_results, batch_id):
+                    entries[entry.get("custom_id")] = entry
+            except (anthropic_batch.AnthropicBatchError, httpx.HTTPError, ValueError) as e:
+                return EngineResult.fail(
+                    error=f"Batch {batch_id} collection failed: {e}",
+                    metadata={
+                        "batch_id": batch_id,
+                        "channel": channel,
+                        "resumable": batch_id is not None,
+                    },
+                )
+
+        interactive = 0
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def settle(custom_id: str, request: dict[str, Any]) -> None:
+            nonlocal interactive
+            async with semaphore:
+                try:
+                    completion = None
+                    if custom_id in entries:
+                        completion = await self.anthropic.batch_result(
+                            entries[custom_id], batch_id=batch_id
+                        )
+                    if completion is None:
+                        interactive += 1
+                        completion = await self.anthropic.complete(**request["call"], model=model)
+                    outcome = await finish(request, completion)
+                except AISpendLimitError as e:
+                    outcome = EngineResult.fail(
+                        error=f"AI spend limit exceeded: {str(e)}",
+                        metadata={"lead_pool_id": str(request["lead_pool_id"])},
+                    )
+                except Exception as e:
+                    outcome = EngineResult.fail(
+                        error=str(e),
+                        metadata={"lead_pool_id": str(request["lead_pool_id"])},
+                    )
+                await record(custom_id, outcome)
+
+        await asyncio.gather(*(settle(cid, p) for cid, p in prepared.items()))
+
+        succeeded = sum(1 for r in results.values() if r.success)
+        return EngineResult.ok(
+            data={"batch_id": batch_id, "channel": channel, "results": results},
+            metadata={
+                "requests": len(prepared),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "interactive_fallback": interactive,
+                "resumed": resumed,
+                "cost_aud": sum(r.metadata.get("cost_aud", 0) for r in results.values()),
+            },
+        )
 
     async def generate_voice_for_pool(
         self,
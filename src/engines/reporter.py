@@ -14,6 +14,7 @@ DEPENDENCIES:
   - src/models/activity.py
   - src/models/campaign.py
   - src/models/lead.py
+  - src/services/activity_rollup_service.py
 RULES APPLIED:
   - Rule 1: Follow blueprint exactly
   - Rule 11: Session passed as argument
@@ -32,6 +33,19 @@ from src.engines.base import BaseEngine, EngineResult
 from src.models.activity import Activity
 from src.models.campaign import Campaign
 from src.models.lead import Lead
+from src.services.activity_rollup_service import fetch_activity_counts
+
+# Activity actions tallied into campaign/client metrics
+TRACKED_ACTIONS = (
+    "sent",
+    "delivered",
+    "opened",
+    "clicked",
+    "replied",
+    "bounced",
+    "unsubscribed",
+    "converted",
+)
 
 
 class ReporterEngine(BaseEngine):
@@ -82,16 +96,9 @@ class ReporterEngine(BaseEngine):
             if not start_date:
                 start_date = end_date - timedelta(days=30)
 
-            # Get all activities for campaign in date range
-            activities_query = select(Activity).where(
-                and_(
-                    Activity.campaign_id == campaign_id,
-                    func.date(Activity.created_at) >= start_date,
-                    func.date(Activity.created_at) <= end_date,
-                )
-            )
-            result = await db.execute(activities_query)
-            activities = result.scalars().all()
+            # Activity counts in date range (rollup + un-folded tail)
+            counts = await fetch_activity_counts(db, start_date, end_date, campaign_id=campaign_id)
+            activities_count = sum(row.count for row in counts)
 
             # Calculate metrics by channel
             metrics = {
@@ -102,61 +109,17 @@ class ReporterEngine(BaseEngine):
                     "end": end_date.isoformat(),
                 },
                 "channels": {},
-                "overall": {
-                    "total_sent": 0,
-                    "total_delivered": 0,
-                    "total_opened": 0,
-                    "total_clicked": 0,
-                    "total_replied": 0,
-                    "total_bounced": 0,
-                    "total_unsubscribed": 0,
-                    "total_converted": 0,
-                },
+                "overall": {f"total_{action}": 0 for action in TRACKED_ACTIONS},
             }
 
-            # Group activities by channel
-            for activity in activities:
-                channel = activity.channel.value
-                action = activity.action
-
-                # Initialize channel metrics if needed
-                if channel not in metrics["channels"]:
-                    metrics["channels"][channel] = {
-                        "sent": 0,
-                        "delivered": 0,
-                        "opened": 0,
-                        "clicked": 0,
-                        "replied": 0,
-                        "bounced": 0,
-                        "unsubscribed": 0,
-                        "converted": 0,
-                    }
-
-                # Count actions
-                if action == "sent":
-                    metrics["channels"][channel]["sent"] += 1
-                    metrics["overall"]["total_sent"] += 1
-                elif action == "delivered":
-                    metrics["channels"][channel]["delivered"] += 1
-                    metrics["overall"]["total_delivered"] += 1
-                elif action == "opened":
-                    metrics["channels"][channel]["opened"] += 1
-                    metrics["overall"]["total_opened"] += 1
-                elif action == "clicked":
-                    metrics["channels"][channel]["clicked"] += 1
-                    metrics["overall"]["total_clicked"] += 1
-                elif action == "replied":
-                    metrics["channels"][channel]["replied"] += 1
-                    metrics["overall"]["total_replied"] += 1
-                elif action == "bounced":
-                    metrics["channels"][channel]["bounced"] += 1
-                    metrics["overall"]["total_bounced"] += 1
-                elif action == "unsubscribed":
-                    metrics["channels"][channel]["unsubscribed"] += 1
-                    metrics["overall"]["total_unsubscribed"] += 1
-                elif action == "converted":
-                    metrics["channels"][channel]["converted"] += 1
-                    metrics["overall"]["total_converted"] += 1
+            # Group counts by channel
+            for row in counts:
+                channel_stats = metrics["channels"].setdefault(
+                    row.channel, dict.fromkeys(TRACKED_ACTIONS, 0)
+                )
+                if row.action in channel_stats:
+                    channel_stats[row.action] += row.count
+                    metrics["overall"][f"total_{row.action}"] += row.count
 
             # Calculate rates for each channel
             for channel, stats in metrics["channels"].items():
@@ -217,7 +180,7 @@ class ReporterEngine(BaseEngine):
             return EngineResult.ok(
                 data=metrics,
                 metadata={
-                    "activities_count": len(activities),
+                    "activities_count": activities_count,
                     "channels_used": list(metrics["channels"].keys()),
                 },
             )
@@ -270,16 +233,9 @@ class ReporterEngine(BaseEngine):
             campaigns_result = await db.execute(campaigns_query)
             campaigns = campaigns_result.scalars().all()
 
-            # Get all activities for client in date range
-            activities_query = select(Activity).where(
-                and_(
-                    Activity.client_id == client_id,
-                    func.date(Activity.created_at) >= start_date,
-                    func.date(Activity.created_at) <= end_date,
-                )
-            )
-            result = await db.execute(activities_query)
-            activities = result.scalars().all()
+            # Activity counts in date range (rollup + un-folded tail)
+            counts = await fetch_activity_counts(db, start_date, end_date, client_id=client_id)
+            activities_count = sum(row.count for row in counts)
 
             # Calculate overall metrics
             metrics = {
@@ -291,54 +247,22 @@ class ReporterEngine(BaseEngine):
                 },
                 "campaigns_count": len(campaigns),
                 "campaigns": [],
-                "overall": {
-                    "total_sent": 0,
-                    "total_delivered": 0,
-                    "total_opened": 0,
-                    "total_clicked": 0,
-                    "total_replied": 0,
-                    "total_bounced": 0,
-                    "total_unsubscribed": 0,
-                    "total_converted": 0,
-                },
+                "overall": {f"total_{action}": 0 for action in TRACKED_ACTIONS},
                 "by_channel": {},
             }
 
-            # Aggregate activities
-            for activity in activities:
-                channel = activity.channel.value
-                action = activity.action
-
-                # Initialize channel if needed
-                if channel not in metrics["by_channel"]:
-                    metrics["by_channel"][channel] = {
-                        "sent": 0,
-                        "delivered": 0,
-                        "replied": 0,
-                        "converted": 0,
-                    }
-
-                # Count actions
-                if action == "sent":
-                    metrics["overall"]["total_sent"] += 1
-                    metrics["by_channel"][channel]["sent"] += 1
-                elif action == "delivered":
-                    metrics["overall"]["total_delivered"] += 1
-                    metrics["by_channel"][channel]["delivered"] += 1
-                elif action == "opened":
-                    metrics["overall"]["total_opened"] += 1
-                elif action == "clicked":
-                    metrics["overall"]["total_clicked"] += 1
-                elif action == "replied":
-                    metrics["overall"]["total_replied"] += 1
-                    metrics["by_channel"][channel]["replied"] += 1
-                elif action == "bounced":
-                    metrics["overall"]["total_bounced"] += 1
-                elif action == "unsubscribed":
-                    metrics["overall"]["total_unsubscribed"] += 1
-                elif action == "converted":
-                    metrics["overall"]["total_converted"] += 1
-                    metrics["by_channel"][channel]["converted"] += 1
+            # Aggregate counts
+            by_campaign: dict[UUID, dict[str, int]] = {}
+            for row in counts:
+                channel_stats = metrics["by_channel"].setdefault(
+                    row.channel, {"sent": 0, "delivered": 0, "replied": 0, "converted": 0}
+                )
+                if row.action in TRACKED_ACTIONS:
+                    metrics["overall"][f"total_{row.action}"] += row.count
+                if row.action in channel_stats:
+                    channel_stats[row.action] += row.count
+                campaign_counts = by_campaign.setdefault(row.campaign_id, {})
+                campaign_counts[row.action] = campaign_counts.get(row.action, 0) + row.count
 
             # Calculate rates
             overall = metrics["overall"]
@@ -360,10 +284,10 @@ class ReporterEngine(BaseEngine):
 
             # Get per-campaign summary
             for campaign in campaigns:
-                campaign_activities = [a for a in activities if a.campaign_id == campaign.id]
-                sent_count = sum(1 for a in campaign_activities if a.action == "sent")
-                replied_count = sum(1 for a in campaign_activities if a.action == "replied")
-                converted_count = sum(1 for a in campaign_activities if a.action == "converted")
+                campaign_counts = by_campaign.get(campaign.id, {})
+                sent_count = campaign_counts.get("sent", 0)
+                replied_count = campaign_counts.get("replied", 0)
+                converted_count = campaign_counts.get("converted", 0)
 
                 metrics["campaigns"].append(
                     {
@@ -380,7 +304,7 @@ class ReporterEngine(BaseEngine):
             return EngineResult.ok(
                 data=metrics,
                 metadata={
-                    "activities_count": len(activities),
+                    "activities_count": activities_count,
                     "channels_used": list(metrics["by_channel"].keys()),
                 },
             )
@@ -49,14 +49,26 @@ PHASE 24A+ CHANGES (LinkedIn Enrichment):
   - Boosts score when company has posts, high followers
   - Max LinkedIn boost: 10 points
   - Uses linkedin_person_data and linkedin_company_data from lead_assignments
+COLUMNAR BATCH SCORING:
+  - score_batch / score_pool_batch accept columnar=True
+  - Rows and boost inputs bulk-loaded in a few set-based queries
+  - ALS components computed as NumPy column operations
+  - Results written back with UPDATE ... FROM (VALUES ...) per chunk
+  - Boost rules factored into pure helpers shared with the per-lead path
 """
 
+import json
 import logging
+from collections.abc import Callable, Hashable
 from datetime import UTC, date, datetime
+from types import SimpleNamespace
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, select, text, update
+import numpy as np
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import Text, and_, bindparam, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.engines.base import BaseEngine, EngineResult
@@ -66,6 +78,12 @@ from src.models.base import ChannelType, LeadStatus
 from src.models.client import Client
 from src.models.conversion_patterns import ConversionPattern
 from src.models.lead import Lead
+from src.utils.scoring_config_cache import (
+    NS_CEO_WEIGHTS,
+    NS_ICP_CONFIG,
+    NS_LEARNED_WEIGHTS,
+    get_scoring_config_cache,
+)
 
 # ============================================
 # ALS Scoring Constants
@@ -236,6 +254,88 @@ DEFAULT_ICP_CONFIG = {
     "timezone": "Australia/Sydney",
 }
 
+# Columnar batch scoring: rows per bulk load, and bind-parameter budget per
+# bulk UPDATE ... FROM (VALUES ...) statement (asyncpg caps a statement at 32767).
+COLUMNAR_CHUNK_SIZE = 5000
+BULK_UPDATE_MAX_PARAMS = 30000
+
+# Component order for columnar weighting (matches the per-lead dict order so
+# float accumulation is identical)
+COMPONENT_ORDER = ["data_quality", "authority", "company_fit", "timing", "risk"]
+COMPONENT_NORMALISERS = {
+    "data_quality": 5,  # 0-20 -> 0-100
+    "authority": 4,  # 0-25 -> 0-100
+    "company_fit": 4,  # 0-25 -> 0-100
+    "timing": 6.67,  # 0-15 -> 0-100
+    "risk": 6.67,  # 0-15 -> 0-100
+}
+
+
+def _map_distinct(values: list[Hashable], fn: Callable[[Any], int]) -> np.ndarray:
+    """
+    Evaluate a scalar scoring rule once per distinct value and gather per row.
+
+    Titles, industries, countries and email statuses are heavily repeated
+    across a pool, so the string rules run on the distinct values only and
+    the result is broadcast back as an int64 column.
+    """
+    index: dict[Hashable, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(v, len(index)) for v in values), dtype=np.int64, count=len(values)
+    )
+    table = np.fromiter((fn(v) for v in index), dtype=np.int64, count=len(index))
+    return table[codes]
+
+
+def _days_since(value: Any, today: date) -> float:
+    """Days between a date (or ISO date string) and today; NaN when missing/unparseable."""
+    if not value:
+        return np.nan
+    if isinstance(value, str):
+        try:
+            value = date.fromisoformat(value[:10])
+        except ValueError:
+            return np.nan
+    return float((today - value).days)
+
+
+def _tiers_for_scores(scores: np.ndarray) -> np.ndarray:
+    """Vectorised _get_tier."""
+    return np.select(
+        [scores >= TIER_HOT, scores >= TIER_WARM, scores >= TIER_COOL, scores >= TIER_COLD],
+        ["hot", "warm", "cool", "cold"],
+        default="dead",
+    )
+
+
+def _values_update_chunks(
+    columns: list[tuple[str, str]],
+    rows: list[dict[str, Any]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Build chunked ``(VALUES ...)`` fragments for a bulk UPDATE ... FROM.
+
+    Args:
+        columns: (column name, postgres type) pairs, id first
+        rows: Row dicts keyed by column name
+
+    Returns:
+        List of (values_sql, params) tuples, each within BULK_UPDATE_MAX_PARAMS
+    """
+    per_stmt = max(1, BULK_UPDATE_MAX_PARAMS // len(columns))
+    chunks = []
+    for start in range(0, len(rows), per_stmt):
+        tuples = []
+        params: dict[str, Any] = {}
+        for i, row in enumerate(rows[start : start + per_stmt]):
+            placeholders = []
+            for name, pg_type in columns:
+                params[f"{name}_{i}"] = row[name]
+                placeholders.append(f"CAST(:{name}_{i} AS {pg_type})")
+            tuples.append(f"({', '.join(placeholders)})")
+        chunks.append((",\n".join(tuples), params))
+    return chunks
+
 
 class ScorerEngine(BaseEngine):
     """
@@ -400,6 +500,7 @@ class ScorerEngine(BaseEngine):
         lead_ids: list[UUID],
         target_industries: list[str] | None = None,
         competitor_domains: list[str] | None = None,
+        columnar: bool = False,
     ) -> EngineResult[dict[str, Any]]:
         """
         Score a batch of leads.
@@ -409,10 +510,17 @@ class ScorerEngine(BaseEngine):
             lead_ids: List of lead UUIDs to score
             target_industries: Optional target industries
             competitor_domains: Optional competitor domains
+            columnar: Use set-based loads + NumPy scoring + bulk UPDATE
+                (same scores as the per-lead path, far fewer round trips)
 
         Returns:
             EngineResult with batch scoring summary
         """
+        if columnar:
+            return await self._score_batch_columnar(
+                db, lead_ids, target_industries, competitor_domains
+            )
+
         results = {
             "total": len(lead_ids),
             "scored": 0,
@@ -765,42 +873,12 @@ class ScorerEngine(BaseEngine):
             Weights dict with 'reachability' and 'propensity' sub-dicts
         """
         try:
-            result = await db.execute(
-                text("""
-                    SELECT value
-                    FROM ceo_memory
-                    WHERE key = :key
-                """),
-                {"key": CEO_MEMORY_WEIGHTS_KEY},
+            # Cached per process; errors propagate so the fallback below is never cached
+            return await get_scoring_config_cache().get_or_load(
+                NS_CEO_WEIGHTS,
+                CEO_MEMORY_WEIGHTS_KEY,
+                lambda: self._load_weights_from_ceo_memory(db),
             )
-            row = result.fetchone()
-
-            if row and row.value:
-                weights = row.value
-                if isinstance(weights, str):
-                    import json
-
-                    weights = json.loads(weights)
-                logger.info(f"Loaded weights from ceo_memory: {CEO_MEMORY_WEIGHTS_KEY}")
-                return weights
-
-            # Fallback to default weights if not in ceo_memory
-            logger.warning(
-                f"Weights not found in ceo_memory ({CEO_MEMORY_WEIGHTS_KEY}), "
-                "using defaults. Please populate ceo_memory."
-            )
-            return {
-                "reachability": DEFAULT_REACHABILITY_WEIGHTS,
-                "propensity": {
-                    "industry_match": 15,
-                    "company_size_fit": 10,
-                    "authority_level": 20,
-                    "timing_signals": 15,
-                    "engagement_signals": 25,
-                    "buyer_history": 15,
-                },
-            }
-
         except Exception as e:
             logger.error(f"Error fetching weights from ceo_memory: {e}")
             return {
@@ -808,6 +886,50 @@ class ScorerEngine(BaseEngine):
                 "propensity": {},
             }
 
+    async def _load_weights_from_ceo_memory(self, db: AsyncSession) -> dict:
+        """
+        Query ceo_memory for the scoring weights (uncached).
+
+        Args:
+            db: Database session
+
+        Returns:
+            Weights dict, or the defaults if the key is not populated
+        """
+        result = await db.execute(
+            text("""
+                SELECT value
+                FROM ceo_memory
+                WHERE key = :key
+            """),
+            {"key": CEO_MEMORY_WEIGHTS_KEY},
+        )
+        row = result.fetchone()
+
+        if row and row.value:
+            weights = row.value
+            if isinstance(weights, str):
+                weights = json.loads(weights)
+            logger.info(f"Loaded weights from ceo_memory: {CEO_MEMORY_WEIGHTS_KEY}")
+            return weights
+
+        # Fallback to default weights if not in ceo_memory
+        logger.warning(
+            f"Weights not found in ceo_memory ({CEO_MEMORY_WEIGHTS_KEY}), "
+            "using defaults. Please populate ceo_memory."
+        )
+        return {
+            "reachability": DEFAULT_REACHABILITY_WEIGHTS,
+            "propensity": {
+                "industry_match": 15,
+                "company_size_fit": 10,
+                "authority_level": 20,
+                "timing_signals": 15,
+                "engagement_signals": 25,
+                "buyer_history": 15,
+            },
+        }
+
     async def calculate_reachability(
         self,
         db: AsyncSession,
@@ -1114,13 +1236,27 @@ class ScorerEngine(BaseEngine):
         Returns:
             Learned weights dict if available, None otherwise
         """
+        # Cached per client (including None); invalidated by the pattern learning flows
+        return await get_scoring_config_cache().get_or_load(
+            NS_LEARNED_WEIGHTS,
+            str(client_id),
+            lambda: self._load_learned_weights(db, client_id),
+        )
+
+    async def _load_learned_weights(
+        self,
+        db: AsyncSession,
+        client_id: UUID,
+    ) -> dict[str, float] | None:
+        """Query learned weights for a client (uncached)."""
         # First check client's stored learned weights
         client_stmt = select(Client).where(Client.id == client_id)
         client_result = await db.execute(client_stmt)
         client = client_result.scalar_one_or_none()
+        stored = client.propensity_learned_weights if client else None
 
-        if client and client.propensity_learned_weights:
-            return client.propensity_learned_weights
+        if stored:
+            return stored
 
         # Fall back to WHO pattern's recommended weights
         pattern_stmt = select(ConversionPattern).where(
@@ -1134,13 +1270,41 @@ class ScorerEngine(BaseEngine):
             )
         )
         pattern_result = await db.execute(pattern_stmt)
-        pattern = pattern_result.scalar_one_or_none()
+        who_patterns = [pattern.patterns for pattern in pattern_result.scalars().all()]
 
-        if pattern and pattern.patterns:
-            recommended = pattern.patterns.get("recommended_weights")
-            if recommended:
-                return recommended
+        return self._resolve_learned_weights(client_id, stored, who_patterns)
 
+    @staticmethod
+    def _resolve_learned_weights(
+        client_id: Any,
+        stored: dict[str, float] | None,
+        who_patterns: list[dict[str, Any] | None],
+    ) -> dict[str, float] | None:
+        """
+        Pick a client's learned weights.
+
+        Pure helper shared by _load_learned_weights and the columnar batch
+        path so both resolve the same weights for a client.
+
+        Args:
+            client_id: Client UUID (for logging)
+            stored: Client.propensity_learned_weights
+            who_patterns: patterns of the client's valid WHO ConversionPatterns
+
+        Returns:
+            Stored weights if set, else the recommended weights of the single
+            valid WHO pattern; None when there is none or it is ambiguous
+        """
+        if stored:
+            return stored
+        if len(who_patterns) > 1:
+            logger.warning(
+                f"Client {client_id} has {len(who_patterns)} valid WHO patterns; "
+                "using default weights"
+            )
+            return None
+        if who_patterns and who_patterns[0]:
+            return who_patterns[0].get("recommended_weights") or None
         return None
 
     async def _get_icp_config(
@@ -1174,36 +1338,12 @@ class ScorerEngine(BaseEngine):
             return DEFAULT_ICP_CONFIG.copy()
 
         try:
-            result = await db.execute(
-                text("""
-                    SELECT icp_config
-                    FROM campaigns
-                    WHERE id = :campaign_id
-                    AND deleted_at IS NULL
-                """),
-                {"campaign_id": str(campaign_id)},
-            )
-            row = result.fetchone()
-
-            if row and row.icp_config:
-                logger.info(
-                    f"Using dynamic ICP config for campaign {campaign_id}: "
-                    f"employee_range={row.icp_config.get('employee_range')}, "
-                    f"countries={row.icp_config.get('countries')}"
-                )
-                return row.icp_config
-
-            # Campaign exists but no ICP config - use default
-            logger.warning(f"Campaign {campaign_id} has no icp_config, using default")
-            await self.log_operation_to_db(
-                db=db,
-                operation="icp_config_fallback",
-                campaign_id=campaign_id,
-                success=True,
-                metadata={"reason": "no_icp_config_on_campaign", "fallback": "DEFAULT_ICP_CONFIG"},
+            # Cached per campaign; errors propagate so the fallback below is never cached
+            return await get_scoring_config_cache().get_or_load(
+                NS_ICP_CONFIG,
+                str(campaign_id),
+                lambda: self._load_icp_config(db, campaign_id),
             )
-            return DEFAULT_ICP_CONFIG.copy()
-
         except Exception as e:
             logger.error(f"Error fetching ICP config for campaign {campaign_id}: {e}")
             await self.log_operation_to_db(
@@ -1216,6 +1356,51 @@ class ScorerEngine(BaseEngine):
             )
             return DEFAULT_ICP_CONFIG.copy()
 
+    async def _load_icp_config(
+        self,
+        db: AsyncSession,
+        campaign_id: UUID,
+    ) -> dict[str, Any]:
+        """
+        Query a campaign's icp_config (uncached).
+
+        Args:
+            db: Database session
+            campaign_id: Campaign UUID
+
+        Returns:
+            ICP config dict, or DEFAULT_ICP_CONFIG if the campaign has none
+        """
+        result = await db.execute(
+            text("""
+                SELECT icp_config
+                FROM campaigns
+                WHERE id = :campaign_id
+                AND deleted_at IS NULL
+            """),
+            {"campaign_id": str(campaign_id)},
+        )
+        row = result.fetchone()
+
+        if row and row.icp_config:
+            logger.info(
+                f"Using dynamic ICP config for campaign {campaign_id}: "
+                f"employee_range={row.icp_config.get('employee_range')}, "
+                f"countries={row.icp_config.get('countries')}"
+            )
+            return row.icp_config
+
+        # Campaign exists but no ICP config - use default
+        logger.warning(f"Campaign {campaign_id} has no icp_config, using default")
+        await self.log_operation_to_db(
+            db=db,
+            operation="icp_config_fallback",
+            campaign_id=campaign_id,
+            success=True,
+            metadata={"reason": "no_icp_config_on_campaign", "fallback": "DEFAULT_ICP_CONFIG"},
+        )
+        return DEFAULT_ICP_CONFIG.copy()
+
     async def _get_buyer_boost(
         self,
         db: AsyncSession,
@@ -1258,16 +1443,11 @@ class ScorerEngine(BaseEngine):
                 signal_row = signal_result.fetchone()
 
                 if signal_row:
-                    times_bought = signal_row.times_bought or 1
-                    if times_bought >= 3:
-                        reason = f"Repeat agency buyer ({times_bought}x)"
-                    elif times_bought >= 2:
-                        reason = "Has bought agency services before (2x)"
-                    else:
-                        reason = "Known agency services buyer"
-
-                    logger.info(f"Buyer boost for {domain}: +{boost} points ({reason})")
-                    return {"boost_points": boost, "reason": reason}
+                    buyer_boost = self._buyer_boost_from_signal(boost, signal_row.times_bought)
+                    logger.info(
+                        f"Buyer boost for {domain}: +{boost} points ({buyer_boost['reason']})"
+                    )
+                    return buyer_boost
 
             return {"boost_points": 0, "reason": None}
 
@@ -1275,6 +1455,27 @@ class ScorerEngine(BaseEngine):
             logger.warning(f"Error getting buyer boost for {domain}: {e}")
             return {"boost_points": 0, "reason": None}
 
+    @staticmethod
+    def _buyer_boost_from_signal(boost: int, times_bought: int | None) -> dict[str, Any]:
+        """
+        Build the buyer boost result for a domain with a platform_buyer_signals row.
+
+        Args:
+            boost: Points returned by get_buyer_score_boost
+            times_bought: platform_buyer_signals.times_bought (None treated as 1)
+
+        Returns:
+            Dict with boost_points (int) and reason (str)
+        """
+        times_bought = times_bought or 1
+        if times_bought >= 3:
+            reason = f"Repeat agency buyer ({times_bought}x)"
+        elif times_bought >= 2:
+            reason = "Has bought agency services before (2x)"
+        else:
+            reason = "Known agency services buyer"
+        return {"boost_points": boost, "reason": reason}
+
     async def _get_linkedin_boost(
         self,
         db: AsyncSession,
@@ -1318,63 +1519,9 @@ class ScorerEngine(BaseEngine):
             if not row or not row.enrichment_data:
                 return {"boost_points": 0, "signals": []}
 
-            boost_points = 0
-            signals = []
-
-            enrichment_data = row.enrichment_data
-            if isinstance(enrichment_data, str):
-                import json
-
-                enrichment_data = json.loads(enrichment_data)
-
-            # Parse person LinkedIn data from enrichment_data
-            person_data = enrichment_data.get("linkedin_person", {})
-            if person_data:
-                # Check for posts (engaged on LinkedIn)
-                posts = person_data.get("posts", [])
-                if posts and len(posts) > 0:
-                    boost_points += LINKEDIN_PERSON_POSTS_BOOST
-                    signals.append(f"Active on LinkedIn ({len(posts)} recent posts)")
-
-                    # Check for recent activity (posted in last 30 days)
-                    recent_post = posts[0] if posts else {}
-                    post_date = recent_post.get("posted_date")
-                    if post_date:
-                        try:
-                            if isinstance(post_date, str):
-                                post_dt = datetime.fromisoformat(post_date[:10])
-                            else:
-                                post_dt = post_date
-                            days_ago = (datetime.now(UTC) - post_dt).days
-                            if days_ago <= 30:
-                                boost_points += LINKEDIN_RECENT_ACTIVITY_BOOST
-                                signals.append("Posted in last 30 days")
-                        except (ValueError, TypeError):
-                            pass
-
-                # Check connections (influential)
-                connections = person_data.get("connections", 0)
-                if connections and connections >= 500:
-                    boost_points += LINKEDIN_HIGH_CONNECTIONS_BOOST
-                    signals.append(f"High influence ({connections}+ connections)")
-
-            # Parse company LinkedIn data from enrichment_data
-            company_data = enrichment_data.get("linkedin_company", {})
-            if company_data:
-                # Check for company posts (active company)
-                company_posts = company_data.get("posts", [])
-                if company_posts and len(company_posts) > 0:
-                    boost_points += LINKEDIN_COMPANY_POSTS_BOOST
-                    signals.append(f"Active company ({len(company_posts)} recent posts)")
-
-                # Check company followers (established)
-                followers = company_data.get("followers", 0)
-                if followers and followers >= 1000:
-                    boost_points += LINKEDIN_HIGH_FOLLOWERS_BOOST
-                    signals.append(f"Established company ({followers}+ followers)")
-
-            # Cap at max
-            boost_points = min(boost_points, MAX_LINKEDIN_BOOST)
+            linkedin_boost = self._linkedin_boost_from_enrichment(row.enrichment_data)
+            boost_points = linkedin_boost["boost_points"]
+            signals = linkedin_boost["signals"]
 
             if boost_points > 0:
                 logger.info(
@@ -1388,6 +1535,76 @@ class ScorerEngine(BaseEngine):
             logger.warning(f"Error getting LinkedIn boost for {lead_pool_id}: {e}")
             return {"boost_points": 0, "signals": []}
 
+    @staticmethod
+    def _linkedin_boost_from_enrichment(enrichment_data: dict | str) -> dict[str, Any]:
+        """
+        Compute the LinkedIn engagement boost from lead_pool.enrichment_data.
+
+        Pure helper shared by _get_linkedin_boost and the columnar batch path.
+
+        Args:
+            enrichment_data: lead_pool.enrichment_data (dict or JSON string)
+
+        Returns:
+            Dict with boost_points (int, max 10) and signals (list of reasons)
+        """
+        boost_points = 0
+        signals = []
+
+        if isinstance(enrichment_data, str):
+            enrichment_data = json.loads(enrichment_data)
+
+        # Parse person LinkedIn data from enrichment_data
+        person_data = enrichment_data.get("linkedin_person", {})
+        if person_data:
+            # Check for posts (engaged on LinkedIn)
+            posts = person_data.get("posts", [])
+            if posts and len(posts) > 0:
+                boost_points += LINKEDIN_PERSON_POSTS_BOOST
+                signals.append(f"Active on LinkedIn ({len(posts)} recent posts)")
+
+                # Check for recent activity (posted in last 30 days)
+                recent_post = posts[0] if posts else {}
+                post_date = recent_post.get("posted_date")
+                if post_date:
+                    try:
+                        if isinstance(post_date, str):
+                            post_dt = datetime.fromisoformat(post_date[:10])
+                        else:
+                            post_dt = post_date
+                        days_ago = (datetime.now(UTC) - post_dt).days
+                        if days_ago <= 30:
+                            boost_points += LINKEDIN_RECENT_ACTIVITY_BOOST
+                            signals.append("Posted in last 30 days")
+                    except (ValueError, TypeError):
+                        pass
+
+            # Check connections (influential)
+            connections = person_data.get("connections", 0)
+            if connections and connections >= 500:
+                boost_points += LINKEDIN_HIGH_CONNECTIONS_BOOST
+                signals.append(f"High influence ({connections}+ connections)")
+
+        # Parse company LinkedIn data from enrichment_data
+        company_data = enrichment_data.get("linkedin_company", {})
+        if company_data:
+            # Check for company posts (active company)
+            company_posts = company_data.get("posts", [])
+            if company_posts and len(company_posts) > 0:
+                boost_points += LINKEDIN_COMPANY_POSTS_BOOST
+                signals.append(f"Active company ({len(company_posts)} recent posts)")
+
+            # Check company followers (established)
+            followers = company_data.get("followers", 0)
+            if followers and followers >= 1000:
+                boost_points += LINKEDIN_HIGH_FOLLOWERS_BOOST
+                signals.append(f"Established company ({followers}+ followers)")
+
+        # Cap at max
+        boost_points = min(boost_points, MAX_LINKEDIN_BOOST)
+
+        return {"boost_points": boost_points, "signals": signals}
+
     async def _get_funnel_boost(
         self,
         db: AsyncSession,
@@ -1434,50 +1651,9 @@ class ScorerEngine(BaseEngine):
             if not pattern or not pattern.patterns:
                 return {"boost_points": 0, "signals": []}
 
-            boost_points = 0
-            signals = []
-            patterns = pattern.patterns
-
-            # Check show rate patterns for this tier
-            show_rate_data = patterns.get("show_rate", {})
-            tier_show_rates = show_rate_data.get("insights", [])
-            for insight in tier_show_rates:
-                if insight.get("type") == "als_tier_impact":
-                    tier_rates = insight.get("tier_show_rates", {})
-                    tier_rate = tier_rates.get(current_tier, 0)
-                    if tier_rate >= 80:
-                        boost_points += FUNNEL_HIGH_SHOW_RATE_BOOST
-                        signals.append(
-                            f"{current_tier.upper()} tier has {tier_rate:.0f}% show rate"
-                        )
-                    elif tier_rate >= 60:
-                        boost_points += 2  # Partial boost for decent show rate
-                        signals.append(
-                            f"{current_tier.upper()} tier has {tier_rate:.0f}% show rate"
-                        )
-
-            # Check meeting-to-deal patterns
-            deal_data = patterns.get("meeting_to_deal", {})
-            deal_rate = deal_data.get("meeting_to_deal_rate", 0)
-            if deal_rate >= 40:
-                boost_points += FUNNEL_GOOD_DEAL_RATE_BOOST
-                signals.append(f"Strong meeting-to-deal conversion ({deal_rate:.0f}%)")
-            elif deal_rate >= 25:
-                boost_points += 2  # Partial boost
-                signals.append(f"Good meeting-to-deal conversion ({deal_rate:.0f}%)")
-
-            # Check win rate patterns
-            win_data = patterns.get("win_rate", {})
-            win_rate = win_data.get("win_rate", 0)
-            if win_rate >= 30:
-                boost_points += FUNNEL_STRONG_WIN_RATE_BOOST
-                signals.append(f"Strong win rate ({win_rate:.0f}%)")
-            elif win_rate >= 20:
-                boost_points += 2  # Partial boost
-                signals.append(f"Good win rate ({win_rate:.0f}%)")
-
-            # Cap at max
-            boost_points = min(boost_points, MAX_FUNNEL_BOOST)
+            funnel_boost = self._funnel_boost_from_patterns(pattern.patterns, current_tier)
+            boost_points = funnel_boost["boost_points"]
+            signals = funnel_boost["signals"]
 
             if boost_points > 0:
                 logger.info(
@@ -1491,6 +1667,62 @@ class ScorerEngine(BaseEngine):
             logger.warning(f"Error getting funnel boost for client {client_id}: {e}")
             return {"boost_points": 0, "signals": []}
 
+    @staticmethod
+    def _funnel_boost_from_patterns(patterns: dict[str, Any], current_tier: str) -> dict[str, Any]:
+        """
+        Compute the funnel boost for a tier from a client's funnel patterns.
+
+        Pure helper shared by _get_funnel_boost and the columnar batch path.
+
+        Args:
+            patterns: ConversionPattern.patterns for pattern_type='funnel'
+            current_tier: The lead's current ALS tier
+
+        Returns:
+            Dict with boost_points (int, max 12) and signals (list of reasons)
+        """
+        boost_points = 0
+        signals = []
+
+        # Check show rate patterns for this tier
+        show_rate_data = patterns.get("show_rate", {})
+        tier_show_rates = show_rate_data.get("insights", [])
+        for insight in tier_show_rates:
+            if insight.get("type") == "als_tier_impact":
+                tier_rates = insight.get("tier_show_rates", {})
+                tier_rate = tier_rates.get(current_tier, 0)
+                if tier_rate >= 80:
+                    boost_points += FUNNEL_HIGH_SHOW_RATE_BOOST
+                    signals.append(f"{current_tier.upper()} tier has {tier_rate:.0f}% show rate")
+                elif tier_rate >= 60:
+                    boost_points += 2  # Partial boost for decent show rate
+                    signals.append(f"{current_tier.upper()} tier has {tier_rate:.0f}% show rate")
+
+        # Check meeting-to-deal patterns
+        deal_data = patterns.get("meeting_to_deal", {})
+        deal_rate = deal_data.get("meeting_to_deal_rate", 0)
+        if deal_rate >= 40:
+            boost_points += FUNNEL_GOOD_DEAL_RATE_BOOST
+            signals.append(f"Strong meeting-to-deal conversion ({deal_rate:.0f}%)")
+        elif deal_rate >= 25:
+            boost_points += 2  # Partial boost
+            signals.append(f"Good meeting-to-deal conversion ({deal_rate:.0f}%)")
+
+        # Check win rate patterns
+        win_data = patterns.get("win_rate", {})
+        win_rate = win_data.get("win_rate", 0)
+        if win_rate >= 30:
+            boost_points += FUNNEL_STRONG_WIN_RATE_BOOST
+            signals.append(f"Strong win rate ({win_rate:.0f}%)")
+        elif win_rate >= 20:
+            boost_points += 2  # Partial boost
+            signals.append(f"Good win rate ({win_rate:.0f}%)")
+
+        # Cap at max
+        boost_points = min(boost_points, MAX_FUNNEL_BOOST)
+
+        return {"boost_points": boost_points, "signals": signals}
+
     async def _get_multi_source_boost(
         self,
         db: AsyncSession,
@@ -1535,73 +1767,98 @@ class ScorerEngine(BaseEngine):
             if not row:
                 return {"boost_points": 0, "sources": [], "reason": None}
 
-            sources_verified = []
-            enrichment_data = row.enrichment_data or {}
-
-            if isinstance(enrichment_data, str):
-                import json
-
-                try:
-                    enrichment_data = json.loads(enrichment_data)
-                except (json.JSONDecodeError, TypeError):
-                    enrichment_data = {}
-
-            # Check ABN verification
-            if enrichment_data.get("abn_verified") or enrichment_data.get("abn"):
-                sources_verified.append("ABN")
-
-            # Check GMB (Google My Business)
-            if enrichment_data.get("gmb_verified") or enrichment_data.get("gmb_place_id"):
-                sources_verified.append("GMB")
-
-            # Check Leadmagic email verification
-            if row.email_status == "verified" or enrichment_data.get("leadmagic_verified"):
-                sources_verified.append("Leadmagic")
-
-            # Check LinkedIn data
-            if enrichment_data.get("linkedin_person") or enrichment_data.get("linkedin_url"):
-                sources_verified.append("LinkedIn")
-
-            # Check Prospeo enrichment
-            enrichment_source = row.enrichment_source or ""
-            if "prospeo" in enrichment_source.lower():
-                sources_verified.append("Prospeo")
-
-            # Check if we have multiple enrichment sources in the data
-            if enrichment_data.get("siege_waterfall_sources"):
-                waterfall_sources = enrichment_data.get("siege_waterfall_sources", [])
-                if "leadmagic" in [s.lower() for s in waterfall_sources]:
-                    if "Leadmagic" not in sources_verified:
-                        sources_verified.append("Leadmagic")
-                if "prospeo" in [s.lower() for s in waterfall_sources]:
-                    if "Prospeo" not in sources_verified:
-                        sources_verified.append("Prospeo")
-
-            # Check DataForSEO / SERP data
-            if enrichment_data.get("dataforseo") or enrichment_data.get("serp_data"):
-                sources_verified.append("DataForSEO")
-
-            # Award boost if 3+ sources confirmed
-            source_count = len(sources_verified)
-
-            if source_count >= 3:
-                boost_points = MAX_MULTI_SOURCE_BOOST  # 15 points
-                reason = (
-                    f"Multi-source verified ({source_count} sources: {', '.join(sources_verified)})"
+            multi_source_boost = self._multi_source_boost_from_enrichment(
+                row.enrichment_data, row.enrichment_source, row.email_status
+            )
+            if multi_source_boost["boost_points"] > 0:
+                logger.info(
+                    f"Multi-source boost for {lead_pool_id}: "
+                    f"+{multi_source_boost['boost_points']} ({multi_source_boost['reason']})"
                 )
-                logger.info(f"Multi-source boost for {lead_pool_id}: +{boost_points} ({reason})")
-                return {
-                    "boost_points": boost_points,
-                    "sources": sources_verified,
-                    "reason": reason,
-                }
-
-            return {"boost_points": 0, "sources": sources_verified, "reason": None}
+            return multi_source_boost
 
         except Exception as e:
             logger.warning(f"Error getting multi-source boost for {lead_pool_id}: {e}")
             return {"boost_points": 0, "sources": [], "reason": None}
 
+    @staticmethod
+    def _multi_source_boost_from_enrichment(
+        enrichment_data: dict | str | None,
+        enrichment_source: str | None,
+        email_status: str | None,
+    ) -> dict[str, Any]:
+        """
+        Compute the multi-source verified boost from lead_pool columns.
+
+        Pure helper shared by _get_multi_source_boost and the columnar batch path.
+
+        Args:
+            enrichment_data: lead_pool.enrichment_data (dict or JSON string)
+            enrichment_source: lead_pool.enrichment_source
+            email_status: lead_pool.email_status
+
+        Returns:
+            Dict with boost_points (int, max 15), sources (list) and reason
+        """
+        sources_verified = []
+        enrichment_data = enrichment_data or {}
+
+        if isinstance(enrichment_data, str):
+            try:
+                enrichment_data = json.loads(enrichment_data)
+            except (json.JSONDecodeError, TypeError):
+                enrichment_data = {}
+
+        # Check ABN verification
+        if enrichment_data.get("abn_verified") or enrichment_data.get("abn"):
+            sources_verified.append("ABN")
+
+        # Check GMB (Google My Business)
+        if enrichment_data.get("gmb_verified") or enrichment_data.get("gmb_place_id"):
+            sources_verified.append("GMB")
+
+        # Check Leadmagic email verification
+        if email_status == "verified" or enrichment_data.get("leadmagic_verified"):
+            sources_verified.append("Leadmagic")
+
+        # Check LinkedIn data
+        if enrichment_data.get("linkedin_person") or enrichment_data.get("linkedin_url"):
+            sources_verified.append("LinkedIn")
+
+        # Check Prospeo enrichment
+        enrichment_source = enrichment_source or ""
+        if "prospeo" in enrichment_source.lower():
+            sources_verified.append("Prospeo")
+
+        # Check if we have multiple enrichment sources in the data
+        if enrichment_data.get("siege_waterfall_sources"):
+            waterfall_sources = enrichment_data.get("siege_waterfall_sources", [])
+            if "leadmagic" in [s.lower() for s in waterfall_sources]:
+                if "Leadmagic" not in sources_verified:
+                    sources_verified.append("Leadmagic")
+            if "prospeo" in [s.lower() for s in waterfall_sources]:
+                if "Prospeo" not in sources_verified:
+                    sources_verified.append("Prospeo")
+
+        # Check DataForSEO / SERP data
+        if enrichment_data.get("dataforseo") or enrichment_data.get("serp_data"):
+            sources_verified.append("DataForSEO")
+
+        # Award boost if 3+ sources confirmed
+        source_count = len(sources_verified)
+
+        if source_count >= 3:
+            reason = (
+                f"Multi-source verified ({source_count} sources: {', '.join(sources_verified)})"
+            )
+            return {
+                "boost_points": MAX_MULTI_SOURCE_BOOST,  # 15 points
+                "sources": sources_verified,
+                "reason": reason,
+            }
+
+        return {"boost_points": 0, "sources": sources_verified, "reason": None}
+
     async def _get_social_post_timing_boost(
         self,
         db: AsyncSession,
@@ -1646,32 +1903,9 @@ class ScorerEngine(BaseEngine):
                 row = result.fetchone()
 
                 if row and row.enrichment_data:
-                    enrichment_data = row.enrichment_data
-                    if isinstance(enrichment_data, str):
-                        import json
-
-                        try:
-                            enrichment_data = json.loads(enrichment_data)
-                        except (json.JSONDecodeError, TypeError):
-                            enrichment_data = {}
-
-                    # Check person LinkedIn posts
-                    person_posts = enrichment_data.get("linkedin_person", {}).get("posts", [])
-                    for post in person_posts[:10]:  # Check up to 10 recent posts
-                        content = (post.get("text", "") or "").lower()
-                        for signal in SOCIAL_POST_TIMING_SIGNALS:
-                            if signal.lower() in content and signal not in signals_found:
-                                signals_found.append(signal)
-                                boost_points += 3  # 3 points per signal
-
-                    # Check company LinkedIn posts
-                    company_posts = enrichment_data.get("linkedin_company", {}).get("posts", [])
-                    for post in company_posts[:10]:
-                        content = (post.get("text", "") or "").lower()
-                        for signal in SOCIAL_POST_TIMING_SIGNALS:
-                            if signal.lower() in content and signal not in signals_found:
-                                signals_found.append(signal)
-                                boost_points += 2  # 2 points per company signal
+                    boost_points, signals_found = self._social_post_signals_from_enrichment(
+                        row.enrichment_data
+                    )
 
             # Also check lead_social_posts table if we have lead_id
             if lead_id:
@@ -1701,24 +1935,73 @@ class ScorerEngine(BaseEngine):
                             else:
                                 boost_points += 3
 
-            # Cap at maximum
-            boost_points = min(boost_points, MAX_SOCIAL_TIMING_BOOST)
-
-            if boost_points > 0:
-                reason = f"Social timing signals ({len(signals_found)} found: {', '.join(signals_found[:5])})"
-                logger.info(f"Social timing boost for lead: +{boost_points} ({reason})")
-                return {
-                    "boost_points": boost_points,
-                    "signals": signals_found,
-                    "reason": reason,
-                }
-
-            return {"boost_points": 0, "signals": [], "reason": None}
+            social_timing_boost = self._social_timing_boost_result(boost_points, signals_found)
+            if social_timing_boost["boost_points"] > 0:
+                logger.info(
+                    f"Social timing boost for lead: "
+                    f"+{social_timing_boost['boost_points']} ({social_timing_boost['reason']})"
+                )
+            return social_timing_boost
 
         except Exception as e:
             logger.warning(f"Error getting social post timing boost: {e}")
             return {"boost_points": 0, "signals": [], "reason": None}
 
+    @staticmethod
+    def _social_post_signals_from_enrichment(
+        enrichment_data: dict | str,
+    ) -> tuple[int, list[str]]:
+        """
+        Scan LinkedIn posts in lead_pool.enrichment_data for timing signals.
+
+        Pure helper shared by _get_social_post_timing_boost and the columnar
+        batch path. Returns uncapped points so callers can add lead_social_posts
+        signals before applying MAX_SOCIAL_TIMING_BOOST.
+
+        Args:
+            enrichment_data: lead_pool.enrichment_data (dict or JSON string)
+
+        Returns:
+            Tuple of (boost_points, signals_found)
+        """
+        boost_points = 0
+        signals_found: list[str] = []
+
+        if isinstance(enrichment_data, str):
+            try:
+                enrichment_data = json.loads(enrichment_data)
+            except (json.JSONDecodeError, TypeError):
+                enrichment_data = {}
+
+        # Check person LinkedIn posts
+        person_posts = enrichment_data.get("linkedin_person", {}).get("posts", [])
+        for post in person_posts[:10]:  # Check up to 10 recent posts
+            content = (post.get("text", "") or "").lower()
+            for signal in SOCIAL_POST_TIMING_SIGNALS:
+                if signal.lower() in content and signal not in signals_found:
+                    signals_found.append(signal)
+                    boost_points += 3  # 3 points per signal
+
+        # Check company LinkedIn posts
+        company_posts = enrichment_data.get("linkedin_company", {}).get("posts", [])
+        for post in company_posts[:10]:
+            content = (post.get("text", "") or "").lower()
+            for signal in SOCIAL_POST_TIMING_SIGNALS:
+                if signal.lower() in content and signal not in signals_found:
+                    signals_found.append(signal)
+                    boost_points += 2  # 2 points per company signal
+
+        return boost_points, signals_found
+
+    @staticmethod
+    def _social_timing_boost_result(boost_points: int, signals_found: list[str]) -> dict[str, Any]:
+        """Cap social timing points and build the boost result dict."""
+        boost_points = min(boost_points, MAX_SOCIAL_TIMING_BOOST)
+        if boost_points > 0:
+            reason = f"Social timing signals ({len(signals_found)} found: {', '.join(signals_found[:5])})"
+            return {"boost_points": boost_points, "signals": signals_found, "reason": reason}
+        return {"boost_points": 0, "signals": [], "reason": None}
+
     async def _update_lead_score(
         self,
         db: AsyncSession,
@@ -1943,6 +2226,7 @@ class ScorerEngine(BaseEngine):
         lead_pool_ids: list[UUID],
         target_industries: list[str] | None = None,
         competitor_domains: list[str] | None = None,
+        columnar: bool = False,
     ) -> EngineResult[dict[str, Any]]:
         """
         Score a batch of pool leads.
@@ -1954,10 +2238,17 @@ class ScorerEngine(BaseEngine):
             lead_pool_ids: List of lead pool UUIDs to score
             target_industries: Optional target industries
             competitor_domains: Optional competitor domains
+            columnar: Use set-based loads + NumPy scoring + bulk UPDATE
+                (same scores as score_pool_lead, far fewer round trips)
 
         Returns:
             EngineResult with batch scoring summary
         """
+        if columnar:
+            return await self._score_pool_batch_columnar(
+                db, lead_pool_ids, target_industries, competitor_domains
+            )
+
         results = {
             "total": len(lead_pool_ids),
             "scored": 0,
@@ -2022,6 +2313,891 @@ class ScorerEngine(BaseEngine):
             },
         )
 
+    # ============================================
+    # COLUMNAR BATCH SCORING
+    # ============================================
+    # score_batch / score_pool_batch with columnar=True bulk-load rows and boost
+    # inputs in a handful of set-based queries, evaluate the ALS components as
+    # NumPy column operations and write back with one UPDATE ... FROM (VALUES)
+    # per chunk. String rules reuse the scalar _score_* methods on distinct
+    # values only, so scores match the per-lead path exactly.
+
+    async def _score_pool_batch_columnar(
+        self,
+        db: AsyncSession,
+        lead_pool_ids: list[UUID],
+        target_industries: list[str] | None = None,
+        competitor_domains: list[str] | None = None,
+    ) -> EngineResult[dict[str, Any]]:
+        """
+        Columnar equivalent of score_pool_batch.
+
+        Args:
+            db: Database session (passed by caller)
+            lead_pool_ids: List of lead pool UUIDs to score
+            target_industries: Optional target industries
+            competitor_domains: Optional competitor domains
+
+        Returns:
+            EngineResult with the same batch summary as score_pool_batch
+        """
+        results = {
+            "total": len(lead_pool_ids),
+            "scored": 0,
+            "failures": 0,
+            "tier_distribution": {"hot": 0, "warm": 0, "cool": 0, "cold": 0, "dead": 0},
+            "average_score": 0.0,
+            "scored_leads": [],
+            "failed_leads": [],
+        }
+        total_score = 0
+
+        for start in range(0, len(lead_pool_ids), COLUMNAR_CHUNK_SIZE):
+            chunk_ids = lead_pool_ids[start : start + COLUMNAR_CHUNK_SIZE]
+            try:
+                rows = await self._load_pool_rows_bulk(db, chunk_ids)
+                rows_by_id = {str(row["id"]): row for row in rows}
+
+                found = []
+                for pool_id in chunk_ids:
+                    row = rows_by_id.get(str(pool_id))
+                    if row is None:
+                        results["failures"] += 1
+                        results["failed_leads"].append(
+                            {"lead_pool_id": str(pool_id), "error": "Lead not found in pool"}
+                        )
+                    else:
+                        found.append(row)
+
+                breakdowns = await self._score_pool_rows_columnar(
+                    db, found, target_industries, competitor_domains
+                )
+                await self._bulk_update_pool_scores(db, breakdowns)
+
+            except Exception as e:
+                logger.error(f"Columnar pool scoring failed for chunk at {start}: {e}")
+                # Earlier chunks are committed; reset the aborted transaction
+                # so the next chunk does not run on it.
+                await db.rollback()
+                for pool_id in chunk_ids:
+                    results["failures"] += 1
+                    results["failed_leads"].append({"lead_pool_id": str(pool_id), "error": str(e)})
+                continue
+
+            for breakdown in breakdowns:
+                tier = breakdown["als_tier"]
+                score = breakdown["propensity_score"]
+                results["scored"] += 1
+                total_score += score
+                results["tier_distribution"][tier] += 1
+                results["scored_leads"].append(
+                    {"lead_pool_id": breakdown["lead_pool_id"], "score": score, "tier": tier}
+                )
+
+        if results["scored"] > 0:
+            results["average_score"] = total_score / results["scored"]
+
+        return EngineResult.ok(
+            data=results,
+            metadata={
+                "batch_size": len(lead_pool_ids),
+                "success_rate": results["scored"] / results["total"] if results["total"] > 0 else 0,
+                "source": "lead_pool",
+                "mode": "columnar",
+            },
+        )
+
+    async def _score_pool_rows_columnar(
+        self,
+        db: AsyncSession,
+        rows: list[dict[str, Any]],
+        target_industries: list[str] | None = None,
+        competitor_domains: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Score bulk-loaded lead_pool rows as columns.
+
+        Args:
+            db: Database session (for the bulk buyer-boost lookup)
+            rows: lead_pool rows incl. enrichment_data / enrichment_source
+            target_industries: Optional target industries
+            competitor_domains: Optional competitor domains
+
+        Returns:
+            One score breakdown per row, identical to score_pool_lead's
+        """
+        if not rows:
+            return []
+
+        n = len(rows)
+        today = date.today()
+        icp_config = DEFAULT_ICP_CONFIG.copy()
+        emp_range = icp_config.get("employee_range", {"min": 5, "max": 50})
+        emp_min = emp_range.get("min", 5)
+        emp_max = emp_range.get("max", 50)
+        competitor_set = {d.lower() for d in competitor_domains or []}
+
+        def flag(key: str) -> np.ndarray:
+            return np.fromiter((bool(row.get(key)) for row in rows), dtype=bool, count=n)
+
+        titles = [row.get("title", "") for row in rows]
+        domains = [row.get("company_domain") for row in rows]
+
+        # Data Quality (20 max)
+        email_points = _map_distinct(
+            [row.get("email_status", "") for row in rows],
+            lambda status: self._score_pool_data_quality({"email_status": status}),
+        )
+        data_quality = np.minimum(
+            20, email_points + SCORE_PHONE * flag("phone") + SCORE_LINKEDIN * flag("linkedin_url")
+        )
+
+        # Authority (25 max)
+        authority = _map_distinct(
+            [(row.get("seniority", ""), row.get("title", "")) for row in rows],
+            lambda st: self._score_pool_authority({"seniority": st[0], "title": st[1]}),
+        )
+
+        # Company Fit (25 max)
+        industry_points = _map_distinct(
+            [row.get("company_industry", "") for row in rows],
+            lambda industry: self._score_pool_company_fit(
+                {"company_industry": industry}, target_industries, icp_config
+            ),
+        )
+        country_points = _map_distinct(
+            [row.get("company_country", "") for row in rows],
+            lambda country: self._score_pool_company_fit(
+                {"company_country": country}, target_industries, icp_config
+            ),
+        )
+        counts = np.fromiter(
+            (float(c) if (c := row.get("company_employee_count")) else np.nan for row in rows),
+            dtype=np.float64,
+            count=n,
+        )
+        employee_points = np.select(
+            [
+                (emp_min <= counts) & (counts <= emp_max),
+                (emp_max < counts) & (counts <= emp_max * 4),
+                (counts < emp_min) & (counts >= 1),
+            ],
+            [SCORE_EMPLOYEE_COUNT_IDEAL, 5, 3],
+            default=0,
+        )
+        company_fit = np.minimum(25, industry_points + employee_points + country_points)
+
+        # Timing (15 max)
+        months_since_funding = (
+            np.fromiter(
+                (_days_since(row.get("company_latest_funding_date"), today) for row in rows),
+                dtype=np.float64,
+                count=n,
+            )
+            / 30
+        )
+        funding_points = np.select(
+            [months_since_funding < 12, months_since_funding < 24],
+            [SCORE_RECENT_FUNDING, 2],
+            default=0,
+        )
+        timing = np.minimum(15, SCORE_HIRING * flag("company_is_hiring") + funding_points)
+
+        # Risk (15 base with deductions)
+        bad_status = np.fromiter(
+            (row.get("pool_status", "") in ("bounced", "invalid") for row in rows),
+            dtype=bool,
+            count=n,
+        )
+        competitor = _map_distinct(
+            domains, lambda d: bool(competitor_set and d and d.lower() in competitor_set)
+        )
+        bad_title_points = _map_distinct(titles, lambda t: self._score_pool_risk({"title": t}) - 15)
+        risk = np.maximum(
+            0,
+            15
+            + DEDUCTION_BOUNCED * flag("is_bounced")
+            + DEDUCTION_UNSUBSCRIBED * flag("is_unsubscribed")
+            + DEDUCTION_BOUNCED * bad_status
+            + DEDUCTION_COMPETITOR * competitor
+            + bad_title_points,
+        )
+
+        components = {
+            "data_quality": data_quality,
+            "authority": authority,
+            "company_fit": company_fit,
+            "timing": timing,
+            "risk": risk,
+        }
+        weighted = np.zeros(n)
+        for comp in COMPONENT_ORDER:
+            weighted = weighted + (components[comp] * COMPONENT_NORMALISERS[comp]) * (
+                DEFAULT_WEIGHTS.get(comp, 0.2)
+            )
+
+        # Boosts: one bulk query for buyer signals, enrichment_data parsed in-process
+        buyer_boosts = await self._load_buyer_boosts_bulk(db, {d.lower() for d in domains if d})
+        no_buyer = {"boost_points": 0, "reason": None}
+        buyer = [buyer_boosts.get(d.lower(), no_buyer) if d else no_buyer for d in domains]
+        linkedin = [self._linkedin_boost_for_row(row) for row in rows]
+        multi_source = [self._multi_source_boost_for_row(row) for row in rows]
+        social_timing = [self._social_timing_boost_for_row(row) for row in rows]
+
+        for boosts in (buyer, linkedin, multi_source, social_timing):
+            weighted = weighted + np.fromiter(
+                (b.get("boost_points", 0) for b in boosts), dtype=np.float64, count=n
+            )
+
+        total_scores = np.clip(weighted, 0, 100).astype(np.int64)
+        tiers = _tiers_for_scores(total_scores)
+
+        breakdowns = []
+        for i, row in enumerate(rows):
+            raw = {comp: int(components[comp][i]) for comp in COMPONENT_ORDER}
+            tier = str(tiers[i])
+            channels = self._get_channels_for_tier(tier)
+            breakdowns.append(
+                {
+                    "propensity_score": int(total_scores[i]),
+                    "als_tier": tier,
+                    "als_data_quality": raw["data_quality"],
+                    "als_authority": raw["authority"],
+                    "als_company_fit": raw["company_fit"],
+                    "als_timing": raw["timing"],
+                    "als_risk": raw["risk"],
+                    "als_components": {
+                        **raw,
+                        "multi_source_boost": multi_source[i].get("boost_points", 0),
+                        "social_timing_boost": social_timing[i].get("boost_points", 0),
+                        "multi_source_sources": multi_source[i].get("sources", []),
+                        "social_timing_signals": social_timing[i].get("signals", []),
+                    },
+                    "available_channels": [c.value for c in channels],
+                    "lead_pool_id": str(row["id"]),
+                    "buyer_boost": buyer[i].get("boost_points", 0),
+                    "buyer_boost_reason": buyer[i].get("reason"),
+                    "linkedin_boost": linkedin[i].get("boost_points", 0),
+                    "linkedin_signals": linkedin[i].get("signals", []),
+                    "multi_source_boost": multi_source[i].get("boost_points", 0),
+                    "multi_source_sources": multi_source[i].get("sources", []),
+                    "social_timing_boost": social_timing[i].get("boost_points", 0),
+                    "social_timing_signals": social_timing[i].get("signals", []),
+                }
+            )
+        return breakdowns
+
+    def _linkedin_boost_for_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """_get_linkedin_boost against an already-loaded lead_pool row."""
+        if not row.get("enrichment_data"):
+            return {"boost_points": 0, "signals": []}
+        try:
+            return self._linkedin_boost_from_enrichment(row["enrichment_data"])
+        except Exception as e:
+            logger.warning(f"Error getting LinkedIn boost for {row.get('id')}: {e}")
+            return {"boost_points": 0, "signals": []}
+
+    def _multi_source_boost_for_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """_get_multi_source_boost against an already-loaded lead_pool row."""
+        try:
+            return self._multi_source_boost_from_enrichment(
+                row.get("enrichment_data"), row.get("enrichment_source"), row.get("email_status")
+            )
+        except Exception as e:
+            logger.warning(f"Error getting multi-source boost for {row.get('id')}: {e}")
+            return {"boost_points": 0, "sources": [], "reason": None}
+
+    def _social_timing_boost_for_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """_get_social_post_timing_boost against an already-loaded lead_pool row."""
+        try:
+            boost_points, signals_found = 0, []
+            if row.get("enrichment_data"):
+                boost_points, signals_found = self._social_post_signals_from_enrichment(
+                    row["enrichment_data"]
+                )
+            return self._social_timing_boost_result(boost_points, signals_found)
+        except Exception as e:
+            logger.warning(f"Error getting social post timing boost: {e}")
+            return {"boost_points": 0, "signals": [], "reason": None}
+
+    async def _score_batch_columnar(
+        self,
+        db: AsyncSession,
+        lead_ids: list[UUID],
+        target_industries: list[str] | None = None,
+        competitor_domains: list[str] | None = None,
+    ) -> EngineResult[dict[str, Any]]:
+        """
+        Columnar equivalent of score_batch.
+
+        Args:
+            db: Database session (passed by caller)
+            lead_ids: List of lead UUIDs to score
+            target_industries: Optional target industries
+            competitor_domains: Optional competitor domains
+
+        Returns:
+            EngineResult with the same batch summary as score_batch
+        """
+        results = {
+            "total": len(lead_ids),
+            "scored": 0,
+            "failures": 0,
+            "tier_distribution": {"hot": 0, "warm": 0, "cool": 0, "cold": 0, "dead": 0},
+            "average_score": 0.0,
+            "scored_leads": [],
+            "failed_leads": [],
+        }
+        total_score = 0
+
+        for start in range(0, len(lead_ids), COLUMNAR_CHUNK_SIZE):
+            chunk_ids = lead_ids[start : start + COLUMNAR_CHUNK_SIZE]
+            try:
+                stmt = select(Lead).where(
+                    and_(
+                        Lead.id.in_(chunk_ids),
+                        Lead.deleted_at.is_(None),  # Soft delete check
+                    )
+                )
+                leads_by_id = {str(lead.id): lead for lead in (await db.execute(stmt)).scalars()}
+
+                found = []
+                for lead_id in chunk_ids:
+                    lead = leads_by_id.get(str(lead_id))
+                    if lead is None:
+                        results["failures"] += 1
+                        results["failed_leads"].append(
+                            {"lead_id": str(lead_id), "error": f"Lead not found: {lead_id}"}
+                        )
+                    else:
+                        found.append(lead)
+
+                breakdowns = await self._score_lead_rows_columnar(
+                    db, found, target_industries, competitor_domains
+                )
+                await self._bulk_update_lead_scores(db, breakdowns)
+
+            except Exception as e:
+                logger.error(f"Columnar lead scoring failed for chunk at {start}: {e}")
+                # Earlier chunks are committed; reset the aborted transaction
+                # so the next chunk does not run on it.
+                await db.rollback()
+                for lead_id in chunk_ids:
+                    results["failures"] += 1
+                    results["failed_leads"].append({"lead_id": str(lead_id), "error": str(e)})
+                continue
+
+            for breakdown in breakdowns:
+                tier = breakdown["als_tier"]
+                score = breakdown["propensity_score"]
+                results["scored"] += 1
+                total_score += score
+                results["tier_distribution"][tier] += 1
+                results["scored_leads"].append(
+                    {"lead_id": breakdown["lead_id"], "score": score, "tier": tier}
+                )
+
+        if results["scored"] > 0:
+            results["average_score"] = total_score / results["scored"]
+
+        return EngineResult.ok(
+            data=results,
+            metadata={
+                "batch_size": len(lead_ids),
+                "success_rate": results["scored"] / results["total"] if results["total"] > 0 else 0,
+                "mode": "columnar",
+            },
+        )
+
+    async def _score_lead_rows_columnar(
+        self,
+        db: AsyncSession,
+        leads: list[Lead],
+        target_industries: list[str] | None = None,
+        competitor_domains: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Score bulk-loaded Lead rows as columns.
+
+        Args:
+            db: Database session (for bulk weight/pattern/buyer lookups)
+            leads: Lead instances
+            target_industries: Optional target industries
+            competitor_domains: Optional competitor domains
+
+        Returns:
+            One score breakdown per lead, identical to score_lead's
+        """
+        if not leads:
+            return []
+
+        n = len(leads)
+        today = date.today()
+        icp_config = DEFAULT_ICP_CONFIG.copy()
+        emp_range = icp_config.get("employee_range", {"min": 5, "max": 50})
+        emp_min = emp_range.get("min", 5)
+        emp_max = emp_range.get("max", 50)
+        competitor_set = {d.lower() for d in competitor_domains or []}
+
+        def flag(attr: str) -> np.ndarray:
+            return np.fromiter((bool(getattr(lead, attr)) for lead in leads), dtype=bool, count=n)
+
+        def months_since(attr: str) -> np.ndarray:
+            days = np.fromiter(
+                (_days_since(getattr(lead, attr), today) for lead in leads),
+                dtype=np.float64,
+                count=n,
+            )
+            return days / 30
+
+        titles = [lead.title for lead in leads]
+        domains = [lead.domain for lead in leads]
+
+        # Data Quality (20 max)
+        email_points = np.where(flag("email_verified"), SCORE_EMAIL_VERIFIED, 4 * flag("email"))
+        phone_points = np.where(flag("phone_verified"), SCORE_PHONE, 3) * flag("phone")
+        data_quality = np.minimum(
+            20,
+            email_points
+            + phone_points
+            + SCORE_LINKEDIN * flag("linkedin_url")
+            + SCORE_PERSONAL_EMAIL * flag("personal_email"),
+        )
+
+        # Authority (25 max)
+        authority = _map_distinct(titles, lambda t: self._score_authority(SimpleNamespace(title=t)))
+
+        # Company Fit (25 max)
+        def company_fit_for(industry: str | None = None, country: str | None = None) -> int:
+            return self._score_company_fit(
+                SimpleNamespace(
+                    organization_industry=industry,
+                    organization_employee_count=None,
+                    organization_country=country,
+                ),
+                target_industries,
+                icp_config,
+            )
+
+        industry_points = _map_distinct(
+            [lead.organization_industry for lead in leads],
+            lambda industry: company_fit_for(industry=industry),
+        )
+        country_points = _map_distinct(
+            [lead.organization_country for lead in leads],
+            lambda country: company_fit_for(country=country),
+        )
+        counts = np.fromiter(
+            (float(c) if (c := lead.organization_employee_count) else np.nan for lead in leads),
+            dtype=np.float64,
+            count=n,
+        )
+        employee_points = np.select(
+            [
+                (emp_min <= counts) & (counts <= emp_max),
+                (emp_max < counts) & (counts <= emp_max * 4),
+                (counts < emp_min) & (counts >= 1),
+            ],
+            [SCORE_EMPLOYEE_COUNT_IDEAL, 5, 3],
+            default=0,
+        )
+        company_fit = np.minimum(25, industry_points + employee_points + country_points)
+
+        # Timing (15 max)
+        months_in_role = months_since("employment_start_date")
+        months_since_funding = months_since("organization_latest_funding_date")
+        timing = np.minimum(
+            15,
+            np.select([months_in_role < 6, months_in_role < 12], [SCORE_NEW_ROLE, 3], default=0)
+            + SCORE_HIRING * flag("organization_is_hiring")
+            + np.select(
+                [months_since_funding < 12, months_since_funding < 24],
+                [SCORE_RECENT_FUNDING, 2],
+                default=0,
+            ),
+        )
+
+        # Risk (15 base with deductions)
+        bounced = np.fromiter(((lead.bounce_count or 0) > 0 for lead in leads), dtype=bool, count=n)
+        unsubscribed = np.fromiter(
+            (lead.status == LeadStatus.UNSUBSCRIBED for lead in leads), dtype=bool, count=n
+        )
+        competitor = _map_distinct(
+            domains, lambda d: bool(competitor_set and d and d.lower() in competitor_set)
+        )
+        bad_title_points = _map_distinct(
+            titles,
+            lambda t: (
+                self._score_risk(SimpleNamespace(bounce_count=0, status=None, domain=None, title=t))
+                - 15
+            ),
+        )
+        risk = np.maximum(
+            0,
+            15
+            + DEDUCTION_BOUNCED * bounced
+            + DEDUCTION_UNSUBSCRIBED * unsubscribed
+            + DEDUCTION_COMPETITOR * competitor
+            + bad_title_points,
+        )
+
+        components = {
+            "data_quality": data_quality,
+            "authority": authority,
+            "company_fit": company_fit,
+            "timing": timing,
+            "risk": risk,
+        }
+
+        # Phase 16: learned weights per client (one set-based load for the batch)
+        client_ids = list({lead.client_id for lead in leads})
+        learned_by_client, funnel_by_client = await self._load_client_scoring_inputs_bulk(
+            db, client_ids
+        )
+        weights_by_client = {
+            cid: (learned_by_client[cid], "learned")
+            if learned_by_client.get(cid)
+            else (DEFAULT_WEIGHTS.copy(), "default")
+            for cid in client_ids
+        }
+        row_weights = [weights_by_client[lead.client_id][0] for lead in leads]
+
+        weighted = np.zeros(n)
+        for comp in COMPONENT_ORDER:
+            comp_weights = np.fromiter(
+                (w.get(comp, 0.2) for w in row_weights), dtype=np.float64, count=n
+            )
+            weighted = weighted + (components[comp] * COMPONENT_NORMALISERS[comp]) * comp_weights
+
+        # Phase 24F: buyer boost
+        buyer_boosts = await self._load_buyer_boosts_bulk(db, {d.lower() for d in domains if d})
+        no_buyer = {"boost_points": 0, "reason": None}
+        buyer = [buyer_boosts.get(d.lower(), no_buyer) if d else no_buyer for d in domains]
+        weighted = weighted + np.fromiter(
+            (b.get("boost_points", 0) for b in buyer), dtype=np.float64, count=n
+        )
+
+        # Phase 24E: funnel boost keyed on the preliminary tier
+        prelim_tiers = _tiers_for_scores(np.clip(weighted, 0, 100).astype(np.int64))
+        funnel_cache: dict[tuple[Any, str], dict[str, Any]] = {}
+        funnel = []
+        for lead, prelim_tier in zip(leads, prelim_tiers, strict=True):
+            key = (lead.client_id, str(prelim_tier))
+            if key not in funnel_cache:
+                patterns = funnel_by_client.get(lead.client_id)
+                funnel_cache[key] = (
+                    self._funnel_boost_from_patterns(patterns, key[1])
+                    if lead.client_id and patterns
+                    else {"boost_points": 0, "signals": []}
+                )
+            funnel.append(funnel_cache[key])
+        weighted = weighted + np.fromiter(
+            (f.get("boost_points", 0) for f in funnel), dtype=np.float64, count=n
+        )
+
+        total_scores = np.clip(weighted, 0, 100).astype(np.int64)
+        tiers = _tiers_for_scores(total_scores)
+
+        breakdowns = []
+        for i, lead in enumerate(leads):
+            raw = {comp: int(components[comp][i]) for comp in COMPONENT_ORDER}
+            tier = str(tiers[i])
+            channels = self._get_channels_for_tier(tier)
+            weights, weights_source = weights_by_client[lead.client_id]
+            breakdowns.append(
+                {
+                    "propensity_score": int(total_scores[i]),
+                    "als_tier": tier,
+                    "als_data_quality": raw["data_quality"],
+                    "als_authority": raw["authority"],
+                    "als_company_fit": raw["company_fit"],
+                    "als_timing": raw["timing"],
+                    "als_risk": raw["risk"],
+                    "als_components": raw,
+                    "als_weights_used": weights,
+                    "weights_source": weights_source,
+                    "available_channels": [c.value for c in channels],
+                    "lead_id": str(lead.id),
+                    "buyer_boost": buyer[i].get("boost_points", 0),
+                    "buyer_boost_reason": buyer[i].get("reason"),
+                    "funnel_boost": funnel[i].get("boost_points", 0),
+                    "funnel_signals": funnel[i].get("signals", []),
+                }
+            )
+        return breakdowns
+
+    async def _load_pool_rows_bulk(
+        self,
+        db: AsyncSession,
+        lead_pool_ids: list[UUID],
+    ) -> list[dict[str, Any]]:
+        """
+        Load pool rows plus the enrichment columns the boosts read, in one query.
+
+        Args:
+            db: Database session
+            lead_pool_ids: Pool lead UUIDs
+
+        Returns:
+            List of pool lead dicts (missing ids are simply absent)
+        """
+        query = text("""
+            SELECT id, email, email_status, phone, linkedin_url,
+                   title, seniority, company_name, company_domain,
+                   company_industry, company_employee_count, company_country,
+                   company_founded_year, company_is_hiring,
+                   company_latest_funding_date, is_bounced, is_unsubscribed,
+                   pool_status, enrichment_confidence,
+                   enrichment_data, enrichment_source
+            FROM lead_pool
+            WHERE id = ANY(:lead_pool_ids)
+        """).bindparams(bindparam("lead_pool_ids", type_=PG_ARRAY(SA_UUID(as_uuid=True))))
+
+        result = await db.execute(query, {"lead_pool_ids": [UUID(str(i)) for i in lead_pool_ids]})
+        return [dict(row._mapping) for row in result.fetchall()]
+
+    async def _load_buyer_boosts_bulk(
+        self,
+        db: AsyncSession,
+        domains: set[str],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Resolve buyer boosts for many domains in one query.
+
+        Set-based equivalent of _get_buyer_boost: only domains with a positive
+        get_buyer_score_boost and a platform_buyer_signals row get a boost.
+
+        Args:
+            db: Database session
+            domains: Lowercased company domains
+
+        Returns:
+            Dict of domain -> {"boost_points", "reason"} for boosted domains only
+        """
+        if not domains:
+            return {}
+
+        try:
+            result = await db.execute(
+                text("""
+                    SELECT d.domain,
+                           get_buyer_score_boost(d.domain) AS boost,
+                           pbs.times_bought,
+                           pbs.domain IS NOT NULL AS has_signal
+                    FROM unnest(:domains) AS d(domain)
+                    LEFT JOIN platform_buyer_signals pbs ON pbs.domain = d.domain
+                """).bindparams(bindparam("domains", type_=PG_ARRAY(Text))),
+                {"domains": sorted(domains)},
+            )
+            return {
+                row.domain: self._buyer_boost_from_signal(row.boost, row.times_bought)
+                for row in result.fetchall()
+                if row.has_signal and (row.boost or 0) > 0
+            }
+
+        except Exception as e:
+            logger.warning(f"Error bulk-loading buyer boosts for {len(domains)} domains: {e}")
+            return {}
+
+    async def _load_client_scoring_inputs_bulk(
+        self,
+        db: AsyncSession,
+        client_ids: list[UUID],
+    ) -> tuple[dict[Any, dict[str, float] | None], dict[Any, dict[str, Any] | None]]:
+        """
+        Load learned weights and funnel patterns for many clients at once.
+
+        Set-based equivalent of _get_learned_weights + the pattern fetch in
+        _get_funnel_boost. Learned weights come from the scoring config cache
+        like the per-lead path; only cache misses are read from the DB and
+        then cached.
+
+        Args:
+            db: Database session
+            client_ids: Client UUIDs in the batch
+
+        Returns:
+            Tuple of (learned weights by client, funnel patterns by client)
+        """
+        cache = get_scoring_config_cache()
+        learned: dict[Any, dict[str, float] | None] = {}
+        misses: list[Any] = []
+        for client_id in client_ids:
+            hit, weights = cache.get(NS_LEARNED_WEIGHTS, str(client_id))
+            if hit:
+                learned[client_id] = weights
+            else:
+                misses.append(client_id)
+        # Observed before the load so an invalidation during it discards the result
+        version = cache.version(NS_LEARNED_WEIGHTS)
+        generations = {cid: cache.generation(NS_LEARNED_WEIGHTS, str(cid)) for cid in misses}
+
+        stored: dict[Any, dict[str, float] | None] = {}
+        if misses:
+            client_result = await db.execute(
+                select(Client.id, Client.propensity_learned_weights).where(Client.id.in_(misses))
+            )
+            stored = {row.id: row.propensity_learned_weights for row in client_result}
+
+        pattern_result = await db.execute(
+            select(
+                ConversionPattern.client_id,
+                ConversionPattern.pattern_type,
+                ConversionPattern.patterns,
+            ).where(
+                and_(
+                    ConversionPattern.client_id.in_(client_ids),
+                    ConversionPattern.pattern_type.in_(("who", "funnel")),
+                    ConversionPattern.valid_until
+                    > datetime.now(UTC).replace(
+                        tzinfo=None
+                    ),  # asyncpg: naive UTC for mapped Mapped[datetime] column
+                )
+            )
+        )
+        patterns_by_key: dict[tuple[Any, str], list[dict[str, Any] | None]] = {}
+        for row in pattern_result:
+            patterns_by_key.setdefault((row.client_id, row.pattern_type), []).append(row.patterns)
+
+        for client_id in misses:
+            learned[client_id] = self._resolve_learned_weights(
+                client_id,
+                stored.get(client_id),
+                patterns_by_key.get((client_id, "who"), []),
+            )
+            cache.set(
+                NS_LEARNED_WEIGHTS,
+                str(client_id),
+                learned[client_id],
+                version=version,
+                generation=generations[client_id],
+            )
+        funnel: dict[Any, dict[str, Any] | None] = {}
+        for client_id in client_ids:
+            # _get_funnel_boost uses scalar_one_or_none: ambiguous patterns mean none
+            funnel_rows = patterns_by_key.get((client_id, "funnel"), [])
+            funnel[client_id] = funnel_rows[0] if len(funnel_rows) == 1 else None
+
+        return learned, funnel
+
+    async def _bulk_update_pool_scores(
+        self,
+        db: AsyncSession,
+        breakdowns: list[dict[str, Any]],
+    ) -> None:
+        """
+        Write pool scores with UPDATE lead_pool ... FROM (VALUES ...).
+
+        Same columns as _update_pool_lead_score, one statement per chunk and
+        a single commit.
+
+        Args:
+            db: Database session
+            breakdowns: Score breakdowns from _score_pool_rows_columnar
+        """
+        if not breakdowns:
+            return
+
+        columns = [
+            ("id", "uuid"),
+            ("als_score", "integer"),
+            ("als_tier", "text"),
+            ("als_components", "jsonb"),
+        ]
+        rows = [
+            {
+                "id": b["lead_pool_id"],
+                "als_score": b["propensity_score"],
+                "als_tier": b["als_tier"],
+                "als_components": json.dumps(b.get("als_components", {})),
+            }
+            for b in breakdowns
+        ]
+        for values_sql, params in _values_update_chunks(columns, rows):
+            await db.execute(
+                text(f"""
+                    UPDATE lead_pool AS lp
+                    SET als_score = v.als_score,
+                        als_tier = v.als_tier,
+                        als_components = v.als_components,
+                        scored_at = NOW(),
+                        updated_at = NOW()
+                    FROM (VALUES {values_sql}) AS v(id, als_score, als_tier, als_components)
+                    WHERE lp.id = v.id
+                """),
+                params,
+            )
+        await db.commit()
+
+    async def _bulk_update_lead_scores(
+        self,
+        db: AsyncSession,
+        breakdowns: list[dict[str, Any]],
+    ) -> None:
+        """
+        Write lead scores with UPDATE leads ... FROM (VALUES ...).
+
+        Same columns as _update_lead_score, one statement per chunk and a
+        single commit.
+
+        Args:
+            db: Database session
+            breakdowns: Score breakdowns from _score_lead_rows_columnar
+        """
+        if not breakdowns:
+            return
+
+        columns = [
+            ("id", "uuid"),
+            ("als_score", "integer"),
+            ("als_tier", "text"),
+            ("als_data_quality", "integer"),
+            ("als_authority", "integer"),
+            ("als_company_fit", "integer"),
+            ("als_timing", "integer"),
+            ("als_risk", "integer"),
+            ("als_components", "jsonb"),
+            ("als_weights_used", "jsonb"),
+        ]
+        rows = [
+            {
+                "id": b["lead_id"],
+                "als_score": b["propensity_score"],
+                "als_tier": b["als_tier"],
+                "als_data_quality": b["als_data_quality"],
+                "als_authority": b["als_authority"],
+                "als_company_fit": b["als_company_fit"],
+                "als_timing": b["als_timing"],
+                "als_risk": b["als_risk"],
+                "als_components": json.dumps(b.get("als_components")),
+                "als_weights_used": json.dumps(b.get("als_weights_used")),
+            }
+            for b in breakdowns
+        ]
+        column_list = ", ".join(name for name, _ in columns)
+        for values_sql, params in _values_update_chunks(columns, rows):
+            await db.execute(
+                text(f"""
+                    UPDATE leads AS l
+                    SET als_score = v.als_score,
+                        als_tier = v.als_tier,
+                        als_data_quality = v.als_data_quality,
+                        als_authority = v.als_authority,
+                        als_company_fit = v.als_company_fit,
+                        als_timing = v.als_timing,
+                        als_risk = v.als_risk,
+                        als_components = v.als_components,
+                        als_weights_used = v.als_weights_used,
+                        scored_at = NOW(),
+                        status = :status,
+                        updated_at = NOW()
+                    FROM (VALUES {values_sql}) AS v({column_list})
+                    WHERE l.id = v.id
+                """),
+                {**params, "status": LeadStatus.SCORED.value},
+            )
+        await db.commit()
+
     # ============================================
     # CLIENT-SPECIFIC ASSIGNMENT SCORING
     # ============================================
@@ -2791,3 +3967,11 @@ def get_scorer_engine() -> ScorerEngine:
 # [x] Funnel boost integrated into score_assignment
 # [x] funnel_boost and funnel_signals in score breakdown
 # [x] Loads funnel patterns from ConversionPattern table
+# ============================================
+# COLUMNAR BATCH SCORING
+# ============================================
+# [x] columnar=True on score_batch and score_pool_batch
+# [x] Bulk pool/lead load, buyer boosts, learned weights + funnel patterns
+# [x] NumPy component kernels (string rules evaluated per distinct value)
+# [x] Bulk UPDATE ... FROM (VALUES ...) chunked under BULK_UPDATE_MAX_PARAMS
+# [x] Parity tests against the per-lead path
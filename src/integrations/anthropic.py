@@ -7,10 +7,12 @@ DEPENDENCIES:
   - src/config/settings.py
   - src/exceptions.py
   - src/integrations/redis.py
+  - src/integrations/llm_response_cache.py
 RULES APPLIED:
   - Rule 1: Follow blueprint exactly
   - Rule 15: AI spend limiter (daily circuit breaker)
 UPDATED: 2026-01-30 - Added prompt caching (90% cost reduction on repeated system prompts)
+UPDATED: 2026-10-16 - Opt-in response cache for temperature-0 completions
 """
 
 from typing import Any
@@ -20,6 +22,7 @@ from anthropic import AsyncAnthropic
 
 from src.config.settings import settings
 from src.exceptions import AISpendLimitError, APIError, IntegrationError
+from src.integrations.llm_response_cache import cache_key, get_llm_response_cache, is_cacheable
 from src.integrations.redis import ai_spend_tracker
 
 
@@ -57,6 +60,9 @@ class AnthropicClient:
     COST_PER_M_OUTPUT_TOKENS = 6.20
     COST_PER_M_CACHED_TOKENS = 0.124  # 90% discount
 
+    # Message Batches API bills every token class at 50% of the interactive rate
+    BATCH_DISCOUNT = 0.5
+
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or settings.anthropic_api_key
         if not self.api_key:
@@ -66,6 +72,7 @@ class AnthropicClient:
             )
         self._client = AsyncAnthropic(api_key=self.api_key)
         self.daily_limit = settings.anthropic_daily_spend_limit
+        self._response_cache = get_llm_response_cache()
 
     @property
     def messages(self) -> Any:
@@ -103,6 +110,8 @@ class AnthropicClient:
         output_tokens: int,
         cached_tokens: int = 0,
         model: str = "claude-3-5-haiku-20241022",
+        discount: float = 1.0,
+        cache_hit: bool = False,
     ) -> float:
         """
         Record spend from API call.
@@ -112,9 +121,12 @@ class AnthropicClient:
             output_tokens: Output tokens used
             cached_tokens: Cached input tokens (90% discount)
             model: Model used for pricing lookup
+            discount: Price multiplier (BATCH_DISCOUNT for batch results)
+            cache_hit: Served from the response cache; the cost is booked as
+                saved instead of spent
 
         Returns:
-            Cost in AUD
+            Cost in AUD (what the call cost, or would have cost on a cache hit)
         """
         pricing = self.MODEL_PRICING.get(
             model,
@@ -132,7 +144,11 @@ class AnthropicClient:
             (regular_input / 1_000_000) * pricing["input"]
             + (cached_tokens / 1_000_000) * pricing["cached"]
             + (output_tokens / 1_000_000) * pricing["output"]
-        )
+        ) * discount
+        if cache_hit:
+            if self._response_cache is not None:
+                await self._response_cache.record_saving(cost)
+            return cost
         await ai_spend_tracker.add_spend(cost)
         return cost
 
@@ -153,6 +169,46 @@ class AnthropicClient:
             max_tokens / 1_000_000
         ) * self.COST_PER_M_OUTPUT_TOKENS
 
+    def message_params(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        model: str = "claude-3-5-haiku-20241022",
+        enable_caching: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Build /v1/messages request parameters.
+
+        complete() sends these directly; batch callers submit them as the
+        ``params`` of a Message Batches request so both paths see the same
+        request, including the cached system prompt.
+
+        Returns:
+            Keyword arguments for messages.create()
+        """
+        messages: list[anthropic.types.MessageParam] = [{"role": "user", "content": prompt}]
+
+        # Build system prompt with caching if enabled
+        system_param: str | list[dict] = ""
+        if system:
+            if enable_caching:
+                # Use array format with cache_control for caching
+                system_param = [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+                ]
+            else:
+                system_param = system
+
+        return {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_param,
+            "messages": messages,
+        }
+
     async def complete(
         self,
         prompt: str,
@@ -161,6 +217,7 @@ class AnthropicClient:
         temperature: float = 0.7,
         model: str = "claude-3-5-haiku-20241022",
         enable_caching: bool = True,
+        cache: bool = False,
     ) -> dict[str, Any]:
         """
         Generate a completion with optional prompt caching.
@@ -172,37 +229,39 @@ class AnthropicClient:
             temperature: Sampling temperature
             model: Model to use
             enable_caching: Whether to cache system prompt (90% cost reduction)
+            cache: Serve/store the whole response in the LLM response cache.
+                Only honoured at temperature 0; other calls always hit the API.
 
         Returns:
-            Completion result with content and usage
+            Completion result with content and usage. Cache hits have
+            cost_aud 0.0, cache_hit True and cost_saved_aud set.
 
         Raises:
             AISpendLimitError: If daily spend limit exceeded
         """
+        key = None
+        if cache and self._response_cache is not None and is_cacheable(temperature):
+            key = cache_key(model, system, prompt, temperature, max_tokens)
+            cached = await self._response_cache.get(key)
+            if cached is not None:
+                saved = await self._record_spend(
+                    cached["input_tokens"],
+                    cached["output_tokens"],
+                    cached_tokens=cached.get("cached_tokens", 0),
+                    model=model,
+                    cache_hit=True,
+                )
+                return {**cached, "cost_aud": 0.0, "cache_hit": True, "cost_saved_aud": saved}
+
         # Estimate and check budget
         estimated_cost = self._estimate_cost(max_tokens, len(prompt) + len(system or ""))
         await self._check_budget(estimated_cost)
 
         try:
-            messages: list[anthropic.types.MessageParam] = [{"role": "user", "content": prompt}]
-
-            # Build system prompt with caching if enabled
-            system_param: str | list[dict] = ""
-            if system:
-                if enable_caching:
-                    # Use array format with cache_control for caching
-                    system_param = [
-                        {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
-                    ]
-                else:
-                    system_param = system
-
             response = await self._client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_param,
-                messages=messages,
+                **self.message_params(
+                    prompt, system, max_tokens, temperature, model, enable_caching
+                )
             )
 
             # Check for cached tokens
@@ -225,15 +284,17 @@ class AnthropicClient:
                 if hasattr(first_block, "text"):
                     content_text = first_block.text
 
-            return {
+            completion = {
                 "content": content_text,
                 "model": response.model,
                 "input_tokens": response.usage.input_tokens,
                 "output_tokens": response.usage.output_tokens,
                 "cached_tokens": cached_tokens,
-                "cost_aud": cost,
                 "stop_reason": response.stop_reason,
             }
+            if key is not None and response.stop_reason != "max_tokens":
+                await self._response_cache.set(key, model, completion)
+            return {**completion, "cost_aud": cost}
 
         except anthropic.APIError as e:
             raise APIError(
@@ -242,6 +303,86 @@ class AnthropicClient:
                 message=f"Anthropic API error: {str(e)}",
             )
 
+    async def check_batch_budget(self, requests: list[dict[str, Any]]) -> float:
+        """
+        Check the daily budget for a Message Batches submission.
+
+        Args:
+            requests: message_params() dicts that will be submitted together
+
+        Returns:
+            Estimated batch cost in AUD
+
+        Raises:
+            AISpendLimitError: If the whole batch does not fit the remaining budget
+        """
+        estimated_cost = 0.0
+        for params in requests:
+            system = params.get("system") or ""
+            if isinstance(system, list):
+                system = "".join(block.get("text", "") for block in system)
+            prompt = "".join(str(m.get("content", "")) for m in params.get("messages", []))
+            estimated_cost += self._estimate_cost(params["max_tokens"], len(prompt) + len(system))
+        estimated_cost *= self.BATCH_DISCOUNT
+        await self._check_budget(estimated_cost)
+        return estimated_cost
+
+    async def batch_result(
+        self, entry: dict[str, Any], batch_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Convert one Message Batches result line into complete()'s return shape.
+
+        Spend is recorded at BATCH_DISCOUNT. Errored, canceled and expired
+        requests return None so the caller can fall back to complete().
+
+        Args:
+            entry: Result line ({"custom_id", "result": {"type", "message"}})
+            batch_id: Batch the line came from; when given, spend is recorded
+                only the first time the line is converted and a repeat
+                collection (a resumed run) reports cost_aud 0.0
+
+        Returns:
+            Completion result, or None if the request did not succeed
+        """
+        result = entry.get("result") or {}
+        if result.get("type") != "succeeded":
+            return None
+
+        message = result.get("message") or {}
+        usage = message.get("usage") or {}
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        cached_tokens = usage.get("cache_read_input_tokens") or 0
+        model = message.get("model", "")
+
+        cost = 0.0
+        if batch_id is None or await ai_spend_tracker.claim_batch_result(
+            batch_id, str(entry.get("custom_id"))
+        ):
+            cost = await self._record_spend(
+                input_tokens,
+                output_tokens,
+                cached_tokens=cached_tokens,
+                model=model,
+                discount=self.BATCH_DISCOUNT,
+            )
+
+        content_text = ""
+        blocks = message.get("content") or []
+        if blocks and blocks[0].get("type") == "text":
+            content_text = blocks[0].get("text", "")
+
+        return {
+            "content": content_text,
+            "model": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cached_tokens": cached_tokens,
+            "cost_aud": cost,
+            "stop_reason": message.get("stop_reason"),
+        }
+
     async def classify_intent(
         self,
         message: str,
@@ -273,11 +414,13 @@ Return JSON with: {"intent": "category", "confidence": 0.0-1.0, "reasoning": "br
         if context:
             prompt = f"Context: {context}\n\n{prompt}"
 
+        # Deterministic so reprocessing the same reply is served from the response cache
         result = await self.complete(
             prompt=prompt,
             system=system,
             max_tokens=200,
-            temperature=0.3,
+            temperature=0.0,
+            cache=True,
         )
 
         # Parse JSON from response
@@ -361,17 +504,23 @@ Return only the email body text."""
         Get current AI spend status.
 
         Returns:
-            Spend status with remaining budget
+            Spend status with remaining budget and response cache hit rate/AUD saved
         """
         spent = await ai_spend_tracker.get_spend()
         remaining = await ai_spend_tracker.get_remaining()
 
-        return {
+        status = {
             "daily_limit": self.daily_limit,
             "spent": spent,
             "remaining": remaining,
             "percentage_used": (spent / self.daily_limit) * 100 if self.daily_limit > 0 else 0,
         }
+        if self._response_cache is not None:
+            status["response_cache"] = {
+                "process": self._response_cache.stats(),
+                "today": await self._response_cache.daily_stats(),
+            }
+        return status
 
 
 # Singleton instance
@@ -396,6 +545,8 @@ def get_anthropic_client() -> AnthropicClient:
 # [x] Spend tracking via Redis
 # [x] Cost calculation
 # [x] Message completion
+# [x] Message Batches result conversion (batch discount)
+# [x] Opt-in temperature-0 response cache (hit rate + AUD saved)
 # [x] Intent classification
 # [x] Email generation
 # [x] Spend status reporting
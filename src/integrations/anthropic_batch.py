@@ -27,7 +27,9 @@ Beta headers used (see Anthropic batch + 300K-output beta docs):
 
 Security
   - No subprocess. No URL following from caller-supplied input.
-  - The only HTTP target is the constant ANTHROPIC_API_BASE.
+  - The only HTTP target is the constant ANTHROPIC_API_BASE, unless the
+    operator sets ANTHROPIC_BATCH_API_BASE (settings, never caller input)
+    to point at a local stub server; it must be an http(s) URL.
   - batch_id is matched against an allow-list regex before being
     interpolated into a URL path.
   - Caller-supplied `messages` are JSON-serialised by httpx; never
@@ -61,6 +63,9 @@ HTTP_TIMEOUT_S = 30.0
 POLL_INTERVAL_S = 5.0
 POLL_MAX_S = 60 * 60 * 4  # 4 hour safety cap on wait_for_batch
 
+# processing_status values after which results can be fetched
+TERMINAL_STATUSES = frozenset({"ended", "canceled", "expired", "failed"})
+
 _BATCH_ID_RE = re.compile(r"^msgbatch_[A-Za-z0-9_-]{1,128}$")
 
 
@@ -79,6 +84,15 @@ def _api_key() -> str:
     return key
 
 
+def _api_base() -> str:
+    override = (getattr(settings, "anthropic_batch_api_base", "") or "").strip().rstrip("/")
+    if not override:
+        return ANTHROPIC_API_BASE
+    if not override.startswith(("https://", "http://")):
+        raise AnthropicBatchError(f"anthropic_batch_api_base must be http(s): {override!r}")
+    return override
+
+
 def _headers() -> dict[str, str]:
     return {
         "x-api-key": _api_key(),
@@ -150,7 +164,7 @@ def create_batch(
 
     with httpx.Client(timeout=timeout) as client:
         resp = client.post(
-            f"{ANTHROPIC_API_BASE}/messages/batches",
+            f"{_api_base()}/messages/batches",
             json=body,
             headers=_headers(),
         )
@@ -176,7 +190,7 @@ def poll_batch(batch_id: str, *, timeout: float = HTTP_TIMEOUT_S) -> dict:
     bid = _validate_batch_id(batch_id)
     with httpx.Client(timeout=timeout) as client:
         resp = client.get(
-            f"{ANTHROPIC_API_BASE}/messages/batches/{bid}",
+            f"{_api_base()}/messages/batches/{bid}",
             headers=_headers(),
         )
     if resp.status_code >= 400:
@@ -191,7 +205,7 @@ def get_results(batch_id: str, *, timeout: float = HTTP_TIMEOUT_S) -> list[dict]
     bid = _validate_batch_id(batch_id)
     with httpx.Client(timeout=timeout) as client:
         resp = client.get(
-            f"{ANTHROPIC_API_BASE}/messages/batches/{bid}/results",
+            f"{_api_base()}/messages/batches/{bid}/results",
             headers=_headers(),
         )
     if resp.status_code >= 400:
@@ -217,7 +231,7 @@ def cancel_batch(batch_id: str, *, timeout: float = HTTP_TIMEOUT_S) -> dict:
     bid = _validate_batch_id(batch_id)
     with httpx.Client(timeout=timeout) as client:
         resp = client.post(
-            f"{ANTHROPIC_API_BASE}/messages/batches/{bid}/cancel",
+            f"{_api_base()}/messages/batches/{bid}/cancel",
             headers=_headers(),
         )
     if resp.status_code >= 400:
@@ -237,11 +251,10 @@ def wait_for_batch(
     if interval <= 0:
         raise AnthropicBatchError("interval must be > 0")
     deadline = time.monotonic() + max_wait_s
-    terminal = {"ended", "canceled", "expired", "failed"}
     while True:
         payload = poll_batch(batch_id)
         status = payload.get("processing_status")
-        if status in terminal:
+        if status in TERMINAL_STATUSES:
             logger.info(
                 "anthropic_batch.wait batch_id=%s terminal=%s counts=%s",
                 batch_id,
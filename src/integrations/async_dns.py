@@ -0,0 +1,227 @@
+"""
+Contract: src/integrations/async_dns.py
+Purpose: Non-blocking DNS lookups (A/AAAA/MX/TXT) with a shared, TTL-respecting
+         answer cache. Replaces per-call blocking dns.resolver.Resolver use in
+         enrichment and email verification so lookups no longer stall the
+         event loop and repeat lookups are served from memory.
+Layer: 2 - integrations
+Imports: dnspython (dns.asyncresolver)
+Consumers: src/pipeline/free_enrichment.py, src/pipeline/email_verifier.py,
+           src/pipeline/email_waterfall.py
+
+Caching:
+  - Positive answers live for the record TTL, capped at MAX_TTL.
+  - NXDOMAIN / NoAnswer are cached for NEGATIVE_TTL (dead domains are the
+    common case in discovery sweeps and are re-checked every run otherwise).
+  - Timeouts and server failures are never cached.
+Concurrency is bounded by a semaphore (``max_concurrency`` network lookups in
+flight). ``stats()`` reports lookups avoided and the network latency they
+would have cost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+DNS_TIMEOUT = 5.0
+MAX_CONCURRENCY = 50
+MAX_TTL = 6 * 60 * 60
+NEGATIVE_TTL = 15 * 60
+MAX_ENTRIES = 100_000
+
+STATUS_OK = "ok"
+STATUS_NXDOMAIN = "nxdomain"
+STATUS_NOANSWER = "noanswer"
+STATUS_ERROR = "error"
+
+
+@dataclass(frozen=True)
+class DNSAnswer:
+    """Outcome of one (name, rdtype) lookup.
+
+    records: A/AAAA addresses, MX exchanges (best preference first, no trailing
+    dot) or TXT strings. lookup_ms is the network time of the lookup that
+    produced the answer; cache hits return the same object, so it is also the
+    latency each hit saved.
+    """
+
+    name: str
+    rdtype: str
+    status: str
+    records: tuple[str, ...] = ()
+    lookup_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK and bool(self.records)
+
+
+def _records(answer: dns.resolver.Answer, rdtype: str) -> tuple[str, ...]:
+    if rdtype == "MX":
+        ordered = sorted(answer, key=lambda r: r.preference)
+        return tuple(str(r.exchange).rstrip(".") for r in ordered)
+    if rdtype == "TXT":
+        return tuple(b"".join(r.strings).decode(errors="replace") for r in answer)
+    return tuple(r.to_text() for r in answer)
+
+
+class AsyncDNSResolver:
+    """Cached, concurrency-bounded async resolver."""
+
+    def __init__(
+        self,
+        timeout: float = DNS_TIMEOUT,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_ttl: int = MAX_TTL,
+        negative_ttl: int = NEGATIVE_TTL,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+        self._max_ttl = max_ttl
+        self._negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        self._resolver: dns.asyncresolver.Resolver | None = None
+        # (name, rdtype) -> (expires_at monotonic, answer)
+        self._cache: dict[tuple[str, str], tuple[float, DNSAnswer]] = {}
+        self._sem: asyncio.Semaphore | None = None
+        self._sem_loop: asyncio.AbstractEventLoop | None = None
+
+        self.lookups = 0
+        self.cache_hits = 0
+        self.negative_hits = 0
+        self.network_lookups = 0
+        self.errors = 0
+        self.network_ms = 0.0
+        self.latency_saved_ms = 0.0
+
+    # --------------------------------------------
+    # Public API
+    # --------------------------------------------
+
+    async def resolve(self, name: str, rdtype: str) -> DNSAnswer:
+        """Resolve one record type; never raises."""
+        key = (name.lower().rstrip("."), rdtype.upper())
+        self.lookups += 1
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires_at, answer = cached
+            if expires_at > time.monotonic():
+                self.cache_hits += 1
+                if answer.status != STATUS_OK:
+                    self.negative_hits += 1
+                self.latency_saved_ms += answer.lookup_ms
+                return answer
+            del self._cache[key]
+
+        async with self._semaphore():
+            answer, ttl = await self._lookup(*key)
+        if ttl > 0:
+            if len(self._cache) >= self._max_entries:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (time.monotonic() + ttl, answer)
+        return answer
+
+    async def resolve_many(self, queries: Iterable[tuple[str, str]]) -> list[DNSAnswer]:
+        """Resolve (name, rdtype) pairs concurrently, aligned with ``queries``.
+
+        Duplicate pairs in the batch are looked up once.
+        """
+        queries = list(queries)
+        unique = {(n.lower().rstrip("."), t.upper()) for n, t in queries}
+        keys = list(unique)
+        resolved = await asyncio.gather(*(self.resolve(*k) for k in keys))
+        answers = dict(zip(keys, resolved, strict=True))
+        return [answers[(n.lower().rstrip("."), t.upper())] for n, t in queries]
+
+    async def has_address(self, domain: str) -> bool:
+        """True if the domain has an A or AAAA record. NXDOMAIN short-circuits."""
+        a = await self.resolve(domain, "A")
+        if a.ok:
+            return True
+        if a.status == STATUS_NXDOMAIN:
+            return False
+        return (await self.resolve(domain, "AAAA")).ok
+
+    def stats(self) -> dict:
+        """Cumulative counters for run summaries."""
+        return {
+            "lookups": self.lookups,
+            "cache_hits": self.cache_hits,
+            "negative_hits": self.negative_hits,
+            "network_lookups": self.network_lookups,
+            "errors": self.errors,
+            "network_ms": round(self.network_ms, 1),
+            "latency_saved_ms": round(self.latency_saved_ms, 1),
+            "cached_entries": len(self._cache),
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    # --------------------------------------------
+    # Network
+    # --------------------------------------------
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # A Semaphore binds to the loop it first waits on; rebuild it when the
+        # singleton is reused from a new loop (asyncio.run per CLI call/test).
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+            self._sem_loop = loop
+        return self._sem
+
+    async def _query(self, name: str, rdtype: str) -> tuple[tuple[str, ...], int]:
+        """Network lookup → (records, ttl). Raises dnspython exceptions."""
+        if self._resolver is None:
+            self._resolver = dns.asyncresolver.Resolver()
+        answer = await self._resolver.resolve(name, rdtype, lifetime=self._timeout)
+        return _records(answer, rdtype), answer.rrset.ttl if answer.rrset is not None else 0
+
+    async def _lookup(self, name: str, rdtype: str) -> tuple[DNSAnswer, int]:
+        """Run _query and classify the outcome → (answer, cache ttl)."""
+        self.network_lookups += 1
+        t0 = time.perf_counter()
+        try:
+            records, ttl = await self._query(name, rdtype)
+            status, ttl = STATUS_OK, min(ttl, self._max_ttl)
+        except dns.resolver.NXDOMAIN:
+            records, status, ttl = (), STATUS_NXDOMAIN, self._negative_ttl
+        except dns.resolver.NoAnswer:
+            records, status, ttl = (), STATUS_NOANSWER, self._negative_ttl
+        except (dns.exception.DNSException, OSError):
+            records, status, ttl = (), STATUS_ERROR, 0
+            self.errors += 1
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        self.network_ms += elapsed_ms
+        return DNSAnswer(name, rdtype, status, records, elapsed_ms), ttl
+
+
+def stats_delta(before: dict, after: dict) -> dict:
+    """Counter difference between two stats() snapshots (per-run figures)."""
+    delta = {k: round(v - before.get(k, 0), 1) for k, v in after.items()}
+    delta["cached_entries"] = after["cached_entries"]
+    return delta
+
+
+# ============================================
+# Module-level Singleton
+# ============================================
+
+_resolver: AsyncDNSResolver | None = None
+
+
+def get_dns_resolver() -> AsyncDNSResolver:
+    """Process-wide resolver, so every consumer shares one answer cache."""
+    global _resolver  # noqa: PLW0603
+    if _resolver is None:
+        _resolver = AsyncDNSResolver()
+    return _resolver
@@ -1,7 +1,7 @@
 # FILE: src/clients/dfs_labs_client.py
 # PURPOSE: DataForSEO Labs + Domain Analytics client for pipeline v4 discovery/intelligence
 # PHASE: Pipeline v4 — Stages 1 & 2
-# DEPENDENCIES: httpx, tenacity, src.config.settings
+# DEPENDENCIES: httpx, tenacity, src.config.settings, src.integrations.dfs_response_cache
 # DIRECTIVE: #255
 
 """
@@ -20,6 +20,8 @@ import httpx
 from tenacity import before_sleep_log, retry, stop_after_attempt, wait_exponential
 
 from src.config.settings import settings
+from src.integrations.dfs_response_cache import DFSResponseCache, get_dfs_response_cache
+from src.utils.adaptive_limiter import get_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,9 @@ DFS_STATUS_NO_DATA = 40501
 
 AUD_RATE = Decimal("1.55")
 
+DFS_CATEGORIES_ENDPOINT = "/v3/dataforseo_labs/categories"
+DFS_AVAILABLE_HISTORY_ENDPOINT = "/v3/dataforseo_labs/google/available_history"
+
 
 # ============================================
 # Custom Exceptions
@@ -67,12 +72,21 @@ class DFSLabsClient:
     - backlinks_summary()          — $0.020/call, Directive #303 intelligence
     - brand_serp()                 — $0.002/call, Directive #303 intelligence
     - indexed_pages()              — $0.002/call, Directive #303 intelligence
+
+    Pass a ``DFSResponseCache`` to share successful responses across
+    instances and runs; hits are booked as cost avoided, not cost.
     """
 
-    def __init__(self, login: str, password: str) -> None:
+    def __init__(
+        self,
+        login: str,
+        password: str,
+        response_cache: DFSResponseCache | None = None,
+    ) -> None:
         self.login = login
         self.password = password
         self._client: httpx.AsyncClient | None = None
+        self._response_cache = response_cache
 
         # Pre-compute Basic Auth header
         credentials = f"{self.login}:{self.password}"
@@ -104,6 +118,10 @@ class DFSLabsClient:
         self._cost_brand_serp = Decimal("0")
         self._cost_indexed_pages = Decimal("0")
 
+        # Cost avoided by response-cache hits, keyed by the _cost_* attr the
+        # call would have been booked to.
+        self._cost_avoided: dict[str, Decimal] = {}
+
         # Cache for get_categories (free, rarely changes)
         self._categories_cache: list[dict] | None = None
 
@@ -178,6 +196,16 @@ class DFSLabsClient:
         )
         return float(total_usd * AUD_RATE)
 
+    @property
+    def cost_avoided_usd(self) -> float:
+        """USD not spent because the response cache served the call."""
+        return float(sum(self._cost_avoided.values(), Decimal("0")))
+
+    @property
+    def cost_avoided_aud(self) -> float:
+        """AUD not spent because the response cache served the call."""
+        return float(sum(self._cost_avoided.values(), Decimal("0")) * AUD_RATE)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
@@ -208,13 +236,35 @@ class DFSLabsClient:
             DFSAuthError: If DFS returns auth failure status
             httpx.HTTPStatusError: On 429/500/502/503 (triggers tenacity retry)
         """
+        cache = self._response_cache
+        if cache is not None:
+            cached = await cache.get(endpoint, payload)
+            if cached is not None:
+                value, cost_usd = cached
+                self._cost_avoided[cost_attr] = (
+                    self._cost_avoided.get(cost_attr, Decimal("0")) + cost_usd
+                )
+                logger.info(f"DFS {endpoint}: cache hit, cost_avoided_usd={cost_usd}")
+                return value
+            if cache.replay:
+                logger.info("[REPLAY] DFS cache miss, no network: %s", endpoint)
+                return {"items": [], "total_count": 0}
         if os.environ.get("DRY_RUN"):
             logger.info("[DRY-RUN] Would call DFS: %s", endpoint)
             return {"items": [], "total_count": 0}
         client = await self._get_client()
-        t0 = time.monotonic()
-        response = await client.post(endpoint, json=payload)
-        elapsed = time.monotonic() - t0
+        # Provider-wide adaptive cap: every DFS stage shares this limiter, and
+        # each response (429/5xx/latency) feeds back into it.
+        limiter = get_limiter("dataforseo")
+        async with limiter:
+            t0 = time.monotonic()
+            try:
+                response = await client.post(endpoint, json=payload)
+            except httpx.TimeoutException:
+                limiter.observe(time.monotonic() - t0, timeout=True)
+                raise
+            elapsed = time.monotonic() - t0
+            limiter.observe(elapsed, response.status_code)
 
         # Trigger tenacity retry on transient HTTP errors
         if response.status_code in (429, 500, 502, 503):
@@ -258,7 +308,11 @@ class DFSLabsClient:
         )
 
         result = task.get("result") or []
-        return result[0] if result else {}
+        value = result[0] if result else {}
+        # Error and partial task results (40xxx/50xxx) are returned but never cached.
+        if cache is not None and dfs_status == DFS_STATUS_SUCCESS:
+            await cache.set(endpoint, payload, value, cost_per_call)
+        return value
 
     # ============================================
     # ENDPOINT 1: get_categories
@@ -266,7 +320,8 @@ class DFSLabsClient:
 
     async def get_categories(self) -> list[dict]:
         """
-        Fetch DataForSEO Labs categories (FREE, cached after first call).
+        Fetch DataForSEO Labs categories (FREE, cached after first call and in the
+        shared response cache when one is attached).
 
         Returns:
             List of dicts with category_code and category_name.
@@ -274,8 +329,19 @@ class DFSLabsClient:
         if self._categories_cache is not None:
             return self._categories_cache
 
+        cache = self._response_cache
+        if cache is not None:
+            cached = await cache.get(DFS_CATEGORIES_ENDPOINT, None)
+            if cached is not None:
+                self._categories_cache = cached[0]
+                return self._categories_cache
+            if cache.replay:
+                logger.info("[REPLAY] DFS categories not cached, no network")
+                self._categories_cache = []
+                return self._categories_cache
+
         client = await self._get_client()
-        response = await client.get("/v3/dataforseo_labs/categories")
+        response = await client.get(DFS_CATEGORIES_ENDPOINT)
         response.raise_for_status()
         data = response.json()
 
@@ -300,6 +366,8 @@ class DFSLabsClient:
         else:
             self._categories_cache = []
 
+        if cache is not None and dfs_status == DFS_STATUS_SUCCESS:
+            await cache.set(DFS_CATEGORIES_ENDPOINT, None, self._categories_cache, Decimal("0"))
         logger.info(f"DFS categories: fetched {len(self._categories_cache)} categories")
         return self._categories_cache
 
@@ -680,7 +748,8 @@ class DFSLabsClient:
         available_history endpoint returns the single latest valid date.
 
         Cost: FREE (GET request, no task charge).
-        Result cached for the lifetime of this client instance — one call per session.
+        Result cached for the lifetime of this client instance — one call per session
+        — and in the shared response cache (1 day) when one is attached.
 
         Returns:
             ISO date string e.g. "2026-03-01", or today-35d as fallback if fetch fails.
@@ -688,15 +757,24 @@ class DFSLabsClient:
         if self._available_history_date is not None:
             return self._available_history_date
 
+        cache = self._response_cache
         try:
+            cached = await cache.get(DFS_AVAILABLE_HISTORY_ENDPOINT, None) if cache else None
+            if cached is not None:
+                self._available_history_date = cached[0]
+                return self._available_history_date
+            if cache is not None and cache.replay:
+                raise RuntimeError("available_history not cached in replay mode")
             client = await self._get_client()
-            response = await client.get("/v3/dataforseo_labs/google/available_history")
+            response = await client.get(DFS_AVAILABLE_HISTORY_ENDPOINT)
             response.raise_for_status()
             data = response.json()
             result_list = (data.get("tasks") or [{}])[0].get("result") or []
             date_str = (result_list[0] if result_list else {}).get("date", "")
             if date_str:
                 self._available_history_date = date_str
+                if cache is not None:
+                    await cache.set(DFS_AVAILABLE_HISTORY_ENDPOINT, None, date_str, Decimal("0"))
                 logger.info("DFS available_history: latest date = %s", date_str)
                 return date_str
         except Exception as exc:
@@ -1403,6 +1481,7 @@ def get_dfs_labs_client() -> DFSLabsClient:
         _client = DFSLabsClient(
             login=settings.dataforseo_login,
             password=settings.dataforseo_password,
+            response_cache=get_dfs_response_cache(),
         )
     return _client
 
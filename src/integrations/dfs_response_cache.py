@@ -0,0 +1,318 @@
+# FILE: src/integrations/dfs_response_cache.py
+# PURPOSE: Shared content-addressed response cache for DataForSEO paid endpoints
+# PHASE: Pipeline v4 — Stages 1 & 2
+# DEPENDENCIES: redis, sqlite3, src.integrations.redis
+
+"""
+DFS Response Cache
+
+The same domains are re-queried across cohort runs, rescore flows and stale
+lead refresh. Every DFSLabsClient call is a paid task, so successful results
+are cached under a content address of (endpoint, canonical payload):
+
+    v1:dfs:<endpoint-slug>:<sha256(endpoint + canonical JSON payload)>
+
+Each endpoint has its own TTL (``DFS_CACHE_TTLS``); endpoints not listed are
+never cached. Entries are written to Redis (shared across workers) and to a
+local SQLite file (``DFS_CACHE_SQLITE_PATH``). Reads try Redis first and fall
+back to SQLite when Redis is unreachable — a failed Redis call parks Redis for
+``REDIS_RETRY_SECONDS`` so a down Redis costs one connection attempt per
+cooldown, not one per call. SQLite calls run in a worker thread so they never
+block the event loop.
+
+Replay mode (``replay=True`` / ``DFS_CACHE_REPLAY=1``) serves every call from
+the cache, ignoring TTLs, and never touches the network: misses come back as
+the DFS no-data shape and are counted. ``cohort_runner --replay-cache`` uses
+it for offline benchmarking.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from src.integrations.redis import build_cache_key, get_redis
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# Module-level Constants
+# ============================================
+
+DAY = 24 * 60 * 60
+
+# Per-endpoint TTL in seconds. Labs/backlinks data refreshes monthly at DFS, so
+# a week is safe; SERP/ads data moves daily. Endpoints absent here are not cached.
+DFS_CACHE_TTLS: dict[str, int] = {
+    "/v3/dataforseo_labs/categories": 30 * DAY,
+    "/v3/dataforseo_labs/google/available_history": 1 * DAY,
+    "/v3/domain_analytics/technologies/domains_by_technology/live": 7 * DAY,
+    "/v3/dataforseo_labs/google/competitors_domain/live": 7 * DAY,
+    "/v3/dataforseo_labs/google/domain_rank_overview/live": 7 * DAY,
+    "/v3/domain_analytics/technologies/domain_technologies/live": 14 * DAY,
+    "/v3/domain_analytics/technologies/domains_by_html_terms/live": 7 * DAY,
+    "/v3/dataforseo_labs/google/keywords_for_site/live": 7 * DAY,
+    "/v3/dataforseo_labs/google/historical_rank_overview/live": 30 * DAY,
+    "/v3/dataforseo_labs/google/domain_metrics_by_categories/live": 7 * DAY,
+    "/v3/dataforseo_labs/google/bulk_traffic_estimation/live": 7 * DAY,
+    "/v3/backlinks/summary/live": 7 * DAY,
+    "/v3/serp/google/organic/live/advanced": 1 * DAY,
+    "/v3/serp/google/maps/live/advanced": 1 * DAY,
+    "/v3/serp/google/ads_search/live/advanced": 1 * DAY,
+    "/v3/serp/google/ads/live/advanced": 1 * DAY,
+    "/v3/serp/google/jobs/live/advanced": 1 * DAY,
+}
+
+DFS_CACHE_ENABLED_ENV = "DFS_RESPONSE_CACHE"
+DFS_CACHE_REPLAY_ENV = "DFS_CACHE_REPLAY"
+DFS_CACHE_SQLITE_ENV = "DFS_CACHE_SQLITE_PATH"
+DEFAULT_SQLITE_PATH = Path("/tmp/keiracom_dfs_response_cache.sqlite3")
+
+REDIS_RETRY_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dfs_response_cache (
+    key        TEXT PRIMARY KEY,
+    endpoint   TEXT NOT NULL,
+    value      TEXT NOT NULL,
+    cost_usd   TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes"}
+
+
+# ============================================
+# Keying
+# ============================================
+
+
+def canonical_payload(payload: Any) -> str:
+    """Stable JSON for a request payload: sorted keys, no whitespace."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def cache_key(endpoint: str, payload: Any) -> str:
+    """Content address for (endpoint, payload)."""
+    digest = hashlib.sha256(f"{endpoint}\n{canonical_payload(payload)}".encode()).hexdigest()
+    slug = endpoint.strip("/").replace("/", ".")
+    return build_cache_key("dfs", slug, digest)
+
+
+# ============================================
+# Cache
+# ============================================
+
+
+class DFSResponseCache:
+    """
+    Two-tier (Redis + SQLite) response cache for DFSLabsClient.
+
+    Values are the parsed result the client would have returned, plus the USD
+    cost of the call that produced them so a hit can be booked as cost avoided.
+    """
+
+    def __init__(
+        self,
+        sqlite_path: Path | None = None,
+        replay: bool = False,
+        use_redis: bool = True,
+        ttls: dict[str, int] | None = None,
+    ) -> None:
+        self.replay = replay
+        self._sqlite_path = sqlite_path or Path(
+            os.environ.get(DFS_CACHE_SQLITE_ENV) or DEFAULT_SQLITE_PATH
+        )
+        self._use_redis = use_redis
+        self._ttls = DFS_CACHE_TTLS if ttls is None else ttls
+        self._redis_down_until = 0.0
+        self._db: sqlite3.Connection | None = None
+        # Serialises the shared connection across asyncio.to_thread workers
+        self._db_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.replay_misses = 0
+
+    # --------------------------------------------
+    # Policy
+    # --------------------------------------------
+
+    def ttl_for(self, endpoint: str) -> int:
+        """TTL in seconds for an endpoint; 0 means not cacheable."""
+        return self._ttls.get(endpoint, 0)
+
+    def cacheable(self, endpoint: str) -> bool:
+        return self.ttl_for(endpoint) > 0
+
+    # --------------------------------------------
+    # Public API
+    # --------------------------------------------
+
+    async def get(self, endpoint: str, payload: Any) -> tuple[Any, Decimal] | None:
+        """
+        Look up a cached response.
+
+        Returns:
+            (value, cost_usd) on hit, None on miss. Replay mode also serves
+            entries whose TTL has lapsed.
+        """
+        if not self.replay and not self.cacheable(endpoint):
+            return None
+        key = cache_key(endpoint, payload)
+        entry = await self._redis_get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._sqlite_get, key, self.replay)
+        if entry is None:
+            self.misses += 1
+            if self.replay:
+                self.replay_misses += 1
+            return None
+        self.hits += 1
+        return entry["value"], Decimal(entry["cost_usd"])
+
+    async def set(self, endpoint: str, payload: Any, value: Any, cost_usd: Decimal) -> None:
+        """Store a response in both tiers. No-op for uncacheable endpoints."""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        key = cache_key(endpoint, payload)
+        entry = {"value": value, "cost_usd": str(cost_usd)}
+        await self._redis_set(key, entry, ttl)
+        await asyncio.to_thread(self._sqlite_set, key, endpoint, entry, ttl)
+
+    def stats(self) -> dict:
+        """Hit/miss counters for run summaries."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "replay_misses": self.replay_misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # --------------------------------------------
+    # Redis tier
+    # --------------------------------------------
+
+    def _redis_available(self) -> bool:
+        return self._use_redis and time.monotonic() >= self._redis_down_until
+
+    def _park_redis(self, exc: Exception) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(
+            "DFS cache: Redis unavailable, using SQLite for %.0fs: %s", REDIS_RETRY_SECONDS, exc
+        )
+
+    async def _redis_get(self, key: str) -> dict | None:
+        if not self._redis_available():
+            return None
+        try:
+            redis = await get_redis()
+            raw = await redis.get(key)
+        except Exception as exc:
+            self._park_redis(exc)
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _redis_set(self, key: str, entry: dict, ttl: int) -> None:
+        if not self._redis_available():
+            return
+        try:
+            redis = await get_redis()
+            await redis.set(key, json.dumps(entry, default=str), ex=ttl)
+        except Exception as exc:
+            self._park_redis(exc)
+
+    # --------------------------------------------
+    # SQLite tier
+    # --------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        """Open the SQLite file on first use. Caller holds ``_db_lock``."""
+        if self._db is None:
+            self._sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self._sqlite_path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(_SCHEMA)
+            self._db = db
+        return self._db
+
+    def _sqlite_get(self, key: str, allow_expired: bool = False) -> dict | None:
+        try:
+            with self._db_lock:
+                row = (
+                    self._conn()
+                    .execute(
+                        "SELECT value, cost_usd, expires_at FROM dfs_response_cache WHERE key = ?",
+                        (key,),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as exc:
+            logger.warning("DFS cache: SQLite read failed: %s", exc)
+            return None
+        if row is None:
+            return None
+        value, cost_usd, expires_at = row
+        if not allow_expired and expires_at < time.time():
+            return None
+        return {"value": json.loads(value), "cost_usd": cost_usd}
+
+    def _sqlite_set(self, key: str, endpoint: str, entry: dict, ttl: int) -> None:
+        value = json.dumps(entry["value"], default=str)
+        try:
+            with self._db_lock:
+                db = self._conn()
+                db.execute(
+                    "INSERT OR REPLACE INTO dfs_response_cache "
+                    "(key, endpoint, value, cost_usd, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, endpoint, value, entry["cost_usd"], time.time() + ttl),
+                )
+                db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("DFS cache: SQLite write failed: %s", exc)
+
+
+# ============================================
+# Module-level Singleton
+# ============================================
+
+# One instance per mode, sharing the same Redis keys and SQLite file. Replay is
+# fixed per instance so one caller asking for replay never flips another
+# caller's cache into (or out of) replay mode.
+_caches: dict[bool, DFSResponseCache] = {}
+
+
+def get_dfs_response_cache(replay: bool | None = None) -> DFSResponseCache | None:
+    """
+    Get the process-wide response cache for a mode, or None when disabled.
+
+    ``DFS_RESPONSE_CACHE=0`` disables caching. ``replay`` selects the replay
+    instance (default: ``DFS_CACHE_REPLAY``); it never changes an instance
+    another caller already holds.
+    """
+    if os.environ.get(DFS_CACHE_ENABLED_ENV, "1").strip().lower() in {"0", "false", "no"}:
+        return None
+    if replay is None:
+        replay = _env_flag(DFS_CACHE_REPLAY_ENV)
+    cache = _caches.get(replay)
+    if cache is None:
+        cache = _caches[replay] = DFSResponseCache(replay=replay)
+    return cache
@@ -4,32 +4,17 @@ Purpose: Lightweight raw-HTML website scraper using httpx (no JS rendering)
          Uses a persistent AsyncClient with connection pooling to reduce
          SSL handshake overhead on repeated calls.
 Layer: 2 - integrations
-Imports: httpx only
+Imports: httpx, src.utils.html_features
 Consumers: src/pipeline/free_enrichment.py
 Directive: #295, updated #300-FIX (Issue 9)
 """
 
 from __future__ import annotations
 
-import re
-
 import httpx
 
-_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
-_MOBILE_AU_RE = re.compile(r"04\d{2}[\s.\-]?\d{3}[\s.\-]?\d{3}")
-_MOBILE_INT_RE = re.compile(r"\+614\d{2}[\s.\-]?\d{3}[\s.\-]?\d{3}")
-_LANDLINE_RE = re.compile(r"0[2378][\s.\-]?\d{4}[\s.\-]?\d{4}")
-_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
-_LINKEDIN_RE = re.compile(r"linkedin\.com/(?:in|company)/[\w\-]+")
-_CLEAN_RE = re.compile(r"[\s.\-]")
-_GENERIC_EMAIL = frozenset(
-    {"noreply", "info", "support", "admin", "webmaster", "hello", "contact", "enquiries", "enquiry"}
-)
-_PLACEHOLDER_EMAIL_RE = re.compile(
-    r"(?:^|\b)(example@|test@|you@|your@|user@|mail@|email@|no-?reply@"
-    r"|noreply@)|example\.com|yourdomain|placeholder|samplesite",
-    re.IGNORECASE,
-)
+from src.utils.html_features import extract_html_features
+
 _UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -65,53 +50,11 @@ class HttpxScraper:
     def _extract_contact_data(self, html: str) -> dict:
         """
         Extract free contact signals from scraped HTML.
-        Returns separated company_* and dm/linkedin fields.
+        Returns separated company_* and dm/linkedin fields
+        (dm_* are populated by paid waterfalls, not scrape).
         Never raises.
         """
-        contact: dict = {
-            "company_email": None,  # from website mailto/contact page
-            "company_phone": None,  # landline: 0[2378]XXXXXXXX
-            "company_mobile": None,  # 04XX mobile from website
-            "linkedin_company": None,  # company LinkedIn page URL
-            "linkedin_dm": None,  # person LinkedIn profile URL (/in/)
-            # DM fields (populated by paid waterfalls, not scrape)
-            "dm_email": None,
-            "dm_email_verified": False,
-            "dm_mobile": None,
-        }
-        if not html:
-            return contact
-        # Company mobile (04XX — intl takes priority)
-        m = _MOBILE_INT_RE.search(html)
-        if m:
-            raw = _CLEAN_RE.sub("", m.group(0))
-            contact["company_mobile"] = "0" + raw[3:]  # +614 → 04
-        else:
-            m = _MOBILE_AU_RE.search(html)
-            if m:
-                contact["company_mobile"] = _CLEAN_RE.sub("", m.group(0))
-        # Company landline
-        m = _LANDLINE_RE.search(html)
-        if m:
-            contact["company_phone"] = _CLEAN_RE.sub("", m.group(0))
-        # Company email (first non-generic)
-        for email in _EMAIL_RE.findall(html):
-            local = email.split("@")[0].lower()
-            if (
-                local not in _GENERIC_EMAIL
-                and not email.endswith((".png", ".jpg", ".gif"))
-                and not _PLACEHOLDER_EMAIL_RE.search(email)
-            ):
-                contact["company_email"] = email.lower()
-                break
-        # LinkedIn — split company vs person
-        for m in _LINKEDIN_RE.finditer(html):
-            url = "https://www." + m.group(0)
-            if "/in/" in url and not contact["linkedin_dm"]:
-                contact["linkedin_dm"] = url
-            elif "/company/" in url and not contact["linkedin_company"]:
-                contact["linkedin_company"] = url
-        return contact
+        return extract_html_features(html).contact_data()
 
     async def scrape(self, domain: str, timeout: float = 10.0) -> dict | None:
         """
@@ -119,7 +62,9 @@ class HttpxScraper:
 
         Returns:
             dict with keys: status_code (int), html (str), title (str | None),
-            content_length (int)
+            content_length (int), contact_data (dict), features (HTMLFeatures —
+            the single-pass extraction the other fields came from, reused by
+            FreeEnrichment instead of re-parsing the page)
         Returns None on timeout, connection error, or non-200 status.
         """
         url = f"https://{domain}"
@@ -133,13 +78,13 @@ class HttpxScraper:
             return None
 
         html = resp.text
-        title_match = _TITLE_RE.search(html)
-        title = title_match.group(1).strip() if title_match else None
+        features = extract_html_features(html)
 
         return {
             "status_code": resp.status_code,
             "html": html,
-            "title": title,
+            "title": features.title,
             "content_length": len(html),
-            "contact_data": self._extract_contact_data(html),
+            "contact_data": features.contact_data(),
+            "features": features,
         }
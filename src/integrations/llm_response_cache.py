@@ -0,0 +1,352 @@
+# FILE: src/integrations/llm_response_cache.py
+# PURPOSE: Deterministic (temperature=0) completion cache for AnthropicClient.complete
+# PHASE: 3 (Integrations)
+# DEPENDENCIES: redis, sqlite3, src.config.settings, src.integrations.redis
+
+"""
+LLM Response Cache
+
+Classification prompts are re-sent unchanged on retries, reply reprocessing
+and Prefect task reruns. With temperature 0 the answer is (for our purposes)
+a function of the request, so ``AnthropicClient.complete(..., cache=True)``
+stores it under a content address of the request:
+
+    v1:llm:<model>:<sha256(model, system, prompt, temperature, max_tokens)>
+
+Only temperature-0 requests are cached; everything else bypasses the cache.
+Entries expire after ``llm_cache_ttl_seconds`` and each tier keeps at most
+``llm_cache_max_entries``, evicting the least recently used. Redis (shared
+across workers) is read first; when it is unreachable it is parked for
+``REDIS_RETRY_SECONDS`` and the local SQLite file serves instead. SQLite calls
+run in a worker thread so they never block the event loop.
+
+Hit/miss counts and the AUD a hit would have cost are kept per process
+(``stats``) and per day in Redis (``daily_stats``).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from src.config.settings import settings
+from src.integrations.redis import build_cache_key, get_redis
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# Module-level Constants
+# ============================================
+
+REDIS_RETRY_SECONDS = 60.0
+STATS_TTL_SECONDS = 8 * 24 * 60 * 60
+# SQLite eviction trims this fraction below max_entries, so the pass runs once
+# per that many inserts instead of on every write
+SQLITE_EVICT_FRACTION = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key        TEXT PRIMARY KEY,
+    model      TEXT NOT NULL,
+    value      TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used  REAL NOT NULL
+)
+"""
+_LRU_INDEX = """
+CREATE INDEX IF NOT EXISTS llm_response_cache_last_used ON llm_response_cache (last_used)
+"""
+
+
+# ============================================
+# Keying
+# ============================================
+
+
+def is_cacheable(temperature: float) -> bool:
+    """Only deterministic (temperature 0) completions are cached."""
+    return temperature == 0
+
+
+def cache_key(
+    model: str,
+    system: str | None,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Content address for one completion request."""
+    canonical = json.dumps(
+        {
+            "model": model,
+            "system": system or "",
+            "prompt": prompt,
+            "temperature": float(temperature),
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return build_cache_key("llm", model, digest)
+
+
+def _index_key() -> str:
+    return build_cache_key("llm", "index")
+
+
+def _stats_key(day: date | None = None) -> str:
+    return build_cache_key("llm", "stats", (day or date.today()).isoformat())
+
+
+# ============================================
+# Cache
+# ============================================
+
+
+class LLMResponseCache:
+    """
+    Two-tier (Redis + SQLite) cache of completion results.
+
+    Values are complete()'s result without cost fields; the saving on a hit
+    is priced by AnthropicClient._record_spend from the stored token usage.
+    """
+
+    def __init__(
+        self,
+        sqlite_path: Path | None = None,
+        use_redis: bool = True,
+        ttl: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self._sqlite_path = sqlite_path or Path(settings.llm_cache_sqlite_path)
+        self._use_redis = use_redis
+        self.ttl = settings.llm_cache_ttl_seconds if ttl is None else ttl
+        self.max_entries = settings.llm_cache_max_entries if max_entries is None else max_entries
+        self._redis_down_until = 0.0
+        self._db: sqlite3.Connection | None = None
+        # Serialises the shared connection across asyncio.to_thread workers
+        self._db_lock = threading.Lock()
+        self._sqlite_rows = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.aud_saved = 0.0
+
+    # --------------------------------------------
+    # Public API
+    # --------------------------------------------
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Cached completion for ``key``, or None (counted as a miss)."""
+        value = await self._redis_get(key)
+        if value is None:
+            value = await asyncio.to_thread(self._sqlite_get, key)
+        if value is None:
+            self.misses += 1
+            await self._redis_count("misses", 1)
+            return None
+        self.hits += 1
+        await self._redis_count("hits", 1)
+        return value
+
+    async def set(self, key: str, model: str, value: dict[str, Any]) -> None:
+        """Store a completion in both tiers, evicting the oldest past max_entries."""
+        await self._redis_set(key, value)
+        await asyncio.to_thread(self._sqlite_set, key, model, value)
+
+    async def record_saving(self, cost_aud: float) -> None:
+        """Book the AUD a cache hit avoided (called from _record_spend)."""
+        self.aud_saved += cost_aud
+        await self._redis_count("saved_micro_aud", int(round(cost_aud * 1_000_000)))
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and AUD saved in this process."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "aud_saved": round(self.aud_saved, 6),
+        }
+
+    async def daily_stats(self, day: date | None = None) -> dict[str, Any] | None:
+        """Counters summed across workers for ``day`` (None when Redis is down)."""
+        if not self._redis_available():
+            return None
+        try:
+            redis = await get_redis()
+            raw = await redis.hgetall(_stats_key(day))
+        except Exception as exc:
+            self._park_redis(exc)
+            return None
+        hits = int(raw.get("hits", 0))
+        misses = int(raw.get("misses", 0))
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "aud_saved": int(raw.get("saved_micro_aud", 0)) / 1_000_000,
+        }
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # --------------------------------------------
+    # Redis tier
+    # --------------------------------------------
+
+    def _redis_available(self) -> bool:
+        return self._use_redis and time.monotonic() >= self._redis_down_until
+
+    def _park_redis(self, exc: Exception) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(
+            "LLM cache: Redis unavailable, using SQLite for %.0fs: %s", REDIS_RETRY_SECONDS, exc
+        )
+
+    async def _redis_get(self, key: str) -> dict | None:
+        if not self._redis_available():
+            return None
+        try:
+            redis = await get_redis()
+            raw = await redis.get(key)
+            if raw:
+                # Touch the LRU index so hot entries survive eviction
+                await redis.zadd(_index_key(), {key: time.time()})
+        except Exception as exc:
+            self._park_redis(exc)
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _redis_set(self, key: str, value: dict) -> None:
+        if not self._redis_available():
+            return
+        now = time.time()
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline()
+            pipe.set(key, json.dumps(value, default=str), ex=self.ttl)
+            pipe.zadd(_index_key(), {key: now})
+            # Entries idle for longer than the TTL have already expired
+            pipe.zremrangebyscore(_index_key(), "-inf", now - self.ttl)
+            pipe.zcard(_index_key())
+            size = (await pipe.execute())[-1]
+            if size > self.max_entries:
+                evicted = await redis.zpopmin(_index_key(), size - self.max_entries)
+                if evicted:
+                    await redis.delete(*(member for member, _ in evicted))
+        except Exception as exc:
+            self._park_redis(exc)
+
+    async def _redis_count(self, field: str, amount: int) -> None:
+        if not self._redis_available() or amount == 0:
+            return
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline()
+            pipe.hincrby(_stats_key(), field, amount)
+            pipe.expire(_stats_key(), STATS_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as exc:
+            self._park_redis(exc)
+
+    # --------------------------------------------
+    # SQLite tier
+    # --------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        """Open the SQLite file on first use. Caller holds ``_db_lock``."""
+        if self._db is None:
+            self._sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self._sqlite_path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(_SCHEMA)
+            db.execute(_LRU_INDEX)
+            db.execute("DELETE FROM llm_response_cache WHERE expires_at < ?", (time.time(),))
+            db.commit()
+            self._sqlite_rows = db.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+            self._db = db
+        return self._db
+
+    def _sqlite_get(self, key: str) -> dict | None:
+        now = time.time()
+        try:
+            with self._db_lock:
+                db = self._conn()
+                row = db.execute(
+                    "SELECT value, expires_at FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] < now:
+                    db.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    self._sqlite_rows -= 1
+                    row = None
+                else:
+                    db.execute(
+                        "UPDATE llm_response_cache SET last_used = ? WHERE key = ?", (now, key)
+                    )
+                db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("LLM cache: SQLite read failed: %s", exc)
+            return None
+        return json.loads(row[0]) if row else None
+
+    def _sqlite_set(self, key: str, model: str, value: dict) -> None:
+        now = time.time()
+        try:
+            with self._db_lock:
+                db = self._conn()
+                exists = db.execute(
+                    "SELECT 1 FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache "
+                    "(key, model, value, expires_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (key, model, json.dumps(value, default=str), now + self.ttl, now),
+                )
+                if exists is None:
+                    self._sqlite_rows += 1
+                if self._sqlite_rows > self.max_entries:
+                    keep = self.max_entries - int(self.max_entries * SQLITE_EVICT_FRACTION)
+                    db.execute(
+                        "DELETE FROM llm_response_cache WHERE key IN ("
+                        "SELECT key FROM llm_response_cache ORDER BY last_used DESC "
+                        "LIMIT -1 OFFSET ?)",
+                        (keep,),
+                    )
+                    # Re-count: other workers sharing the file insert too
+                    self._sqlite_rows = db.execute(
+                        "SELECT COUNT(*) FROM llm_response_cache"
+                    ).fetchone()[0]
+                db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("LLM cache: SQLite write failed: %s", exc)
+
+
+# ============================================
+# Module-level Singleton
+# ============================================
+
+_cache: LLMResponseCache | None = None
+
+
+def get_llm_response_cache() -> LLMResponseCache | None:
+    """Get the process-wide completion cache, or None when LLM_CACHE_ENABLED is off."""
+    global _cache
+    if not settings.llm_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = LLMResponseCache()
+    return _cache
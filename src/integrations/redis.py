@@ -120,6 +120,11 @@ def build_ai_spend_key(date_str: str | None = None) -> str:
     return build_cache_key("ai_spend", date_str)
 
 
+def build_batch_spend_key(batch_id: str) -> str:
+    """Build cache key for the Message Batches results already billed."""
+    return build_cache_key("ai_spend", "batch", batch_id)
+
+
 # ============================================
 # Cache Operations
 # ============================================
@@ -388,6 +393,10 @@ rate_limiter = RateLimiter()
 # ============================================
 
 
+# Longer than the 29 days Anthropic keeps batch results downloadable
+BATCH_SPEND_TTL_SECONDS = 60 * 60 * 24 * 30
+
+
 class AISpendTracker:
     """
     Track daily AI spend for circuit breaker.
@@ -432,6 +441,27 @@ class AISpendTracker:
 
         return new_cents / 100.0
 
+    async def claim_batch_result(self, batch_id: str, custom_id: str) -> bool:
+        """
+        Mark one Message Batches result as billed.
+
+        Batch results stay downloadable for 29 days and a resumed run collects
+        them again; only the first claim of a result should add its spend.
+
+        Args:
+            batch_id: Message Batches id
+            custom_id: Request custom_id within the batch
+
+        Returns:
+            True if this is the first claim (spend should be recorded)
+        """
+        redis = await self._get_redis()
+        key = build_batch_spend_key(batch_id)
+        added = await redis.sadd(key, custom_id)
+        if added:
+            await redis.expire(key, BATCH_SPEND_TTL_SECONDS)
+        return bool(added)
+
     async def get_spend(self) -> float:
         """Get current daily spend."""
         redis = await self._get_redis()
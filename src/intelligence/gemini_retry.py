@@ -12,9 +12,12 @@ import asyncio
 import json
 import logging
 import random
+import time
 
 import httpx
 
+from src.utils.adaptive_limiter import get_limiter
+
 logger = logging.getLogger(__name__)
 
 GEMINI_MODEL = "gemini-2.5-flash"
@@ -106,8 +109,17 @@ async def gemini_call_with_retry(
             payload["tools"] = tools
 
         try:
-            async with httpx.AsyncClient(timeout=90) as client:
-                resp = await client.post(url, json=payload)
+            # Shared across Stage 3/7/10: 429s and slow responses back it off.
+            limiter = get_limiter("gemini")
+            async with limiter:
+                t0 = time.monotonic()
+                try:
+                    async with httpx.AsyncClient(timeout=90) as client:
+                        resp = await client.post(url, json=payload)
+                except httpx.TimeoutException:
+                    limiter.observe(time.monotonic() - t0, timeout=True)
+                    raise
+                limiter.observe(time.monotonic() - t0, resp.status_code)
 
             if resp.status_code == 429:
                 wait = 2**attempt + random.random()
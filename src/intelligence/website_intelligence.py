@@ -17,6 +17,7 @@ from typing import Any
 
 from src.exceptions import AISpendLimitError, APIError, IntegrationError
 from src.integrations.anthropic import AnthropicClient
+from src.utils.html_features import extract_html_features
 
 logger = logging.getLogger(__name__)
 
@@ -299,9 +300,10 @@ class WebsiteIntelligenceEngine:
                 prompt=prompt,
                 system=_INTENT_SYSTEM,
                 max_tokens=self.SONNET_MAX_TOKENS,
-                temperature=0.2,
+                temperature=0.0,
                 model=self.SONNET_MODEL,
                 enable_caching=True,
+                cache=True,
             )
             parsed = self._parse_haiku_json(result["content"], ["intent_grade", "intent_reasoning"])
             parsed["_cost_aud"] = result.get("cost_aud", 0.0)
@@ -407,51 +409,8 @@ class WebsiteIntelligenceEngine:
         """
         if not html:
             return ""
-
-        # Extract title before stripping head
-        title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-        title = title_match.group(1).strip() if title_match else ""
-
-        # Extract meta description
-        meta_match = re.search(
-            r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)',
-            html,
-            re.IGNORECASE,
-        )
-        if not meta_match:
-            meta_match = re.search(
-                r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']description["\']',
-                html,
-                re.IGNORECASE,
-            )
-        meta_description = meta_match.group(1).strip() if meta_match else ""
-
-        # Extract first h1
-        h1_match = re.search(r"<h1[^>]*>(.*?)</h1>", html, re.IGNORECASE | re.DOTALL)
-        first_h1 = re.sub(r"<[^>]+>", "", h1_match.group(1)).strip() if h1_match else ""
-
-        # Strip script, style, head blocks
-        clean = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        clean = re.sub(r"<style[^>]*>.*?</style>", "", clean, flags=re.DOTALL | re.IGNORECASE)
-        clean = re.sub(r"<head[^>]*>.*?</head>", "", clean, flags=re.DOTALL | re.IGNORECASE)
-
-        # Strip remaining HTML tags and collapse whitespace
-        clean = re.sub(r"<[^>]+>", " ", clean)
-        clean = re.sub(r"\s+", " ", clean).strip()
-
-        body_text = clean[:max_chars]
-
-        parts: list[str] = []
-        if title:
-            parts.append(f"Title: {title}")
-        if meta_description:
-            parts.append(f"Description: {meta_description}")
-        if first_h1:
-            parts.append(f"H1: {first_h1}")
-        parts.append("")
-        parts.append("Page text:")
-        parts.append(body_text)
-        return "\n".join(parts)
+        features = extract_html_features(html, max_text_chars=max_chars)
+        return features.visible_text(max_chars)
 
     @staticmethod
     def _parse_haiku_json(content: str, expected_keys: list[str]) -> dict:
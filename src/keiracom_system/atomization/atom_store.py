@@ -12,7 +12,8 @@ uses _DBProtocol DI (no asyncpg/psycopg import) — caller injects a real
 connection. Same pattern as TenantBudgetPolicy.from_db (PR #1173).
 
 Embedding is computed via TEIClient (PR #1133) — also injected so unit
-tests don't need a live TEI sidecar.
+tests don't need a live TEI sidecar. An EmbeddingService wrapping the client
+works too (batched + memoized embeds for concurrent retrieve_top_k calls).
 
 CI guard scripts/ci/check_no_raw_atom_store_outside_module.sh forbids raw
 SQL against keiracom_atoms outside this module (mirrors A7 CB-10 pattern).
@@ -29,6 +30,7 @@ from src.keiracom_system.atomization.schema import (
     AtomV1,
     SupersessionEdgeV1,
 )
+from src.keiracom_system.embeddings.embedding_service import EmbeddingService
 from src.keiracom_system.embeddings.tei_client import TEIClient
 
 log = logging.getLogger(__name__)
@@ -63,7 +65,7 @@ class AtomStore:
         *,
         db: _DBProtocol,
         tenant_id: str | UUID,
-        embedder: TEIClient,
+        embedder: TEIClient | EmbeddingService,
     ):
         if not tenant_id:
             raise AtomStoreError("tenant_id is required (cross-tenant isolation invariant)")
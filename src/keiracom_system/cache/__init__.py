@@ -31,13 +31,14 @@ from src.keiracom_system.cache.token_budget_policy import (
     TIER_DEFAULTS,
     TenantBudgetPolicy,
 )
-from src.keiracom_system.cache.valkey_client import ValkeyClient
+from src.keiracom_system.cache.valkey_client import SemanticKey, ValkeyClient
 
 __all__ = [
     "CACHE_LAYER_1_MULTIPLIER",
     "CACHE_LAYER_2_MULTIPLIER",
     "TIER_DEFAULTS",
     "TIER_MULTIPLIERS_PROPOSAL",
+    "SemanticKey",
     "VALKEY_TTL_DEFINITION_FETCH",
     "VALKEY_TTL_MUTATION",
     "VALKEY_TTL_READ_MOSTLY",
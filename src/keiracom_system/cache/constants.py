@@ -65,7 +65,23 @@ VALKEY_TTL_MUTATION: int = 0
 # the read/write boundary (defence-in-depth per CB-Atlas).
 VALKEY_KEY_NAMESPACE_PREFIX: str = "v1:"
 
-# Embedding bucket count for canonical_cache_key semantic component. V1
+# Embedding bucket count for the semantic_cache_key LSH bucket. V1
 # PROPOSAL per design §4 + §11 LOOSE item #1; tune from measured collision
 # rate post-baseline. 4096 = 12 bits.
 EMBEDDING_BUCKET_COUNT: int = 4096
+
+# Random-hyperplane LSH for the bucket component (see semantic_lsh.py). The
+# seed fixes the hyperplanes; changing it re-buckets every cached query, so
+# treat it like a key-format version.
+EMBEDDING_LSH_SEED: str = "keiracom.cache.lsh.v1"
+
+# Multi-probe budget: neighbouring buckets read after the query's own bucket
+# on a semantic lookup (one MGET). 24 = every single-bit flip at 12 bits plus
+# the 12 lowest-margin bit pairs.
+EMBEDDING_LSH_MAX_PROBES: int = 24
+
+# Similarity-threshold guard: a cached entry is only served when the cosine
+# between its writer's query embedding and the reader's is at least this.
+# Blocks false hits from bucket collisions and multi-probe neighbours.
+# PROPOSAL — tune with scripts/bench_valkey_lsh_hit_rate.py on recorded pairs.
+SEMANTIC_CACHE_MIN_SIMILARITY: float = 0.92
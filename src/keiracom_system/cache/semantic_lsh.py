@@ -0,0 +1,134 @@
+"""Semantic LSH for the Valkey cache key — Phase A7 bucket re-tune.
+
+Random-hyperplane (sign-projection) locality-sensitive hashing for the
+`:b{bucket}` component of ValkeyClient.semantic_cache_key(). Two embeddings
+at angle θ agree on each sign bit with probability 1 - θ/π, so near-duplicate
+tool queries from different ephemeral agents land in the same bucket or in a
+bucket one or two bit-flips away. The previous V1 scheme SHA-256'd the packed
+floats, which sent every distinct query to an unrelated bucket.
+
+Pieces:
+  - bucket_signature() — bucket index + per-bit projection margins
+  - probe_buckets()    — multi-probe sequence: flip the lowest-margin bits
+                         first (the bits a near neighbour most likely differs on)
+  - pack_entry() / unpack_entry() — cache value envelope carrying the writer's
+                         embedding (float16) so readers can apply the
+                         similarity-threshold guard against false hits
+  - cosine()
+
+Hyperplanes are derived from a fixed seed (random.Random with a str seed is
+hashed via SHA-512, so it is stable across processes and PYTHONHASHSEED), so
+every spawn computes the same bucket for the same embedding.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import math
+import random
+import struct
+
+from src.keiracom_system.cache.constants import (
+    EMBEDDING_BUCKET_COUNT,
+    EMBEDDING_LSH_MAX_PROBES,
+    EMBEDDING_LSH_SEED,
+)
+
+# Envelope: magic + uint16 dim + float16[dim] + raw value bytes.
+_ENTRY_MAGIC = b"KSC1"
+_ENTRY_HEADER = struct.Struct("<4sH")
+
+
+def bits_for(num_buckets: int) -> int:
+    """Sign bits needed to address num_buckets (num_buckets is a power of two in V1)."""
+    return max(1, (num_buckets - 1).bit_length())
+
+
+@functools.lru_cache(maxsize=8)
+def _hyperplanes(dim: int, bits: int, seed: str) -> tuple[tuple[float, ...], ...]:
+    """`bits` Gaussian hyperplane normals in R^dim, deterministic per (dim, bits, seed)."""
+    rng = random.Random(f"{seed}:{dim}:{bits}")
+    return tuple(tuple(rng.gauss(0.0, 1.0) for _ in range(dim)) for _ in range(bits))
+
+
+def bucket_signature(
+    embedding: list[float] | tuple[float, ...],
+    num_buckets: int = EMBEDDING_BUCKET_COUNT,
+    seed: str = EMBEDDING_LSH_SEED,
+) -> tuple[int, tuple[float, ...]]:
+    """Return (bucket, margins) for an embedding.
+
+    Bit i of the bucket is the sign of the projection onto hyperplane i;
+    margins[i] is |projection| — how far the embedding sits from flipping
+    that bit. Scale-invariant, so normalised and raw embeddings agree.
+    """
+    bits = bits_for(num_buckets)
+    code = 0
+    margins = []
+    for i, plane in enumerate(_hyperplanes(len(embedding), bits, seed)):
+        projection = math.fsum(a * b for a, b in zip(embedding, plane, strict=True))
+        if projection >= 0.0:
+            code |= 1 << i
+        margins.append(abs(projection))
+    return code % num_buckets, tuple(margins)
+
+
+def probe_buckets(
+    bucket: int,
+    margins: tuple[float, ...],
+    max_probes: int = EMBEDDING_LSH_MAX_PROBES,
+    num_buckets: int = EMBEDDING_BUCKET_COUNT,
+) -> tuple[int, ...]:
+    """Neighbouring buckets to probe after `bucket`, most likely first.
+
+    Query-directed multi-probe: single flips ordered by ascending margin,
+    then pairs drawn from the lowest-margin bits, up to max_probes buckets
+    (excluding `bucket` itself).
+    """
+    if max_probes <= 0:
+        return ()
+    order = sorted(range(len(margins)), key=lambda i: margins[i])
+    flips: list[tuple[int, ...]] = [(i,) for i in order]
+    flips.extend(sorted(itertools.combinations(order, 2), key=lambda p: sum(margins[i] for i in p)))
+    probes: list[int] = []
+    seen = {bucket}
+    for flip in flips:
+        candidate = bucket
+        for i in flip:
+            candidate ^= 1 << i
+        candidate %= num_buckets
+        if candidate not in seen:
+            seen.add(candidate)
+            probes.append(candidate)
+            if len(probes) >= max_probes:
+                break
+    return tuple(probes)
+
+
+def cosine(a: list[float] | tuple[float, ...], b: list[float] | tuple[float, ...]) -> float:
+    """Cosine similarity; 0.0 for mismatched dims or zero vectors."""
+    if len(a) != len(b):
+        return 0.0
+    dot = math.fsum(x * y for x, y in zip(a, b, strict=True))
+    norm = math.sqrt(math.fsum(x * x for x in a)) * math.sqrt(math.fsum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def pack_entry(embedding: list[float] | tuple[float, ...], value: str | bytes) -> bytes:
+    """Wrap a cache value with the writer's embedding for the similarity guard."""
+    raw = value.encode("utf-8") if isinstance(value, str) else value
+    dim = len(embedding)
+    return _ENTRY_HEADER.pack(_ENTRY_MAGIC, dim) + struct.pack(f"<{dim}e", *embedding) + raw
+
+
+def unpack_entry(blob: bytes) -> tuple[tuple[float, ...], bytes] | None:
+    """Inverse of pack_entry(); None for values not written by set_semantic()."""
+    if len(blob) < _ENTRY_HEADER.size:
+        return None
+    magic, dim = _ENTRY_HEADER.unpack_from(blob)
+    body_start = _ENTRY_HEADER.size + 2 * dim
+    if magic != _ENTRY_MAGIC or len(blob) < body_start:
+        return None
+    embedding = struct.unpack_from(f"<{dim}e", blob, _ENTRY_HEADER.size)
+    return embedding, blob[body_start:]
@@ -2,7 +2,12 @@
 
 Per-tenant Valkey semantic cache client. Wraps the redis-py / valkey-protocol
 connection with:
-  - canonical_cache_key()  — deterministic key construction across spawns
+  - canonical_cache_key()  — deterministic exact-match key construction
+                             across spawns
+  - semantic_cache_key() + get_semantic()/set_semantic()
+                           — LSH bucket + multi-probe lookup with a
+                             similarity-threshold guard (semantic_lsh.py);
+                             the only path for near-duplicate queries
   - tenant prefix guard    — read/write boundary check (CB-Atlas)
   - instrumentation hook   — Better Stack lookup metric emission (sub-task 4)
 
@@ -18,7 +23,8 @@ DESIGN DECISIONS folded in per build-time clarifications (§13):
 TESTABILITY: redis client + TEI client + metric emitter are all injectable so
 unit tests don't need a live Valkey or TEI container. The runtime caller (LLM
 workflow #2 activity factory) constructs the real instances from env config
-and injects.
+and injects. tei_client may be an EmbeddingService so concurrent spawns'
+single-query embeds are coalesced into batched /embed calls and memoized.
 
 CONSUMERS:
   - LLM-call workflow #2 (separate dispatch) — wraps each LLM call's cache_check
@@ -30,14 +36,18 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import struct
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, Protocol
 
+from src.keiracom_system.cache import semantic_lsh
 from src.keiracom_system.cache.constants import (
     EMBEDDING_BUCKET_COUNT,
+    EMBEDDING_LSH_MAX_PROBES,
+    SEMANTIC_CACHE_MIN_SIMILARITY,
     VALKEY_KEY_NAMESPACE_PREFIX,
 )
+from src.keiracom_system.embeddings.embedding_service import EmbeddingService
 from src.keiracom_system.embeddings.tei_client import TEIClient
 
 log = logging.getLogger(__name__)
@@ -51,6 +61,7 @@ class _RedisProtocol(Protocol):
     """Subset of redis.Redis we depend on. Lets unit tests inject a fake."""
 
     def get(self, key: str) -> bytes | None: ...
+    def mget(self, keys: list[str]) -> list[bytes | None]: ...
     def set(self, key: str, value: str | bytes) -> Any: ...
     def setex(self, key: str, time: int, value: str | bytes) -> Any: ...
     def delete(self, *keys: str) -> Any: ...
@@ -66,6 +77,19 @@ class ValkeyClientError(RuntimeError):
     """Raised on any Valkey-side or tenant-isolation violation."""
 
 
+@dataclass(frozen=True)
+class SemanticKey:
+    """Semantic cache key for one query: write key + multi-probe read keys.
+
+    Built once per query by semantic_cache_key() so the TEI embed call is
+    shared by get_semantic() and set_semantic().
+    """
+
+    key: str
+    probe_keys: tuple[str, ...]
+    embedding: tuple[float, ...]
+
+
 class ValkeyClient:
     """Per-tenant cache client.
 
@@ -77,7 +101,7 @@ class ValkeyClient:
         self,
         *,
         redis_client: _RedisProtocol,
-        tei_client: TEIClient,
+        tei_client: TEIClient | EmbeddingService,
         tenant_id: str,
         metric_emitter: MetricEmitter | None = None,
     ):
@@ -106,18 +130,50 @@ class ValkeyClient:
         query_text) always yields the same key, so ephemeral agent #2 hits
         the cache populated by ephemeral agent #1.
 
-        With query_text, includes a semantic bucket component derived from the
-        BGE-small-en-v1.5 embedding (via TEIClient). Without query_text,
-        falls back to args-hash only.
+        With query_text, appends a hash of the exact query text, so get() on
+        this key only ever serves an exact repeat. Reworded (near-duplicate)
+        queries must go through semantic_cache_key() + get_semantic(), which
+        apply the similarity guard; an LSH bucket served through plain get()
+        has no such check. Without query_text, falls back to args-hash only.
+        """
+        args_prefix = self._args_prefix(tool_name, args)
+        if query_text:
+            query_hash = hashlib.sha256(query_text.encode("utf-8")).hexdigest()[:16]
+            return f"{args_prefix}:q{query_hash}"
+        return args_prefix
+
+    def semantic_cache_key(
+        self,
+        *,
+        tool_name: str,
+        args: dict[str, Any],
+        query_text: str,
+        max_probes: int = EMBEDDING_LSH_MAX_PROBES,
+    ) -> SemanticKey:
+        """LSH bucket key plus the neighbouring-bucket keys a lookup probes.
+
+        `key` is the query's own bucket (`{args prefix}:b{bucket}`);
+        `probe_keys` are the multi-probe neighbours, most likely first. Only
+        read these through get_semantic() — a bucket holds any query that
+        hashed there, so plain get() would serve unrelated results.
         """
+        if not query_text:
+            raise ValkeyClientError("query_text is required for a semantic cache key")
+        args_prefix = self._args_prefix(tool_name, args)
+        embedding = self._tei.embed([query_text])[0]
+        bucket, margins = semantic_lsh.bucket_signature(embedding)
+        probes = semantic_lsh.probe_buckets(bucket, margins, max_probes=max_probes)
+        return SemanticKey(
+            key=f"{args_prefix}:b{bucket}",
+            probe_keys=tuple(f"{args_prefix}:b{b}" for b in probes),
+            embedding=tuple(embedding),
+        )
+
+    def _args_prefix(self, tool_name: str, args: dict[str, Any]) -> str:
         if not tool_name:
             raise ValkeyClientError("tool_name is required")
         args_normalised = json.dumps(args, sort_keys=True, separators=(",", ":"))
         args_hash = hashlib.sha256(args_normalised.encode("utf-8")).hexdigest()[:16]
-        if query_text:
-            embedding = self._tei.embed([query_text])[0]
-            bucket = self._quantise_to_bucket(embedding)
-            return f"{self._expected_prefix}{tool_name}:{args_hash}:b{bucket}"
         return f"{self._expected_prefix}{tool_name}:{args_hash}"
 
     @staticmethod
@@ -126,17 +182,13 @@ class ValkeyClient:
     ) -> int:
         """Map a 384-dim embedding to a bucket index in [0, num_buckets).
 
-        V1 — sign-bit hash projection. Stable per (embedding, num_buckets).
-        Phase 2 may swap to a learned hash (e.g. LSH); the canonical key
-        format is stable across implementations because the bucket index is
-        a single integer.
+        Random-hyperplane LSH: one sign bit per hyperplane (12 bits for 4096
+        buckets), so near-duplicate queries share a bucket or sit a bit-flip
+        away. Replaces the V1 SHA-256-of-floats hash, which never produced a
+        cross-query hit. The bucket index is still a single integer.
         """
-        # Pack floats deterministically, hash, then modulo into the bucket space.
-        packed = struct.pack(f"{len(embedding)}f", *embedding)
-        digest = hashlib.sha256(packed).digest()
-        # Take leading 4 bytes as unsigned int, modulo num_buckets.
-        leading = int.from_bytes(digest[:4], byteorder="big", signed=False)
-        return leading % num_buckets
+        bucket, _margins = semantic_lsh.bucket_signature(embedding, num_buckets=num_buckets)
+        return bucket
 
     def _enforce_tenant_prefix(self, key: str) -> None:
         """Reject any key not matching v1:{self._tenant_id}:* at the read/write boundary.
@@ -156,17 +208,54 @@ class ValkeyClient:
         """Read from Valkey. Emits cache_lookup{outcome=hit|miss} metric."""
         self._enforce_tenant_prefix(key)
         value = self._redis.get(key)
-        outcome = OUTCOME_HIT if value is not None else OUTCOME_MISS
+        self._emit_lookup(tool_name, value is not None)
+        return value
+
+    def _emit_lookup(self, tool_name: str | None, hit: bool) -> None:
         if self._metric_emitter is not None:
             self._metric_emitter(
                 "keiracom.cache.valkey.lookup",
                 {
                     "tenant_id": self._tenant_id,
                     "tool_name": tool_name or "unknown",
-                    "outcome": outcome,
+                    "outcome": OUTCOME_HIT if hit else OUTCOME_MISS,
                 },
             )
-        return value
+
+    def get_semantic(
+        self,
+        skey: SemanticKey,
+        *,
+        tool_name: str | None = None,
+        min_similarity: float = SEMANTIC_CACHE_MIN_SIMILARITY,
+    ) -> bytes | None:
+        """Multi-probe semantic read. Emits cache_lookup{outcome=hit|miss} metric.
+
+        Reads the query's bucket and its probe neighbours in one MGET and
+        returns the value whose stored query embedding is most similar to
+        this query, provided the cosine clears `min_similarity`. Entries
+        below the threshold (bucket collisions) and values not written by
+        set_semantic() are ignored.
+        """
+        keys = [skey.key, *skey.probe_keys]
+        for key in keys:
+            self._enforce_tenant_prefix(key)
+        best: bytes | None = None
+        best_similarity = min_similarity
+        for blob in self._redis.mget(keys):
+            entry = semantic_lsh.unpack_entry(blob) if blob is not None else None
+            if entry is None:
+                continue
+            embedding, value = entry
+            similarity = semantic_lsh.cosine(skey.embedding, embedding)
+            if similarity >= best_similarity:
+                best, best_similarity = value, similarity
+        self._emit_lookup(tool_name, best is not None)
+        return best
+
+    def set_semantic(self, skey: SemanticKey, value: str | bytes, *, ttl_seconds: int = 0) -> None:
+        """Write `value` under the query's own bucket, tagged with its embedding."""
+        self.set(skey.key, semantic_lsh.pack_entry(skey.embedding, value), ttl_seconds=ttl_seconds)
 
     def set(self, key: str, value: str | bytes, *, ttl_seconds: int = 0) -> None:
         """Write to Valkey with optional TTL. ttl_seconds=0 means no expiry.
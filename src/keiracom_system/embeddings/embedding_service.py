@@ -0,0 +1,292 @@
+"""embedding_service.py — coalescing, memoizing layer over TEIClient.
+
+Callers such as ValkeyClient.semantic_cache_key() and AtomStore.retrieve_top_k()
+embed one string at a time, so concurrent spawns turn into many one-item
+POST /embed requests. EmbeddingService sits between them and TEIClient:
+
+  - memo     — vectors are memoized by sha256(text) in a bounded in-process
+               LRU, optionally backed by a shared cache (a ValkeyClient, so
+               keys stay tenant-prefixed per CB-10 — no raw redis here).
+  - coalesce — cache misses are queued; a worker thread collects up to
+               `max_batch` texts or waits `window_ms` after the first, then
+               sends them as ONE TEIClient.embed() call. Concurrent requests
+               for the same text share a single in-flight slot.
+  - arrays   — embed_array() returns float32 NumPy arrays (n, dimension);
+               embed() keeps TEIClient's list[list[float]] contract so the
+               service can be injected wherever a TEIClient is.
+
+USAGE:
+    service = EmbeddingService(TEIClient(base_url="http://embed:80"))
+    vec = service.embed_array(["text"])[0]          # np.ndarray float32, (384,)
+    ValkeyClient(redis_client=r, tei_client=service, tenant_id="t1")
+
+Benchmark: scripts/bench_tei_coalescing.py (local fake TEI server).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Protocol
+
+import numpy as np
+
+from src.keiracom_system.embeddings.tei_client import (
+    DEFAULT_TIMEOUT_SECONDS,
+    EXPECTED_MODEL_ID,
+    TEIClient,
+    TEIClientError,
+)
+
+DEFAULT_MAX_BATCH = 32
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_CACHE_SIZE = 10_000
+SHARED_CACHE_TOOL_NAME = "tei_embed"
+SHARED_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Upper bound on waiting for a coalesced batch: a queued batch plus the one
+# ahead of it, each bounded by the TEI HTTP timeout.
+DEFAULT_RESULT_TIMEOUT_SECONDS = 2 * DEFAULT_TIMEOUT_SECONDS
+
+log = logging.getLogger(__name__)
+
+
+class _SharedCache(Protocol):
+    """Subset of ValkeyClient used for the shared vector cache."""
+
+    def canonical_cache_key(
+        self, *, tool_name: str, args: dict[str, Any], query_text: str | None = None
+    ) -> str: ...
+    def get(self, key: str, *, tool_name: str | None = None) -> bytes | None: ...
+    def set(self, key: str, value: str | bytes, *, ttl_seconds: int = 0) -> None: ...
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingService:
+    """Micro-batching, memoizing front for a TEIClient. Thread-safe."""
+
+    def __init__(
+        self,
+        client: TEIClient,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        window_ms: float = DEFAULT_WINDOW_MS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        shared_cache: _SharedCache | None = None,
+        shared_ttl_seconds: int = SHARED_CACHE_TTL_SECONDS,
+        model_id: str = EXPECTED_MODEL_ID,
+        result_timeout_seconds: float = DEFAULT_RESULT_TIMEOUT_SECONDS,
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self._client = client
+        self._max_batch = max_batch
+        self._window = window_ms / 1000.0
+        self._cache_size = cache_size
+        self._shared = shared_cache
+        self._shared_ttl = shared_ttl_seconds
+        self._model_id = model_id
+        self._result_timeout = result_timeout_seconds
+
+        self._lock = threading.Lock()
+        self._lru: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._inflight: dict[str, Future[np.ndarray]] = {}
+        self._queue: queue.Queue[tuple[str, str] | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._counters = {
+            "texts": 0,
+            "lru_hits": 0,
+            "shared_hits": 0,
+            "tei_requests": 0,
+            "tei_texts": 0,
+        }
+
+    @property
+    def dimension(self) -> int:
+        return self._client.dimension
+
+    # ── Public API ─────────────────────────────────────────────────────────
+
+    def embed_array(self, texts: list[str]) -> np.ndarray:
+        """Embed texts → float32 array of shape (len(texts), dimension).
+
+        Raises TEIClientError on invalid input, when the TEI batch carrying
+        any of these texts fails, or when it does not finish within
+        `result_timeout_seconds`.
+        """
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise TEIClientError(f"embed: texts must be list[str], got {type(texts).__name__}")
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        keys = [text_hash(t) for t in texts]
+        vectors: dict[str, np.ndarray] = {}
+        pending: dict[str, Future[np.ndarray]] = {}
+        misses: list[tuple[str, str]] = []
+        with self._lock:
+            self._counters["texts"] += len(texts)
+            for key, text in zip(keys, texts, strict=True):
+                if key in vectors or key in pending:
+                    continue
+                hit = self._lru.get(key)
+                if hit is not None:
+                    self._lru.move_to_end(key)
+                    self._counters["lru_hits"] += 1
+                    vectors[key] = hit
+                elif key in self._inflight:
+                    pending[key] = self._inflight[key]
+                else:
+                    misses.append((key, text))
+
+        for key, text in misses:
+            shared = self._shared_get(key)
+            if shared is not None:
+                vectors[key] = shared
+                continue
+            pending[key] = self._submit(key, text)
+
+        for key, future in pending.items():
+            try:
+                vectors[key] = future.result(timeout=self._result_timeout)
+            except FutureTimeoutError as exc:
+                raise TEIClientError(
+                    f"embed: no result within {self._result_timeout}s (batch still pending)"
+                ) from exc
+        return np.stack([vectors[key] for key in keys])
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """TEIClient.embed-compatible wrapper around embed_array()."""
+        return self.embed_array(texts).tolist()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters: texts requested, LRU/shared hits, TEI requests and texts sent."""
+        with self._lock:
+            counters = dict(self._counters)
+            counters["lru_size"] = len(self._lru)
+        sent = counters["tei_requests"]
+        counters["mean_batch"] = round(counters["tei_texts"] / sent, 2) if sent else None
+        return counters
+
+    def close(self) -> None:
+        """Stop the batching worker (pending batches are flushed first)."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    # ── Memo ───────────────────────────────────────────────────────────────
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self._cache_size:
+                self._lru.popitem(last=False)
+
+    def _shared_key(self, key: str) -> str:
+        return self._shared.canonical_cache_key(
+            tool_name=SHARED_CACHE_TOOL_NAME,
+            args={"model": self._model_id, "sha256": key},
+        )
+
+    def _shared_get(self, key: str) -> np.ndarray | None:
+        if self._shared is None:
+            return None
+        try:
+            blob = self._shared.get(self._shared_key(key), tool_name=SHARED_CACHE_TOOL_NAME)
+        except Exception as exc:
+            log.warning("EmbeddingService: shared cache read failed: %s", exc)
+            return None
+        if blob is None or len(blob) != self.dimension * 4:
+            return None
+        vector = np.frombuffer(blob, dtype=np.float32)
+        with self._lock:
+            self._counters["shared_hits"] += 1
+        self._remember(key, vector)
+        return vector
+
+    def _shared_set(self, key: str, vector: np.ndarray) -> None:
+        if self._shared is None:
+            return
+        try:
+            self._shared.set(self._shared_key(key), vector.tobytes(), ttl_seconds=self._shared_ttl)
+        except Exception as exc:
+            log.warning("EmbeddingService: shared cache write failed: %s", exc)
+
+    # ── Coalescer ──────────────────────────────────────────────────────────
+
+    def _submit(self, key: str, text: str) -> Future[np.ndarray]:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self._inflight[key] = future
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="tei-embed-coalescer", daemon=True
+                )
+                self._worker.start()
+        self._queue.put((key, text))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else None
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = remaining > 0
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: list[tuple[str, str]]) -> None:
+        """Embed one batch and resolve its futures. Never raises: any failure,
+        including a short or malformed TEI response, fails every future of
+        the batch that is still pending, so no caller is left waiting."""
+        keys = [key for key, _ in batch]
+        try:
+            rows = np.asarray(self._client.embed([text for _, text in batch]), dtype=np.float32)
+            if rows.ndim != 2 or rows.shape[0] != len(keys):
+                raise TEIClientError(
+                    f"embed: expected {len(keys)} vectors, got array of shape {rows.shape}"
+                )
+            with self._lock:
+                self._counters["tei_requests"] += 1
+                self._counters["tei_texts"] += len(batch)
+            for key, row in zip(keys, rows, strict=True):
+                row.setflags(write=False)
+                self._remember(key, row)
+                self._shared_set(key, row)
+                with self._lock:
+                    future = self._inflight.pop(key)
+                future.set_result(row)
+        except Exception as exc:
+            error = exc if isinstance(exc, TEIClientError) else TEIClientError(f"embed: {exc}")
+            with self._lock:
+                futures = [self._inflight.pop(key) for key in keys if key in self._inflight]
+            for future in futures:
+                future.set_exception(error)
@@ -0,0 +1,200 @@
+"""
+FILE: src/memory/embeddings.py
+PURPOSE: Batched, content-deduplicated embeddings for agent_memories.
+         Many inputs per OpenAI request; a local SQLite vector cache keyed by
+         sha256(model + content) means identical content is embedded once.
+         The embedder is any callable list[str] -> list[list[float]], so
+         backfills can run against a local stub.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+OPENAI_API_KEY: str = os.environ.get("OPENAI_API_KEY", "")
+
+EMBED_MODEL = "text-embedding-3-small"
+EMBED_URL = "https://api.openai.com/v1/embeddings"
+MAX_INPUT_CHARS = 8000
+EMBED_REQUEST_SIZE = 100  # inputs per embeddings request (API allows 2048)
+VECTOR_CACHE_PATH = Path(
+    os.environ.get("MEMORY_VECTOR_CACHE_PATH", "/tmp/agent_memory_vector_cache.sqlite3")
+)
+
+Embedder = Callable[[list[str]], list[list[float]]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_vectors (
+    content_hash TEXT PRIMARY KEY,
+    model        TEXT NOT NULL,
+    embedding    BLOB NOT NULL,
+    created_at   REAL NOT NULL
+)
+"""
+
+
+def content_hash(text: str, model: str = EMBED_MODEL) -> str:
+    """Cache key for the text the embedder will actually see."""
+    return hashlib.sha256(f"{model}\n{text[:MAX_INPUT_CHARS]}".encode()).hexdigest()
+
+
+class OpenAIEmbedder:
+    """text-embedding-3-small over HTTP, one request per call, cost-logged."""
+
+    def __init__(
+        self,
+        api_key: str = OPENAI_API_KEY,
+        model: str = EMBED_MODEL,
+        use_case: str = "backfill_embedding",
+        timeout: float = 30,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.use_case = use_case
+        self.timeout = timeout
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        resp = httpx.post(
+            EMBED_URL,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={"model": self.model, "input": [t[:MAX_INPUT_CHARS] for t in texts]},
+            timeout=self.timeout,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"OpenAI embeddings returned {resp.status_code}: {resp.text[:200]}")
+        emb_data = resp.json()
+        try:
+            from src.bot_common.openai_cost_logger import log_openai_call
+
+            usage = emb_data.get("usage", {})
+            log_openai_call(
+                callsign=os.environ.get("CALLSIGN", "unknown"),
+                use_case=self.use_case,
+                model=self.model,
+                input_tokens=usage.get("total_tokens", 0),
+            )
+        except Exception:
+            pass
+        # Results carry their input index; don't rely on response order
+        return [d["embedding"] for d in sorted(emb_data["data"], key=lambda d: d["index"])]
+
+
+class VectorCache:
+    """Local SQLite store of embeddings by content hash. Best-effort, never raises."""
+
+    def __init__(self, path: Path = VECTOR_CACHE_PATH):
+        self.path = path
+        self._db: sqlite3.Connection | None = None
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+        return self._db
+
+    def get_many(self, hashes: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        try:
+            db = self._conn()
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, blob in db.execute(
+                    f"SELECT content_hash, embedding FROM memory_vectors "
+                    f"WHERE content_hash IN ({placeholders})",
+                    chunk,
+                ):
+                    found[key] = array("d", blob).tolist()
+        except sqlite3.Error as exc:
+            logger.warning(f"[embeddings] vector cache read failed: {exc}")
+        return found
+
+    def put_many(self, vectors: dict[str, list[float]], model: str = EMBED_MODEL) -> None:
+        if not vectors:
+            return
+        now = time.time()
+        try:
+            db = self._conn()
+            db.executemany(
+                "INSERT OR REPLACE INTO memory_vectors "
+                "(content_hash, model, embedding, created_at) VALUES (?, ?, ?, ?)",
+                [(key, model, array("d", vec).tobytes(), now) for key, vec in vectors.items()],
+            )
+            db.commit()
+        except sqlite3.Error as exc:
+            logger.warning(f"[embeddings] vector cache write failed: {exc}")
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+_vector_cache: VectorCache | None = None
+
+
+def get_vector_cache() -> VectorCache:
+    """Process-wide vector cache at MEMORY_VECTOR_CACHE_PATH."""
+    global _vector_cache
+    if _vector_cache is None:
+        _vector_cache = VectorCache()
+    return _vector_cache
+
+
+def embed_texts(
+    texts: list[str],
+    embedder: Embedder,
+    cache: VectorCache | None = None,
+    batch_size: int = EMBED_REQUEST_SIZE,
+    model: str = EMBED_MODEL,
+) -> tuple[list[list[float] | None], dict]:
+    """Embed texts, sending only unique, uncached content to the embedder.
+
+    A failed request leaves None for its inputs (logged) and the rest proceed.
+
+    Returns:
+        (vectors aligned with texts, {"unique", "cache_hits", "embedded", "requests", "failed"})
+    """
+    hashes = [content_hash(t, model) for t in texts]
+    unique: dict[str, str] = {}
+    for key, text in zip(hashes, texts, strict=True):
+        unique.setdefault(key, text)
+
+    vectors = cache.get_many(list(unique)) if cache is not None else {}
+    stats = {"unique": len(unique), "cache_hits": len(vectors), "embedded": 0, "requests": 0}
+    missing = [key for key in unique if key not in vectors]
+
+    failed = 0
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start : start + batch_size]
+        stats["requests"] += 1
+        try:
+            embedded = embedder([unique[key] for key in chunk])
+            if len(embedded) != len(chunk):
+                raise RuntimeError(f"embedder returned {len(embedded)} vectors for {len(chunk)}")
+        except Exception as exc:
+            failed += len(chunk)
+            logger.warning(f"[embeddings] batch of {len(chunk)} failed: {exc}")
+            continue
+        fresh = dict(zip(chunk, embedded, strict=True))
+        vectors.update(fresh)
+        stats["embedded"] += len(fresh)
+        if cache is not None:
+            cache.put_many(fresh, model)
+
+    stats["failed"] = failed
+    return [vectors.get(key) for key in hashes], stats
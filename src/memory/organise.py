@@ -3,7 +3,9 @@ Event-triggered memory organisation.
 
 Runs when write count exceeds thresholds (not on a schedule).
 Operations:
-1. Embed backfill — rows missing embeddings (capped at 50 per run)
+1. Embed backfill — rows missing embeddings (capped at 50 per run); batched
+   embedding requests, local vector cache, one bulk write per batch.
+   backfill_embeddings_bulk() drains the whole backlog and reports rows/s.
 2. Stale archive — confirmed rows with access_count=0 after 200+ total → archived
 3. Write counter — store() calls increment_write_counter() on every write
 
@@ -13,10 +15,21 @@ Every 25 writes, run_organisation() fires automatically.
 
 import logging
 import os
+import time
 from datetime import UTC
 
 import httpx
 
+from .embeddings import (
+    EMBED_MODEL,
+    EMBED_REQUEST_SIZE,
+    Embedder,
+    OpenAIEmbedder,
+    VectorCache,
+    embed_texts,
+    get_vector_cache,
+)
+
 logger = logging.getLogger(__name__)
 
 SUPABASE_URL: str = os.environ.get("SUPABASE_URL", "")
@@ -52,60 +65,100 @@ def increment_write_counter() -> None:
             logger.warning(f"[organise] auto-trigger failed: {exc}")
 
 
-def backfill_embeddings(limit: int = EMBED_BATCH_LIMIT) -> int:
-    """Embed rows missing embeddings. Capped at `limit` per call."""
-    if not OPENAI_API_KEY:
-        return 0
-
-    headers = _headers()
-    resp = httpx.get(
-        f"{SUPABASE_URL}/rest/v1/agent_memories?embedding=is.null&select=id,content&limit={limit}",
+def _bulk_set_embeddings(rows: list[dict], headers: dict) -> int:
+    """Write a batch of {"id", "embedding"} in one RPC call. Returns rows updated."""
+    resp = httpx.post(
+        f"{SUPABASE_URL}/rest/v1/rpc/set_agent_memory_embeddings",
         headers=headers,
-        timeout=10,
+        json={"rows": rows},
+        timeout=30,
     )
     if resp.status_code != 200:
+        logger.warning(f"[organise] bulk embedding write failed: {resp.status_code}")
         return 0
+    return int(resp.json() or 0)
+
+
+def backfill_embeddings_bulk(
+    max_rows: int | None = None,
+    page_size: int = EMBED_REQUEST_SIZE,
+    embedder: Embedder | None = None,
+    cache: VectorCache | None = None,
+) -> dict:
+    """Embed every row missing an embedding (or up to max_rows), a page at a time.
+
+    Each page is one Supabase read, at most one embeddings request per
+    EMBED_REQUEST_SIZE uncached contents, and one bulk write. Pages are walked
+    by id, so rows whose embedding failed are not re-fetched in the same run.
+
+    Args:
+        max_rows: Stop after this many rows (None = all)
+        page_size: Rows per read/write batch
+        embedder: list[str] -> list[vector]; defaults to OpenAI (needs OPENAI_API_KEY)
+        cache: Vector cache; defaults to the process-wide local cache
+
+    Returns:
+        {"rows", "written", "cache_hits", "requests", "failed", "seconds", "rows_per_second"}
+    """
+    stats = {"rows": 0, "written": 0, "cache_hits": 0, "requests": 0, "failed": 0}
+    if embedder is None:
+        if not OPENAI_API_KEY:
+            return {**stats, "seconds": 0.0, "rows_per_second": 0.0}
+        embedder = OpenAIEmbedder(OPENAI_API_KEY)
+    if cache is None:
+        cache = get_vector_cache()
 
-    rows = resp.json()
-    count = 0
-    for row in rows:
-        try:
-            emb_resp = httpx.post(
-                "https://api.openai.com/v1/embeddings",
-                headers={
-                    "Authorization": f"Bearer {OPENAI_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={"model": "text-embedding-3-small", "input": row["content"][:8000]},
-                timeout=10,
-            )
-            if emb_resp.status_code == 200:
-                emb_data = emb_resp.json()
-                try:
-                    from src.bot_common.openai_cost_logger import log_openai_call
-
-                    usage = emb_data.get("usage", {})
-                    log_openai_call(
-                        callsign=os.environ.get("CALLSIGN", "unknown"),
-                        use_case="backfill_embedding",
-                        model="text-embedding-3-small",
-                        input_tokens=usage.get("total_tokens", 0),
-                    )
-                except Exception:
-                    pass
-                embedding = emb_data["data"][0]["embedding"]
-                httpx.patch(
-                    f"{SUPABASE_URL}/rest/v1/agent_memories?id=eq.{row['id']}",
-                    headers={**headers, "Prefer": "return=minimal"},
-                    json={"embedding": embedding},
-                    timeout=10,
-                )
-                count += 1
-        except Exception:
-            pass
-    if count:
-        logger.info(f"[organise] backfilled {count} embeddings")
-    return count
+    headers = _headers()
+    started = time.monotonic()
+    last_id = None
+    while max_rows is None or stats["rows"] < max_rows:
+        limit = page_size if max_rows is None else min(page_size, max_rows - stats["rows"])
+        after = f"&id=gt.{last_id}" if last_id else ""
+        resp = httpx.get(
+            f"{SUPABASE_URL}/rest/v1/agent_memories?embedding=is.null&select=id,content"
+            f"&order=id.asc{after}&limit={limit}",
+            headers=headers,
+            timeout=10,
+        )
+        if resp.status_code != 200:
+            break
+        rows = resp.json()
+        if not rows:
+            break
+        last_id = rows[-1]["id"]
+        stats["rows"] += len(rows)
+
+        vectors, embed_stats = embed_texts(
+            [row.get("content") or "" for row in rows], embedder, cache, model=EMBED_MODEL
+        )
+        stats["cache_hits"] += embed_stats["cache_hits"]
+        stats["requests"] += embed_stats["requests"]
+        updates = [
+            {"id": row["id"], "embedding": vector}
+            for row, vector in zip(rows, vectors, strict=True)
+            if vector is not None
+        ]
+        stats["failed"] += len(rows) - len(updates)
+        if updates:
+            stats["written"] += _bulk_set_embeddings(updates, headers)
+        if len(rows) < limit:
+            break
+
+    seconds = time.monotonic() - started
+    stats["seconds"] = round(seconds, 3)
+    stats["rows_per_second"] = round(stats["written"] / seconds, 1) if seconds > 0 else 0.0
+    if stats["rows"]:
+        logger.info(
+            f"[organise] backfilled {stats['written']}/{stats['rows']} embeddings "
+            f"({stats['cache_hits']} cached, {stats['requests']} requests, "
+            f"{stats['rows_per_second']} rows/s)"
+        )
+    return stats
+
+
+def backfill_embeddings(limit: int = EMBED_BATCH_LIMIT) -> int:
+    """Embed rows missing embeddings. Capped at `limit` per call."""
+    return backfill_embeddings_bulk(max_rows=limit, page_size=limit)["written"]
 
 
 def archive_stale(limit: int = 20) -> int:
@@ -1,7 +1,8 @@
 """
 FILE: src/memory/store.py
 PURPOSE: Write a memory row to agent_memories via PostgREST.
-         Auto-generates embedding via OpenAI text-embedding-3-small on every write.
+         Auto-generates embedding via OpenAI text-embedding-3-small on every write
+         (deduplicated through the local vector cache in embeddings.py).
          Auto-populates supersedes_id when a new decision/verified_fact closely
          matches an existing row (connective writes — diagnostic FM-6).
 """
@@ -15,6 +16,7 @@ import httpx
 
 from . import ratelimit
 from .client import MEMORIES_ENDPOINT, _supabase_headers, _supabase_url
+from .embeddings import OpenAIEmbedder, embed_texts, get_vector_cache
 from .types import VALID_SOURCE_TYPES
 
 logger = logging.getLogger(__name__)
@@ -30,34 +32,20 @@ SUPERSEDE_SOURCE_TYPES: set[str] = {"decision", "verified_fact", "dave_confirmed
 
 
 def _generate_embedding(text: str) -> list[float] | None:
-    """Generate embedding via OpenAI text-embedding-3-small. Best-effort."""
+    """Generate embedding via OpenAI text-embedding-3-small. Best-effort.
+
+    Goes through the local vector cache, so re-storing identical content
+    does not call OpenAI again.
+    """
     if not OPENAI_API_KEY:
         return None
     try:
-        resp = httpx.post(
-            "https://api.openai.com/v1/embeddings",
-            headers={
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json={"model": "text-embedding-3-small", "input": text[:8000]},
-            timeout=10,
+        vectors, _ = embed_texts(
+            [text],
+            OpenAIEmbedder(OPENAI_API_KEY, use_case="store_embedding", timeout=10),
+            get_vector_cache(),
         )
-        if resp.status_code == 200:
-            emb_data = resp.json()
-            try:
-                from src.bot_common.openai_cost_logger import log_openai_call
-
-                usage = emb_data.get("usage", {})
-                log_openai_call(
-                    callsign=os.environ.get("CALLSIGN", "unknown"),
-                    use_case="store_embedding",
-                    model="text-embedding-3-small",
-                    input_tokens=usage.get("total_tokens", 0),
-                )
-            except Exception:
-                pass
-            return emb_data["data"][0]["embedding"]
+        return vectors[0]
     except Exception as exc:
         logger.warning(f"[store] embedding generation failed: {exc}")
     return None
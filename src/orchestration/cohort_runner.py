@@ -3,8 +3,22 @@
 Chains all 11 stages sequentially. Within each stage, domains run in parallel
 via src/intelligence/parallel.py.
 
+--streaming drops the barriers between stages 2-11: each domain flows through
+the same _run_stageN wrappers on its own (run_pipelined), with per-stage
+worker pools / bounded queues sized from STAGE_PARALLELISM and the budget cap
+checked before every stage call. The summary then carries per-stage
+utilisation and the wall-clock saved against the barrier schedule.
+
+Every completed stage is checkpointed per domain to
+<output_dir>/checkpoint.sqlite3 (src/pipeline/run_checkpoint.py).
+--resume <run_id> reopens that run's checkpoint, rehydrates domain_data and
+skips Stage 1 and every stage already completed, so paid DFS / Gemini /
+Bright Data results are not bought twice after a crash or budget kill.
+
 Usage:
     python -m src.orchestration.cohort_runner --size 20 --categories dental,plumbing,legal,accounting,fitness
+    python -m src.orchestration.cohort_runner --size 100 --streaming
+    python -m src.orchestration.cohort_runner --resume 20261016_093000
 
 Pipeline F v2.1. Directive D1.
 """
@@ -35,14 +49,16 @@ for _k, _v in env.items():
 
 from src.config.category_etv_windows import CATEGORY_ETV_WINDOWS, get_etv_window
 from src.config.settings import settings
+from src.config.stage_parallelism import get_parallelism
 from src.integrations.bright_data_client import BrightDataClient
 from src.integrations.dfs_labs_client import DFSLabsClient
+from src.integrations.dfs_response_cache import get_dfs_response_cache
 from src.integrations.leadmagic import LeadmagicClient
 from src.intelligence.dfs_signal_bundle import build_signal_bundle
 from src.intelligence.enhanced_vr import run_stage10_vr_and_messaging
 from src.intelligence.funnel_classifier import assemble_card
 from src.intelligence.gemini_client import GeminiClient
-from src.intelligence.parallel import run_parallel
+from src.intelligence.parallel import PipelineStage, run_parallel, run_pipelined
 from src.intelligence.prospect_scorer import score_prospect
 from src.intelligence.serp_verify import run_serp_verify
 from src.intelligence.stage6_enrich import run_stage6_enrich
@@ -52,7 +68,9 @@ from src.pipeline.contactout_enricher import enrich_dm_via_contactout
 from src.pipeline.email_waterfall import discover_email, verify_discovered_email
 from src.pipeline.latency_tracker import LatencyTracker
 from src.pipeline.mobile_waterfall import run_mobile_waterfall
+from src.pipeline.run_checkpoint import RunCheckpointStore, checkpoint_path, run_checkpointed
 from src.pipeline.suppression_manager import SuppressionManager
+from src.utils.adaptive_limiter import limiter_snapshots
 from src.utils.domain_blocklist import is_blocked
 
 logger = logging.getLogger(__name__)
@@ -172,11 +190,15 @@ def _tg(msg: str) -> None:
         )
 
 
-def _tg_progress(stage_label: str, pipeline: list[dict], cost_so_far: float) -> None:
+def _progress_line(stage_label: str, pipeline: list[dict], cost_so_far: float) -> str:
     total = len(pipeline)
     dropped = sum(1 for d in pipeline if d.get("dropped_at"))
     active = total - dropped
-    _tg(f"{stage_label}: {active}/{total} active, {dropped} dropped, cost=${cost_so_far:.2f}")
+    return f"{stage_label}: {active}/{total} active, {dropped} dropped, cost=${cost_so_far:.2f}"
+
+
+def _tg_progress(stage_label: str, pipeline: list[dict], cost_so_far: float) -> None:
+    _tg(_progress_line(stage_label, pipeline, cost_so_far))
 
 
 # ---------------------------------------------------------------------------
@@ -946,9 +968,61 @@ def _build_summary(pipeline: list[dict], wall_s: float) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def _check_budget(pipeline: list[dict], cap: float) -> bool:
-    """Return True if cumulative cost_usd across pipeline exceeds cap."""
-    return sum(d.get("cost_usd", 0) for d in pipeline) > cap
+def _check_budget(pipeline: list[dict], cap: float, baseline: float = 0.0) -> bool:
+    """Return True if cost_usd spent across pipeline beyond ``baseline`` exceeds cap.
+
+    ``baseline`` is the spend rehydrated on --resume: it was paid by the
+    interrupted run (and may be what tripped the cap), so only spend made
+    after the resume counts against this run's cap.
+    """
+    return sum(d.get("cost_usd", 0) for d in pipeline) - baseline > cap
+
+
+# Streaming mode stage chain: (stage key, STAGE_PARALLELISM key, progress label)
+COHORT_STAGES: list[tuple[str, str, str]] = [
+    ("stage2", "cohort_stage2_verify", "Stage 2 VERIFY"),
+    ("stage3", "cohort_stage3_identify", "Stage 3 IDENTIFY"),
+    ("stage4", "cohort_stage4_signal", "Stage 4 SIGNAL"),
+    ("stage5", "cohort_stage5_score", "Stage 5 SCORE"),
+    ("stage6", "cohort_stage6_enrich", "Stage 6 ENRICH"),
+    ("stage7", "cohort_stage7_analyse", "Stage 7 ANALYSE"),
+    ("stage8", "cohort_stage8_contact", "Stage 8 CONTACT"),
+    ("stage9", "cohort_stage9_social", "Stage 9 SOCIAL"),
+    ("stage10", "cohort_stage10_vr_msg", "Stage 10 VR+MSG"),
+    ("stage11", "cohort_stage11_card", "Stage 11 CARD"),
+]
+_STAGE_LABELS = {name: label for name, _, label in COHORT_STAGES}
+
+
+def _cohort_stages(
+    dfs: DFSLabsClient,
+    gemini: GeminiClient,
+    bd: BrightDataClient,
+    lm: LeadmagicClient,
+    checkpoint: RunCheckpointStore | None = None,
+) -> list[PipelineStage]:
+    """Stages 2-11 as a run_pipelined chain over the same _run_stageN wrappers."""
+    calls = {
+        "stage2": (_run_stage2, dfs),
+        "stage3": (_run_stage3, gemini),
+        "stage4": (_run_stage4, dfs),
+        "stage5": (_run_stage5,),
+        "stage6": (_run_stage6, dfs),
+        "stage7": (_run_stage7, gemini),
+        "stage8": (_run_stage8, dfs, bd, lm),
+        "stage9": (_run_stage9, bd),
+        "stage10": (_run_stage10,),
+        "stage11": (_run_stage11,),
+    }
+
+    def _stage_func(name: str):
+        func, *args = calls[name]
+        return lambda d: run_checkpointed(checkpoint, name, d, func, *args)
+
+    return [
+        PipelineStage(name, _stage_func(name), get_parallelism(key), label)
+        for name, key, label in COHORT_STAGES
+    ]
 
 
 async def run_cohort(
@@ -958,27 +1032,60 @@ async def run_cohort(
     domains: list[str] | None = None,
     force_replay: bool = False,
     dry_run: bool = False,
+    replay_cache: bool = False,
+    streaming: bool = False,
+    resume: str | None = None,
 ) -> dict:
     if dry_run:
         os.environ["DRY_RUN"] = "1"
         logger.info("[DRY-RUN] All API calls will return empty responses. No spend.")
         _tg("[DRY-RUN] Trace mode — no API calls, no spend")
-    run_ts = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    run_ts = resume or datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     out_path = Path(output_dir) if output_dir else Path("scripts/output") / f"cohort_run_{run_ts}"
     wall_start = time.monotonic()
 
-    # Init clients
+    # Stage checkpoints. A resumed run must find the original run's log.
+    if resume:
+        ckpt = RunCheckpointStore.open_existing(checkpoint_path(out_path))
+        resume_meta = ckpt.run_meta or {}
+        resume_domains: list | None = resume_meta.get("domains") or []
+        logger.info(
+            "[RESUME] run %s: %d domains, %d checkpoint records",
+            run_ts,
+            len(resume_domains),
+            ckpt.records_loaded,
+        )
+    else:
+        ckpt = RunCheckpointStore(checkpoint_path(out_path))
+        resume_domains = None
+    logger.info("Run id %s — checkpoint %s", run_ts, ckpt.path)
+
+    # Init clients. replay_cache serves every DFS call from the shared response
+    # cache with no network (offline benchmarking); misses return no-data.
+    if replay_cache:
+        logger.info("[REPLAY] DFS calls served from response cache only — no DFS spend.")
+    dfs_cache = get_dfs_response_cache(replay=True if replay_cache else None)
     dfs = DFSLabsClient(
         login=env.get("DATAFORSEO_LOGIN", ""),
         password=env.get("DATAFORSEO_PASSWORD", ""),
+        response_cache=dfs_cache,
     )
     gemini = GeminiClient(api_key=env.get("GEMINI_API_KEY"))
     bd = BrightDataClient(api_key=env.get("BRIGHTDATA_API_KEY", ""))
     lm = LeadmagicClient()
 
+    # Load the suppression index before any stage runs: Stage 8's pre-check is
+    # sync and, on the running loop, blocks sends until the snapshot is loaded.
+    await SuppressionManager.refresh_index()
+
     # Pre-run cost estimate and hard cap
     # When --domains is used, domains_per_category=0 and categories=[], so use len(domains) directly
-    total_requested = len(domains) if domains else (domains_per_category * len(categories))
+    if resume_domains is not None:
+        total_requested = len(resume_domains)
+    elif domains:
+        total_requested = len(domains)
+    else:
+        total_requested = domains_per_category * len(categories)
     estimated_cost_per_domain = 0.25  # USD, from Pipeline F v2.1 economics doc
     estimated_total = total_requested * estimated_cost_per_domain
     budget_hard_cap = estimated_total * 5
@@ -999,7 +1106,11 @@ async def run_cohort(
     # ---------------------------------------------------------------------------
     all_domain_items: list[dict] = []
 
-    if domains:
+    if resume_domains is not None:
+        # Resume — same domain list as the checkpointed run, stage outputs rehydrated
+        all_domain_items = [ckpt.rehydrate(_new_domain(d, cat)) for d, cat in resume_domains]
+        _tg(f"[RESUME] {run_ts}: {len(all_domain_items)} domains rehydrated (bypassed Stage 1)")
+    elif domains:
         # Bypass Stage 1 — direct domain injection
         for d in domains:
             if not d or "." not in d:
@@ -1049,11 +1160,12 @@ async def run_cohort(
             f"Stage 1 DISCOVER complete: {len(all_domain_items)} domains across {len(categories)} categories"
         )
 
-    if domains:
+    if domains or resume_domains is not None:
         # all_domain_items already contains _new_domain() dicts (injected above)
         pipeline: list[dict] = all_domain_items
     else:
         pipeline = [_new_domain(d["domain"], d["category"]) for d in all_domain_items]
+    ckpt.record_run({"domains": [[d["domain"], d["category"]] for d in pipeline]})
 
     if not pipeline:
         logger.warning("No domains discovered — aborting")
@@ -1070,14 +1182,91 @@ async def run_cohort(
     def _total_cost() -> float:
         return sum(d["cost_usd"] for d in pipeline)
 
+    # Spend carried over from the checkpoint does not count against the cap.
+    budget_baseline = _total_cost() if resume_domains is not None else 0.0
+    if budget_baseline:
+        logger.info(
+            "[RESUME] $%.2f already spent; cap $%.2f applies to new spend",
+            budget_baseline,
+            budget_hard_cap,
+        )
+
+    if streaming:
+        loop = asyncio.get_running_loop()
+        notices: list[asyncio.Future] = []
+
+        def _stage_done(name: str) -> None:
+            # Slack relay is a blocking subprocess; keep it off the event loop
+            # so the downstream stages keep streaming. The line is built here:
+            # the stages keep mutating pipeline while the relay thread runs.
+            line = _progress_line(_STAGE_LABELS[name], pipeline, _total_cost())
+            notices.append(loop.run_in_executor(None, _tg, line))
+
+        try:
+            updated, stream_stats = await run_pipelined(
+                pipeline,
+                _cohort_stages(dfs, gemini, bd, lm, checkpoint=ckpt),
+                skip=lambda d: bool(d.get("dropped_at")),
+                should_stop=lambda: _check_budget(pipeline, budget_hard_cap, budget_baseline),
+                on_stage_complete=_stage_done,
+            )
+        finally:
+            for outcome in await asyncio.gather(*notices, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    logger.warning("Stage progress notice failed: %s", outcome)
+        _merge(pipeline, updated)
+        extra = {
+            "mode": "streaming",
+            "run_id": run_ts,
+            "streaming": stream_stats,
+            "checkpoint": ckpt.stats(),
+        }
+        logger.info(
+            "Streaming: %.1fs wall vs %.1fs barrier estimate (saved %.1fs, %.1f%%)",
+            stream_stats["wall_clock_s"],
+            stream_stats["barrier_estimate_s"],
+            stream_stats["savings_s"],
+            stream_stats["savings_pct"],
+        )
+        if stream_stats["stopped"]:
+            cost_now = _total_cost() - budget_baseline
+            logger.error(
+                "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
+                cost_now,
+                budget_hard_cap,
+            )
+            _tg(
+                f"BUDGET KILL: ${cost_now:.2f} exceeds cap ${budget_hard_cap:.2f}. Partial results saved."
+            )
+            await dfs.close()
+            summary = _build_summary(pipeline, time.monotonic() - wall_start)
+            summary.update(extra)
+            out_path.mkdir(parents=True, exist_ok=True)
+            (out_path / "summary.json").write_text(json.dumps(summary, indent=2, default=str))
+            _write_outputs(pipeline, out_path)
+            return summary
+        return await _finish_run(
+            pipeline,
+            dfs,
+            dfs_cache,
+            wall_start,
+            out_path,
+            replay_cache=replay_cache,
+            dry_run=dry_run,
+            extra=extra,
+        )
+
     # Stage 2
     updated = await run_parallel(
-        pipeline, lambda d: _run_stage2(d, dfs), concurrency=30, label="Stage 2 VERIFY"
+        pipeline,
+        lambda d: run_checkpointed(ckpt, "stage2", d, _run_stage2, dfs),
+        concurrency=get_parallelism("cohort_stage2_verify"),
+        label="Stage 2 VERIFY",
     )
     pipeline = updated
     _tg_progress("Stage 2 VERIFY", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1097,12 +1286,15 @@ async def run_cohort(
     # Stage 3
     active3 = _active(pipeline)
     updated3 = await run_parallel(
-        active3, lambda d: _run_stage3(d, gemini), concurrency=20, label="Stage 3 IDENTIFY"
+        active3,
+        lambda d: run_checkpointed(ckpt, "stage3", d, _run_stage3, gemini),
+        concurrency=get_parallelism("cohort_stage3_identify"),
+        label="Stage 3 IDENTIFY",
     )
     _merge(pipeline, updated3)
     _tg_progress("Stage 3 IDENTIFY", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1122,12 +1314,15 @@ async def run_cohort(
     # Stage 4
     active4 = _active(pipeline)
     updated4 = await run_parallel(
-        active4, lambda d: _run_stage4(d, dfs), concurrency=20, label="Stage 4 SIGNAL"
+        active4,
+        lambda d: run_checkpointed(ckpt, "stage4", d, _run_stage4, dfs),
+        concurrency=get_parallelism("cohort_stage4_signal"),
+        label="Stage 4 SIGNAL",
     )
     _merge(pipeline, updated4)
     _tg_progress("Stage 4 SIGNAL", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1147,7 +1342,10 @@ async def run_cohort(
     # Stage 5
     active5 = _active(pipeline)
     updated5 = await run_parallel(
-        active5, lambda d: _run_stage5(d), concurrency=50, label="Stage 5 SCORE"
+        active5,
+        lambda d: run_checkpointed(ckpt, "stage5", d, _run_stage5),
+        concurrency=get_parallelism("cohort_stage5_score"),
+        label="Stage 5 SCORE",
     )
     _merge(pipeline, updated5)
     _tg_progress("Stage 5 SCORE", pipeline, _total_cost())
@@ -1155,12 +1353,15 @@ async def run_cohort(
     # Stage 6 (gated inside wrapper — runs all active, skips low scorers internally)
     active6 = _active(pipeline)
     updated6 = await run_parallel(
-        active6, lambda d: _run_stage6(d, dfs), concurrency=10, label="Stage 6 ENRICH"
+        active6,
+        lambda d: run_checkpointed(ckpt, "stage6", d, _run_stage6, dfs),
+        concurrency=get_parallelism("cohort_stage6_enrich"),
+        label="Stage 6 ENRICH",
     )
     _merge(pipeline, updated6)
     _tg_progress("Stage 6 ENRICH", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1180,12 +1381,15 @@ async def run_cohort(
     # Stage 7
     active7 = _active(pipeline)
     updated7 = await run_parallel(
-        active7, lambda d: _run_stage7(d, gemini), concurrency=20, label="Stage 7 ANALYSE"
+        active7,
+        lambda d: run_checkpointed(ckpt, "stage7", d, _run_stage7, gemini),
+        concurrency=get_parallelism("cohort_stage7_analyse"),
+        label="Stage 7 ANALYSE",
     )
     _merge(pipeline, updated7)
     _tg_progress("Stage 7 ANALYSE", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1205,12 +1409,15 @@ async def run_cohort(
     # Stage 8
     active8 = _active(pipeline)
     updated8 = await run_parallel(
-        active8, lambda d: _run_stage8(d, dfs, bd, lm), concurrency=15, label="Stage 8 CONTACT"
+        active8,
+        lambda d: run_checkpointed(ckpt, "stage8", d, _run_stage8, dfs, bd, lm),
+        concurrency=get_parallelism("cohort_stage8_contact"),
+        label="Stage 8 CONTACT",
     )
     _merge(pipeline, updated8)
     _tg_progress("Stage 8 CONTACT", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1230,12 +1437,15 @@ async def run_cohort(
     # Stage 9 (gated inside wrapper)
     active9 = _active(pipeline)
     updated9 = await run_parallel(
-        active9, lambda d: _run_stage9(d, bd), concurrency=10, label="Stage 9 SOCIAL"
+        active9,
+        lambda d: run_checkpointed(ckpt, "stage9", d, _run_stage9, bd),
+        concurrency=get_parallelism("cohort_stage9_social"),
+        label="Stage 9 SOCIAL",
     )
     _merge(pipeline, updated9)
     _tg_progress("Stage 9 SOCIAL", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1255,12 +1465,15 @@ async def run_cohort(
     # Stage 10 (gated inside wrapper)
     active10 = _active(pipeline)
     updated10 = await run_parallel(
-        active10, lambda d: _run_stage10(d), concurrency=10, label="Stage 10 VR+MSG"
+        active10,
+        lambda d: run_checkpointed(ckpt, "stage10", d, _run_stage10),
+        concurrency=get_parallelism("cohort_stage10_vr_msg"),
+        label="Stage 10 VR+MSG",
     )
     _merge(pipeline, updated10)
     _tg_progress("Stage 10 VR+MSG", pipeline, _total_cost())
-    if _check_budget(pipeline, budget_hard_cap):
-        cost_now = _total_cost()
+    if _check_budget(pipeline, budget_hard_cap, budget_baseline):
+        cost_now = _total_cost() - budget_baseline
         logger.error(
             "BUDGET HARD CAP EXCEEDED: $%.2f > $%.2f. Saving partial results.",
             cost_now,
@@ -1280,15 +1493,49 @@ async def run_cohort(
     # Stage 11 — all active get a card attempt
     active11 = _active(pipeline)
     updated11 = await run_parallel(
-        active11, lambda d: _run_stage11(d), concurrency=50, label="Stage 11 CARD"
+        active11,
+        lambda d: run_checkpointed(ckpt, "stage11", d, _run_stage11),
+        concurrency=get_parallelism("cohort_stage11_card"),
+        label="Stage 11 CARD",
     )
     _merge(pipeline, updated11)
     _tg_progress("Stage 11 CARD", pipeline, _total_cost())
 
+    return await _finish_run(
+        pipeline,
+        dfs,
+        dfs_cache,
+        wall_start,
+        out_path,
+        replay_cache=replay_cache,
+        dry_run=dry_run,
+        extra={"mode": "barrier", "run_id": run_ts, "checkpoint": ckpt.stats()},
+    )
+
+
+async def _finish_run(
+    pipeline: list[dict],
+    dfs: DFSLabsClient,
+    dfs_cache,
+    wall_start: float,
+    out_path: Path,
+    replay_cache: bool,
+    dry_run: bool,
+    extra: dict | None = None,
+) -> dict:
+    """Close clients, write summary + outputs for a completed run."""
     await dfs.close()
 
     wall_s = time.monotonic() - wall_start
     summary = _build_summary(pipeline, wall_s)
+    summary.update(extra or {})
+    summary["dfs_cache"] = {
+        **(dfs_cache.stats() if dfs_cache is not None else {}),
+        "replay": replay_cache,
+        "cost_avoided_usd": round(dfs.cost_avoided_usd, 4),
+        "cost_avoided_aud": round(dfs.cost_avoided_aud, 4),
+    }
+    summary["concurrency"] = limiter_snapshots()
     out_path.mkdir(parents=True, exist_ok=True)
     (out_path / "summary.json").write_text(json.dumps(summary, indent=2, default=str))
     _write_outputs(pipeline, out_path)
@@ -1348,6 +1595,22 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument(
         "--dry-run", action="store_true", help="Trace decision logic without API calls (no spend)"
     )
+    p.add_argument(
+        "--replay-cache",
+        action="store_true",
+        help="Serve all DFS calls from the response cache, no DFS network (offline benchmark)",
+    )
+    p.add_argument(
+        "--resume",
+        default=None,
+        metavar="RUN_ID",
+        help="Resume a run from its checkpoint, skipping completed stages (same --output-dir)",
+    )
+    p.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Run stages 2-11 pipelined per domain instead of stage-by-stage barriers",
+    )
     return p.parse_args()
 
 
@@ -1355,7 +1618,19 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     args = _parse_args()
 
-    if args.domains:
+    if args.resume:
+        asyncio.run(
+            run_cohort(
+                categories=[],
+                domains_per_category=0,
+                output_dir=args.output_dir,
+                dry_run=args.dry_run,
+                replay_cache=args.replay_cache,
+                streaming=args.streaming,
+                resume=args.resume,
+            )
+        )
+    elif args.domains:
         domain_list = [d.strip() for d in args.domains.split(",") if d.strip()]
         asyncio.run(
             run_cohort(
@@ -1365,6 +1640,8 @@ if __name__ == "__main__":
                 domains=domain_list,
                 force_replay=args.force_replay,
                 dry_run=args.dry_run,
+                replay_cache=args.replay_cache,
+                streaming=args.streaming,
             )
         )
     else:
@@ -1380,5 +1657,7 @@ if __name__ == "__main__":
                 output_dir=args.output_dir,
                 force_replay=args.force_replay,
                 dry_run=args.dry_run,
+                replay_cache=args.replay_cache,
+                streaming=args.streaming,
             )
         )
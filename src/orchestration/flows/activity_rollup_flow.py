@@ -0,0 +1,94 @@
+"""
+FILE: src/orchestration/flows/activity_rollup_flow.py
+PURPOSE: Keep activity_daily_rollup current and check it against a raw scan
+PHASE: 4 (Engines) reporting support
+DEPENDENCIES:
+  - src/integrations/supabase.py
+  - src/services/activity_rollup_service.py
+RULES APPLIED:
+  - Rule 11: Session passed as argument
+
+ReporterEngine reads the rollup plus the activities past its watermark, so a
+late or skipped run only makes reports slower, never wrong.
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from prefect import flow
+
+from src.integrations.supabase import get_db_session
+from src.prefect_utils.completion_hook import on_completion_hook
+from src.prefect_utils.hooks import on_failure_hook
+from src.services.activity_rollup_service import (
+    DEFAULT_SETTLE_SECONDS,
+    check_rollup_parity,
+    refresh_activity_rollup,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@flow(
+    name="activity_rollup",
+    description="Fold new activities into activity_daily_rollup and verify parity",
+    on_completion=[on_completion_hook],
+    on_failure=[on_failure_hook],
+)
+async def activity_rollup_flow(
+    settle_seconds: int = DEFAULT_SETTLE_SECONDS,
+    max_slices: int = 50,
+    parity_days: int = 2,
+) -> dict[str, Any]:
+    """
+    Advance the rollup watermark, then compare recent days against a raw scan.
+
+    Args:
+        settle_seconds: Age below which activities are left to the read-time tail
+        max_slices: Upper bound on refresh slices per run (each is at most 7 days)
+        parity_days: Trailing days to check against a raw scan (0 disables)
+
+    Returns:
+        Refresh summary and parity result
+    """
+    slices = 0
+    groups = 0
+    caught_up = False
+    watermark = None
+    while slices < max_slices and not caught_up:
+        async with get_db_session() as db:
+            step = await refresh_activity_rollup(db, settle_seconds=settle_seconds)
+        caught_up = step["caught_up"]
+        watermark = step["to"]
+        if step["groups"] or not caught_up:
+            slices += 1
+            groups += step["groups"]
+
+    parity = None
+    if parity_days > 0:
+        end = datetime.now(UTC).date()
+        async with get_db_session() as db:
+            parity = await check_rollup_parity(db, end - timedelta(days=parity_days - 1), end)
+        if not parity["match"]:
+            logger.error(
+                "activity_rollup parity mismatch: rollup=%d raw=%d (%d groups)",
+                parity["rollup_total"],
+                parity["raw_total"],
+                len(parity["mismatches"]),
+            )
+
+    logger.info(
+        "activity_rollup: %d slices, %d groups, watermark=%s, caught_up=%s",
+        slices,
+        groups,
+        watermark,
+        caught_up,
+    )
+    return {
+        "slices": slices,
+        "groups": groups,
+        "watermark": watermark.isoformat() if watermark else None,
+        "caught_up": caught_up,
+        "parity": parity,
+    }
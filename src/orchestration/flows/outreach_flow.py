@@ -58,6 +58,8 @@ from src.models.base import (
 from src.models.campaign import Campaign
 from src.models.client import Client
 from src.models.lead import Lead
+from src.outreach.safety.send_pacer import SendPacer
+from src.outreach.send_executor import DEFAULT_MAX_CONCURRENT_RESOURCES, run_send_batch
 from src.prefect_utils.completion_hook import on_completion_hook
 from src.prefect_utils.hooks import on_failure_hook
 from src.services.cis_service import get_cis_service
@@ -350,6 +352,21 @@ def _admit_send(
         )
 
 
+def _release_send(
+    snapshot: dict[str, dict[str, float]],
+    lead_data: dict[str, Any],
+    channel: str,
+) -> None:
+    """Undo an _admit_send() reservation when the send did not go out."""
+    client_id = str(lead_data.get("client_id") or "")
+    domain = (lead_data.get("domain") or "").strip()
+    cost = CHANNEL_COST_AUD.get(channel, 0.0)
+    if client_id and client_id in snapshot.get("by_client", {}):
+        snapshot["by_client"][client_id] -= cost
+    if domain and domain in snapshot.get("by_domain", {}):
+        snapshot["by_domain"][domain] -= cost
+
+
 # ============================================
 # TASKS
 # ============================================
@@ -1432,21 +1449,29 @@ async def send_sms_outreach_task(
     on_completion=[on_completion_hook],
     on_failure=[on_failure_hook],
 )
-async def hourly_outreach_flow(batch_size: int = 50) -> dict[str, Any]:
+async def hourly_outreach_flow(
+    batch_size: int = 50,
+    max_concurrent_resources: int = DEFAULT_MAX_CONCURRENT_RESOURCES,
+    pace_sends: bool = False,
+) -> dict[str, Any]:
     """
     Hourly outreach flow.
 
     Steps:
     1. Get leads ready for outreach (with JIT validation)
-    2. For each lead and channel:
-       a. JIT validate client/campaign/lead status
-       b. Check rate limits (via Allocator)
-       c. Generate content (via Content engine)
-       d. Send via appropriate channel engine
-       e. Record activity
+    2. For each lead and channel (one serial lane per sending resource,
+       lanes concurrent — see src/outreach/send_executor.py):
+       a. Budget gate: check and reserve spend (released if the send fails)
+       b. JIT validate client/campaign/lead status
+       c. Check rate limits (via Allocator)
+       d. Generate content (via Content engine)
+       e. Send via appropriate channel engine
+       f. Record activity
 
     Args:
         batch_size: Maximum leads to process
+        max_concurrent_resources: Sends in flight across all resource lanes
+        pace_sends: Apply SendPacer jitter between sends on the same resource
 
     Returns:
         Dict with outreach summary
@@ -1523,13 +1548,6 @@ async def hourly_outreach_flow(batch_size: int = 50) -> dict[str, Any]:
             "message": "All campaigns failed quality gate (100% Cold leads)",
         }
 
-    # Step 2: Process outreach by channel
-    results = {
-        "email": [],
-        "linkedin": [],
-        "sms": [],
-    }
-
     # ─── BU-CLOSED-LOOP-C1 — pre-loop spend snapshot ───────────────────────
     # Admission control fires BEFORE any send. Snapshot loads the last-24h
     # AUD spend per client + per domain, plus credits_remaining and tier.
@@ -1555,99 +1573,30 @@ async def hourly_outreach_flow(batch_size: int = 50) -> dict[str, Any]:
         domains=snapshot_domains,
     )
 
-    # Process email outreach
-    for lead_data in leads_data["leads_by_channel"]["email"]:
-        gate_skip = _check_budget_gate(spend_snapshot, lead_data, "email")
-        if gate_skip is not None:
-            logger.info(
-                "outreach_budget_gate refused: lead=%s channel=email reason=%s",
-                lead_data.get("lead_id"),
-                gate_skip["reason"],
-            )
-            results["email"].append(gate_skip)
-            continue
-        try:
-            # JIT validation
-            validation = await jit_validate_outreach_task(
-                lead_id=lead_data["lead_id"],
-                campaign_id=lead_data["campaign_id"],
-                client_id=lead_data["client_id"],
-            )
-
-            # Send email
-            result = await send_email_outreach_task(
-                lead_id=lead_data["lead_id"],
-                campaign_id=lead_data["campaign_id"],
-                resource=lead_data["resource"],
-                permission_mode=validation["permission_mode"],
-            )
-            if result.get("success"):
-                _admit_send(spend_snapshot, lead_data, "email")
-            results["email"].append(result)
-
-        except ValueError as e:
-            logger.warning(f"JIT validation failed for lead {lead_data['lead_id']}: {e}")
-            results["email"].append(
-                {
-                    "lead_id": lead_data["lead_id"],
-                    "channel": "email",
-                    "success": False,
-                    "error": str(e),
-                }
-            )
-
-    # Process LinkedIn outreach
-    for lead_data in leads_data["leads_by_channel"]["linkedin"]:
-        gate_skip = _check_budget_gate(spend_snapshot, lead_data, "linkedin")
-        if gate_skip is not None:
-            logger.info(
-                "outreach_budget_gate refused: lead=%s channel=linkedin reason=%s",
-                lead_data.get("lead_id"),
-                gate_skip["reason"],
-            )
-            results["linkedin"].append(gate_skip)
-            continue
-        try:
-            # JIT validation
-            validation = await jit_validate_outreach_task(
-                lead_id=lead_data["lead_id"],
-                campaign_id=lead_data["campaign_id"],
-                client_id=lead_data["client_id"],
-            )
-
-            # Send LinkedIn
-            result = await send_linkedin_outreach_task(
-                lead_id=lead_data["lead_id"],
-                campaign_id=lead_data["campaign_id"],
-                resource=lead_data["resource"],
-                permission_mode=validation["permission_mode"],
-            )
-            if result.get("success"):
-                _admit_send(spend_snapshot, lead_data, "linkedin")
-            results["linkedin"].append(result)
-
-        except ValueError as e:
-            logger.warning(f"JIT validation failed for lead {lead_data['lead_id']}: {e}")
-            results["linkedin"].append(
-                {
-                    "lead_id": lead_data["lead_id"],
-                    "channel": "linkedin",
-                    "success": False,
-                    "error": str(e),
-                }
-            )
+    # Step 3: Send. One serial lane per sending resource (mailbox, LinkedIn
+    # seat, phone number); lanes run concurrently, so the hour's throughput
+    # scales with resources rather than the sum of provider latencies.
+    send_tasks = {
+        "email": send_email_outreach_task,
+        "linkedin": send_linkedin_outreach_task,
+        "sms": send_sms_outreach_task,
+    }
 
-    # Process SMS outreach
-    for lead_data in leads_data["leads_by_channel"]["sms"]:
-        gate_skip = _check_budget_gate(spend_snapshot, lead_data, "sms")
+    async def _send_lead(channel: str, lead_data: dict[str, Any]) -> dict[str, Any]:
+        gate_skip = _check_budget_gate(spend_snapshot, lead_data, channel)
         if gate_skip is not None:
             logger.info(
-                "outreach_budget_gate refused: lead=%s channel=sms reason=%s",
+                "outreach_budget_gate refused: lead=%s channel=%s reason=%s",
                 lead_data.get("lead_id"),
+                channel,
                 gate_skip["reason"],
             )
-            results["sms"].append(gate_skip)
-            continue
+            return gate_skip
+        # Reserve the spend before the first await: gate + reserve run with no
+        # await between them, so concurrent lanes can never both pass the gate
+        # on the same headroom. Released below unless the send succeeds.
+        _admit_send(spend_snapshot, lead_data, channel)
+        result: dict[str, Any] | None = None
         try:
             # JIT validation
             validation = await jit_validate_outreach_task(
@@ -1655,28 +1604,32 @@ async def hourly_outreach_flow(batch_size: int = 50) -> dict[str, Any]:
                 campaign_id=lead_data["campaign_id"],
                 client_id=lead_data["client_id"],
             )
-
-            # Send SMS
-            result = await send_sms_outreach_task(
+            result = await send_tasks[channel](
                 lead_id=lead_data["lead_id"],
                 campaign_id=lead_data["campaign_id"],
                 resource=lead_data["resource"],
                 permission_mode=validation["permission_mode"],
             )
-            if result.get("success"):
-                _admit_send(spend_snapshot, lead_data, "sms")
-            results["sms"].append(result)
-
         except ValueError as e:
             logger.warning(f"JIT validation failed for lead {lead_data['lead_id']}: {e}")
-            results["sms"].append(
-                {
-                    "lead_id": lead_data["lead_id"],
-                    "channel": "sms",
-                    "success": False,
-                    "error": str(e),
-                }
-            )
+            result = {
+                "lead_id": lead_data["lead_id"],
+                "channel": channel,
+                "success": False,
+                "error": str(e),
+            }
+        finally:
+            if result is None or not result.get("success"):
+                _release_send(spend_snapshot, lead_data, channel)
+        return result
+
+    results, send_throughput = await run_send_batch(
+        leads_by_channel=leads_data["leads_by_channel"],
+        send_one=_send_lead,
+        channels=("email", "linkedin", "sms"),
+        max_concurrent_resources=max_concurrent_resources,
+        pacer=SendPacer() if pace_sends else None,
+    )
 
     # Compile summary
     emails_sent = sum(1 for r in results["email"] if r["success"])
@@ -1758,6 +1711,7 @@ async def hourly_outreach_flow(batch_size: int = 50) -> dict[str, Any]:
         "total_sent": emails_sent + linkedin_sent + sms_sent,
         "skipped_per_domain_cap": skipped_per_domain_cap,
         "skipped_per_customer_cap": skipped_per_customer_cap,
+        "send_throughput": send_throughput,
         "results": results,
         "completed_at": datetime.now(UTC).isoformat(),
     }
@@ -1766,6 +1720,16 @@ async def hourly_outreach_flow(batch_size: int = 50) -> dict[str, Any]:
         f"Hourly outreach flow completed: {emails_sent} emails, "
         f"{linkedin_sent} linkedin, {sms_sent} sms"
     )
+    for channel, stats in send_throughput.items():
+        logger.info(
+            "outreach_send_throughput channel=%s sent=%d resources=%d elapsed=%.1fs "
+            "sends_per_minute=%.2f",
+            channel,
+            stats["sent"],
+            stats["resources"],
+            stats["elapsed_s"],
+            stats["sends_per_minute"],
+        )
 
     return summary
 
@@ -45,6 +45,7 @@ from src.models.conversion_patterns import ConversionPattern
 from src.models.lead import Lead
 from src.prefect_utils.completion_hook import on_completion_hook
 from src.prefect_utils.hooks import on_failure_hook
+from src.utils.scoring_config_cache import invalidate_learned_weights
 
 logger = logging.getLogger(__name__)
 
@@ -249,6 +250,9 @@ async def run_full_detection_task(client_id: str) -> dict[str, Any]:
         for name, detector in detectors:
             try:
                 pattern = await detector.detect(db=db, client_id=client_uuid)
+                if name == "who":
+                    # WHO recommended_weights feed ScorerEngine learned weights
+                    invalidate_learned_weights(client_uuid)
                 results["detectors"][name] = {
                     "success": True,
                     "pattern_id": str(pattern.id),
@@ -305,6 +309,7 @@ async def optimize_weights_backfill_task(client_id: str) -> dict[str, Any]:
                 )
                 await db.execute(stmt)
                 await db.commit()
+                invalidate_learned_weights(client_uuid)
 
                 logger.info(f"Weights optimized for client {client_id}")
 
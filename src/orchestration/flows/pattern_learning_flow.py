@@ -45,6 +45,7 @@ from src.models.conversion_patterns import ConversionPattern, ConversionPatternH
 from src.models.lead import Lead
 from src.prefect_utils.completion_hook import on_completion_hook
 from src.prefect_utils.hooks import on_failure_hook
+from src.utils.scoring_config_cache import invalidate_learned_weights
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +190,8 @@ async def run_who_detector_task(client_id: str) -> dict[str, Any]:
 
         try:
             pattern = await detector.detect(db=db, client_id=client_uuid)
+            # WHO recommended_weights feed ScorerEngine learned weights
+            invalidate_learned_weights(client_uuid)
 
             logger.info(
                 f"WHO pattern detected for client {client_id}: "
@@ -431,6 +434,7 @@ async def optimize_client_weights_task(client_id: str) -> dict[str, Any]:
                 )
                 await db.execute(stmt)
                 await db.commit()
+                invalidate_learned_weights(client_uuid)
 
                 logger.info(
                     f"Weights optimized for client {client_id}: "
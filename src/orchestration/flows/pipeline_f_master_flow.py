@@ -555,6 +555,7 @@ async def pipeline_f_master_flow(
     """
     from src.integrations.bright_data_client import BrightDataClient
     from src.integrations.dfs_labs_client import DFSLabsClient
+    from src.integrations.dfs_response_cache import get_dfs_response_cache
     from src.integrations.leadmagic import LeadmagicClient
     from src.intelligence.gemini_client import GeminiClient
     from src.pipeline.pipeline_orchestrator import PipelineOrchestrator, ProspectCard
@@ -601,6 +602,7 @@ async def pipeline_f_master_flow(
     dfs = DFSLabsClient(
         login=env.get("DATAFORSEO_LOGIN", ""),
         password=env.get("DATAFORSEO_PASSWORD", ""),
+        response_cache=get_dfs_response_cache(),
     )
     gemini = GeminiClient(api_key=env.get("GEMINI_API_KEY"))
     bd = BrightDataClient(api_key=env.get("BRIGHTDATA_API_KEY", ""))
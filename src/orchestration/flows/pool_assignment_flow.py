@@ -212,11 +212,13 @@ async def score_pool_leads_task(
         scorer = get_scorer_engine()
         pool_uuids = [UUID(pid) for pid in lead_pool_ids]
 
+        # Columnar mode: set-based loads + one bulk UPDATE instead of ~6 queries per lead
         result = await scorer.score_pool_batch(
             db=db,
             lead_pool_ids=pool_uuids,
             target_industries=target_industries,
             competitor_domains=competitor_domains,
+            columnar=True,
         )
 
         if result.success:
@@ -636,26 +638,33 @@ async def jit_validate_outreach_batch_flow(
     valid_leads = []
     blocked_leads = []
 
-    for lead_pool_id in lead_pool_ids:
-        result = await jit_validate_for_outreach_task(
-            lead_pool_id=lead_pool_id,
+    # Set-based gating: a constant number of queries for the whole batch
+    async with get_db_session() as db:
+        validator = JITValidator(db)
+        results = await validator.batch_validate(
+            [{"lead_pool_id": lead_pool_id} for lead_pool_id in lead_pool_ids],
             client_id=client_id,
             channel=channel,
         )
 
-        if result["is_valid"]:
+    for lead_pool_id, result in results.items():
+        if result.is_valid:
             valid_leads.append(
                 {
-                    "lead_pool_id": result["lead_pool_id"],
-                    "assignment_id": result["assignment_id"],
+                    "lead_pool_id": lead_pool_id,
+                    "assignment_id": str(result.assignment_id) if result.assignment_id else None,
                 }
             )
         else:
+            logger.warning(
+                f"JIT validation failed for lead {lead_pool_id}: "
+                f"{result.block_reason} ({result.block_code})"
+            )
             blocked_leads.append(
                 {
-                    "lead_pool_id": result["lead_pool_id"],
-                    "block_reason": result["block_reason"],
-                    "block_code": result["block_code"],
+                    "lead_pool_id": lead_pool_id,
+                    "block_reason": result.block_reason,
+                    "block_code": result.block_code,
                 }
             )
 
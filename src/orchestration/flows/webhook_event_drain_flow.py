@@ -0,0 +1,97 @@
+"""
+FILE: src/orchestration/flows/webhook_event_drain_flow.py
+PURPOSE: Drain the email engagement webhook queue in batches
+PHASE: 24C (Email Engagement)
+DEPENDENCIES:
+  - src/integrations/supabase.py
+  - src/services/webhook_event_queue.py
+  - src/engines/closer.py
+  - src/models/lead.py
+RULES APPLIED:
+  - Rule 11: Session passed as argument
+  - Rule 14: Soft deletes only
+  - Rule 20: Webhook-first architecture (webhooks enqueue, this flow processes)
+
+Only has work when WEBHOOK_INGEST_MODE=queue. Each batch is claimed with
+FOR UPDATE SKIP LOCKED, so several deployments can drain concurrently.
+"""
+
+import logging
+from typing import Any
+
+from prefect import flow
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.engines.closer import get_closer_engine
+from src.integrations.supabase import get_db_session
+from src.models.base import ChannelType
+from src.models.lead import Lead
+from src.prefect_utils.completion_hook import on_completion_hook
+from src.prefect_utils.hooks import on_failure_hook
+from src.services.webhook_event_queue import (
+    DEFAULT_BATCH_SIZE,
+    drain_webhook_events,
+    reply_message,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def forward_reply(db: AsyncSession, provider: str, parsed: dict[str, Any]) -> None:
+    """Forward a queued reply event to the closer engine (same as the inline route)."""
+    lead_email = (parsed.get("lead_email") or "").lower()
+    result = await db.execute(
+        select(Lead).where(and_(Lead.email == lead_email, Lead.deleted_at.is_(None)))
+    )
+    lead = result.scalar_one_or_none()
+    if not lead:
+        return
+    metadata = parsed.get("raw") or {}
+    if provider == "resend":
+        metadata = {**metadata, "provider": "resend"}
+    await get_closer_engine().process_reply(
+        db=db,
+        lead_id=lead.id,
+        message=reply_message(provider, parsed.get("raw")),
+        channel=ChannelType.EMAIL,
+        provider_message_id=parsed["provider_message_id"],
+        metadata=metadata,
+    )
+
+
+@flow(
+    name="webhook_event_drain",
+    description="Process queued email engagement webhooks in batches",
+    on_completion=[on_completion_hook],
+    on_failure=[on_failure_hook],
+)
+async def webhook_event_drain_flow(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: int = 20,
+) -> dict[str, Any]:
+    """
+    Drain queued webhook events until the queue is empty or max_batches is hit.
+
+    Args:
+        batch_size: Rows claimed per batch
+        max_batches: Upper bound on batches per run
+
+    Returns:
+        Totals across batches
+    """
+    totals: dict[str, int] = {}
+    batches = 0
+    for _ in range(max_batches):
+        async with get_db_session() as db:
+            stats = await drain_webhook_events(db, forward_reply, batch_size=batch_size)
+        if not stats["claimed"]:
+            break
+        batches += 1
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+        logger.info("webhook_event_drain batch %d: %s", batches, stats)
+        if stats["claimed"] < batch_size:
+            break
+
+    return {"batches": batches, **totals}
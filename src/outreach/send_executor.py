@@ -0,0 +1,139 @@
+"""
+Contract: src/outreach/send_executor.py
+Purpose: Run one outreach batch concurrently across sending resources
+         (mailbox, LinkedIn seat, phone number) instead of one lead at a time.
+Layer:   services
+Imports: stdlib + src.outreach.safety (SendPacer, Channel)
+Consumers: src/orchestration/flows/outreach_flow.py (hourly_outreach_flow)
+
+The batch is partitioned by (channel, resource). Partitions run concurrently,
+bounded by ``max_concurrent_resources``; inside a partition sends are strictly
+serial and in batch order. That keeps the per-resource invariants the safety
+modules rely on — one in-flight send per mailbox (MailboxRotator's lock), one
+counter update at a time per account (RateLimiter), and an inter-send gap per
+account (SendPacer) — while hourly throughput scales with the number of
+resources instead of the sum of provider latencies.
+
+Admission (budget gate, JIT validation) stays in the caller's ``send_one``.
+The executor never raises for a single lead: an exception becomes a failed
+result row, so one bad send cannot strand the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from src.outreach.safety.send_pacer import SendPacer
+from src.outreach.safety.timing_engine import Channel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_RESOURCES = 10
+
+SendOne = Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+def partition_by_resource(
+    leads_by_channel: dict[str, list[dict[str, Any]]],
+    channels: Sequence[str],
+) -> dict[tuple[str, str | None], list[tuple[int, dict[str, Any]]]]:
+    """Group leads by (channel, resource), keeping each lead's batch index.
+
+    Leads with no resource assigned share one partition per channel.
+    """
+    partitions: dict[tuple[str, str | None], list[tuple[int, dict[str, Any]]]] = {}
+    for channel in channels:
+        for index, lead_data in enumerate(leads_by_channel.get(channel, [])):
+            resource = lead_data.get("resource")
+            key = (channel, str(resource) if resource is not None else None)
+            partitions.setdefault(key, []).append((index, lead_data))
+    return partitions
+
+
+async def run_send_batch(
+    leads_by_channel: dict[str, list[dict[str, Any]]],
+    send_one: SendOne,
+    channels: Sequence[str] = ("email", "linkedin", "sms"),
+    max_concurrent_resources: int = DEFAULT_MAX_CONCURRENT_RESOURCES,
+    pacer: SendPacer | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, dict[str, Any]]]:
+    """Send a batch with one serial lane per resource.
+
+    Args:
+        leads_by_channel: Channel -> lead dicts (each with an optional "resource").
+        send_one: Async callable(channel, lead_data) -> result dict with "success".
+        channels: Channels to send, in reporting order.
+        max_concurrent_resources: Sends in flight across all lanes.
+        pacer: Optional SendPacer; when set, each lane sleeps the pacer's delay
+            between its sends (outside the concurrency slot).
+
+    Returns:
+        (results, throughput): results per channel in batch order, and per
+        channel {"attempted", "sent", "resources", "elapsed_s", "sends_per_minute"}.
+    """
+    results: dict[str, list[dict[str, Any] | None]] = {
+        channel: [None] * len(leads_by_channel.get(channel, [])) for channel in channels
+    }
+    partitions = partition_by_resource(leads_by_channel, channels)
+    slots = asyncio.Semaphore(max(1, max_concurrent_resources))
+    window: dict[str, list[float]] = {}  # channel -> [first start, last finish]
+
+    async def _send(channel: str, lead_data: dict[str, Any]) -> dict[str, Any]:
+        async with slots:
+            started = time.monotonic()
+            try:
+                return await send_one(channel, lead_data)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "send_executor: lead=%s channel=%s failed: %s",
+                    lead_data.get("lead_id"),
+                    channel,
+                    exc,
+                )
+                return {
+                    "lead_id": lead_data.get("lead_id"),
+                    "channel": channel,
+                    "success": False,
+                    "error": str(exc),
+                }
+            finally:
+                span = window.setdefault(channel, [started, started])
+                span[0] = min(span[0], started)
+                span[1] = max(span[1], time.monotonic())
+
+    async def _lane(
+        channel: str, resource: str | None, items: list[tuple[int, dict[str, Any]]]
+    ) -> None:
+        account = resource or "*"
+        for position, (index, lead_data) in enumerate(items):
+            if pacer is not None and position:
+                delay = pacer.compute_delay(Channel(channel), account)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            result = await _send(channel, lead_data)
+            if pacer is not None and result.get("success"):
+                pacer.record_send(Channel(channel), account)
+            results[channel][index] = result
+
+    await asyncio.gather(
+        *(_lane(channel, resource, items) for (channel, resource), items in partitions.items())
+    )
+
+    throughput: dict[str, dict[str, Any]] = {}
+    for channel in channels:
+        channel_results = results[channel]
+        sent = sum(1 for r in channel_results if r and r.get("success"))
+        start, end = window.get(channel, (0.0, 0.0))
+        elapsed = end - start
+        throughput[channel] = {
+            "attempted": len(channel_results),
+            "sent": sent,
+            "resources": sum(1 for ch, _ in partitions if ch == channel),
+            "elapsed_s": round(elapsed, 3),
+            "sends_per_minute": round(sent * 60 / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+    return {channel: list(rows) for channel, rows in results.items()}, throughput  # type: ignore[misc]
@@ -0,0 +1,179 @@
+"""abn_name_matcher.py — ranked, index-served name matching against abn_registry.
+
+FreeEnrichment's local ABN strategies look up registry entities whose legal or
+trading name contains every keyword. Each keyword becomes
+``lower(name) LIKE '%kw%'``, which the trigram GIN expression index
+``abn_registry_trgm_gin`` (migration 20261016_abn_registry_trgm_gin.sql)
+serves as a BitmapAnd of index scans instead of a sequential scan over the
+registry. Matching rows come back ordered by pg_trgm ``similarity()`` against
+the joined keywords and are then re-ranked in Python on the same difflib ratio
+FreeEnrichment._abn_confidence buckets, so the first candidate is the one with
+the best confidence tier (state match breaks ties within a tier).
+
+``match_many`` runs a whole enrichment batch as one UNION ALL round trip per
+chunk of queries.
+"""
+
+from __future__ import annotations
+
+import difflib
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+# Candidates fetched per query, and queries per UNION ALL statement.
+CANDIDATE_LIMIT = 10
+BATCH_QUERIES = 50
+# Keywords ANDed per query — more over-constrains the match.
+MAX_KEYWORDS = 4
+
+# difflib ratio thresholds for ABNMatchConfidence.EXACT / PARTIAL.
+EXACT_RATIO = 0.90
+PARTIAL_RATIO = 0.60
+
+_RE_ENTITY_SUFFIXES = re.compile(
+    r"\s*(PTY\.?\s*LTD\.?|PROPRIETARY\s+LIMITED|PTY\s+LIMITED|LIMITED"
+    r"|LTD\.?|TRUST|TRADING\s+AS|T/A|ABN)\s*$",
+    re.IGNORECASE,
+)
+_RE_ENTITY_PREFIXES = re.compile(
+    r"^(THE\s+TRUSTEE\s+FOR\s+THE\s+|THE\s+TRUSTEE\s+FOR\s+"
+    r"|THE\s+TRUST\s+OF\s+|TRUSTEE\s+FOR\s+THE\s+|TRUSTEE\s+FOR\s+)",
+    re.IGNORECASE,
+)
+
+_COLUMNS = "abn, legal_name, trading_name, gst_registered, entity_type, registration_date, state"
+
+
+def clean_registry_name(name: str) -> str:
+    """Strip ABN registry entity prefixes/suffixes ("THE TRUSTEE FOR", "PTY LTD")."""
+    name = _RE_ENTITY_PREFIXES.sub("", name).strip()
+    return _RE_ENTITY_SUFFIXES.sub("", name).strip()
+
+
+def name_ratio(search_name: str, entity_name: str) -> float:
+    """Case-insensitive difflib ratio — the score ABN confidence is bucketed on."""
+    return difflib.SequenceMatcher(None, search_name.lower(), entity_name.lower()).ratio()
+
+
+def _tier(ratio: float) -> int:
+    if ratio >= EXACT_RATIO:
+        return 2
+    if ratio >= PARTIAL_RATIO:
+        return 1
+    return 0
+
+
+@dataclass(frozen=True)
+class ABNQuery:
+    """One keyword-intersection lookup."""
+
+    keywords: tuple[str, ...]
+    state_hint: str | None = None
+
+    @classmethod
+    def of(cls, keywords: Sequence[str], state_hint: str | None = None) -> ABNQuery:
+        return cls(tuple(k.lower() for k in keywords[:MAX_KEYWORDS]), state_hint)
+
+    @property
+    def search_name(self) -> str:
+        return " ".join(self.keywords)
+
+
+@dataclass(frozen=True)
+class ABNCandidate:
+    """A registry row plus its match scores.
+
+    ``similarity`` is the pg_trgm score used to order rows in SQL; ``ratio`` is
+    name_ratio(query, cleaned trading-or-legal name), i.e. what
+    FreeEnrichment._abn_confidence would bucket for this row.
+    """
+
+    row: Any
+    similarity: float
+    ratio: float
+    state_match: bool
+
+    @property
+    def rank_key(self) -> tuple[int, bool, float, float]:
+        return (_tier(self.ratio), self.state_match, self.ratio, self.similarity)
+
+
+def _query_sql(query: ABNQuery, params: list[Any], query_idx: int | None = None) -> str:
+    """SELECT for one query, appending its bind values to ``params``."""
+    params.append(query.search_name)
+    name_param = len(params)
+    conditions = []
+    for kw in query.keywords:
+        params.append(f"%{kw}%")
+        idx = len(params)
+        conditions.append(f"(lower(legal_name) LIKE ${idx} OR lower(trading_name) LIKE ${idx})")
+    idx_column = f"{query_idx} AS query_idx, " if query_idx is not None else ""
+    return (
+        f"SELECT {idx_column}{_COLUMNS}, "
+        f"GREATEST(COALESCE(similarity(lower(trading_name), ${name_param}), 0.0), "
+        f"COALESCE(similarity(lower(legal_name), ${name_param}), 0.0)) AS name_similarity "
+        f"FROM abn_registry WHERE {' AND '.join(conditions)} "
+        f"ORDER BY name_similarity DESC LIMIT {CANDIDATE_LIMIT}"
+    )
+
+
+def rank_candidates(query: ABNQuery, rows: Sequence[Any]) -> list[ABNCandidate]:
+    """Score registry rows for ``query``, best first."""
+    hint = (query.state_hint or "").upper()
+    candidates = []
+    for row in rows:
+        entity_name = row.get("trading_name") or row.get("legal_name") or ""
+        candidates.append(
+            ABNCandidate(
+                row=row,
+                similarity=float(row.get("name_similarity") or 0.0),
+                ratio=name_ratio(query.search_name, clean_registry_name(entity_name)),
+                state_match=bool(hint) and (row.get("state") or "").upper() == hint,
+            )
+        )
+    candidates.sort(key=lambda c: c.rank_key, reverse=True)
+    return candidates
+
+
+class ABNNameMatcher:
+    """Keyword-intersection matcher over abn_registry.
+
+    ``acquire`` returns an async context manager yielding an asyncpg connection
+    (FreeEnrichment._acquire, or ``pool.acquire``).
+    """
+
+    def __init__(self, acquire: Callable[[], Any]) -> None:
+        self._acquire = acquire
+
+    async def match(self, query: ABNQuery) -> list[ABNCandidate]:
+        """Ranked candidates for one query ([] when no keywords or no rows)."""
+        if not query.keywords:
+            return []
+        params: list[Any] = []
+        sql = _query_sql(query, params)
+        async with self._acquire() as conn:
+            rows = await conn.fetch(sql, *params)
+        return rank_candidates(query, rows)
+
+    async def match_many(self, queries: Sequence[ABNQuery]) -> list[list[ABNCandidate]]:
+        """Ranked candidates for every query, aligned with ``queries``.
+
+        Queries are sent BATCH_QUERIES at a time as one UNION ALL statement;
+        each branch is still index-served and capped at CANDIDATE_LIMIT rows.
+        """
+        results: list[list[ABNCandidate]] = [[] for _ in queries]
+        pending = [i for i, q in enumerate(queries) if q.keywords]
+        for start in range(0, len(pending), BATCH_QUERIES):
+            chunk = pending[start : start + BATCH_QUERIES]
+            params: list[Any] = []
+            sql = " UNION ALL ".join(f"({_query_sql(queries[i], params, i)})" for i in chunk)
+            async with self._acquire() as conn:
+                rows = await conn.fetch(sql, *params)
+            by_query: dict[int, list[Any]] = {}
+            for row in rows:
+                by_query.setdefault(row["query_idx"], []).append(row)
+            for i in chunk:
+                results[i] = rank_candidates(queries[i], by_query.get(i, []))
+        return results
@@ -215,7 +215,8 @@ def is_suppressed(email: str, channel: str = CHANNEL_ALL) -> bool:
         True if the address is suppressed, False otherwise.
     """
     key = email.lower()
-    record = _SUPPRESSION.get(key)
+    with _lock:
+        record = _SUPPRESSION.get(key)
     if record is None:
         return False
     stored_channel = record.get("channel", CHANNEL_ALL)
@@ -235,7 +236,8 @@ def get_suppression_list() -> list[dict[str, Any]]:
     Returns:
         List of suppression record dicts.
     """
-    return list(_SUPPRESSION.values())
+    with _lock:
+        return list(_SUPPRESSION.values())
 
 
 def process_bounce(email: str, bounce_type: str) -> dict[str, Any]:
@@ -312,7 +314,9 @@ def generate_compliance_report(start_date: str, end_date: str) -> dict[str, Any]
     by_channel: dict[str, int] = {}
     total = 0
 
-    for record in _SUPPRESSION.values():
+    with _lock:
+        records = list(_SUPPRESSION.values())
+    for record in records:
         suppressed_at = datetime.fromisoformat(record["suppressed_at"])
         if not (start_dt <= suppressed_at <= end_dt):
             continue
@@ -19,7 +19,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-import dns.resolver
+from src.integrations.async_dns import get_dns_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -82,17 +82,13 @@ def generate_patterns(first_name: str, last_name: str, domain: str) -> list[str]
 # ── MX resolution ─────────────────────────────────────────────────────────────
 
 
-def resolve_mx(domain: str, timeout: float = 5.0) -> str | None:
-    """Resolve MX record for domain. Returns highest-priority MX host or None."""
-    resolver = dns.resolver.Resolver()
-    resolver.lifetime = timeout
-    try:
-        answers = resolver.resolve(domain, "MX")
-        # Lowest preference = highest priority
-        best = sorted(answers, key=lambda r: r.preference)[0]
-        return str(best.exchange).rstrip(".")
-    except Exception:
-        return None
+async def resolve_mx(domain: str) -> str | None:
+    """Resolve MX record for domain. Returns highest-priority MX host or None.
+
+    Served from the shared async DNS cache (src.integrations.async_dns).
+    """
+    answer = await get_dns_resolver().resolve(domain, "MX")
+    return answer.records[0] if answer.ok else None
 
 
 # ── SMTP probing ──────────────────────────────────────────────────────────────
@@ -230,7 +226,7 @@ async def discover_email(
 
         loop = asyncio.get_event_loop()
 
-        mx_host = await loop.run_in_executor(None, lambda: resolve_mx(domain))
+        mx_host = await resolve_mx(domain)
         if not mx_host:
             return {
                 "domain": domain,
@@ -278,7 +274,7 @@ async def verify_emails(emails: list[str]) -> list[dict[str, Any]]:
     async def _verify_domain_group(domain: str, email_list: list[str]) -> None:
         async with SMTP_SEM:
             loop = asyncio.get_event_loop()
-            mx_host = await loop.run_in_executor(None, lambda: resolve_mx(domain))
+            mx_host = await resolve_mx(domain)
             if not mx_host:
                 for e in email_list:
                     results.append(
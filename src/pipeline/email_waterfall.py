@@ -447,15 +447,9 @@ def _extract_emails_from_html(html: str, domain: str, dm_name: str) -> EmailResu
 
 async def _check_mx(domain: str) -> bool:
     """Check if domain has MX records (accepts mail). Returns False on error."""
-    try:
-        import dns.resolver
+    from src.integrations.async_dns import get_dns_resolver
 
-        resolver = dns.resolver.Resolver()
-        resolver.lifetime = 5.0
-        resolver.resolve(domain, "MX")
-        return True
-    except Exception:
-        return False
+    return (await get_dns_resolver().resolve(domain, "MX")).ok
 
 
 async def _try_patterns(first: str, last: str, domain: str) -> EmailResult | None:
@@ -2,7 +2,7 @@
 Contract: src/pipeline/free_enrichment.py
 Purpose: Zero-cost enrichment for business_universe — DNS, website scrape, ABN match
 Layer: 4 - orchestration (uses asyncpg connection directly)
-Imports: asyncpg, httpx, dns.resolver, src.integrations (ABN fallback)
+Imports: asyncpg, httpx, src.integrations (async DNS, ABN fallback)
 Consumers: orchestration flows
 Directive: #282
 """
@@ -10,7 +10,6 @@ Directive: #282
 from __future__ import annotations
 
 import asyncio
-import difflib
 import json
 import logging
 import os
@@ -19,30 +18,26 @@ from enum import StrEnum
 from typing import Any
 
 import asyncpg
-import dns.resolver
 import httpx
 
+from src.integrations.async_dns import get_dns_resolver, stats_delta
 from src.integrations.httpx_scraper import HttpxScraper
+from src.pipeline.abn_name_matcher import (
+    EXACT_RATIO,
+    PARTIAL_RATIO,
+    ABNCandidate,
+    ABNNameMatcher,
+    ABNQuery,
+    clean_registry_name,
+    name_ratio,
+)
+from src.pipeline.keyword_automaton import LEXICON_AUTOMATON, automaton_for
+from src.utils.html_features import HTMLFeatures, extract_html_features
 
 SPIDER_API_URL = "https://api.spider.cloud/scrape"
 BATCH_SIZE = 50
-DNS_TIMEOUT = 5
 SPIDER_MAX_CREDITS_PER_PAGE = 50
 
-# ── Ad tag detection regexes ─────────────────────────────────────────────────
-AW_TAG_RE = re.compile(
-    r'gtag\s*\(\s*["\']config["\']\s*,\s*["\']AW-|googleadservices\.com/pagead/conversion',
-    re.IGNORECASE,
-)
-GADS_RMK_RE = re.compile(
-    r"google_remarketing_only|google_conversion_id|googleads\.g\.doubleclick\.net",
-    re.IGNORECASE,
-)
-META_PIXEL_RE = re.compile(
-    r"connect\.facebook\.net|fbq\s*\(|facebook-jssdk",
-    re.IGNORECASE,
-)
-
 # ── ABN multi-strategy matching constants ────────────────────────────────────
 # _ABN_STOPWORDS removed in #328.3b — replaced by DOMAIN_STOPWORDS from au_lexicon
 
@@ -51,79 +46,17 @@ def _semantic_split(text: str, known_terms: frozenset[str]) -> list[str]:
     """Recursively split a compound string on known term boundaries.
 
     Finds the longest known term in the text, splits around it,
-    and recurses on the remaining segments.
+    and recurses on the remaining segments. Runs on a prebuilt Aho-Corasick
+    automaton (see keyword_automaton) — one scan per part, not one per term.
     """
-    if len(text) < 3:
-        return [text] if len(text) >= 3 else []
-
-    # Find all known terms that appear as substrings, longest first
-    matches = []
-    for term in sorted(known_terms, key=len, reverse=True):
-        idx = text.find(term)
-        if idx >= 0:
-            matches.append((idx, term))
-
-    if not matches:
-        return [text]
-
-    # Use the longest match (sorted by term length descending, take first)
-    idx, term = matches[0]
-
-    before = text[:idx]
-    after = text[idx + len(term) :]
-
-    result = []
-    if before and len(before) >= 3:
-        result.extend(_semantic_split(before, known_terms))
-    # Drop fragments shorter than 3 chars silently
-
-    result.append(term)
-
-    if after and len(after) >= 3:
-        result.extend(_semantic_split(after, known_terms))
-    # Drop short trailing fragments silently
-
-    return result
+    return automaton_for(known_terms).segment(text)
 
 
-_RE_ABN_ENTITY_SUFFIXES = re.compile(
-    r"\s*(PTY\.?\s*LTD\.?|PROPRIETARY\s+LIMITED|PTY\s+LIMITED|LIMITED"
-    r"|LTD\.?|TRUST|TRADING\s+AS|T/A|ABN)\s*$",
-    re.IGNORECASE,
-)
-_RE_ABN_ENTITY_PREFIXES = re.compile(
-    r"^(THE\s+TRUSTEE\s+FOR\s+THE\s+|THE\s+TRUSTEE\s+FOR\s+"
-    r"|THE\s+TRUST\s+OF\s+|TRUSTEE\s+FOR\s+THE\s+|TRUSTEE\s+FOR\s+)",
-    re.IGNORECASE,
-)
 _RE_ABN_TITLE_CLEANUP = re.compile(
     r"^\s*(Home\s*[\|\u2013\-]|Welcome\s+to|About\s*[\|\u2013\-]|Contact)\s*",
     re.IGNORECASE,
 )
 
-CMS_PATTERNS = {
-    "wp-content/": "wordpress",
-    "wp-includes/": "wordpress",
-    "/cdn.shopify.com": "shopify",
-    "squarespace.com/universal": "squarespace",
-    "wix.com": "wix",
-    "webflow.com": "webflow",
-    ".ghost.io": "ghost",
-    "drupal.org": "drupal",
-}
-
-TECH_PATTERNS = {
-    "jquery": "jquery",
-    "react": "react",
-    "/vue": "vue",
-    "angular": "angular",
-    "next": "nextjs",
-    "nuxt": "nuxtjs",
-    "gatsby": "gatsby",
-    "bootstrap": "bootstrap",
-    "tailwind": "tailwind",
-}
-
 MX_PROVIDER_MAP = {
     "google": "google",
     "gmail": "google",
@@ -134,16 +67,6 @@ MX_PROVIDER_MAP = {
     "proofpoint": "proofpoint",
 }
 
-TRACKER_CHECKS: list[tuple[list[str], str]] = [
-    (["gtag(", "g-", "ga-", "ua-"], "google_analytics"),
-    (["gtm-"], "google_tag_manager"),
-    (["fbq(", "facebook.net"], "facebook_pixel"),
-    (["_linkedin_partner_id"], "linkedin_insight"),
-    (["hs-script", "js.hubspot.com"], "hubspot"),
-    (["hotjar"], "hotjar"),
-    (["clarity.ms"], "clarity"),
-]
-
 DKIM_SELECTORS = ["google._domainkey", "selector1._domainkey", "default._domainkey"]
 
 TEAM_SLUGS = ["/about", "/team", "/our-team", "/people", "/staff"]
@@ -184,6 +107,9 @@ class FreeEnrichment:
     Writes results back to business_universe and stamps free_enrichment_completed_at.
     """
 
+    # Strategy-1 ABN candidates for the run() batch in flight, keyed by query.
+    _abn_prefetch: dict[ABNQuery, list[ABNCandidate]] | None = None
+
     def __init__(self, conn: asyncpg.Connection | asyncpg.Pool) -> None:
         # Accept either a single Connection (legacy) or a Pool (preferred).
         # Pool supports concurrent ABN queries; Connection serialises them.
@@ -213,24 +139,14 @@ class FreeEnrichment:
         Free signal: no extra API calls, uses already-scraped content.
         Returns: has_google_ads_tag, has_meta_pixel, has_any_ad_tag
         """
-        if not html:
-            return {"has_google_ads_tag": False, "has_meta_pixel": False, "has_any_ad_tag": False}
-        aw = bool(AW_TAG_RE.search(html))
-        rmk = bool(GADS_RMK_RE.search(html))
-        meta = bool(META_PIXEL_RE.search(html))
-        gads = aw or rmk
-        return {
-            "has_google_ads_tag": gads,
-            "has_meta_pixel": meta,
-            "has_any_ad_tag": gads or meta,
-        }
+        return extract_html_features(html).ad_tags()
 
     def _abn_confidence(self, search_name: str, api_name: str) -> ABNMatchConfidence:
         """Compute name similarity between search term and ABN registry name."""
-        ratio = difflib.SequenceMatcher(None, search_name.lower(), api_name.lower()).ratio()
-        if ratio >= 0.90:
+        ratio = name_ratio(search_name, api_name)
+        if ratio >= EXACT_RATIO:
             return ABNMatchConfidence.EXACT
-        if ratio >= 0.60:
+        if ratio >= PARTIAL_RATIO:
             return ABNMatchConfidence.PARTIAL
         return ABNMatchConfidence.LOW
 
@@ -242,16 +158,14 @@ class FreeEnrichment:
             "DENTISTS@PYMBLE PTY LIMITED" → "DENTISTS@PYMBLE"
             "THE TRUSTEE FOR ABC TRUST" → "ABC TRUST"
         """
-        name = _RE_ABN_ENTITY_PREFIXES.sub("", name).strip()
-        name = _RE_ABN_ENTITY_SUFFIXES.sub("", name).strip()
-        return name
+        return clean_registry_name(name)
 
     @staticmethod
     def _extract_domain_keywords(domain: str) -> list[str]:
         """Extract meaningful keywords from a domain name using semantic word-boundary detection.
 
-        Uses BUSINESS_TERMS and AU_SUBURBS from src.config.au_lexicon to find
-        word boundaries in compound domain names.
+        Uses BUSINESS_TERMS and AU_SUBURBS from src.config.au_lexicon (via the
+        prebuilt LEXICON_AUTOMATON) to find word boundaries in compound domain names.
 
         Examples:
             "theavenuedental.com.au" → ["avenue", "dental"]
@@ -261,7 +175,7 @@ class FreeEnrichment:
             "dentistsatpymble.com.au" → ["dentists", "pymble"]
             "happy-dentistry.com.au" → ["happy", "dentistry"]
         """
-        from src.config.au_lexicon import AU_SUBURBS, BUSINESS_TERMS, DOMAIN_STOPWORDS
+        from src.config.au_lexicon import DOMAIN_STOPWORDS
 
         # Step 1: Strip protocol, www, TLD
         d = domain.lower().strip()
@@ -296,7 +210,6 @@ class FreeEnrichment:
 
         # Step 3: For each part, apply semantic splitting
         all_words: list[str] = []
-        known_terms = BUSINESS_TERMS | AU_SUBURBS
 
         for part in parts:
             if len(part) <= 3:
@@ -304,7 +217,7 @@ class FreeEnrichment:
                     all_words.append(part)
                 continue
 
-            found_splits = _semantic_split(part, known_terms)
+            found_splits = LEXICON_AUTOMATON.segment(part)
             if found_splits and len(found_splits) > 1:
                 all_words.extend(found_splits)
             else:
@@ -333,29 +246,29 @@ class FreeEnrichment:
 
         Uses AND-intersection so that e.g. ["dentists", "pymble"] only matches
         entities that contain BOTH words — avoiding broad false positives.
+        Candidates are ranked by ABNNameMatcher (confidence tier, then state
+        match); results prefetched for the current run() batch are reused.
         """
         if not keywords:
             return None
-        conditions: list[str] = []
-        params: list[str] = []
-        for kw in keywords[:4]:  # cap at 4 to avoid over-constraining
-            idx = len(params) + 1
-            conditions.append(f"(LOWER(legal_name) LIKE ${idx} OR LOWER(trading_name) LIKE ${idx})")
-            params.append(f"%{kw}%")
-        sql = (
-            "SELECT abn, legal_name, trading_name, gst_registered, "
-            "entity_type, registration_date, state "
-            f"FROM abn_registry WHERE {' AND '.join(conditions)} LIMIT 10"
-        )
-        async with self._acquire() as conn:
-            rows = await conn.fetch(sql, *params)
-        if not rows:
-            return None
-        if state_hint and len(rows) > 1:
-            for r in rows:
-                if (r.get("state") or "").upper() == state_hint.upper():
-                    return r
-        return rows[0]
+        query = ABNQuery.of(keywords, state_hint)
+        candidates = (self._abn_prefetch or {}).get(query)
+        if candidates is None:
+            candidates = await ABNNameMatcher(self._acquire).match(query)
+        return candidates[0].row if candidates else None
+
+    async def _prefetch_abn_matches(self, rows: list[asyncpg.Record]) -> None:
+        """Batch the domain-keyword ABN lookup (strategy 1) for a run() batch."""
+        queries = {
+            ABNQuery.of(self._extract_domain_keywords(r["domain"]), r.get("state")) for r in rows
+        }
+        queries = [q for q in queries if q.keywords]
+        try:
+            matches = await ABNNameMatcher(self._acquire).match_many(queries)
+        except Exception as exc:
+            self._logger.debug("ABN batch prefetch failed, matching per domain: %s", exc)
+            return
+        self._abn_prefetch = dict(zip(queries, matches, strict=True))
 
     async def _local_abn_gst(self, abn_raw: str) -> tuple[bool | None, str | None, Any]:
         """Return (gst_registered, entity_type, registration_date) for a given ABN from local table."""
@@ -405,37 +318,7 @@ class FreeEnrichment:
 
     def _extract_jsonld_address(self, html: str) -> dict[str, str | None] | None:
         """Extract structured address from JSON-LD schema.org blocks in HTML."""
-        blocks = re.findall(
-            r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-            html,
-            re.IGNORECASE | re.DOTALL,
-        )
-        for block in blocks:
-            try:
-                data = json.loads(block)
-            except (json.JSONDecodeError, ValueError):
-                continue
-            # Normalise to a list of items
-            if isinstance(data, dict) and "@graph" in data:
-                items = data["@graph"]
-            elif isinstance(data, list):
-                items = data
-            else:
-                items = [data]
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                address = item.get("address")
-                if not address:
-                    continue
-                if isinstance(address, dict):
-                    return {
-                        "street": address.get("streetAddress"),
-                        "suburb": address.get("addressLocality"),
-                        "state": address.get("addressRegion"),
-                        "postcode": address.get("postalCode"),
-                    }
-        return None
+        return extract_html_features(html).jsonld_address
 
     def _is_au_domain(self, domain: str, html: str) -> bool:
         """Return True if domain is likely Australian."""
@@ -481,14 +364,22 @@ class FreeEnrichment:
             "abn_unmatched": 0,
             "errors": [],
         }
+        dns_before = get_dns_resolver().stats()
         for i in range(0, len(rows), BATCH_SIZE):
             batch = rows[i : i + BATCH_SIZE]
-            await asyncio.gather(*[self._process_domain(row, stats) for row in batch])
+            await self._prefetch_abn_matches(batch)
+            try:
+                await asyncio.gather(*[self._process_domain(row, stats) for row in batch])
+            finally:
+                self._abn_prefetch = None
             self._logger.info(
                 "FreeEnrichment: processed %d/%d",
                 min(i + BATCH_SIZE, len(rows)),
                 len(rows),
             )
+        # Lookups served from the shared DNS cache this run (lookups avoided)
+        # and the network time they would have cost (latency saved).
+        stats["dns"] = stats_delta(dns_before, get_dns_resolver().stats())
         return stats
 
     async def enrich(self, domain: str) -> dict | None:
@@ -498,11 +389,11 @@ class FreeEnrichment:
         Used by PipelineOrchestrator.run().
         """
         try:
-            domain_alive = self._dns_precheck(domain)
+            domain_alive = await self._dns_precheck(domain)
             website_data: dict = {}
             if domain_alive:
                 website_data = await self._scrape_website(domain) or {}
-            dns_data = self._enrich_dns(domain)
+            dns_data = await self._enrich_dns(domain)
             abn_data = await self._match_abn(
                 domain,
                 website_data.get("title"),
@@ -542,7 +433,7 @@ class FreeEnrichment:
         sem_abn explicitly.
         """
         try:
-            dns_data = self._enrich_dns(domain)
+            dns_data = await self._enrich_dns(domain)
             title = spider_data.get("title", "")
             suburb = (spider_data.get("website_address") or {}).get("suburb")
             abn_data = await self._match_abn(
@@ -575,7 +466,7 @@ class FreeEnrichment:
         bu_id = row["id"]
         state_hint = row.get("state")
         try:
-            domain_alive = self._dns_precheck(domain)
+            domain_alive = await self._dns_precheck(domain)
             website_data: dict[str, Any] = {}
             if domain_alive:
                 website_data = await self._scrape_website(domain)
@@ -584,7 +475,7 @@ class FreeEnrichment:
                 # Instrumentation: mark the dead-DNS skip path so the gap is visible.
                 # Not a hard drop — _write_results still runs below with empty website_data.
                 await self._write_filter_reason(bu_id, "permanent_dns_unreachable")
-            dns_data = self._enrich_dns(domain)
+            dns_data = await self._enrich_dns(domain)
             suburb = (website_data.get("website_address") or {}).get("suburb")
             abn_data = await self._match_abn(
                 domain, website_data.get("title"), state_hint, suburb=suburb
@@ -620,36 +511,32 @@ class FreeEnrichment:
                 reason,
             )
 
-    def _dns_precheck(self, domain: str) -> bool:
-        resolver = dns.resolver.Resolver()
-        resolver.lifetime = float(DNS_TIMEOUT)
-        for rdtype in ("A", "AAAA"):
-            try:
-                resolver.resolve(domain, rdtype)
-                return True
-            except dns.resolver.NXDOMAIN:
-                return False
-            except Exception:
-                continue
-        return False
+    async def _dns_precheck(self, domain: str) -> bool:
+        return await get_dns_resolver().has_address(domain)
+
+    def _website_fields(self, features: HTMLFeatures, content: str, links: list) -> dict[str, Any]:
+        """Scrape result fields derived from one single-pass feature extraction."""
+        return {
+            "website_cms": features.cms,
+            "website_tech_stack": features.tech_stack,
+            "website_tracking_codes": features.trackers,
+            "website_team_names": self._extract_team_urls(links),
+            "website_contact_emails": features.contact_emails(links),
+            "website_address": features.jsonld_address,
+            "_raw_html": content,
+            **features.ad_tags(),
+        }
 
     async def _scrape_website(self, domain: str) -> dict[str, Any]:
         # ── Try httpx first (fast, free) ──────────────────────────────────────
         httpx_result = await self._httpx.scrape(domain)
         if httpx_result is not None and len(httpx_result["html"]) >= 1000:
             content = httpx_result["html"]
-            website_address = self._extract_jsonld_address(content)
+            features = httpx_result.get("features") or extract_html_features(content)
             return {
                 "title": httpx_result["title"] or "",
-                "website_cms": self._extract_cms(content),
-                "website_tech_stack": self._extract_tech_stack(content),
-                "website_tracking_codes": self._extract_trackers(content),
-                "website_team_names": self._extract_team_urls([]),
-                "website_contact_emails": self._extract_emails(content, []),
-                "website_address": website_address,
-                "_raw_html": content,
+                **self._website_fields(features, content, []),
                 "scraper_used": "httpx",
-                **self._detect_ad_tags(content),
             }
 
         # ── Fall back to Spider ────────────────────────────────────────────────
@@ -682,72 +569,26 @@ class FreeEnrichment:
             metadata: dict = item.get("metadata") or {}
             if not content:
                 return {}
-            # JSON-LD address extraction (falls back to None — regex not used here)
-            website_address = self._extract_jsonld_address(content)
             return {
                 "title": metadata.get("title", ""),
-                "website_cms": self._extract_cms(content),
-                "website_tech_stack": self._extract_tech_stack(content),
-                "website_tracking_codes": self._extract_trackers(content),
-                "website_team_names": self._extract_team_urls(links),
-                "website_contact_emails": self._extract_emails(content, links),
-                "website_address": website_address,
-                "_raw_html": content,
+                **self._website_fields(extract_html_features(content), content, links),
                 "scraper_used": "spider",
-                **self._detect_ad_tags(content),
             }
         except Exception as exc:
             self._logger.warning("Spider error for %s: %s", domain, exc)
             return {}
 
+    # The per-signal extractors below are kept for callers and tests that need
+    # a single signal; _scrape_website reads all of them from one pass.
+
     def _extract_cms(self, html: str) -> str | None:
-        gen = re.search(
-            r'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)',
-            html,
-            re.IGNORECASE,
-        )
-        if not gen:
-            gen = re.search(
-                r'content=["\']([^"\']*(?:wordpress|shopify|squarespace|wix|webflow|ghost|drupal)[^"\']*)["\']',
-                html,
-                re.IGNORECASE,
-            )
-        if gen:
-            val = gen.group(1).lower()
-            for kw, cms in [
-                ("wordpress", "wordpress"),
-                ("shopify", "shopify"),
-                ("squarespace", "squarespace"),
-                ("wix", "wix"),
-                ("webflow", "webflow"),
-                ("ghost", "ghost"),
-                ("drupal", "drupal"),
-            ]:
-                if kw in val:
-                    return cms
-        for pattern, cms in CMS_PATTERNS.items():
-            if pattern in html:
-                return cms
-        return None
+        return extract_html_features(html).cms
 
     def _extract_tech_stack(self, html: str) -> list[str]:
-        srcs = re.findall(r'<script[^>]+src=["\']([^"\']+)["\']', html, re.IGNORECASE)
-        src_text = " ".join(srcs).lower()
-        inline = html.lower()
-        techs: list[str] = []
-        for pattern, tech in TECH_PATTERNS.items():
-            if pattern in src_text or pattern in inline:
-                if tech not in techs:
-                    techs.append(tech)
-        return techs
+        return extract_html_features(html).tech_stack
 
     def _extract_trackers(self, html: str) -> list[str]:
-        lower = html.lower()
-        trackers: list[str] = []
-        for patterns, name in TRACKER_CHECKS:
-            if any(p in lower for p in patterns):
-                trackers.append(name)
-        return trackers
+        return extract_html_features(html).trackers
 
     def _extract_team_urls(self, links: list) -> list[str]:
         found: list[str] = []
@@ -758,61 +599,38 @@ class FreeEnrichment:
         return found
 
     def _extract_emails(self, html: str, links: list) -> list[str]:
-        emails: set[str] = set()
-        for link in links:
-            if isinstance(link, str) and link.lower().startswith("mailto:"):
-                email = link[7:].strip().lower()
-                if email:
-                    emails.add(email)
-        for match in re.findall(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", html):
-            emails.add(match.lower())
-        result = sorted(emails)
-        generics = {"noreply", "info"}
-        specific = [e for e in result if not any(e.startswith(g + "@") for g in generics)]
-        return specific if specific else result
-
-    def _enrich_dns(self, domain: str) -> dict[str, Any]:
+        return extract_html_features(html).contact_emails(links)
+
+    async def _enrich_dns(self, domain: str) -> dict[str, Any]:
         result: dict[str, Any] = {
             "dns_mx_provider": None,
             "dns_has_spf": False,
             "dns_has_dkim": False,
         }
-        resolver = dns.resolver.Resolver()
-        resolver.lifetime = float(DNS_TIMEOUT)
+        # MX, SPF TXT and every DKIM selector resolve concurrently via the
+        # shared cache instead of one blocking lookup after another.
+        mx, txt, *dkim = await get_dns_resolver().resolve_many(
+            [(domain, "MX"), (domain, "TXT")]
+            + [(f"{selector}.{domain}", "TXT") for selector in DKIM_SELECTORS]
+        )
 
         # MX
-        try:
-            mx_answers = resolver.resolve(domain, "MX")
-            for mx in mx_answers:
-                host = str(mx.exchange).lower()
-                for kw, provider in MX_PROVIDER_MAP.items():
-                    if kw in host:
-                        result["dns_mx_provider"] = provider
-                        break
-                if result["dns_mx_provider"]:
+        for exchange in mx.records:
+            host = exchange.lower()
+            for kw, provider in MX_PROVIDER_MAP.items():
+                if kw in host:
+                    result["dns_mx_provider"] = provider
                     break
-            if not result["dns_mx_provider"] and mx_answers:
-                result["dns_mx_provider"] = "other"
-        except Exception:
-            pass
+            if result["dns_mx_provider"]:
+                break
+        if not result["dns_mx_provider"] and mx.records:
+            result["dns_mx_provider"] = "other"
 
         # SPF
-        try:
-            for txt in resolver.resolve(domain, "TXT"):
-                if "v=spf1" in str(txt).lower():
-                    result["dns_has_spf"] = True
-                    break
-        except Exception:
-            pass
+        result["dns_has_spf"] = any("v=spf1" in t.lower() for t in txt.records)
 
         # DKIM — collected for storage only; not used in maturity classification
-        for selector in DKIM_SELECTORS:
-            try:
-                resolver.resolve(f"{selector}.{domain}", "TXT")
-                result["dns_has_dkim"] = True
-                break
-            except Exception:
-                continue
+        result["dns_has_dkim"] = any(answer.ok for answer in dkim)
 
         # Email maturity classification from MX + SPF
         result["email_maturity"] = self._compute_email_maturity(
@@ -0,0 +1,123 @@
+"""keyword_automaton.py — Aho-Corasick longest-match segmentation for domain keywords.
+
+Replaces the per-call ``sorted(known_terms)`` + ``str.find`` scan in
+free_enrichment._semantic_split. The automaton is built once over the
+au_lexicon terms (``LEXICON_AUTOMATON``, at import); one pass over a domain
+part yields every lexicon occurrence, and the recursive longest-match split
+then runs over that occurrence list instead of re-scanning the text.
+
+Segmentation rule (same as the legacy split): take the longest term found in
+the segment, keep the fragments either side only if they are >= 3 chars,
+recurse on them. Equal-length candidates resolve to the leftmost occurrence
+(the legacy scan left this to frozenset iteration order).
+
+Pure Python, no external dependencies. Instances are plain dicts/lists and
+pickle cleanly.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+from src.config.au_lexicon import AU_SUBURBS, BUSINESS_TERMS
+
+# Fragments shorter than this are dropped, matching _semantic_split.
+MIN_FRAGMENT_LEN = 3
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed term set."""
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: frozenset[str] = frozenset(t for t in terms if t)
+        # State 0 is the root. _goto[s] maps a char to the next state,
+        # _fail[s] is the failure link, _out[s] the terms ending at s
+        # (own term + everything reachable through failure links).
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for term in sorted(self.terms):
+            self._insert(term)
+        self._link()
+
+    def _insert(self, term: str) -> None:
+        state = 0
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = (term,)
+
+    def _link(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = link if link != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> list[tuple[int, str]]:
+        """Every (start, term) occurrence in ``text``, in one pass."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: list[tuple[int, str]] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for term in out[state]:
+                found.append((i - len(term) + 1, term))
+        return found
+
+    def segment(self, text: str) -> list[str]:
+        """Longest-match split of ``text`` on known term boundaries.
+
+        Returns [] for text shorter than MIN_FRAGMENT_LEN and [text] when no
+        term occurs.
+        """
+        if len(text) < MIN_FRAGMENT_LEN:
+            return []
+        ranked = sorted(self.find_all(text), key=lambda m: (-len(m[1]), m[0]))
+        if not ranked:
+            return [text]
+
+        result: list[str] = []
+
+        def split(lo: int, hi: int) -> None:
+            for start, term in ranked:
+                if start >= lo and start + len(term) <= hi:
+                    break
+            else:
+                result.append(text[lo:hi])
+                return
+            end = start + len(term)
+            if start - lo >= MIN_FRAGMENT_LEN:
+                split(lo, start)
+            result.append(term)
+            if hi - end >= MIN_FRAGMENT_LEN:
+                split(end, hi)
+
+        split(0, len(text))
+        return result
+
+
+LEXICON_TERMS: frozenset[str] = BUSINESS_TERMS | AU_SUBURBS
+LEXICON_AUTOMATON = KeywordAutomaton(LEXICON_TERMS)
+
+
+def automaton_for(terms: frozenset[str]) -> KeywordAutomaton:
+    """The prebuilt lexicon automaton, or a fresh one for a custom term set."""
+    if terms is LEXICON_TERMS or terms == LEXICON_TERMS:
+        return LEXICON_AUTOMATON
+    return KeywordAutomaton(terms)
@@ -52,6 +52,8 @@ from src.orchestration.cohort_runner import (
     _run_stage10,
     _run_stage11,
 )
+from src.pipeline.run_checkpoint import RunCheckpointStore, run_checkpointed
+from src.utils.adaptive_limiter import limiter_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -272,7 +274,10 @@ SEM_PAID = 20  # DFS Ads Search + GMB concurrent
 SEM_DM = 20  # DFS SERP LinkedIn concurrent
 SEM_LLM = 10  # Anthropic concurrent limit
 
-GLOBAL_SEM_DFS = asyncio.Semaphore(28)  # DFS API concurrent calls
+# Domains inside a DFS stage. The provider's request-level cap is the adaptive
+# "dataforseo" limiter in DFSLabsClient._post (src/utils/adaptive_limiter.py);
+# this stays a plain admission bound so stage slots never wait on request slots.
+GLOBAL_SEM_DFS = asyncio.Semaphore(28)
 GLOBAL_SEM_SCRAPE = asyncio.Semaphore(80)  # httpx + Spider concurrent scrapes
 GLOBAL_SEM_ADS_SCRAPER = asyncio.Semaphore(15)  # Ads Transparency concurrent scrapes
 GLOBAL_SEM_ABN = asyncio.Semaphore(50)  # asyncpg ABN queries
@@ -296,6 +301,7 @@ class PipelineStats:
     total_cost_usd: float = 0.0
     elapsed_seconds: float = 0.0
     category_stats: dict = field(default_factory=dict)  # category_code -> prospects found
+    concurrency: dict = field(default_factory=dict)  # provider -> AdaptiveLimiter.snapshot()
 
 
 @dataclass
@@ -472,6 +478,8 @@ class PipelineOrchestrator:
         lm_client:      LeadmagicClient  (stage 8)
         discovery:      pull_batch(category_code, location, limit, offset) -> list[dict]
         on_card:        optional callable(ProspectCard) — fires as each card completes
+        checkpoint:     optional RunCheckpointStore — per-domain stage checkpoints
+                        for resuming an interrupted run
     """
 
     def __init__(
@@ -484,6 +492,7 @@ class PipelineOrchestrator:
         discovery=None,
         on_card: Callable[[ProspectCard], None] | None = None,
         on_domain_complete: Callable[[dict], Any] | None = None,
+        checkpoint: RunCheckpointStore | None = None,
         # Legacy keyword args — kept for backwards compatibility
         free_enrichment=None,
         scorer=None,
@@ -505,6 +514,10 @@ class PipelineOrchestrator:
         # FIX 4 — persistence hook. Called after Stage 11 card assembly with
         # the full domain_data dict. Default wraps persist_stage8_to_db([d]).
         self._on_domain_complete = on_domain_complete or _default_on_domain_complete
+        # Optional stage checkpoint log (run_checkpoint). Stages already
+        # recorded for a domain are skipped and their outputs rehydrated, so a
+        # restarted run does not re-buy completed paid stages.
+        self._checkpoint = checkpoint
 
         # Legacy shims — kept so existing callers don't break
         self._fe = free_enrichment
@@ -547,31 +560,38 @@ class PipelineOrchestrator:
         }
         card: ProspectCard | None = None
         stage6_task: asyncio.Task | None = None
+        ckpt = self._checkpoint
 
         try:
             # Stage 2 — SERP verify (PAID)
             async with GLOBAL_SEM_DFS:
-                domain_data = await _run_stage2(domain_data, clients["dfs"])
+                domain_data = await run_checkpointed(
+                    ckpt, "stage2", domain_data, _run_stage2, clients["dfs"]
+                )
             if domain_data.get("dropped_at"):
                 return None
             if await self._check_budget_gate(domain_data, "stage2"):
                 return None
 
             # Stage 3 — Gemini F3A (GATE: enterprise/no-DM → DROP)
-            domain_data = await _run_stage3(domain_data, clients["gemini"])
+            domain_data = await run_checkpointed(
+                ckpt, "stage3", domain_data, _run_stage3, clients["gemini"]
+            )
             if domain_data.get("dropped_at"):
                 return None
 
             # Stage 4 — DFS signal bundle (PAID)
             async with GLOBAL_SEM_DFS:
-                domain_data = await _run_stage4(domain_data, clients["dfs"])
+                domain_data = await run_checkpointed(
+                    ckpt, "stage4", domain_data, _run_stage4, clients["dfs"]
+                )
             if domain_data.get("dropped_at"):
                 return None
             if await self._check_budget_gate(domain_data, "stage4"):
                 return None
 
             # Stage 5 — composite scoring (GATE: score < 30 → DROP)
-            domain_data = await _run_stage5(domain_data)
+            domain_data = await run_checkpointed(ckpt, "stage5", domain_data, _run_stage5)
             if domain_data.get("dropped_at"):
                 return None
 
@@ -587,19 +607,26 @@ class PipelineOrchestrator:
 
                 async def _stage6_bg():
                     async with GLOBAL_SEM_DFS:
-                        return await _run_stage6(domain_data, clients["dfs"])
+                        return await run_checkpointed(
+                            ckpt, "stage6", domain_data, _run_stage6, clients["dfs"]
+                        )
 
                 stage6_task = asyncio.create_task(_stage6_bg())
 
             # Stage 7 — Gemini F3B analysis (concurrent with stage 6)
-            domain_data = await _run_stage7(domain_data, clients["gemini"])
+            domain_data = await run_checkpointed(
+                ckpt, "stage7", domain_data, _run_stage7, clients["gemini"]
+            )
             if domain_data.get("dropped_at"):
                 return None
 
             # Stage 8 — contact waterfall (PAID)
             async with GLOBAL_SEM_DFS:
-                domain_data = await _run_stage8(
+                domain_data = await run_checkpointed(
+                    ckpt,
+                    "stage8",
                     domain_data,
+                    _run_stage8,
                     clients["dfs"],
                     bd=clients["bd"],
                     lm=clients["lm"],
@@ -610,14 +637,16 @@ class PipelineOrchestrator:
                 return None
 
             # Stage 9 — LinkedIn social (PAID — gate inside _run_stage9)
-            domain_data = await _run_stage9(domain_data, clients["bd"])
+            domain_data = await run_checkpointed(
+                ckpt, "stage9", domain_data, _run_stage9, clients["bd"]
+            )
             if domain_data.get("dropped_at"):
                 return None
             if await self._check_budget_gate(domain_data, "stage9"):
                 return None
 
             # Stage 10 — VR + messaging (SKIP if no email, gate inside)
-            domain_data = await _run_stage10(domain_data)
+            domain_data = await run_checkpointed(ckpt, "stage10", domain_data, _run_stage10)
             if domain_data.get("dropped_at"):
                 return None
 
@@ -635,7 +664,7 @@ class PipelineOrchestrator:
                     return None
 
             # Stage 11 — card assembly
-            domain_data = await _run_stage11(domain_data)
+            domain_data = await run_checkpointed(ckpt, "stage11", domain_data, _run_stage11)
             card = _card_from_domain_data(domain_data)
             return card
         finally:
@@ -820,6 +849,10 @@ class PipelineOrchestrator:
                     return
 
                 domain_data = _new_domain(domain, category_label)
+                if self._checkpoint is not None:
+                    # Resume: earlier spend on this domain is not this run's spend.
+                    self._checkpoint.rehydrate(domain_data)
+                    cost_state["per_domain"][id(domain_data)] = domain_data["cost_usd"]
                 try:
                     card = await self._process_domain(domain_data)
                 except Exception as exc:
@@ -1037,6 +1070,7 @@ class PipelineOrchestrator:
             self._run_cost_state = None
 
         stats.elapsed_seconds = time.monotonic() - t0
+        stats.concurrency = limiter_snapshots()
         if budget_exceeded.is_set():
             logger.warning(
                 "run_streaming_budget_exceeded cards=%d discovered=%d cap_usd=$%.3f total_usd=$%.3f",
@@ -0,0 +1,326 @@
+"""
+Contract: src/pipeline/run_checkpoint.py
+Purpose: Durable per-domain, per-stage checkpoints for Pipeline F runs, so a
+         crash, budget kill or deploy mid-run does not throw away paid stage
+         results. Every completed _run_stageN call appends one record; a
+         resumed run rehydrates domain_data from the records and skips the
+         stages that already completed.
+Layer: 2 - pipeline (stdlib sqlite3 only)
+Consumers: src/orchestration/cohort_runner.py (--resume <run_id>),
+           src/pipeline/pipeline_orchestrator.py (checkpoint=...)
+
+Storage: one SQLite file per run, append-only (WAL, one commit per record).
+Stage records are written from a worker thread so the pipelined run's event
+loop never waits on a commit.
+  kind='run'   — run metadata (domain list / categories), written once
+  kind='stage' — a stage's output keys for one domain
+Records are deltas: only the keys a stage writes (STAGE_OUTPUT_KEYS) plus the
+running per-domain fields (cost, drop state, timings, errors). Replaying them
+in order reproduces domain_data as it stood after the last completed stage.
+
+A stage is recorded only when its wrapper returns; a stage interrupted by a
+crash is re-run on resume. Wrappers catch their own exceptions and append a
+"stageN...: <error>" entry to ``errors``; a stage that adds one is not
+recorded either, so it is retried on resume (its stale entries are dropped
+when it re-runs). Budget-gate drops applied by the caller after a stage are
+not recorded, so a budget-killed domain continues on resume.
+
+Payloads are JSON with explicit, type-tagged encoders (datetime, date,
+Decimal, UUID, tuple, set, frozenset) so values rehydrate with the type they
+were recorded with. A stage whose outputs hold any other non-JSON type is not
+recorded (logged) and re-runs on resume rather than coming back as a string.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "checkpoint.sqlite3"
+
+# domain_data keys each stage writes (cohort_runner._run_stageN).
+STAGE_OUTPUT_KEYS: dict[str, tuple[str, ...]] = {
+    "stage2": ("stage2",),
+    "stage3": ("stage3",),
+    "stage4": ("stage4",),
+    "stage5": ("stage5",),
+    "stage6": ("stage6",),
+    "stage7": ("stage7",),
+    "stage8": ("stage8_verify", "stage8_contacts"),
+    "stage9": ("stage9",),
+    "stage10": ("stage10",),
+    "stage11": ("stage11", "latency_report"),
+}
+# Fields any stage may update.
+_RUNNING_KEYS = ("cost_usd", "dropped_at", "drop_reason", "timings", "errors")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind        TEXT NOT NULL,
+    domain      TEXT,
+    stage       TEXT,
+    recorded_at REAL NOT NULL,
+    payload     TEXT NOT NULL
+)
+"""
+
+
+# Tag key for values JSON cannot represent natively.
+_TYPE_TAG = "__ckpt_type__"
+
+
+def _encode(value: Any) -> Any:
+    """Convert value to JSON-safe data, tagging types JSON would lose."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError(f"checkpoint dict keys must be str, got {list(value)[:3]}")
+        if _TYPE_TAG in value:
+            raise TypeError(f"checkpoint dict uses reserved key {_TYPE_TAG}")
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, tuple):
+        return {_TYPE_TAG: "tuple", "v": [_encode(v) for v in value]}
+    if isinstance(value, set | frozenset):
+        items = sorted((_encode(v) for v in value), key=repr)
+        return {_TYPE_TAG: type(value).__name__, "v": items}
+    if isinstance(value, datetime):
+        return {_TYPE_TAG: "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_TAG: "date", "v": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {_TYPE_TAG: "decimal", "v": str(value)}
+    if isinstance(value, UUID):
+        return {_TYPE_TAG: "uuid", "v": str(value)}
+    raise TypeError(f"checkpoint cannot encode {type(value).__name__}")
+
+
+_DECODERS: dict[str, Any] = {
+    "tuple": tuple,
+    "set": set,
+    "frozenset": frozenset,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "decimal": Decimal,
+    "uuid": UUID,
+}
+
+
+def _decode_hook(obj: dict) -> Any:
+    tag = obj.get(_TYPE_TAG)
+    return _DECODERS[tag](obj["v"]) if tag is not None else obj
+
+
+def dumps(data: Any) -> str:
+    """Serialise a checkpoint payload (raises TypeError on unsupported types)."""
+    return json.dumps(_encode(data))
+
+
+def loads(payload: str) -> Any:
+    """Inverse of dumps()."""
+    return json.loads(payload, object_hook=_decode_hook)
+
+
+def checkpoint_path(output_dir: str | Path) -> Path:
+    """Checkpoint file for a run writing its outputs to ``output_dir``."""
+    return Path(output_dir) / CHECKPOINT_FILENAME
+
+
+class RunCheckpointStore:
+    """Append-only stage checkpoint log for one run.
+
+    Opening an existing file loads its records, so the same object serves a
+    fresh run (empty log) and a resumed one.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Serialises the connection across asyncio.to_thread writers
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+        self._run_meta: dict[str, Any] | None = None
+        # domain -> merged stage outputs / completed stages
+        self._state: dict[str, dict[str, Any]] = {}
+        self._done: dict[str, set[str]] = {}
+        self.records_loaded = 0
+        self.records_written = 0
+        self.stages_skipped = 0
+        self._load()
+
+    @classmethod
+    def open_existing(cls, path: str | Path) -> RunCheckpointStore:
+        """Open a checkpoint that must already exist (resume)."""
+        if not Path(path).exists():
+            raise FileNotFoundError(f"No checkpoint at {path}")
+        return cls(path)
+
+    # --------------------------------------------
+    # Reads
+    # --------------------------------------------
+
+    def _load(self) -> None:
+        rows = self._conn.execute(
+            "SELECT kind, domain, stage, payload FROM checkpoint ORDER BY seq"
+        ).fetchall()
+        for kind, domain, stage, payload in rows:
+            data = loads(payload)
+            if kind == "run":
+                self._run_meta = data
+            else:
+                self._state.setdefault(domain, {}).update(data)
+                self._done.setdefault(domain, set()).add(stage)
+        self.records_loaded = len(rows)
+
+    @property
+    def run_meta(self) -> dict[str, Any] | None:
+        return self._run_meta
+
+    def is_done(self, domain: str, stage: str) -> bool:
+        return stage in self._done.get(domain, ())
+
+    def completed_stages(self, domain: str) -> set[str]:
+        return set(self._done.get(domain, ()))
+
+    def rehydrate(self, domain_data: dict) -> dict:
+        """Apply recorded stage outputs to a fresh _new_domain() dict in place."""
+        state = self._state.get(domain_data["domain"])
+        if state:
+            domain_data.update(state)
+        return domain_data
+
+    # --------------------------------------------
+    # Writes
+    # --------------------------------------------
+
+    def _append(self, kind: str, domain: str | None, stage: str | None, payload: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO checkpoint (kind, domain, stage, recorded_at, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, domain, stage, time.time(), payload),
+            )
+            self._conn.commit()
+            self.records_written += 1
+
+    def record_run(self, meta: dict[str, Any]) -> None:
+        """Record run-level metadata once (the discovered domain list)."""
+        if self._run_meta is None:
+            self._append("run", None, None, dumps(meta))
+            self._run_meta = meta
+
+    def record_stage(self, domain_data: dict, stage: str) -> bool:
+        """Append ``stage``'s outputs for this domain.
+
+        Returns False (stage left unrecorded, so it re-runs on resume) when
+        the outputs hold a type the checkpoint encoders do not support.
+        """
+        record = self._stage_record(domain_data, stage)
+        if record is None:
+            return False
+        self._append("stage", *record)
+        self._mark_done(*record)
+        return True
+
+    async def record_stage_async(self, domain_data: dict, stage: str) -> bool:
+        """record_stage() with the SQLite write in a worker thread.
+
+        The payload is serialised on the calling loop first: Stage 6 runs
+        concurrently with Stage 7 on the same domain_data.
+        """
+        record = self._stage_record(domain_data, stage)
+        if record is None:
+            return False
+        await asyncio.to_thread(self._append, "stage", *record)
+        self._mark_done(*record)
+        return True
+
+    def _stage_record(self, domain_data: dict, stage: str) -> tuple[str, str, str] | None:
+        keys = STAGE_OUTPUT_KEYS.get(stage, (stage,)) + _RUNNING_KEYS
+        delta = {k: domain_data.get(k) for k in keys if k in domain_data}
+        domain = domain_data["domain"]
+        try:
+            payload = dumps(delta)
+        except TypeError as exc:
+            logger.error("checkpoint: %s %s not recorded: %s", domain, stage, exc)
+            return None
+        return domain, stage, payload
+
+    def _mark_done(self, domain: str, stage: str, payload: str) -> None:
+        self._state.setdefault(domain, {}).update(loads(payload))
+        self._done.setdefault(domain, set()).add(stage)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "records_loaded": self.records_loaded,
+            "records_written": self.records_written,
+            "domains_checkpointed": len(self._done),
+            "stages_skipped": self.stages_skipped,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _is_stage_error(entry: Any, stage: str) -> bool:
+    """True for an ``errors`` entry a stage wrapper's except block appended.
+
+    Matches "stage2: ..." and sub-step forms like "stage8c_email: ...", but
+    not "stage8_suppressed: ..." (a suppression decision, not a failure) and
+    not stage10's entries when asked about stage1.
+    """
+    return isinstance(entry, str) and re.match(rf"{stage}(?:[a-z][a-z_]*)?:", entry) is not None
+
+
+async def run_checkpointed(
+    store: RunCheckpointStore | None,
+    stage: str,
+    domain_data: dict,
+    func,
+    *args: Any,
+    **kwargs: Any,
+) -> dict:
+    """Run ``func(domain_data, *args)`` unless ``stage`` is already checkpointed.
+
+    With no store this is a plain call. A completed stage is skipped (its
+    outputs were rehydrated); otherwise the result is recorded on return,
+    unless the stage reported an error, in which case it re-runs on resume.
+    """
+    if store is None:
+        return await func(domain_data, *args, **kwargs)
+    domain = domain_data["domain"]
+    if store.is_done(domain, stage):
+        store.stages_skipped += 1
+        return domain_data
+    # A retried stage starts without the errors its failed attempt left.
+    errors = domain_data.get("errors")
+    if errors:
+        errors[:] = [e for e in errors if not _is_stage_error(e, stage)]
+    domain_data = await func(domain_data, *args, **kwargs)
+    if any(_is_stage_error(e, stage) for e in domain_data.get("errors") or ()):
+        logger.warning("checkpoint: %s %s not recorded: stage reported an error", domain, stage)
+        return domain_data
+    await store.record_stage_async(domain_data, stage)
+    return domain_data
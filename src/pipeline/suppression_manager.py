@@ -6,7 +6,17 @@ Integrates with:
   - booking_handler.py (converted prospects)
 
 Primary store: Supabase public.suppression_list via PostgREST.
-In-memory _store acts as a write-through cache (check cache first, fall back to DB).
+In-memory _store is a full snapshot of that table (the suppression index):
+loaded once, then refreshed incrementally by suppressed_at watermark, with a
+periodic full rebuild to pick up deletes from other processes. Local writes
+go to _store immediately and to the DB asynchronously. Checks are pure
+in-memory lookups, so bulk_check is authoritative once the snapshot is loaded.
+
+Until the snapshot is loaded, checks never fail open: without a running
+loop they fall back to a DB lookup; inside a running loop (which must not be
+blocked) they return a non-authoritative "suppressed" result that blocks the
+send while the load runs in the background. Async callers should await
+SuppressionManager.refresh_index() up front (cohort_runner does).
 """
 
 from __future__ import annotations
@@ -15,7 +25,9 @@ import asyncio
 import logging
 import os
 import threading
-from datetime import UTC, datetime
+import time
+from collections.abc import Iterator, MutableMapping
+from datetime import UTC, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +37,90 @@ logger = logging.getLogger(__name__)
 
 _lock = threading.Lock()
 
+
+class _SuppressionStore(MutableMapping):
+    """email -> record mapping whose backing dict can be swapped in one step.
+
+    compliance_handler aliases _store and reads it without _lock, so a full
+    rebuild must never expose an empty or half-built dict: it builds a new
+    dict and replace()s the reference. Views (values/items/keys) are bound to
+    one backing dict, so iteration never mixes two snapshots.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[str, dict] = {}
+
+    def replace(self, data: dict[str, dict]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> dict:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: dict) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: dict | None = None) -> dict | None:
+        return self._data.get(key, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data = {}
+
+
 # email -> {reason, channel, source, suppressed_at}
-_store: dict[str, dict] = {}
+_store = _SuppressionStore()
+
+# Snapshot / refresh state of the suppression index
+_index_state: dict = {
+    "loaded": False,  # a full snapshot has been merged into _store
+    "watermark": None,  # max suppressed_at seen (ISO string)
+    "refreshed_at": None,  # monotonic time of the last refresh attempt
+    "full_at": None,  # monotonic time of the last full snapshot
+    "task": None,  # single-flight asyncio.Task for loads/refreshes on a running loop
+}
+
+INDEX_REFRESH_SECONDS = 60
+INDEX_FULL_REBUILD_SECONDS = 3600
+SNAPSHOT_PAGE_SIZE = 1000
+# Incremental refreshes re-read rows this far behind the watermark: rows with a
+# suppressed_at equal to it, or written with an earlier timestamp but committed
+# late, would be missed by a strict suppressed_at > watermark filter.
+INDEX_REFRESH_OVERLAP_SECONDS = 300
+# Local writes this recent survive a full rebuild even if the snapshot lacks
+# them (the fire-and-forget DB upsert may still be in flight)
+LOCAL_WRITE_GRACE_SECONDS = 300
 
 VALID_REASONS = {"unsubscribe", "bounce", "complaint", "converted", "manual"}
 VALID_CHANNELS = {"all", "email", "phone", "linkedin", "sms", "voice"}
 
+# Returned while the index is not loaded and the DB could not confirm either way
+_UNVERIFIED = {
+    "suppressed": True,
+    "reason": "suppression_index_unavailable",
+    "suppressed_at": None,
+    "authoritative": False,
+}
+
 # ---------------------------------------------------------------------------
 # PostgREST helpers (best-effort — non-fatal if Supabase is down)
 # ---------------------------------------------------------------------------
@@ -42,14 +132,18 @@ def _get_supabase_creds() -> tuple[str, str]:
     return url, key
 
 
-async def _db_check(email: str) -> dict | None:
-    """GET /rest/v1/suppression_list?email=eq.{email} — returns first row or None."""
+async def _db_check(email: str) -> tuple[bool, dict | None]:
+    """GET /rest/v1/suppression_list?email=eq.{email}.
+
+    Returns (ok, first row or None); ok is False when the DB could not be read,
+    so callers can tell "not suppressed" from "unknown".
+    """
     try:
         import httpx
 
         url, key = _get_supabase_creds()
         if not url or not key:
-            return None
+            return False, None
         async with httpx.AsyncClient(timeout=5) as client:
             resp = await client.get(
                 f"{url}/rest/v1/suppression_list",
@@ -62,10 +156,11 @@ async def _db_check(email: str) -> dict | None:
             )
         if resp.status_code == 200:
             rows = resp.json()
-            return rows[0] if rows else None
+            return True, rows[0] if rows else None
+        logger.warning("suppression_manager: DB check returned HTTP %s", resp.status_code)
     except Exception as exc:  # noqa: BLE001
         logger.warning("suppression_manager: DB check failed (non-fatal): %s", exc)
-    return None
+    return False, None
 
 
 async def _db_upsert(record: dict) -> bool:
@@ -125,6 +220,221 @@ def _fire_and_forget(coro) -> None:
         logger.warning("suppression_manager: fire-and-forget failed: %s", exc)
 
 
+# ---------------------------------------------------------------------------
+# Suppression index (snapshot + watermark refresh)
+# ---------------------------------------------------------------------------
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _record_from_row(row: dict) -> dict:
+    return {
+        "reason": row.get("reason"),
+        "channel": row.get("channel", "all"),
+        "source": row.get("source", "system"),
+        "suppressed_at": row.get("suppressed_at"),
+    }
+
+
+def _pgrst_quote(value: str) -> str:
+    """Quote a PostgREST filter value (timestamps hold ':' and '+', emails '.')."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+async def _db_fetch_since(since: str | None) -> list[dict] | None:
+    """Page through suppression_list rows with suppressed_at >= since (all rows if None).
+
+    Pages are keyset-ordered on (suppressed_at, email): each page starts after
+    the last row of the previous one, so rows inserted or deleted mid-read
+    cannot shift a page and skip or repeat an email the way an offset would.
+
+    Returns None on failure so callers can keep the current snapshot.
+    """
+    try:
+        import httpx
+
+        url, key = _get_supabase_creds()
+        if not url or not key:
+            return None
+        rows: list[dict] = []
+        last: dict | None = None
+        async with httpx.AsyncClient(timeout=30) as client:
+            while True:
+                params = {
+                    "select": "email,reason,channel,source,suppressed_at",
+                    "order": "suppressed_at.asc,email.asc",
+                    "limit": str(SNAPSHOT_PAGE_SIZE),
+                }
+                if since:
+                    params["suppressed_at"] = f"gte.{since}"
+                if last is not None:
+                    ts = _pgrst_quote(last["suppressed_at"])
+                    email = _pgrst_quote(last["email"])
+                    params["or"] = (
+                        f"(suppressed_at.gt.{ts},and(suppressed_at.eq.{ts},email.gt.{email}))"
+                    )
+                resp = await client.get(
+                    f"{url}/rest/v1/suppression_list",
+                    params=params,
+                    headers={"apikey": key, "Authorization": f"Bearer {key}"},
+                )
+                if resp.status_code != 200:
+                    logger.warning(
+                        "suppression_manager: snapshot fetch returned HTTP %s", resp.status_code
+                    )
+                    return None
+                page = resp.json()
+                rows.extend(page)
+                if len(page) < SNAPSHOT_PAGE_SIZE:
+                    return rows
+                last = page[-1]
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("suppression_manager: snapshot fetch failed (non-fatal): %s", exc)
+    return None
+
+
+async def refresh_index(full: bool = False) -> dict:
+    """Load or refresh the suppression index from suppression_list.
+
+    The first call (or ``full=True``, or once INDEX_FULL_REBUILD_SECONDS have
+    passed) replaces the snapshot; later calls merge rows from
+    INDEX_REFRESH_OVERLAP_SECONDS before the suppressed_at watermark onwards
+    (re-read rows dedupe by email). On failure the current snapshot is kept.
+
+    Returns:
+        {ok: bool, full: bool, rows: int, total: int}
+    """
+    started = time.monotonic()
+    full = (
+        full
+        or not _index_state["loaded"]
+        or _index_state["full_at"] is None
+        or started - _index_state["full_at"] >= INDEX_FULL_REBUILD_SECONDS
+    )
+    keep_local_after = datetime.now(UTC).timestamp() - LOCAL_WRITE_GRACE_SECONDS
+    rows = await _db_fetch_since(None if full else _overlap_since(_index_state["watermark"]))
+
+    with _lock:
+        _index_state["refreshed_at"] = started
+        if rows is None:
+            return {"ok": False, "full": full, "rows": 0, "total": len(_store)}
+
+        fetched = {row["email"].lower().strip(): _record_from_row(row) for row in rows}
+        if full:
+            # Keep recent local writes that may not have reached the DB yet, then
+            # swap the new snapshot in: lock-free readers never see a partial one.
+            for email, entry in _store.items():
+                suppressed_at = _parse_ts(entry.get("suppressed_at"))
+                if suppressed_at and suppressed_at.timestamp() >= keep_local_after:
+                    fetched.setdefault(email, entry)
+            _store.replace(fetched)
+            _index_state["full_at"] = started
+            _index_state["loaded"] = True
+        else:
+            _store.update(fetched)
+
+        newest = max(
+            (row.get("suppressed_at") for row in rows if _parse_ts(row.get("suppressed_at"))),
+            key=_parse_ts,
+            default=None,
+        )
+        current = _index_state["watermark"]
+        if newest and (full or not current or _parse_ts(newest) > _parse_ts(current)):
+            _index_state["watermark"] = newest
+        total = len(_store)
+
+    logger.info(
+        "suppression_manager: %s refresh merged %d rows (index size %d)",
+        "full" if full else "incremental",
+        len(rows),
+        total,
+    )
+    return {"ok": True, "full": full, "rows": len(rows), "total": total}
+
+
+def _overlap_since(watermark: str | None) -> str | None:
+    parsed = _parse_ts(watermark)
+    if parsed is None:
+        return watermark
+    return (parsed - timedelta(seconds=INDEX_REFRESH_OVERLAP_SECONDS)).isoformat()
+
+
+def _schedule_refresh(loop: asyncio.AbstractEventLoop) -> asyncio.Task:
+    """Start (or join) the single in-flight refresh task on the running loop."""
+    with _lock:
+        task = _index_state["task"]
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(refresh_index())
+            _index_state["task"] = task
+    return task
+
+
+def _ensure_index() -> None:
+    """Make sure the index is loaded; schedule a refresh when it is stale.
+
+    Loads/refreshes are attempted at most once per INDEX_REFRESH_SECONDS. With
+    no running loop they run inline; on a running loop they are a single
+    background task and never block it — until the first load lands, checks
+    use the not-loaded path (see SuppressionManager.check_before_outreach).
+    """
+    url, key = _get_supabase_creds()
+    if not url or not key:
+        return
+
+    refreshed_at = _index_state["refreshed_at"]
+    if refreshed_at is not None and time.monotonic() - refreshed_at < INDEX_REFRESH_SECONDS:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(refresh_index())
+        return
+    _schedule_refresh(loop)
+
+
+def _index_authoritative() -> bool:
+    """True when a miss in _store means "not suppressed"."""
+    url, key = _get_supabase_creds()
+    # Without Supabase the local store is the whole suppression list.
+    return _index_state["loaded"] or not url or not key
+
+
+def _remember_row(key: str, row: dict) -> None:
+    with _lock:
+        _store.setdefault(key, _record_from_row(row))
+
+
+async def _db_check_misses(keys: list[str]) -> dict[str, bool]:
+    """Per-email DB lookups for index misses; once the DB fails the rest stay suppressed."""
+    result: dict[str, bool] = {}
+    for i, key in enumerate(keys):
+        ok, row = await _db_check(key)
+        if not ok:
+            result.update(dict.fromkeys(keys[i:], True))
+            break
+        result[key] = row is not None
+        if row is not None:
+            _remember_row(key, row)
+    return result
+
+
+def _in_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Public class
 # ---------------------------------------------------------------------------
@@ -140,15 +450,19 @@ class SuppressionManager:
     ) -> dict:
         """Check if a prospect should be suppressed before any outreach.
 
-        Checks in-memory cache first; if not found, queries Supabase and
-        populates cache for subsequent calls.
+        In-memory lookup against the suppression index; the index is loaded
+        or refreshed first if needed (see _ensure_index). While it is not
+        loaded a miss is not trusted: the email is looked up in the DB when no
+        loop is running, otherwise (or if the DB read fails) the result is
+        suppressed with authoritative=False so the send is blocked.
 
         Returns:
             {suppressed: bool, reason: str | None, suppressed_at: str | None}
+            plus authoritative: False on the blocking fallback.
         """
         key = email.lower().strip()
+        _ensure_index()
 
-        # Cache hit
         with _lock:
             entry = _store.get(key)
         if entry:
@@ -157,33 +471,22 @@ class SuppressionManager:
                 "reason": entry["reason"],
                 "suppressed_at": entry["suppressed_at"],
             }
-
-        # Cache miss — try DB (best-effort, run sync via new event loop)
-        try:
-            url, key_cred = _get_supabase_creds()
-            if not url or not key_cred:
-                # No creds — skip DB round-trip
-                return {"suppressed": False, "reason": None, "suppressed_at": None}
-            loop = asyncio.new_event_loop()
-            row = loop.run_until_complete(_db_check(key))
-            loop.close()
-            if row:
-                with _lock:
-                    _store[key] = {
-                        "reason": row.get("reason"),
-                        "channel": row.get("channel", "all"),
-                        "source": row.get("source", "system"),
-                        "suppressed_at": row.get("suppressed_at"),
-                    }
-                return {
-                    "suppressed": True,
-                    "reason": row.get("reason"),
-                    "suppressed_at": row.get("suppressed_at"),
-                }
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("suppression_manager: check DB fallback failed (non-fatal): %s", exc)
-
-        return {"suppressed": False, "reason": None, "suppressed_at": None}
+        if _index_authoritative():
+            return {"suppressed": False, "reason": None, "suppressed_at": None}
+        if _in_running_loop():
+            return dict(_UNVERIFIED)
+
+        ok, row = asyncio.run(_db_check(key))
+        if not ok:
+            return dict(_UNVERIFIED)
+        if row is None:
+            return {"suppressed": False, "reason": None, "suppressed_at": None}
+        _remember_row(key, row)
+        return {
+            "suppressed": True,
+            "reason": row.get("reason"),
+            "suppressed_at": row.get("suppressed_at"),
+        }
 
     @staticmethod
     def add_to_suppression(
@@ -277,10 +580,51 @@ class SuppressionManager:
 
     @staticmethod
     def bulk_check(emails: list[str]) -> dict[str, bool]:
-        """Check multiple emails at once (cache only — fast path).
+        """Check multiple emails at once against the suppression index.
+
+        One index freshness check, then a single in-memory pass — authoritative
+        once the snapshot is loaded. Before that, misses are resolved per
+        email as in check_before_outreach (unverified emails count as
+        suppressed).
 
         Returns:
             {email: is_suppressed}  — keys are normalised (lowercased).
         """
+        if not emails:
+            return {}
+        _ensure_index()
+        keys = [email.lower().strip() for email in emails]
         with _lock:
-            return {email.lower().strip(): email.lower().strip() in _store for email in emails}
+            result = {key: key in _store for key in keys}
+        if _index_authoritative():
+            return result
+        misses = [key for key, suppressed in result.items() if not suppressed]
+        if _in_running_loop():
+            result.update(dict.fromkeys(misses, True))
+        else:
+            result.update(asyncio.run(_db_check_misses(misses)))
+        return result
+
+    @staticmethod
+    async def refresh_index(full: bool = False) -> dict:
+        """Refresh the suppression index now (e.g. at the start of a cohort run)."""
+        return await refresh_index(full=full)
+
+    @staticmethod
+    def get_index_status() -> dict:
+        """Return suppression index freshness.
+
+        Returns:
+            {loaded: bool, watermark: str | None, size: int, age_seconds: float | None}
+            where age_seconds is the time since the last refresh attempt.
+        """
+        with _lock:
+            refreshed_at = _index_state["refreshed_at"]
+            return {
+                "loaded": _index_state["loaded"],
+                "watermark": _index_state["watermark"],
+                "size": len(_store),
+                "age_seconds": time.monotonic() - refreshed_at
+                if refreshed_at is not None
+                else None,
+            }
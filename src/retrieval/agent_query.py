@@ -61,6 +61,7 @@ def _record_event(
     elapsed_ms: int,
     bypass_rerank: bool,
     top_citation: Citation | None,
+    bank_recalls: tuple[orchestrator.BankRecall, ...] = (),
 ) -> None:
     """Write one row to public.retrieval_events. Best-effort; logs on failure.
 
@@ -83,6 +84,9 @@ def _record_event(
         "bypass_rerank": bypass_rerank,
         "top_citation_id": top_citation.source_id if top_citation else None,
         "top_score": round(top_citation.score, 3) if top_citation else None,
+        # Log-only: per-bank fan-out latency + status (not a retrieval_events column).
+        "bank_latency_ms": {b.collection: b.latency_ms for b in bank_recalls},
+        "bank_status": {b.collection: b.status for b in bank_recalls if b.status != "ok"},
     }
     logger.info("retrieval_event %s", payload)
     dsn = os.environ.get("RETRIEVAL_EVENTS_DSN") or os.environ.get("DATABASE_URL")
@@ -265,6 +269,7 @@ def _finalize(
         elapsed_ms=elapsed_ms,
         bypass_rerank=outcome.bypass_rerank,
         top_citation=top,
+        bank_recalls=outcome.bank_recalls,
     )
     return QueryResult(
         answer=answer,
@@ -387,7 +392,9 @@ async def query_async(
     through `asyncio.run()` / a worker thread, which sync `query()` must do
     because `asyncio.run()` raises inside a running loop. The non-fusion path
     runs the blocking Hindsight recall via `asyncio.to_thread` so the event
-    loop stays free. Argument semantics are identical to `query()`.
+    loop stays free; the per-bank fan-out itself runs concurrently on the
+    orchestrator's recall loop either way. Argument semantics are identical to
+    `query()`.
     """
     started = time.monotonic()
     # HyDE expansion (see query()) — runs the sync Anthropic call off-loop via
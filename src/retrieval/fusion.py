@@ -1,7 +1,8 @@
 """Wave 5 — cross-topology fusion recall.
 
 `fused_recall` fires a recall against EVERY mapped fleet Hindsight bank in
-parallel (`asyncio.gather` over `asyncio.to_thread`), instead of the default
+parallel (`orchestrator.gather_ann_pool_async` — one concurrent fan-out over
+the shared keep-alive recall pool), instead of the default
 three-collection slice `agent_query.query()` uses. Results are merged,
 deduplicated by content hash (the higher-scored copy wins when the same text
 surfaces in more than one bank), and ranked by score. This prevents siloed
@@ -10,19 +11,18 @@ agent_memories + keis no longer has to pick one bank up front.
 
 Gated behind `RETRIEVAL_FUSION_ENABLED` (default False) — matches the
 `DISPATCHER_RERANKER_ENABLED` / spawn-recall flag pattern. Fail-open: a bank
-whose recall fails is dropped from the union; the surviving banks still
-return. Tenant context is validated once, fail-fast, before any HTTP — a
+whose recall fails or misses its per-bank deadline is dropped from the union;
+the surviving banks still return. Tenant context is validated once, fail-fast, before any HTTP — a
 wire-contract violation is never per-bank-swallowed (mirrors
 `orchestrator._gather_ann_pool`).
 
-Each bank is recalled by reusing `orchestrator._gather_ann_pool` with a
-single-collection tuple, so the Hindsight wire contract, response-shape
-parsing, and per-collection fail-open all stay defined in exactly one place.
+The fan-out is the same one `orchestrator._gather_ann_pool` drives, so the
+Hindsight wire contract, response-shape parsing, deadline and per-bank
+fail-open all stay defined in exactly one place.
 """
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import logging
 import os
@@ -75,30 +75,22 @@ async def fused_recall(
 
     Returns:
         Up to `top_k` `RetrievedNode`s, ranked by score descending. A bank that
-        fails contributes nothing; the surviving banks' nodes still return.
+        fails or misses its deadline contributes nothing; the surviving banks'
+        nodes still return.
     """
     orchestrator._require_tenant_id(tenant)  # fail-fast; never per-bank-swallowed
     collections = tuple(orchestrator.HINDSIGHT_BANK_BY_CLASS)
-    tasks = [
-        asyncio.to_thread(
-            orchestrator._gather_ann_pool,
-            query,
-            (collection,),
-            top_k,
-            None,
-            tenant_id=tenant,
+    try:
+        pool, banks = await orchestrator.gather_ann_pool_async(
+            query, collections, top_k, tenant_id=tenant
         )
-        for collection in collections
-    ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    node_lists: list[list[RetrievedNode]] = []
-    for collection, result in zip(collections, results, strict=True):
-        if isinstance(result, BaseException):
-            logger.warning(
-                "fusion bank recall failed collection=%s — dropping from union",
-                collection,
-                exc_info=result,
-            )
-            continue
-        node_lists.append(result)
-    return _merge_dedup(node_lists, top_k)
+    except orchestrator.MissingTenantContextError:
+        raise
+    except Exception:  # noqa: BLE001 — recall loop failure; fail-open to empty union
+        logger.warning("fusion recall fan-out failed — returning empty union", exc_info=True)
+        return []
+    logger.debug(
+        "fusion bank recalls %s",
+        {b.collection: (b.status, b.latency_ms) for b in banks},
+    )
+    return _merge_dedup([pool], top_k)
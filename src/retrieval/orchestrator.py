@@ -25,29 +25,52 @@ was Agency_OS-4bsc (Discoveries hand-migration) so all three default
 collections (Discoveries / Decisions / Keis) have Hindsight bank coverage.
 The write path (`_build_index` + `index_document`) still uses LlamaIndex
 until a follow-up PR — kept here so the orthogonal-scope discipline holds.
+
+Concurrent recall: the per-collection recalls fan out concurrently on a
+dedicated recall event loop that owns one keep-alive `httpx.AsyncClient`, so
+every bank query in a process reuses the same connection pool instead of
+opening a fresh urllib connection per bank. Each bank gets its own deadline
+(HINDSIGHT_BANK_DEADLINE_SECONDS); a bank that errors or misses it is dropped
+and the pool is built from the banks that answered (partial results). Per-bank
+status + latency is reported as `BankRecall` entries on
+`RetrievalOutcome.bank_recalls`.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import concurrent.futures
 import logging
 import os
+import threading
 import time
+from collections.abc import Coroutine
 from dataclasses import dataclass, replace
-from typing import Any
-from urllib import request as urlrequest
+from typing import Any, TypeVar
+
+import httpx
 
 from src.keiracom_system.reranker import RerankerClient
 from src.retrieval import weaviate_store
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Hindsight read endpoint — POST /v1/{tenant_id}/banks/{bank_id}/memories/recall
 # with body {"query": str, "max_tokens": int, "top_k": int, "tags"?: list,
 # "tags_match"?: "all"|"any"}. Returns {"memories": [...]} or {"results": [...]}.
 HINDSIGHT_BASE = os.environ.get("HINDSIGHT_BASE", "http://localhost:8889")  # NOSONAR S5332 loopback
 HINDSIGHT_RECALL_TIMEOUT_SECONDS = 30.0
 HINDSIGHT_RECALL_MAX_TOKENS = 2000
+# Per-bank deadline for the concurrent fan-out. A bank that has not answered
+# by then is dropped from the pool (reported as status="timeout") so one slow
+# bank cannot hold the whole recall to the 30s transport timeout.
+HINDSIGHT_BANK_DEADLINE_SECONDS = float(os.environ.get("HINDSIGHT_BANK_DEADLINE_SECONDS", "10"))
+# Shared keep-alive pool: sized so a full fan-out over every mapped bank can
+# run without queueing on a connection.
+HINDSIGHT_RECALL_MAX_CONNECTIONS = 16
+HINDSIGHT_RECALL_KEEPALIVE_SECONDS = 60.0
 
 # Audit fix YELLOW-4 (Agency_OS-7sj6, 2026-05-28): every Hindsight recall callsite
 # must declare its tenant slug. Fleet-internal recall (shared fleet_* banks
@@ -199,16 +222,96 @@ def index_document(
             weaviate_store.close_client(weaviate_client)
 
 
+@dataclass(frozen=True)
+class BankRecall:
+    """Per-bank result of one recall fan-out.
+
+    status is "ok", "error", "timeout" (missed HINDSIGHT_BANK_DEADLINE_SECONDS)
+    or "unmapped" (collection has no Hindsight bank; nothing was sent).
+    """
+
+    collection: str
+    bank_id: str | None
+    status: str
+    latency_ms: int
+    hits: int = 0
+
+
 @dataclass(frozen=True)
 class RetrievalOutcome:
     nodes: tuple[RetrievedNode, ...]
     bypass_rerank: bool
     rerank_reason: str
     rerank_elapsed_ms: int
+    bank_recalls: tuple[BankRecall, ...] = ()
+
+
+# ─── Recall event loop + shared connection pool ────────────────────────────────
+# One daemon thread runs an event loop that owns the keep-alive AsyncClient.
+# Sync callers (retrieve_with_outcome via agent_query.query / spawn_recall)
+# and async callers (fusion.fused_recall) both submit their fan-out to this
+# loop, so the pool is shared process-wide regardless of the caller's loop.
+_recall_loop: asyncio.AbstractEventLoop | None = None
+_recall_client: httpx.AsyncClient | None = None
+_recall_loop_lock = threading.Lock()
+
+
+def _get_recall_loop() -> asyncio.AbstractEventLoop:
+    """Return the recall loop, starting its daemon thread on first use."""
+    global _recall_loop  # noqa: PLW0603
+    with _recall_loop_lock:
+        if _recall_loop is None or _recall_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="hindsight-recall", daemon=True).start()
+            _recall_loop = loop
+        return _recall_loop
+
+
+def _reset_recall_loop_after_fork() -> None:
+    """A forked child does not inherit the loop thread; start fresh on next use."""
+    global _recall_loop, _recall_client  # noqa: PLW0603
+    _recall_loop = None
+    _recall_client = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_recall_loop_after_fork)
+
+
+def _shared_recall_client() -> httpx.AsyncClient:
+    """Keep-alive client bound to the recall loop. Only call on that loop."""
+    global _recall_client  # noqa: PLW0603
+    if _recall_client is None or _recall_client.is_closed:
+        _recall_client = httpx.AsyncClient(
+            timeout=HINDSIGHT_RECALL_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HINDSIGHT_RECALL_MAX_CONNECTIONS,
+                max_keepalive_connections=HINDSIGHT_RECALL_MAX_CONNECTIONS,
+                keepalive_expiry=HINDSIGHT_RECALL_KEEPALIVE_SECONDS,
+            ),
+        )
+    return _recall_client
 
 
-def _hindsight_recall(
-    text: str, bank_id: str, *, top_k: int, tenant_id: str
+def _submit_to_recall_loop(coro: Coroutine[Any, Any, _T]) -> concurrent.futures.Future[_T]:
+    loop = _get_recall_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("blocking recall submitted from the recall loop itself")
+    return asyncio.run_coroutine_threadsafe(coro, loop)
+
+
+async def _hindsight_recall(
+    text: str,
+    bank_id: str,
+    *,
+    top_k: int,
+    tenant_id: str,
+    client: httpx.AsyncClient | None = None,
 ) -> list[dict[str, Any]]:
     """POST /v1/{tenant_id}/banks/{bank_id}/memories/recall — returns memories list.
 
@@ -217,24 +320,132 @@ def _hindsight_recall(
     customer slug resolved via KeiracomTenantExtension. The slug is validated
     at the wire boundary — empty/invalid raises MissingTenantContextError.
 
-    Empty list on any HTTP/JSON failure (caller logs at the call site for
-    per-collection visibility).
+    `client` defaults to the shared keep-alive pool, which is bound to the
+    recall loop — pass an explicit client when awaiting from any other loop.
+    HTTP/JSON failures raise; the fan-out records them per bank.
     """
     tenant_slug = _require_tenant_id(tenant_id)
     body = {"query": text, "max_tokens": HINDSIGHT_RECALL_MAX_TOKENS, "top_k": top_k}
-    data = json.dumps(body).encode("utf-8")
-    req = urlrequest.Request(
+    http = client if client is not None else _shared_recall_client()
+    resp = await http.post(
         f"{HINDSIGHT_BASE}/v1/{tenant_slug}/banks/{bank_id}/memories/recall",
-        data=data,
-        method="POST",
+        json=body,
         headers={"Content-Type": "application/json", "Accept": "application/json"},
     )
-    with urlrequest.urlopen(req, timeout=HINDSIGHT_RECALL_TIMEOUT_SECONDS) as resp:
-        raw = resp.read().decode("utf-8")
-    parsed = json.loads(raw) if raw else {}
+    resp.raise_for_status()
+    parsed = resp.json() if resp.content else {}
     return parsed.get("memories") or parsed.get("results") or []
 
 
+def _memories_to_nodes(memories: list[dict[str, Any]], collection: str) -> list[RetrievedNode]:
+    nodes: list[RetrievedNode] = []
+    for mem in memories:
+        content = mem.get("content") or mem.get("text") or ""
+        score = float(mem.get("score") or mem.get("relevance") or 0.0)
+        metadata = dict(mem.get("metadata") or {})
+        nodes.append(
+            RetrievedNode(text=content, score=score, metadata=metadata, collection=collection)
+        )
+    return nodes
+
+
+async def _recall_one_bank(
+    text: str,
+    collection: str,
+    bank_id: str,
+    *,
+    top_k: int,
+    tenant_id: str,
+    deadline_s: float,
+) -> tuple[list[RetrievedNode], BankRecall]:
+    started = time.monotonic()
+    try:
+        memories = await asyncio.wait_for(
+            _hindsight_recall(text, bank_id, top_k=top_k, tenant_id=tenant_id), deadline_s
+        )
+    except MissingTenantContextError:
+        raise  # wire-contract violation — never swallow
+    except (TimeoutError, httpx.TimeoutException):
+        elapsed = int((time.monotonic() - started) * 1000)
+        logger.warning(
+            "hindsight recall for %s missed the %.1fs deadline — dropping bank",
+            collection,
+            deadline_s,
+        )
+        return [], BankRecall(collection, bank_id, "timeout", elapsed)
+    except Exception:  # noqa: BLE001
+        elapsed = int((time.monotonic() - started) * 1000)
+        logger.warning("hindsight recall failed for %s", collection, exc_info=True)
+        return [], BankRecall(collection, bank_id, "error", elapsed)
+    elapsed = int((time.monotonic() - started) * 1000)
+    nodes = _memories_to_nodes(memories, collection)
+    return nodes, BankRecall(collection, bank_id, "ok", elapsed, len(nodes))
+
+
+async def _fan_out_recall(
+    text: str,
+    collections: tuple[str, ...],
+    k_initial: int,
+    tenant_id: str,
+    deadline_s: float,
+) -> tuple[list[RetrievedNode], tuple[BankRecall, ...]]:
+    """Recall every mapped collection concurrently; runs on the recall loop."""
+    reports: dict[str, BankRecall] = {}
+    tasks: dict[str, asyncio.Task[tuple[list[RetrievedNode], BankRecall]]] = {}
+    for collection in collections:
+        bank_id = HINDSIGHT_BANK_BY_CLASS.get(collection)
+        if bank_id is None:
+            logger.warning(
+                "no Hindsight bank mapping for collection=%s — skipping (see "
+                "HINDSIGHT_BANK_BY_CLASS canonical at scripts/orchestrator/"
+                "indexer_base.CLASS_TO_BANK)",
+                collection,
+            )
+            reports[collection] = BankRecall(collection, None, "unmapped", 0)
+            continue
+        tasks[collection] = asyncio.ensure_future(
+            _recall_one_bank(
+                text,
+                collection,
+                bank_id,
+                top_k=k_initial,
+                tenant_id=tenant_id,
+                deadline_s=deadline_s,
+            )
+        )
+    results = await asyncio.gather(*tasks.values())
+    pool: list[RetrievedNode] = []
+    for collection, (nodes, report) in zip(tasks, results, strict=True):
+        pool.extend(nodes)
+        reports[collection] = report
+    pool.sort(key=lambda n: n.score, reverse=True)
+    return pool, tuple(reports[c] for c in collections if c in reports)
+
+
+async def gather_ann_pool_async(
+    text: str,
+    collections: tuple[str, ...],
+    k_initial: int,
+    *,
+    tenant_id: str,
+    deadline_s: float | None = None,
+) -> tuple[list[RetrievedNode], tuple[BankRecall, ...]]:
+    """Async ANN pool: concurrent per-bank recall over the shared keep-alive pool.
+
+    Returns (pool, per-bank reports). Partial-result policy: a bank that raises
+    or misses `deadline_s` (default HINDSIGHT_BANK_DEADLINE_SECONDS) contributes
+    nothing and is reported with its status; the pool holds every bank that
+    answered in time. Tenant context is validated before any request and a
+    MissingTenantContextError is never swallowed per bank.
+    """
+    _require_tenant_id(tenant_id)
+    deadline = HINDSIGHT_BANK_DEADLINE_SECONDS if deadline_s is None else deadline_s
+    future = _submit_to_recall_loop(
+        _fan_out_recall(text, collections, k_initial, tenant_id, deadline)
+    )
+    return await asyncio.wrap_future(future)
+
+
 def _gather_ann_pool(
     text: str,
     collections: tuple[str, ...],
@@ -242,9 +453,14 @@ def _gather_ann_pool(
     weaviate_client: Any,
     *,
     tenant_id: str,
+    bank_report: list[BankRecall] | None = None,
 ) -> list[RetrievedNode]:
     """Source the ANN pool from Hindsight `/memories/recall` per collection.
 
+    Sync entry to the concurrent fan-out (see `gather_ann_pool_async`): blocks
+    the calling thread while the recall loop queries every bank in parallel.
+    When `bank_report` is given, the per-bank reports are appended to it.
+
     `weaviate_client` is retained for backwards-compat with the public
     `retrieve_with_outcome(client=...)` signature; ignored on the Hindsight
     path. Removed entirely in the next PR (after the write-path cutover).
@@ -252,42 +468,17 @@ def _gather_ann_pool(
 
     `tenant_id` is validated once upfront (fail-fast before any HTTP) and
     forwarded to every per-collection recall. A MissingTenantContextError
-    is intentionally NOT caught inside the per-collection try/except — bad
-    tenant context is a wire-contract violation, not a per-collection hiccup.
+    is intentionally NOT caught by the per-bank fail-open — bad tenant
+    context is a wire-contract violation, not a per-collection hiccup.
     """
     _require_tenant_id(tenant_id)
     del weaviate_client  # noqa: ARG001 — retained for ABI; intentional ignore
-    pool: list[RetrievedNode] = []
-    for collection in collections:
-        bank_id = HINDSIGHT_BANK_BY_CLASS.get(collection)
-        if bank_id is None:
-            logger.warning(
-                "no Hindsight bank mapping for collection=%s — skipping (see "
-                "HINDSIGHT_BANK_BY_CLASS canonical at scripts/orchestrator/"
-                "indexer_base.CLASS_TO_BANK)",
-                collection,
-            )
-            continue
-        try:
-            memories = _hindsight_recall(text, bank_id, top_k=k_initial, tenant_id=tenant_id)
-        except MissingTenantContextError:
-            raise  # wire-contract violation — never swallow
-        except Exception:  # noqa: BLE001
-            logger.warning("hindsight recall failed for %s", collection, exc_info=True)
-            continue
-        for mem in memories:
-            content = mem.get("content") or mem.get("text") or ""
-            score = float(mem.get("score") or mem.get("relevance") or 0.0)
-            metadata = dict(mem.get("metadata") or {})
-            pool.append(
-                RetrievedNode(
-                    text=content,
-                    score=score,
-                    metadata=metadata,
-                    collection=collection,
-                )
-            )
-    pool.sort(key=lambda n: n.score, reverse=True)
+    future = _submit_to_recall_loop(
+        _fan_out_recall(text, collections, k_initial, tenant_id, HINDSIGHT_BANK_DEADLINE_SECONDS)
+    )
+    pool, reports = future.result()
+    if bank_report is not None:
+        bank_report.extend(reports)
     return pool
 
 
@@ -347,16 +538,24 @@ def retrieve_with_outcome(
     Audit fix YELLOW-4 (Agency_OS-7sj6, 2026-05-28): `tenant_id` is a
     keyword-only REQUIRED arg — every caller must declare which Hindsight
     tenant slot it reads from. Fleet-internal callers pass FLEET_TENANT_SLUG.
+
+    `bank_recalls` on the outcome carries per-bank status + latency from the
+    concurrent fan-out, including banks dropped by the partial-result policy.
     """
     del client  # noqa: ARG001 — retained for ABI; intentional ignore
-    pool = _gather_ann_pool(text, collections, k_initial, weaviate_client=None, tenant_id=tenant_id)
+    banks: list[BankRecall] = []
+    pool = _gather_ann_pool(
+        text, collections, k_initial, weaviate_client=None, tenant_id=tenant_id, bank_report=banks
+    )
     if not pool:
-        return RetrievalOutcome((), False, "empty_pool", 0)
-    if not rerank:
-        return RetrievalOutcome(tuple(pool[:k_returned]), True, "rerank_disabled", 0)
-    if not reranker_enabled:
-        return RetrievalOutcome(tuple(pool[:k_returned]), True, "reranker_flag_off", 0)
-    return _sidecar_rerank(text, tuple(pool), k_returned)
+        outcome = RetrievalOutcome((), False, "empty_pool", 0)
+    elif not rerank:
+        outcome = RetrievalOutcome(tuple(pool[:k_returned]), True, "rerank_disabled", 0)
+    elif not reranker_enabled:
+        outcome = RetrievalOutcome(tuple(pool[:k_returned]), True, "reranker_flag_off", 0)
+    else:
+        outcome = _sidecar_rerank(text, tuple(pool), k_returned)
+    return replace(outcome, bank_recalls=tuple(banks))
 
 
 def retrieve_nodes(
@@ -0,0 +1,263 @@
+"""
+Contract: src/services/activity_rollup_service.py
+Purpose: Incrementally maintained activity count rollup for reporting
+Layer: 3 - services
+Imports: stdlib, sqlalchemy
+Consumers: src/engines/reporter.py, src/orchestration/flows/activity_rollup_flow.py
+
+Reporting used to load every Activity row in the date range and tally it in
+Python. ``activity_daily_rollup`` (supabase/migrations/20261016_activity_daily_rollup.sql)
+holds counts per (client, campaign, day, channel, action) instead:
+
+  - ``refresh_activity_rollup`` folds activities between the watermark and
+    ``NOW() - settle_seconds`` into the rollup and moves the watermark, in one
+    transaction. The settle lag keeps rows whose created_at was stamped by a
+    still-open transaction from being skipped.
+  - ``fetch_activity_counts`` reads the rollup for the requested days plus a
+    GROUP BY over the raw activities past the watermark, so counts are exact
+    however far behind the last refresh is.
+  - ``scan_activity_counts`` is the raw-scan reference and
+    ``check_rollup_parity`` compares the two paths.
+
+Activities are append-only; a row changed after it was folded shows up as a
+parity mismatch (see the migration for the rebuild steps).
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = "activity_daily"
+DEFAULT_SETTLE_SECONDS = 120
+DEFAULT_MAX_SPAN = timedelta(days=7)
+
+
+class ActivityCount(NamedTuple):
+    """Activity count for one campaign/channel/action over a date range."""
+
+    campaign_id: UUID
+    channel: str
+    action: str
+    count: int
+
+
+def _filters(client_id: UUID | None, campaign_id: UUID | None) -> tuple[str, dict[str, Any]]:
+    conditions = []
+    params: dict[str, Any] = {}
+    if client_id is not None:
+        conditions.append("client_id = :client_id")
+        params["client_id"] = client_id
+    if campaign_id is not None:
+        conditions.append("campaign_id = :campaign_id")
+        params["campaign_id"] = campaign_id
+    return "".join(f" AND {c}" for c in conditions), params
+
+
+def _rows(result) -> list[ActivityCount]:
+    return [
+        ActivityCount(row.campaign_id, row.channel, row.action, int(row.n))
+        for row in result.fetchall()
+    ]
+
+
+async def fetch_activity_counts(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    client_id: UUID | None = None,
+    campaign_id: UUID | None = None,
+) -> list[ActivityCount]:
+    """
+    Activity counts per campaign/channel/action for days in [start_date, end_date].
+
+    Args:
+        db: Database session
+        start_date: First day (inclusive)
+        end_date: Last day (inclusive)
+        client_id: Optional client filter
+        campaign_id: Optional campaign filter
+
+    Returns:
+        One ActivityCount per (campaign, channel, action) with activity
+    """
+    where, params = _filters(client_id, campaign_id)
+    result = await db.execute(
+        text(f"""
+            WITH wm AS (
+                SELECT COALESCE(
+                    (SELECT high_water FROM activity_rollup_watermark WHERE rollup = :rollup),
+                    '-infinity'::timestamptz
+                ) AS high_water
+            )
+            SELECT campaign_id, channel, action, SUM(n) AS n
+            FROM (
+                SELECT campaign_id, channel, action, activity_count AS n
+                FROM activity_daily_rollup
+                WHERE day BETWEEN :start_date AND :end_date{where}
+                UNION ALL
+                SELECT campaign_id, channel::text AS channel, action, COUNT(*) AS n
+                FROM activities
+                WHERE created_at >= (SELECT high_water FROM wm)
+                  AND created_at >= CAST(:start_date AS date)
+                  AND created_at < CAST(:end_date AS date) + 1{where}
+                GROUP BY campaign_id, channel, action
+            ) counts
+            GROUP BY campaign_id, channel, action
+            ORDER BY campaign_id, channel, action
+        """),
+        {"rollup": ROLLUP_NAME, "start_date": start_date, "end_date": end_date, **params},
+    )
+    return _rows(result)
+
+
+async def scan_activity_counts(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    client_id: UUID | None = None,
+    campaign_id: UUID | None = None,
+) -> list[ActivityCount]:
+    """Same as fetch_activity_counts, computed from activities alone (reference path)."""
+    where, params = _filters(client_id, campaign_id)
+    result = await db.execute(
+        text(f"""
+            SELECT campaign_id, channel::text AS channel, action, COUNT(*) AS n
+            FROM activities
+            WHERE created_at >= CAST(:start_date AS date)
+              AND created_at < CAST(:end_date AS date) + 1{where}
+            GROUP BY campaign_id, channel, action
+            ORDER BY campaign_id, channel, action
+        """),
+        {"start_date": start_date, "end_date": end_date, **params},
+    )
+    return _rows(result)
+
+
+async def check_rollup_parity(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    client_id: UUID | None = None,
+    campaign_id: UUID | None = None,
+) -> dict[str, Any]:
+    """
+    Compare rollup-backed counts with a raw scan of activities.
+
+    Returns:
+        {"match", "rollup_total", "raw_total", "mismatches"} where each
+        mismatch is {"campaign_id", "channel", "action", "rollup", "raw"}
+    """
+    rollup = {
+        (r.campaign_id, r.channel, r.action): r.count
+        for r in await fetch_activity_counts(db, start_date, end_date, client_id, campaign_id)
+    }
+    raw = {
+        (r.campaign_id, r.channel, r.action): r.count
+        for r in await scan_activity_counts(db, start_date, end_date, client_id, campaign_id)
+    }
+    mismatches = [
+        {
+            "campaign_id": str(key[0]),
+            "channel": key[1],
+            "action": key[2],
+            "rollup": rollup.get(key, 0),
+            "raw": raw.get(key, 0),
+        }
+        for key in sorted(rollup.keys() | raw.keys(), key=lambda k: (str(k[0]), k[1], k[2]))
+        if rollup.get(key, 0) != raw.get(key, 0)
+    ]
+    if mismatches:
+        logger.warning(
+            "activity rollup parity: %d mismatches for %s..%s (client=%s campaign=%s)",
+            len(mismatches),
+            start_date,
+            end_date,
+            client_id,
+            campaign_id,
+        )
+    return {
+        "match": not mismatches,
+        "rollup_total": sum(rollup.values()),
+        "raw_total": sum(raw.values()),
+        "mismatches": mismatches,
+    }
+
+
+async def refresh_activity_rollup(
+    db: AsyncSession,
+    settle_seconds: int = DEFAULT_SETTLE_SECONDS,
+    max_span: timedelta = DEFAULT_MAX_SPAN,
+) -> dict[str, Any]:
+    """
+    Fold the next slice of activities into the rollup and advance the watermark.
+
+    The watermark row is locked for the duration, so concurrent refreshes
+    serialise instead of double counting. Each call folds at most
+    ``max_span`` of activity time; call again while ``caught_up`` is False.
+
+    Args:
+        db: Database session
+        settle_seconds: Leave the newest activities to the read-time tail
+        max_span: Largest created_at range folded per call
+
+    Returns:
+        {"from", "to", "groups", "caught_up"}
+    """
+    result = await db.execute(
+        text("""
+            SELECT
+                CASE WHEN high_water = '-infinity'::timestamptz
+                     THEN (SELECT MIN(created_at) FROM activities)
+                     ELSE high_water END AS low,
+                NOW() - make_interval(secs => :settle_seconds) AS cutoff
+            FROM activity_rollup_watermark
+            WHERE rollup = :rollup
+            FOR UPDATE
+        """),
+        {"rollup": ROLLUP_NAME, "settle_seconds": settle_seconds},
+    )
+    row = result.fetchone()
+    if row is None:
+        await db.rollback()
+        raise RuntimeError(
+            f"activity_rollup_watermark has no '{ROLLUP_NAME}' row; "
+            "apply supabase/migrations/20261016_activity_daily_rollup.sql"
+        )
+    low: datetime | None = row.low
+    cutoff: datetime = row.cutoff
+    if low is None or low >= cutoff:
+        await db.rollback()
+        return {"from": low, "to": low, "groups": 0, "caught_up": True}
+
+    high = min(cutoff, low + max_span)
+    upsert = await db.execute(
+        text("""
+            INSERT INTO activity_daily_rollup
+                (client_id, campaign_id, day, channel, action, activity_count)
+            SELECT client_id, campaign_id, created_at::date, channel::text, action, COUNT(*)
+            FROM activities
+            WHERE created_at >= :low AND created_at < :high
+            GROUP BY client_id, campaign_id, created_at::date, channel, action
+            ON CONFLICT (client_id, campaign_id, day, channel, action) DO UPDATE
+            SET activity_count = activity_daily_rollup.activity_count
+                                 + EXCLUDED.activity_count,
+                updated_at = NOW()
+        """),
+        {"low": low, "high": high},
+    )
+    await db.execute(
+        text("""
+            UPDATE activity_rollup_watermark
+            SET high_water = :high, updated_at = NOW()
+            WHERE rollup = :rollup
+        """),
+        {"high": high, "rollup": ROLLUP_NAME},
+    )
+    await db.commit()
+    return {"from": low, "to": high, "groups": upsert.rowcount, "caught_up": high >= cutoff}
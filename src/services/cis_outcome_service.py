@@ -26,6 +26,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.governance.ceo_memory_writer import upsert_ceo_memory_key
+from src.utils.scoring_config_cache import invalidate_propensity_weights
 
 logger = logging.getLogger(__name__)
 
@@ -382,6 +383,7 @@ def save_propensity_weights(
     try:
         callsign = os.environ.get("CALLSIGN", "system")
         upsert_ceo_memory_key(callsign, "ceo:propensity_weights_v3", weights)
+        invalidate_propensity_weights()
         logger.info("CIS: Saved updated propensity weights")
         return {"success": True}
 
@@ -53,6 +53,9 @@ class EmailEventsService:
             session: Async database session
         """
         self.session = session
+        # Activities resolved in bulk (find_activities_by_provider_ids), reused
+        # by record_event instead of one SELECT per event.
+        self._activities: dict[UUID, Activity] = {}
 
     async def record_event(
         self,
@@ -458,8 +461,37 @@ class EmailEventsService:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def find_activities_by_provider_ids(
+        self,
+        provider_message_ids: list[str],
+    ) -> dict[str, Activity]:
+        """
+        Find activities for many provider message IDs in one query.
+
+        Resolved activities are also remembered for this service instance, so
+        recording events against them does not look each one up again.
+
+        Args:
+            provider_message_ids: Provider message IDs (duplicates allowed)
+
+        Returns:
+            Dict of provider message ID -> Activity (missing IDs omitted)
+        """
+        ids = list(dict.fromkeys(i for i in provider_message_ids if i))
+        if not ids:
+            return {}
+        stmt = select(Activity).where(Activity.provider_message_id.in_(ids))
+        result = await self.session.execute(stmt)
+        found: dict[str, Activity] = {}
+        for activity in result.scalars().all():
+            found[activity.provider_message_id] = activity
+            self._activities[activity.id] = activity
+        return found
+
     async def _get_activity(self, activity_id: UUID) -> Activity | None:
         """Get activity by ID."""
+        if activity_id in self._activities:
+            return self._activities[activity_id]
         stmt = select(Activity).where(Activity.id == activity_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
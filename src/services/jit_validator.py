@@ -33,9 +33,23 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Columns of the bulk pool query that make up each view (see _get_pool_leads_bulk)
+_POOL_LEAD_FIELDS = ("id", "email", "email_status", "pool_status", "is_bounced", "is_unsubscribed")
+_ASSIGNMENT_FIELDS = (
+    "total_touches",
+    "max_touches",
+    "cooling_until",
+    "has_replied",
+    "reply_intent",
+    "last_contacted_at",
+    "channels_used",
+)
+
 
 class ValidationResult(Enum):
     """Result of JIT validation."""
@@ -157,22 +171,10 @@ class JITValidator:
         if not timing_result.is_valid:
             return timing_result
 
-        # 7. Check rate limits
-        rate_result = await self._check_rate_limits(client_id, channel)
-        if not rate_result.is_valid:
-            return rate_result
-
-        # 8. Check warmup (email only)
-        if channel == "email":
-            warmup_result = await self._check_warmup(client_id)
-            if not warmup_result.is_valid:
-                return warmup_result
-
-        # 9. Check physical address (email only - CAN-SPAM/GDPR compliance, Directive 057)
-        if channel == "email":
-            address_result = await self._check_physical_address(client_id)
-            if not address_result.is_valid:
-                return address_result
+        # 7-9. Rate limits, warmup and physical address (client-level)
+        client_result = await self._check_client_gates(client_id, channel)
+        if not client_result.is_valid:
+            return client_result
 
         # All checks passed
         return JITValidationResult.ok(assignment_id=assignment["id"], lead_pool_id=lead_pool_id)
@@ -218,7 +220,10 @@ class JITValidator:
         """
         Validate multiple leads at once.
 
-        More efficient for batch operations.
+        Resolves pool leads, assignments, suppression hits and client-level
+        gates for the whole batch in a constant number of queries (pool +
+        assignment, suppression, rate limit, warmup, address), then applies
+        the same decision ladder as validate() in memory.
 
         Args:
             leads: List of leads with 'lead_pool_id' key
@@ -228,22 +233,162 @@ class JITValidator:
         Returns:
             Dict mapping lead_pool_id to validation result
         """
-        results = {}
-
+        batch: list[tuple[str, UUID]] = []
         for lead in leads:
             lead_pool_id = lead.get("lead_pool_id")
             if not lead_pool_id:
                 continue
+            batch.append(
+                (
+                    str(lead_pool_id),
+                    UUID(lead_pool_id) if isinstance(lead_pool_id, str) else lead_pool_id,
+                )
+            )
+
+        if not batch:
+            return {}
+
+        # 1. Pool leads + assignments (one query)
+        rows = await self._get_pool_leads_bulk([pool_id for _, pool_id in batch], client_id)
+
+        # 2. Global blocks, in memory
+        results: dict[str, JITValidationResult] = {}
+        pending: list[tuple[str, UUID, dict[str, Any]]] = []
+        for key, pool_id in batch:
+            row = rows.get(pool_id)
+            if not row:
+                results[key] = JITValidationResult.fail("Lead not found in pool", "lead_not_found")
+                continue
+            global_result = self._check_global_blocks(row["pool_lead"], channel)
+            if not global_result.is_valid:
+                results[key] = global_result
+                continue
+            pending.append((key, pool_id, row))
+
+        # 3. Suppression list (one query for all remaining emails)
+        suppressed = await self._get_suppressions_bulk(
+            client_id, [row["pool_lead"].get("email") for _, _, row in pending]
+        )
+
+        client_result: JITValidationResult | None = None
+        for key, pool_id, row in pending:
+            email = row["pool_lead"].get("email")
+            suppression_row = suppressed.get(email.lower()) if email else None
+            if suppression_row is not None:
+                results[key] = self._suppression_failure(suppression_row, pool_id)
+                continue
+
+            # 4-6. Assignment, status and timing
+            assignment = row["assignment"]
+            if not assignment:
+                results[key] = JITValidationResult.fail(
+                    "Lead not assigned to this client", "not_assigned", pool_id
+                )
+                continue
+            assignment_result = self._check_assignment(assignment)
+            if not assignment_result.is_valid:
+                results[key] = assignment_result
+                continue
+            timing_result = self._check_timing(assignment, channel)
+            if not timing_result.is_valid:
+                results[key] = timing_result
+                continue
+
+            # 7-9. Client-level gates are identical for every lead: evaluate once
+            if client_result is None:
+                client_result = await self._check_client_gates(client_id, channel)
+            if not client_result.is_valid:
+                results[key] = client_result
+                continue
 
-            result = await self.validate(
-                UUID(lead_pool_id) if isinstance(lead_pool_id, str) else lead_pool_id,
-                client_id,
-                channel,
+            results[key] = JITValidationResult.ok(
+                assignment_id=assignment["id"], lead_pool_id=pool_id
             )
-            results[str(lead_pool_id)] = result
 
         return results
 
+    async def _get_pool_leads_bulk(
+        self, lead_pool_ids: list[UUID], client_id: UUID
+    ) -> dict[UUID, dict[str, Any]]:
+        """
+        Get pool leads and their assignment view for many IDs at once.
+
+        Set-based equivalent of _get_pool_lead + _get_assignment. The
+        assignment is None when the lead is not owned by the client.
+
+        Returns:
+            Dict mapping lead_pool_id to {'pool_lead': ..., 'assignment': ...}
+        """
+        query = text("""
+            SELECT
+                lp.id,
+                lp.email,
+                lp.email_status,
+                lp.pool_status,
+                lp.is_bounced,
+                lp.is_unsubscribed,
+                COALESCE(lp.client_id = :client_id, false) as is_assigned,
+                lp.total_touches,
+                COALESCE(c.sequence_steps, 10) as max_touches,
+                CASE
+                    WHEN lp.last_contacted_at IS NOT NULL
+                    THEN lp.last_contacted_at + INTERVAL '2 days'
+                    ELSE NULL
+                END as cooling_until,
+                lp.has_replied,
+                lp.reply_intent,
+                lp.last_contacted_at,
+                lp.channels_used
+            FROM lead_pool lp
+            LEFT JOIN campaigns c ON c.id = lp.campaign_id
+            WHERE lp.id = ANY(:lead_pool_ids)
+        """).bindparams(bindparam("lead_pool_ids", type_=PG_ARRAY(SA_UUID(as_uuid=True))))
+        result = await self.session.execute(
+            query,
+            {"lead_pool_ids": list(lead_pool_ids), "client_id": str(client_id)},
+        )
+
+        rows: dict[UUID, dict[str, Any]] = {}
+        for row in result.fetchall():
+            data = dict(row._mapping)
+            rows[data["id"]] = {
+                "pool_lead": {field: data[field] for field in _POOL_LEAD_FIELDS},
+                "assignment": (
+                    {
+                        "id": data["id"],
+                        "status": data["pool_status"],
+                        **{field: data[field] for field in _ASSIGNMENT_FIELDS},
+                    }
+                    if data["is_assigned"]
+                    else None
+                ),
+            }
+        return rows
+
+    async def _get_suppressions_bulk(
+        self, client_id: UUID, emails: list[str | None]
+    ) -> dict[str, Any]:
+        """
+        Run is_suppressed() for many emails in one round trip.
+
+        Returns:
+            Dict mapping lowercased email to the suppression row (suppressed only)
+        """
+        unique_emails = sorted({email.lower() for email in emails if email})
+        if not unique_emails:
+            return {}
+
+        query = text("""
+            SELECT e.email, s.suppressed, s.reason, s.details
+            FROM unnest(:emails) AS e(email)
+            CROSS JOIN LATERAL is_suppressed(:client_id, e.email, NULL) s
+            WHERE s.suppressed
+        """).bindparams(bindparam("emails", type_=PG_ARRAY(Text)))
+        result = await self.session.execute(
+            query, {"emails": unique_emails, "client_id": str(client_id)}
+        )
+        return {row.email: row for row in result.fetchall()}
+
     async def _get_pool_lead(self, lead_pool_id: UUID) -> dict[str, Any] | None:
         """Get lead from pool."""
         query = text("""
@@ -345,14 +490,18 @@ class JITValidator:
         row = result.fetchone()
 
         if row and row.suppressed:
-            return JITValidationResult.fail(
-                row.details or f"Lead is suppressed: {row.reason}",
-                f"suppressed_{row.reason}",
-                lead_pool_id,
-            )
+            return self._suppression_failure(row, lead_pool_id)
 
         return JITValidationResult(is_valid=True)
 
+    def _suppression_failure(self, row: Any, lead_pool_id: UUID) -> JITValidationResult:
+        """Build the failing result for an is_suppressed() hit."""
+        return JITValidationResult.fail(
+            row.details or f"Lead is suppressed: {row.reason}",
+            f"suppressed_{row.reason}",
+            lead_pool_id,
+        )
+
     def _check_assignment(self, assignment: dict[str, Any]) -> JITValidationResult:
         """
         Check assignment-level conditions.
@@ -419,6 +568,32 @@ class JITValidator:
 
         return JITValidationResult(is_valid=True)
 
+    async def _check_client_gates(self, client_id: UUID, channel: str) -> JITValidationResult:
+        """
+        Run the client-level checks, which do not depend on the lead.
+
+        Shared by validate() and batch_validate() so the batch path evaluates
+        them once per client/channel instead of once per lead.
+        """
+        # 7. Check rate limits
+        rate_result = await self._check_rate_limits(client_id, channel)
+        if not rate_result.is_valid:
+            return rate_result
+
+        # 8. Check warmup (email only)
+        if channel == "email":
+            warmup_result = await self._check_warmup(client_id)
+            if not warmup_result.is_valid:
+                return warmup_result
+
+        # 9. Check physical address (email only - CAN-SPAM/GDPR compliance, Directive 057)
+        if channel == "email":
+            address_result = await self._check_physical_address(client_id)
+            if not address_result.is_valid:
+                return address_result
+
+        return JITValidationResult(is_valid=True)
+
     async def _check_rate_limits(self, client_id: UUID, channel: str) -> JITValidationResult:
         """Check rate limits for the client/channel."""
         # Get today's count for this channel
@@ -527,7 +702,7 @@ class JITValidator:
 # [x] JITValidationResult dataclass for results
 # [x] validate main method
 # [x] validate_by_email convenience method
-# [x] batch_validate for efficiency
+# [x] batch_validate resolves the batch in a constant number of queries
 # [x] Global block checks (bounced, unsubscribed)
 # [x] Assignment status checks
 # [x] Timing checks (cooling, touch gap)
@@ -31,6 +31,154 @@ from src.services.icp_filter_service import get_icp_filter_service
 
 logger = logging.getLogger(__name__)
 
+# Bulk upsert: rows per multi-row INSERT are bounded by the bind-parameter
+# budget (asyncpg/Postgres cap a statement at 32767 parameters)
+BULK_UPSERT_MAX_PARAMS = 30000
+
+# Columns written by bulk_upsert: create()'s column list, in _prepare_insert_params order
+INSERT_COLUMNS = (
+    "email",
+    "linkedin_url",
+    "first_name",
+    "last_name",
+    "title",
+    "seniority",
+    "linkedin_headline",
+    "photo_url",
+    "twitter_url",
+    "phone",
+    "personal_email",
+    "city",
+    "state",
+    "country",
+    "timezone",
+    "departments",
+    "employment_history",
+    "current_role_start_date",
+    "company_name",
+    "company_domain",
+    "company_website",
+    "company_linkedin_url",
+    "company_description",
+    "company_logo_url",
+    "company_industry",
+    "company_sub_industry",
+    "company_employee_count",
+    "company_revenue",
+    "company_revenue_range",
+    "company_founded_year",
+    "company_country",
+    "company_city",
+    "company_state",
+    "company_postal_code",
+    "company_is_hiring",
+    "company_latest_funding_stage",
+    "company_latest_funding_date",
+    "company_total_funding",
+    "company_technologies",
+    "company_keywords",
+    "email_status",
+    "enrichment_source",
+    "enrichment_confidence",
+    "enrichment_data",
+    "enrichment_source_url",
+    "enrichment_captured_at",
+)
+
+# Fields update() may change. bulk_upsert applies the same rule on conflict:
+# a NULL incoming value keeps the stored value.
+UPDATABLE_FIELDS = (
+    "first_name",
+    "last_name",
+    "title",
+    "seniority",
+    "linkedin_headline",
+    "photo_url",
+    "twitter_url",
+    "phone",
+    "personal_email",
+    "linkedin_url",
+    "city",
+    "state",
+    "country",
+    "timezone",
+    "departments",
+    "employment_history",
+    "current_role_start_date",
+    "company_name",
+    "company_domain",
+    "company_website",
+    "company_linkedin_url",
+    "company_description",
+    "company_logo_url",
+    "company_industry",
+    "company_sub_industry",
+    "company_employee_count",
+    "company_revenue",
+    "company_revenue_range",
+    "company_founded_year",
+    "company_country",
+    "company_city",
+    "company_state",
+    "company_postal_code",
+    "company_is_hiring",
+    "company_latest_funding_stage",
+    "company_latest_funding_date",
+    "company_total_funding",
+    "company_technologies",
+    "company_keywords",
+    "email_status",
+    "enrichment_confidence",
+    "enrichment_data",
+    # CEO Directive #057: Enrichment provenance for Spam Act compliance
+    "enrichment_source_url",
+    "enrichment_captured_at",
+)
+
+# _prepare_insert_params fills these with a default when absent; the default
+# must not overwrite a stored value on conflict
+_BULK_DEFAULTED_VALUES = {
+    "departments": "'{}'",
+    "company_technologies": "'{}'",
+    "company_keywords": "'{}'",
+    "email_status": "'unknown'",
+}
+
+
+def _bulk_update_assignment(field: str) -> str:
+    """SET clause for one field of the ON CONFLICT DO UPDATE."""
+    incoming = f"EXCLUDED.{field}"
+    if field in _BULK_DEFAULTED_VALUES:
+        incoming = f"NULLIF({incoming}, {_BULK_DEFAULTED_VALUES[field]})"
+    return f"{field} = COALESCE({incoming}, lead_pool.{field})"
+
+
+def _merge_duplicate_leads(leads: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], int]:
+    """
+    Collapse rows sharing an email, later non-None values winning.
+
+    ON CONFLICT DO UPDATE cannot touch the same row twice in one statement,
+    so duplicates are merged up front. Matches the sequential path, where a
+    repeated email creates once and then updates.
+
+    Returns:
+        Tuple of (one row per normalised email, number of repeats merged)
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    repeats = 0
+    for lead_data in leads:
+        email = lead_data.get("email")
+        if not email:
+            continue
+        email = email.lower().strip()
+        if email in merged:
+            repeats += 1
+            merged[email].update({k: v for k, v in lead_data.items() if v is not None})
+        else:
+            merged[email] = dict(lead_data)
+        merged[email]["email"] = email
+    return list(merged.values()), repeats
+
 
 class LeadPoolService:
     """
@@ -187,55 +335,7 @@ class LeadPoolService:
         update_fields = []
         params = {"id": str(lead_pool_id)}
 
-        updatable_fields = [
-            "first_name",
-            "last_name",
-            "title",
-            "seniority",
-            "linkedin_headline",
-            "photo_url",
-            "twitter_url",
-            "phone",
-            "personal_email",
-            "linkedin_url",
-            "city",
-            "state",
-            "country",
-            "timezone",
-            "departments",
-            "employment_history",
-            "current_role_start_date",
-            "company_name",
-            "company_domain",
-            "company_website",
-            "company_linkedin_url",
-            "company_description",
-            "company_logo_url",
-            "company_industry",
-            "company_sub_industry",
-            "company_employee_count",
-            "company_revenue",
-            "company_revenue_range",
-            "company_founded_year",
-            "company_country",
-            "company_city",
-            "company_state",
-            "company_postal_code",
-            "company_is_hiring",
-            "company_latest_funding_stage",
-            "company_latest_funding_date",
-            "company_total_funding",
-            "company_technologies",
-            "company_keywords",
-            "email_status",
-            "enrichment_confidence",
-            "enrichment_data",
-            # CEO Directive #057: Enrichment provenance for Spam Act compliance
-            "enrichment_source_url",
-            "enrichment_captured_at",
-        ]
-
-        for field in updatable_fields:
+        for field in UPDATABLE_FIELDS:
             if field in lead_data and lead_data[field] is not None:
                 update_fields.append(f"{field} = :{field}")
                 value = lead_data[field]
@@ -478,7 +578,11 @@ class LeadPoolService:
 
         return dict(row._mapping)
 
-    async def bulk_create(self, leads: list[dict[str, Any]]) -> tuple[int, int]:
+    async def bulk_create(
+        self,
+        leads: list[dict[str, Any]],
+        bulk: bool = False,
+    ) -> tuple[int, int]:
         """
         Bulk create leads in the pool.
 
@@ -486,10 +590,15 @@ class LeadPoolService:
 
         Args:
             leads: List of lead data
+            bulk: Stage rows through multi-row INSERT ... ON CONFLICT
+                (see bulk_upsert) instead of a lookup + write per row
 
         Returns:
             Tuple of (created_count, updated_count)
         """
+        if bulk:
+            return await self.bulk_upsert(leads)
+
         created = 0
         updated = 0
 
@@ -508,6 +617,75 @@ class LeadPoolService:
 
         return created, updated
 
+    async def bulk_upsert(
+        self,
+        leads: list[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> tuple[int, int]:
+        """
+        Upsert many leads with one multi-row INSERT ... ON CONFLICT per chunk.
+
+        Rows are normalised with _prepare_insert_params and written with
+        ON CONFLICT (email) DO UPDATE; RETURNING (xmax = 0) tells inserted
+        rows from updated ones, so the counts are exact. On conflict only
+        the update() fields change, and only where the incoming value is
+        present. Each chunk is committed separately.
+
+        Args:
+            leads: List of lead data
+            chunk_size: Rows per statement (default: as many as fit the
+                bind-parameter budget)
+
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        rows, repeats = _merge_duplicate_leads(leads)
+        if not rows:
+            return 0, 0
+
+        max_rows = BULK_UPSERT_MAX_PARAMS // len(INSERT_COLUMNS)
+        chunk_size = min(chunk_size or max_rows, max_rows)
+
+        created = 0
+        updated = repeats
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            query, params = self._build_bulk_upsert(chunk)
+            result = await self.session.execute(text(query), params)
+            inserted_flags = [bool(row.inserted) for row in result.fetchall()]
+            await self.session.commit()
+
+            chunk_created = sum(inserted_flags)
+            created += chunk_created
+            updated += len(inserted_flags) - chunk_created
+
+        logger.info(f"Bulk upserted {len(rows)} pool leads: {created} created, {updated} updated")
+        return created, updated
+
+    def _build_bulk_upsert(self, chunk: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+        """Build the multi-row INSERT ... ON CONFLICT statement for one chunk."""
+        params: dict[str, Any] = {}
+        value_rows = []
+        for i, lead_data in enumerate(chunk):
+            row_params = self._prepare_insert_params(lead_data)
+            placeholders = []
+            for column in INSERT_COLUMNS:
+                params[f"{column}_{i}"] = row_params[column]
+                placeholders.append(f":{column}_{i}")
+            value_rows.append(f"({', '.join(placeholders)}, NOW(), 'available')")
+
+        assignments = [_bulk_update_assignment(field) for field in UPDATABLE_FIELDS]
+        assignments += ["last_enriched_at = NOW()", "updated_at = NOW()"]
+
+        query = f"""
+            INSERT INTO lead_pool ({", ".join(INSERT_COLUMNS)}, enriched_at, pool_status)
+            VALUES {", ".join(value_rows)}
+            ON CONFLICT (email) DO UPDATE SET
+                {", ".join(assignments)}
+            RETURNING (xmax = 0) AS inserted
+        """
+        return query, params
+
     def _prepare_insert_params(self, lead_data: dict[str, Any]) -> dict[str, Any]:
         """Prepare parameters for insert statement."""
         import json
@@ -594,6 +772,7 @@ class LeadPoolService:
 # [x] mark_unsubscribed for global unsubscribe
 # [x] get_pool_stats for analytics
 # [x] bulk_create for batch operations
+# [x] bulk_upsert: multi-row INSERT ... ON CONFLICT with exact created/updated counts
 # [x] No hardcoded credentials
 # [x] All methods async
 # [x] All methods have type hints
@@ -0,0 +1,419 @@
+"""
+Contract: src/services/webhook_event_queue.py
+Purpose: Durable ack-fast ingestion of email engagement webhooks and the
+         batch worker that drains them
+Layer: 3 - services
+Imports: models, services (email_events_service)
+Consumers: src/api/routes/webhooks.py, src/orchestration/flows/webhook_event_drain_flow.py
+
+With ``settings.webhook_ingest_mode == "queue"`` the Smartlead, Salesforge and
+Resend routes verify the signature, append the raw payload to
+``webhook_event_queue`` (supabase/migrations/20261016_webhook_event_queue.sql)
+and return 200. Nothing else runs on the request path, so an open/click storm
+after a large send costs one INSERT per webhook instead of a lookup, a dedup
+check, an insert, a commit and a CIS update.
+
+``drain_webhook_events`` processes one batch:
+  1. claim up to ``batch_size`` rows (FOR UPDATE SKIP LOCKED, with a lease so
+     rows held by a dead worker become claimable again)
+  2. parse each payload with its provider parser (a row that fails to parse
+     is failed on its own; the rest of the batch proceeds)
+  3. drop redeliveries (same provider + provider_event_id) and coalesce
+     repeated opens of one message within ``OPEN_COALESCE_WINDOW_S`` into the
+     earliest open (image-proxy and link-scanner bursts)
+  4. resolve every activity with one ``IN`` query
+  5. record the remaining events through ``apply_email_event`` — the same
+     code the inline webhook path runs — and hand replies to ``reply_handler``
+  6. mark rows processed with their outcome, or store the error for retry
+"""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.email_events_service import (
+    EmailEventsService,
+    parse_resend_webhook,
+    parse_salesforge_webhook,
+    parse_smartlead_webhook,
+)
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_PARSERS: dict[str, Callable[[dict], dict[str, Any]]] = {
+    "smartlead": parse_smartlead_webhook,
+    "salesforge": parse_salesforge_webhook,
+    "resend": parse_resend_webhook,
+}
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_LEASE_SECONDS = 300
+OPEN_COALESCE_WINDOW_S = 60
+# Numeric timestamps above this are epoch milliseconds (1e11 s is year 5138)
+EPOCH_MS_THRESHOLD = 1e11
+
+ReplyHandler = Callable[[AsyncSession, str, dict[str, Any]], Awaitable[Any]]
+
+
+# ============================================
+# Shared event handling (inline and queued)
+# ============================================
+
+
+def reply_message(provider: str, raw: dict[str, Any] | None) -> str:
+    """Reply body from a raw provider payload."""
+    raw = raw or {}
+    if provider == "resend":
+        return (raw.get("data") or {}).get("reply_text", "")
+    return raw.get("reply_text", "")
+
+
+async def apply_email_event(
+    email_service: EmailEventsService,
+    provider: str,
+    parsed: dict[str, Any],
+    activity_id: UUID,
+) -> bool:
+    """
+    Record one parsed engagement event against its activity.
+
+    Replies are not recorded here; the caller forwards them to the closer.
+    Delivery events are only recorded for Resend, as before.
+
+    Args:
+        email_service: EmailEventsService bound to the caller's session
+        provider: smartlead, salesforge or resend
+        parsed: Output of the provider's parse_*_webhook
+        activity_id: Activity the event belongs to
+
+    Returns:
+        True if an event write was attempted
+    """
+    event_type = parsed["event_type"]
+    common = {
+        "activity_id": activity_id,
+        "event_at": parsed.get("event_at"),
+        "provider": provider,
+        "provider_event_id": parsed.get("provider_event_id"),
+    }
+
+    if event_type == "opened":
+        await email_service.record_open(
+            device_info=parsed.get("device_info"),
+            geo_info=parsed.get("geo_info"),
+            **common,
+        )
+    elif event_type == "clicked":
+        await email_service.record_click(
+            clicked_url=parsed.get("clicked_url", ""),
+            device_info=parsed.get("device_info"),
+            geo_info=parsed.get("geo_info"),
+            **common,
+        )
+    elif event_type == "bounced":
+        await email_service.record_bounce(
+            bounce_type=parsed.get("bounce_type", "hard"),
+            raw_payload=parsed.get("raw"),
+            **common,
+        )
+    elif event_type == "unsubscribed":
+        await email_service.record_unsubscribe(**common)
+    elif event_type == "complained":
+        await email_service.record_complaint(**common)
+    elif event_type == "delivered" and provider == "resend":
+        await email_service.record_event(event_type="delivered", **common)
+    else:
+        return False
+    return True
+
+
+# ============================================
+# Ingestion
+# ============================================
+
+
+async def enqueue_webhook_event(db: AsyncSession, provider: str, payload: dict) -> int:
+    """
+    Append a verified raw webhook payload to the queue.
+
+    Args:
+        db: Database session
+        provider: smartlead, salesforge or resend
+        payload: Raw webhook JSON
+
+    Returns:
+        Queue row id
+    """
+    if provider not in PROVIDER_PARSERS:
+        raise ValueError(f"Unknown webhook provider: {provider}")
+    result = await db.execute(
+        text("""
+            INSERT INTO webhook_event_queue (provider, payload)
+            VALUES (:provider, CAST(:payload AS jsonb))
+            RETURNING id
+        """),
+        {"provider": provider, "payload": json.dumps(payload, default=str)},
+    )
+    row_id = result.scalar_one()
+    await db.commit()
+    return row_id
+
+
+# ============================================
+# Draining
+# ============================================
+
+
+async def claim_webhook_events(
+    db: AsyncSession,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> list[dict[str, Any]]:
+    """Claim the oldest pending rows for this worker (id, provider, payload)."""
+    result = await db.execute(
+        text("""
+            UPDATE webhook_event_queue q
+            SET claimed_at = NOW(), attempts = q.attempts + 1
+            WHERE q.id IN (
+                SELECT id FROM webhook_event_queue
+                WHERE processed_at IS NULL
+                  AND attempts < :max_attempts
+                  AND (claimed_at IS NULL
+                       OR claimed_at < NOW() - make_interval(secs => :lease_seconds))
+                ORDER BY id
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING q.id, q.provider, q.payload
+        """),
+        {
+            "batch_size": batch_size,
+            "max_attempts": max_attempts,
+            "lease_seconds": lease_seconds,
+        },
+    )
+    rows = [
+        {
+            "id": row.id,
+            "provider": row.provider,
+            # Raw text() queries return JSONB as a string under asyncpg.
+            "payload": json.loads(row.payload) if isinstance(row.payload, str) else row.payload,
+        }
+        for row in result.fetchall()
+    ]
+    await db.commit()
+    rows.sort(key=lambda r: r["id"])
+    return rows
+
+
+def _event_time(value: Any) -> datetime | None:
+    """Best-effort parse of a provider timestamp (ISO string, epoch seconds or ms)."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+    if isinstance(value, int | float):
+        if abs(value) > EPOCH_MS_THRESHOLD:
+            value = value / 1000
+        return datetime.fromtimestamp(value, tz=UTC)
+    if isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    return None
+
+
+def plan_batch(
+    rows: list[dict[str, Any]],
+) -> tuple[list[tuple[int, str, dict[str, Any]]], dict[int, str], dict[int, str]]:
+    """
+    Parse a claimed batch and decide which rows need an event write.
+
+    Args:
+        rows: Claimed rows ({"id", "provider", "payload"}) in id order
+
+    Returns:
+        (work, skipped, failed): work is [(row_id, provider, parsed)] in id
+        order; skipped maps row_id -> outcome for rows that need no write
+        ("duplicate", "coalesced", "ignored:<reason>"); failed maps row_id ->
+        error for rows whose payload or timestamp could not be parsed.
+    """
+    skipped: dict[int, str] = {}
+    failed: dict[int, str] = {}
+    parsed_rows: list[tuple[int, str, dict[str, Any]]] = []
+    seen_events: set[tuple[str, str]] = set()
+
+    for row in rows:
+        parser = PROVIDER_PARSERS.get(row["provider"])
+        if parser is None:
+            skipped[row["id"]] = "ignored:unknown_provider"
+            continue
+        try:
+            parsed = parser(row["payload"] or {})
+            event_type, message_id = parsed["event_type"], parsed["provider_message_id"]
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("webhook_event_queue: row %s unparseable: %s", row["id"], exc)
+            failed[row["id"]] = f"parse failed: {exc!r}"
+            continue
+        if not event_type:
+            skipped[row["id"]] = "ignored:unknown_event_type"
+            continue
+        if not message_id:
+            skipped[row["id"]] = "ignored:no_message_id"
+            continue
+        event_id = parsed.get("provider_event_id")
+        if event_id:
+            key = (row["provider"], str(event_id))
+            if key in seen_events:
+                skipped[row["id"]] = "duplicate"
+                continue
+            seen_events.add(key)
+        parsed_rows.append((row["id"], row["provider"], parsed))
+
+    # Coalesce opens per message: keep the earliest, drop opens within the
+    # window of the last kept one. Opens without a usable timestamp are kept.
+    opens: dict[tuple[str, str], list[tuple[datetime, int]]] = {}
+    for row_id, provider, parsed in parsed_rows:
+        if parsed["event_type"] != "opened":
+            continue
+        try:
+            at = _event_time(parsed.get("event_at"))
+        except (ValueError, OverflowError, OSError) as exc:
+            logger.warning("webhook_event_queue: row %s bad event_at: %s", row_id, exc)
+            failed[row_id] = f"bad event_at: {exc!r}"
+            continue
+        if at is not None:
+            opens.setdefault((provider, parsed["provider_message_id"]), []).append((at, row_id))
+    for events in opens.values():
+        events.sort()
+        kept_at = None
+        for at, row_id in events:
+            if kept_at is not None and (at - kept_at).total_seconds() < OPEN_COALESCE_WINDOW_S:
+                skipped[row_id] = "coalesced"
+            else:
+                kept_at = at
+
+    work = [item for item in parsed_rows if item[0] not in skipped and item[0] not in failed]
+    return work, skipped, failed
+
+
+async def complete_webhook_events(
+    db: AsyncSession,
+    outcomes: dict[int, str],
+    errors: dict[int, str],
+) -> None:
+    """Mark finished rows processed (grouped by outcome) and store errors for retry."""
+    by_outcome: dict[str, list[int]] = {}
+    for row_id, outcome in outcomes.items():
+        by_outcome.setdefault(outcome, []).append(row_id)
+    for outcome, ids in by_outcome.items():
+        await db.execute(
+            text("""
+                UPDATE webhook_event_queue
+                SET processed_at = NOW(), outcome = :outcome, error_message = NULL
+                WHERE id = ANY(:ids)
+            """),
+            {"outcome": outcome, "ids": ids},
+        )
+    for row_id, error in errors.items():
+        await db.execute(
+            text("UPDATE webhook_event_queue SET error_message = :error WHERE id = :id"),
+            {"error": error[:1000], "id": row_id},
+        )
+    await db.commit()
+
+
+async def drain_webhook_events(
+    db: AsyncSession,
+    reply_handler: ReplyHandler | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> dict[str, int]:
+    """
+    Claim and process one batch of queued webhook events.
+
+    Args:
+        db: Database session
+        reply_handler: Async callable(db, provider, parsed) for "replied"
+            events (the drain flow passes the closer forwarder). Without one,
+            replies are left in the queue as failed so they are not lost.
+        batch_size: Rows to claim
+        max_attempts: Rows that failed this many times are no longer claimed
+        lease_seconds: How long a claim blocks other workers
+
+    Returns:
+        Batch stats: claimed, recorded, replies, duplicates, coalesced,
+        ignored, failed, activity_lookups
+    """
+    stats = {
+        "claimed": 0,
+        "recorded": 0,
+        "replies": 0,
+        "duplicates": 0,
+        "coalesced": 0,
+        "ignored": 0,
+        "failed": 0,
+        "activity_lookups": 0,
+    }
+    rows = await claim_webhook_events(db, batch_size, max_attempts, lease_seconds)
+    stats["claimed"] = len(rows)
+    if not rows:
+        return stats
+
+    work, outcomes, errors = plan_batch(rows)
+
+    email_service = EmailEventsService(db)
+    activity_ids: dict[str, UUID] = {}
+    if work:
+        found = await email_service.find_activities_by_provider_ids(
+            [parsed["provider_message_id"] for _, _, parsed in work]
+        )
+        stats["activity_lookups"] = 1
+        activity_ids = {pmid: activity.id for pmid, activity in found.items()}
+
+    for row_id, provider, parsed in work:
+        activity_id = activity_ids.get(parsed["provider_message_id"])
+        if activity_id is None:
+            outcomes[row_id] = "ignored:activity_not_found"
+            continue
+        try:
+            if parsed["event_type"] == "replied":
+                if reply_handler is None:
+                    errors[row_id] = "no reply handler"
+                    continue
+                await reply_handler(db, provider, parsed)
+                outcomes[row_id] = "processed"
+                stats["replies"] += 1
+            elif await apply_email_event(email_service, provider, parsed, activity_id):
+                outcomes[row_id] = "processed"
+                stats["recorded"] += 1
+            else:
+                outcomes[row_id] = f"ignored:{parsed['event_type']}"
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("webhook_event_queue: row %s (%s) failed: %s", row_id, provider, exc)
+            errors[row_id] = str(exc)
+            await db.rollback()
+            # Rollback expires the bulk-resolved activities; fall back to
+            # per-event lookups for the rest of the batch.
+            email_service = EmailEventsService(db)
+
+    for outcome in outcomes.values():
+        if outcome == "duplicate":
+            stats["duplicates"] += 1
+        elif outcome == "coalesced":
+            stats["coalesced"] += 1
+        elif outcome.startswith("ignored"):
+            stats["ignored"] += 1
+    stats["failed"] = len(errors)
+
+    await complete_webhook_events(db, outcomes, errors)
+    return stats
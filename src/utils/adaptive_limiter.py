@@ -0,0 +1,257 @@
+"""
+Contract: src/utils/adaptive_limiter.py
+Purpose: Per-provider adaptive concurrency (AIMD). Replaces a fixed in-flight
+         cap with one that grows while a provider is healthy and backs off
+         when it pushes back, so runs use the headroom a provider actually
+         has instead of a number picked in an audit.
+Layer: 1 - utils (reads src/config/stage_parallelism.py)
+Consumers: src/integrations/dfs_labs_client.py, src/intelligence/gemini_retry.py,
+           src/orchestration/cohort_runner.py, src/pipeline/pipeline_orchestrator.py
+
+Control loop (one limiter per provider, shared by every stage that calls it):
+  - Callers hold a slot for each outbound request (``async with limiter``) and
+    report the outcome with ``observe(latency_s, status)``.
+  - Additive increase: after ``limit`` healthy completions (one window at the
+    current limit) the limit grows by ``increase`` up to ``ceiling``.
+  - Multiplicative decrease: a 429, a 5xx or a timeout cuts the limit by
+    ``backoff``; so does a window whose p95 latency exceeds
+    ``latency_tolerance`` x the baseline p95. Congestion signals within
+    ``cooldown_s`` of a cut are counted but do not cut again, so one burst of
+    429s from requests already in flight costs one halving, not several.
+  - The baseline is the lowest window p95 seen, relaxed 10% towards each new
+    window so a lasting shift in workload becomes the new normal.
+
+``snapshot()`` / ``limiter_snapshots()`` expose the current limit, latency and
+the recent decisions for run reports and dashboards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any
+
+from src.config.stage_parallelism import ADAPTIVE_CONCURRENCY, get_provider_ceiling
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SAMPLES = 200
+MIN_P95_SAMPLES = 20
+DECISION_HISTORY = 50
+
+
+def is_congestion_status(status: int | None) -> bool:
+    """True for responses that mean the provider wants less load."""
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _p95(samples) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter for one provider.
+
+    Usable as ``async with limiter:`` in place of an ``asyncio.Semaphore``.
+    The slot itself records nothing; call ``observe`` with each response.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        initial: int,
+        ceiling: int,
+        floor: int = 1,
+        increase: int = 1,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown_s: float = 2.0,
+    ) -> None:
+        if not 1 <= floor <= ceiling:
+            raise ValueError(f"{provider}: need 1 <= floor ({floor}) <= ceiling ({ceiling})")
+        self.provider = provider
+        self.ceiling = ceiling
+        self.floor = floor
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.cooldown_s = cooldown_s
+        self.limit = max(floor, min(initial, ceiling))
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latencies: deque[float] = deque(maxlen=WINDOW_SAMPLES)
+        self._healthy_since_change = 0
+        self._baseline_p95: float | None = None
+        self._last_p95: float | None = None
+        self._last_decrease = float("-inf")
+        self.decisions: deque[dict[str, Any]] = deque(maxlen=DECISION_HISTORY)
+        self.completed = 0
+        self.congestion_signals = 0
+        self.peak_in_flight = 0
+
+    # --------------------------------------------
+    # Slots
+    # --------------------------------------------
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._take()
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed over just as we were cancelled.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _take(self) -> None:
+        self._in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._take()
+                fut.set_result(None)
+
+    async def __aenter__(self) -> AdaptiveLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    # --------------------------------------------
+    # Feedback
+    # --------------------------------------------
+
+    def observe(
+        self, latency_s: float, status: int | None = None, *, timeout: bool = False
+    ) -> None:
+        """Record one request outcome and adjust the limit."""
+        self.completed += 1
+        if timeout or is_congestion_status(status):
+            self.congestion_signals += 1
+            reason = "timeout" if timeout else ("429" if status == 429 else "5xx")
+            self._decrease(reason)
+            return
+
+        self._latencies.append(latency_s)
+        self._healthy_since_change += 1
+        if self._healthy_since_change < self.limit:
+            return
+
+        p95 = self._window_p95()
+        baseline = self._baseline_p95
+        if p95 is not None:
+            self._last_p95 = p95
+            self._baseline_p95 = (
+                p95 if baseline is None or p95 < baseline else baseline + 0.1 * (p95 - baseline)
+            )
+        if p95 is not None and baseline is not None and p95 > baseline * self.latency_tolerance:
+            self._decrease("p95")
+        elif self.limit < self.ceiling:
+            self._set_limit(min(self.ceiling, self.limit + self.increase), "increase", "healthy")
+        else:
+            self._healthy_since_change = 0
+
+    def _window_p95(self) -> float | None:
+        if len(self._latencies) < MIN_P95_SAMPLES:
+            return None
+        return _p95(self._latencies)
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_s:
+            return
+        self._last_decrease = now
+        self._latencies.clear()
+        new = max(self.floor, int(self.limit * self.backoff))
+        if new == self.limit:
+            self._healthy_since_change = 0
+            return
+        self._set_limit(new, "decrease", reason)
+        logger.warning(
+            "[%s] concurrency %d -> %d (%s)",
+            self.provider,
+            self.decisions[-1]["from"],
+            new,
+            reason,
+        )
+
+    def _set_limit(self, new: int, action: str, reason: str) -> None:
+        self.decisions.append(
+            {
+                "at": round(time.time(), 3),
+                "action": action,
+                "reason": reason,
+                "from": self.limit,
+                "to": new,
+                "p95_ms": None if self._last_p95 is None else round(self._last_p95 * 1000, 1),
+            }
+        )
+        self.limit = new
+        self._healthy_since_change = 0
+        self._wake()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current state for run reports and dashboards."""
+        return {
+            "provider": self.provider,
+            "limit": self.limit,
+            "ceiling": self.ceiling,
+            "floor": self.floor,
+            "in_flight": self._in_flight,
+            "waiting": sum(1 for f in self._waiters if not f.done()),
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "congestion_signals": self.congestion_signals,
+            "p95_ms": None if self._last_p95 is None else round(self._last_p95 * 1000, 1),
+            "baseline_p95_ms": (
+                None if self._baseline_p95 is None else round(self._baseline_p95 * 1000, 1)
+            ),
+            "decisions": list(self.decisions),
+        }
+
+
+# ============================================
+# Process-wide registry
+# ============================================
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(provider: str) -> AdaptiveLimiter:
+    """Shared limiter for ``provider`` (configured in ADAPTIVE_CONCURRENCY)."""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        cfg = ADAPTIVE_CONCURRENCY[provider]
+        limiter = AdaptiveLimiter(provider, ceiling=get_provider_ceiling(provider), **cfg)
+        _limiters[provider] = limiter
+    return limiter
+
+
+def limiter_snapshots() -> dict[str, dict[str, Any]]:
+    """Snapshot of every limiter created in this process, keyed by provider."""
+    return {name: limiter.snapshot() for name, limiter in sorted(_limiters.items())}
+
+
+def reset_limiters() -> None:
+    """Drop all shared limiters (tests, or a fresh run in a long-lived worker)."""
+    _limiters.clear()
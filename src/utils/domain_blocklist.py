@@ -15,6 +15,7 @@ TRADEOFF (ratified by CEO, #328 Stage 1):
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 
 # ── GOVERNMENT TLDs (all countries) ──────────────────────────────────────────
 # Regex: any domain ending in .gov, .govt, .go.XX, .gov.XX, .gouv.XX, .gob.XX
@@ -1957,45 +1958,87 @@ SPORTING_ORGS = frozenset(
     }
 )
 
-# ── COMBINED SET (for exact/subdomain match) ─────────────────────────────────
-BLOCKED_DOMAINS: frozenset[str] = (
-    SOCIAL_PLATFORMS
-    | TECH_GIANTS
-    | WEBSITE_BUILDERS
-    | HOSTING_INFRA
-    | AU_GOVERNMENT
-    | AU_MEDIA
-    | AGGREGATORS
-    | CONSTRUCTION_RETAILERS
-    | BRANDS
-    | HEALTH_FUNDS
-    | DENTAL_CHAINS
-    | CONSTRUCTION_CHAINS
-    | LEGAL_CHAINS
-    | AUTO_CHAINS
-    | FOREIGN_CLINICS
-    | FITNESS_CHAINS
-    | FOOD_CHAINS
-    | MEDIA_COMPANIES
-    | ACCOUNTING_CHAINS
-    | GOVERNMENT_HEALTH
-    | INDUSTRIAL_WHOLESALE
-    |
+# ── CATEGORIES (reported by is_blocked_many; first listed wins on overlap) ──
+BLOCK_CATEGORIES: dict[str, frozenset[str]] = {
+    "social_platforms": SOCIAL_PLATFORMS,
+    "tech_giants": TECH_GIANTS,
+    "website_builders": WEBSITE_BUILDERS,
+    "hosting_infra": HOSTING_INFRA,
+    "au_government": AU_GOVERNMENT,
+    "au_media": AU_MEDIA,
+    "aggregators": AGGREGATORS,
+    "construction_retailers": CONSTRUCTION_RETAILERS,
+    "brands": BRANDS,
+    "health_funds": HEALTH_FUNDS,
+    "dental_chains": DENTAL_CHAINS,
+    "construction_chains": CONSTRUCTION_CHAINS,
+    "legal_chains": LEGAL_CHAINS,
+    "auto_chains": AUTO_CHAINS,
+    "foreign_clinics": FOREIGN_CLINICS,
+    "fitness_chains": FITNESS_CHAINS,
+    "food_chains": FOOD_CHAINS,
+    "media_companies": MEDIA_COMPANIES,
+    "accounting_chains": ACCOUNTING_CHAINS,
+    "government_health": GOVERNMENT_HEALTH,
+    "industrial_wholesale": INDUSTRIAL_WHOLESALE,
     # New D2.1A categories
-    AU_BANKS_FINANCE
-    | RETAIL_CHAINS
-    | TELCO_UTILITIES
-    | EDUCATION
-    | HOSPITALS_HEALTH_NETWORKS
-    | FRANCHISE_HOME_SERVICES
-    | TRANSPORT_CHAINS
-    | REAL_ESTATE_CHAINS
-    | ALLIED_HEALTH_CHAINS
-    | CHARITIES_NFP
-    | CHILDCARE_CHAINS
-    | GAMBLING_CHAINS
-    | SPORTING_ORGS
-)
+    "au_banks_finance": AU_BANKS_FINANCE,
+    "retail_chains": RETAIL_CHAINS,
+    "telco_utilities": TELCO_UTILITIES,
+    "education": EDUCATION,
+    "hospitals_health_networks": HOSPITALS_HEALTH_NETWORKS,
+    "franchise_home_services": FRANCHISE_HOME_SERVICES,
+    "transport_chains": TRANSPORT_CHAINS,
+    "real_estate_chains": REAL_ESTATE_CHAINS,
+    "allied_health_chains": ALLIED_HEALTH_CHAINS,
+    "charities_nfp": CHARITIES_NFP,
+    "childcare_chains": CHILDCARE_CHAINS,
+    "gambling_chains": GAMBLING_CHAINS,
+    "sporting_orgs": SPORTING_ORGS,
+}
+
+# ── COMBINED SET (for exact/subdomain match) ─────────────────────────────────
+BLOCKED_DOMAINS: frozenset[str] = frozenset().union(*BLOCK_CATEGORIES.values())
+
+# Reasons reported for domains rejected before the blocklist lookup.
+REASON_EMPTY = "empty"
+REASON_NON_AU = "non_au_tld"
+REASON_GOVERNMENT = "government_tld"
+
+# ── REVERSED-LABEL TRIE ──────────────────────────────────────────────────────
+# "www.shop.example.com.au" is walked as au → com → example → shop → www; a
+# node carrying _TERMINAL is a blocked domain, so a hit anywhere on the walk is
+# an exact match (last label) or a blocked parent domain (earlier label).
+# Lookup is O(number of labels) instead of a scan over every blocked entry.
+# _TERMINAL is a sentinel, not a string, so no label (not even the empty one in
+# "a..x.com.au") can collide with it.
+_TERMINAL = object()
+
+
+def _build_trie(categories: dict[str, frozenset[str]]) -> dict:
+    root: dict = {}
+    for category, domains in categories.items():
+        for blocked in domains:
+            node = root
+            for label in reversed(blocked.split(".")):
+                node = node.setdefault(label, {})
+            node.setdefault(_TERMINAL, category)
+    return root
+
+
+_BLOCK_TRIE: dict = _build_trie(BLOCK_CATEGORIES)
+
+
+def _trie_category(d: str) -> str | None:
+    """Category of the most specific blocked domain that d equals or sits under."""
+    node = _BLOCK_TRIE
+    found = None
+    for label in reversed(d.split(".")):
+        node = node.get(label)
+        if node is None:
+            break
+        found = node.get(_TERMINAL, found)
+    return found
 
 
 def is_au_domain(domain: str) -> bool:
@@ -2007,34 +2050,58 @@ def is_au_domain(domain: str) -> bool:
     return any(d.endswith(suffix) for suffix in AU_TLD_WHITELIST)
 
 
-def is_blocked(domain: str | None) -> bool:
-    """Return True if domain should be excluded from discovery.
+def block_reason(domain: str | None) -> str | None:
+    """Why domain is excluded from discovery, or None if it is allowed.
 
     Checks (in order — cheapest/broadest first):
-    1. Empty / None
-    2. AU enforcement — must have commercial AU TLD (cheapest regex, kills largest chunk)
-    3. Government TLD regex (all countries — catches .gov.au that passed AU check)
-    4. Exact match in BLOCKED_DOMAINS (retailer/chain/media/aggregator)
-    5. Subdomain of a blocked domain
+    1. Empty / None                                   → "empty"
+    2. AU enforcement — must have commercial AU TLD   → "non_au_tld"
+    3. Government TLD regex (all countries)           → "government_tld"
+    4. Exact match or subdomain of a BLOCKED_DOMAINS entry (www. included)
+                                                      → BLOCK_CATEGORIES key
     """
     if not domain:
-        return True
+        return REASON_EMPTY
     d = domain.lower().strip()
     if not d:
-        return True
+        return REASON_EMPTY
 
     # Pass 1: AU enforcement — must have commercial AU TLD (cheapest, biggest kill)
     if not is_au_domain(d):
-        return True
+        return REASON_NON_AU
 
     # Pass 2: Government TLD (catches .gov.au that passed AU whitelist)
     if _GOVERNMENT_RE.search(d):
-        return True
+        return REASON_GOVERNMENT
+
+    # Pass 3: exact/subdomain match. "www.x" is a subdomain of "x", so the
+    # trie walk also covers the without-www exact match.
+    return _trie_category(d)
 
-    # Exact match (with and without www.)
-    d_nowww = d.removeprefix("www.")
-    if d_nowww in BLOCKED_DOMAINS or d in BLOCKED_DOMAINS:
-        return True
 
-    # Subdomain of blocked domain
-    return any(d.endswith("." + blocked) for blocked in BLOCKED_DOMAINS)
+def is_blocked(domain: str | None) -> bool:
+    """Return True if domain should be excluded from discovery.
+
+    See block_reason for the checks applied.
+    """
+    return block_reason(domain) is not None
+
+
+def is_blocked_many(
+    domains: Iterable[str | None],
+) -> tuple[list[bool], list[str | None]]:
+    """Batch is_blocked for bulk discovery filtering.
+
+    Returns (mask, reasons), both aligned with ``domains``: mask[i] is True when
+    domains[i] is blocked and reasons[i] is its block_reason (None if allowed).
+    Repeated domains within the batch are looked up once.
+    """
+    seen: dict[str | None, str | None] = {}
+    reasons: list[str | None] = []
+    for domain in domains:
+        if domain in seen:
+            reason = seen[domain]
+        else:
+            reason = seen[domain] = block_reason(domain)
+        reasons.append(reason)
+    return [r is not None for r in reasons], reasons
@@ -0,0 +1,387 @@
+"""
+Contract: src/utils/html_features.py
+Purpose: Single-pass feature extraction from a scraped homepage. One call
+         caps the page, lowercases it once, walks the tags of interest once
+         (script/style/title/head/h1/meta) and derives every signal the
+         enrichment stages read — CMS, tech stack, trackers, ad tags, emails,
+         phones, LinkedIn URLs, JSON-LD address, title/description/h1 and
+         visible text — into one HTMLFeatures result.
+Layer: 1 - utils (no src imports)
+Consumers: src/pipeline/free_enrichment.py, src/integrations/httpx_scraper.py,
+           src/intelligence/website_intelligence.py
+
+Previously each of those ran its own regex / html.lower() pass over the same
+page (FreeEnrichment._extract_*, HttpxScraper._extract_contact_data,
+WebsiteIntelligenceEngine._extract_visible_text). Those methods now delegate
+here; scripts/bench_html_features.py compares both on a page corpus.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+# Pages are cut at this many characters before any parsing (≈ bytes for the
+# ASCII-dominated markup of SMB homepages). Larger pages are almost always
+# inlined bundles/base64 assets that carry no extra signal.
+MAX_HTML_BYTES = 1_000_000
+# Visible body text kept on the result; callers slice further.
+MAX_TEXT_CHARS = 8_000
+
+# ── Marker tables (substring checks on the lowercased page) ─────────────────
+CMS_PATTERNS = {
+    "wp-content/": "wordpress",
+    "wp-includes/": "wordpress",
+    "/cdn.shopify.com": "shopify",
+    "squarespace.com/universal": "squarespace",
+    "wix.com": "wix",
+    "webflow.com": "webflow",
+    ".ghost.io": "ghost",
+    "drupal.org": "drupal",
+}
+
+_CMS_KEYWORDS = ("wordpress", "shopify", "squarespace", "wix", "webflow", "ghost", "drupal")
+
+TECH_PATTERNS = {
+    "jquery": "jquery",
+    "react": "react",
+    "/vue": "vue",
+    "angular": "angular",
+    "next": "nextjs",
+    "nuxt": "nuxtjs",
+    "gatsby": "gatsby",
+    "bootstrap": "bootstrap",
+    "tailwind": "tailwind",
+}
+
+TRACKER_CHECKS: list[tuple[list[str], str]] = [
+    (["gtag(", "g-", "ga-", "ua-"], "google_analytics"),
+    (["gtm-"], "google_tag_manager"),
+    (["fbq(", "facebook.net"], "facebook_pixel"),
+    (["_linkedin_partner_id"], "linkedin_insight"),
+    (["hs-script", "js.hubspot.com"], "hubspot"),
+    (["hotjar"], "hotjar"),
+    (["clarity.ms"], "clarity"),
+]
+
+# ── Ad tag detection (IGNORECASE for callers passing raw HTML) ───────────────
+AW_TAG_RE = re.compile(
+    r'gtag\s*\(\s*["\']config["\']\s*,\s*["\']AW-|googleadservices\.com/pagead/conversion',
+    re.IGNORECASE,
+)
+GADS_RMK_RE = re.compile(
+    r"google_remarketing_only|google_conversion_id|googleads\.g\.doubleclick\.net",
+    re.IGNORECASE,
+)
+META_PIXEL_RE = re.compile(
+    r"connect\.facebook\.net|fbq\s*\(|facebook-jssdk",
+    re.IGNORECASE,
+)
+# Same patterns for the already-lowercased page — no IGNORECASE cost.
+_AW_TAG_LOWER_RE = re.compile(
+    r'gtag\s*\(\s*["\']config["\']\s*,\s*["\']aw-|googleadservices\.com/pagead/conversion'
+)
+_GADS_RMK_LOWER_RE = re.compile(GADS_RMK_RE.pattern)
+_META_PIXEL_LOWER_RE = re.compile(META_PIXEL_RE.pattern)
+
+# ── Contact patterns ─────────────────────────────────────────────────────────
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+_EMAIL_LOCAL_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-"
+)
+MOBILE_AU_RE = re.compile(r"04\d{2}[\s.\-]?\d{3}[\s.\-]?\d{3}")
+MOBILE_INT_RE = re.compile(r"\+614\d{2}[\s.\-]?\d{3}[\s.\-]?\d{3}")
+LANDLINE_RE = re.compile(r"0[2378][\s.\-]?\d{4}[\s.\-]?\d{4}")
+LINKEDIN_RE = re.compile(r"linkedin\.com/(?:in|company)/[\w\-]+")
+_PHONE_CLEAN_RE = re.compile(r"[\s.\-]")
+GENERIC_EMAIL_LOCALS = frozenset(
+    {"noreply", "info", "support", "admin", "webmaster", "hello", "contact", "enquiries", "enquiry"}
+)
+PLACEHOLDER_EMAIL_RE = re.compile(
+    r"(?:^|\b)(example@|test@|you@|your@|user@|mail@|email@|no-?reply@"
+    r"|noreply@)|example\.com|yourdomain|placeholder|samplesite",
+    re.IGNORECASE,
+)
+
+# ── Tokeniser ────────────────────────────────────────────────────────────────
+# Runs on the lowercased page, so no IGNORECASE. Raw-text elements are taken
+# whole (their bodies are never scanned for tags); for the rest only the tags
+# whose content or position we use are matched.
+_TAG_RE = re.compile(
+    r"<(script|style|title)\b([^>]*)>(.*?)</\1\s*>|<(/?)(head|h1|meta)\b([^>]*)>",
+    re.DOTALL,
+)
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_GENERATOR_RE = re.compile(r'name=["\']generator["\'][^>]+content=["\']([^"\']+)')
+_DESCRIPTION_RE = re.compile(
+    r'name=["\']description["\'][^>]+content=["\']([^"\']+)'
+    r'|content=["\']([^"\']+)["\'][^>]+name=["\']description["\']'
+)
+_CMS_CONTENT_RE = re.compile(
+    r'content=["\']([^"\']*(?:wordpress|shopify|squarespace|wix|webflow|ghost|drupal)[^"\']*)["\']'
+)
+
+
+@dataclass
+class HTMLFeatures:
+    """Every signal extracted from one page."""
+
+    title: str | None = None
+    meta_description: str = ""
+    first_h1: str = ""
+    cms: str | None = None
+    tech_stack: list[str] = field(default_factory=list)
+    trackers: list[str] = field(default_factory=list)
+    has_google_ads_tag: bool = False
+    has_meta_pixel: bool = False
+    # Email-shaped strings in document order, as written on the page.
+    emails: list[str] = field(default_factory=list)
+    company_mobile: str | None = None
+    company_phone: str | None = None
+    linkedin_company: str | None = None
+    linkedin_dm: str | None = None
+    jsonld_address: dict[str, str | None] | None = None
+    # Visible text (scripts/styles/head removed, whitespace collapsed).
+    body_text: str = ""
+    truncated: bool = False
+
+    @property
+    def has_any_ad_tag(self) -> bool:
+        return self.has_google_ads_tag or self.has_meta_pixel
+
+    def ad_tags(self) -> dict[str, bool]:
+        return {
+            "has_google_ads_tag": self.has_google_ads_tag,
+            "has_meta_pixel": self.has_meta_pixel,
+            "has_any_ad_tag": self.has_any_ad_tag,
+        }
+
+    def contact_emails(self, links: list | tuple = ()) -> list[str]:
+        """Sorted lowercase emails from mailto links + page; noreply/info only as fallback."""
+        emails: set[str] = set()
+        for link in links:
+            if isinstance(link, str) and link.lower().startswith("mailto:"):
+                email = link[7:].strip().lower()
+                if email:
+                    emails.add(email)
+        emails.update(e.lower() for e in self.emails)
+        result = sorted(emails)
+        generics = {"noreply", "info"}
+        specific = [e for e in result if not any(e.startswith(g + "@") for g in generics)]
+        return specific if specific else result
+
+    def company_email(self) -> str | None:
+        """First non-generic, non-placeholder, non-asset email on the page."""
+        for email in self.emails:
+            local = email.split("@")[0].lower()
+            if (
+                local not in GENERIC_EMAIL_LOCALS
+                and not email.endswith((".png", ".jpg", ".gif"))
+                and not PLACEHOLDER_EMAIL_RE.search(email)
+            ):
+                return email.lower()
+        return None
+
+    def contact_data(self) -> dict[str, Any]:
+        """HttpxScraper contact_data shape."""
+        return {
+            "company_email": self.company_email(),
+            "company_phone": self.company_phone,
+            "company_mobile": self.company_mobile,
+            "linkedin_company": self.linkedin_company,
+            "linkedin_dm": self.linkedin_dm,
+            "dm_email": None,
+            "dm_email_verified": False,
+            "dm_mobile": None,
+        }
+
+    def visible_text(self, max_chars: int = 3000) -> str:
+        """Prompt-ready text: Title / Description / H1 prefix, then page text."""
+        parts: list[str] = []
+        if self.title:
+            parts.append(f"Title: {self.title}")
+        if self.meta_description:
+            parts.append(f"Description: {self.meta_description}")
+        if self.first_h1:
+            parts.append(f"H1: {self.first_h1}")
+        parts.append("")
+        parts.append("Page text:")
+        parts.append(self.body_text[:max_chars])
+        return "\n".join(parts)
+
+
+def address_from_jsonld(blocks: list[str]) -> dict[str, str | None] | None:
+    """First schema.org address found in JSON-LD script bodies."""
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except (json.JSONDecodeError, ValueError):
+            continue
+        # Normalise to a list of items
+        if isinstance(data, dict) and "@graph" in data:
+            items = data["@graph"]
+        elif isinstance(data, list):
+            items = data
+        else:
+            items = [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            address = item.get("address")
+            if isinstance(address, dict):
+                return {
+                    "street": address.get("streetAddress"),
+                    "suburb": address.get("addressLocality"),
+                    "state": address.get("addressRegion"),
+                    "postcode": address.get("postalCode"),
+                }
+    return None
+
+
+def _find_emails(page: str) -> list[str]:
+    """EMAIL_RE.findall, anchored on '@' instead of tried at every offset.
+
+    For each '@' the match is attempted from the start of the local-part run in
+    front of it (or the end of the previous match) — the leftmost position
+    EMAIL_RE could match from — so pages with few addresses but long runs of
+    minified JS or base64 stay linear.
+    """
+    found: list[str] = []
+    end = 0
+    at = page.find("@")
+    while at != -1:
+        start = at
+        while start > end and page[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        if start < at:
+            m = EMAIL_RE.match(page, start)
+            if m:
+                found.append(m.group(0))
+                end = m.end()
+        at = page.find("@", max(at + 1, end))
+    return found
+
+
+def _cms(page: str, lower: str, generator: str | None) -> str | None:
+    value = generator
+    if value is None:
+        m = _CMS_CONTENT_RE.search(lower)
+        value = m.group(1) if m else None
+    if value:
+        for kw in _CMS_KEYWORDS:
+            if kw in value:
+                return kw
+    for pattern, cms in CMS_PATTERNS.items():
+        if pattern in page:
+            return cms
+    return None
+
+
+def extract_html_features(
+    html: str,
+    max_bytes: int = MAX_HTML_BYTES,
+    max_text_chars: int = MAX_TEXT_CHARS,
+) -> HTMLFeatures:
+    """Extract every enrichment signal from ``html`` in one pass."""
+    features = HTMLFeatures()
+    if not html:
+        return features
+    page = html[:max_bytes]
+    features.truncated = len(html) > max_bytes
+    lower = page.lower()
+    if len(lower) != len(page):
+        # A handful of non-ASCII characters change length when lowercased;
+        # fall back to an ASCII-only lowering so offsets line up with page.
+        lower = page.translate(_ASCII_LOWER)
+
+    # ── One walk over the tags of interest ──────────────────────────────────
+    generator: str | None = None
+    jsonld: list[str] = []
+    skip_spans: list[tuple[int, int]] = []
+    head_start: int | None = None
+    h1_start: int | None = None
+    h1_done = False
+    for m in _TAG_RE.finditer(lower):
+        raw_name = m.group(1)
+        if raw_name is not None:
+            if raw_name == "title":
+                if features.title is None:
+                    features.title = page[m.start(3) : m.end(3)].strip()
+                continue
+            skip_spans.append(m.span())
+            if raw_name == "script" and "application/ld+json" in m.group(2):
+                jsonld.append(page[m.start(3) : m.end(3)])
+            continue
+        closing, name, attrs = m.group(4), m.group(5), m.group(6)
+        if name == "meta":
+            if generator is None:
+                g = _GENERATOR_RE.search(attrs)
+                if g:
+                    generator = g.group(1)
+            if not features.meta_description:
+                d = _DESCRIPTION_RE.search(attrs)
+                if d:
+                    start = d.start(1) if d.group(1) else d.start(2)
+                    end = d.end(1) if d.group(1) else d.end(2)
+                    offset = m.start(6)
+                    features.meta_description = page[offset + start : offset + end].strip()
+        elif name == "head":
+            if not closing and head_start is None:
+                head_start = m.start()
+            elif closing and head_start is not None and head_start >= 0:
+                skip_spans.append((head_start, m.end()))
+                head_start = -1  # only the first <head> block is removed
+        elif name == "h1" and not h1_done:
+            if not closing and h1_start is None:
+                h1_start = m.end()
+            elif closing and h1_start is not None:
+                features.first_h1 = _ANY_TAG_RE.sub("", page[h1_start : m.start()]).strip()
+                h1_done = True
+
+    # ── Visible text: everything outside script/style/head, tags stripped ──
+    pieces: list[str] = []
+    pos = 0
+    for start, end in sorted(skip_spans):
+        if start > pos:
+            pieces.append(page[pos:start])
+        pos = max(pos, end)
+    pieces.append(page[pos:])
+    text = _WS_RE.sub(" ", _ANY_TAG_RE.sub(" ", "".join(pieces))).strip()
+    features.body_text = text[:max_text_chars]
+
+    # ── Marker checks on the single lowercased copy ─────────────────────────
+    features.cms = _cms(page, lower, generator)
+    features.tech_stack = [tech for pattern, tech in TECH_PATTERNS.items() if pattern in lower]
+    features.trackers = [
+        name for patterns, name in TRACKER_CHECKS if any(p in lower for p in patterns)
+    ]
+    features.has_google_ads_tag = bool(
+        _AW_TAG_LOWER_RE.search(lower) or _GADS_RMK_LOWER_RE.search(lower)
+    )
+    features.has_meta_pixel = bool(_META_PIXEL_LOWER_RE.search(lower))
+
+    # ── Contact signals (case-preserving, on the page itself) ───────────────
+    features.emails = _find_emails(page)
+    m = MOBILE_INT_RE.search(page)
+    if m:
+        features.company_mobile = "0" + _PHONE_CLEAN_RE.sub("", m.group(0))[3:]  # +614 → 04
+    else:
+        m = MOBILE_AU_RE.search(page)
+        if m:
+            features.company_mobile = _PHONE_CLEAN_RE.sub("", m.group(0))
+    m = LANDLINE_RE.search(page)
+    if m:
+        features.company_phone = _PHONE_CLEAN_RE.sub("", m.group(0))
+    for m in LINKEDIN_RE.finditer(page):
+        url = "https://www." + m.group(0)
+        if "/in/" in url and not features.linkedin_dm:
+            features.linkedin_dm = url
+        elif "/company/" in url and not features.linkedin_company:
+            features.linkedin_company = url
+
+    features.jsonld_address = address_from_jsonld(jsonld)
+    return features
@@ -0,0 +1,225 @@
+"""
+Process-local TTL + version cache for scoring weights and ICP configs.
+
+ScorerEngine reads the ``ceo:propensity_weights_v3`` vector, each client's
+learned weights and each campaign's ``icp_config`` for every lead it scores,
+although those values change only a few times a day. This cache keeps them
+in-process:
+
+- Entries expire after a TTL, which bounds staleness when another process
+  writes a new version.
+- Each namespace carries a version counter. The ``invalidate_*`` helpers bump
+  it when this process writes a new weight vector or ICP refinement, so every
+  entry filled under the old version is dropped at once, and a load that was
+  in flight across the write is not stored. Invalidating a single key bumps
+  that key's generation instead, with the same effect on its in-flight loads.
+- Hit/miss/invalidation counters are exposed via ``stats()`` so flows can
+  report the DB reads the cache removed.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+# Namespaces
+NS_CEO_WEIGHTS = "ceo_weights"
+NS_LEARNED_WEIGHTS = "learned_weights"
+NS_ICP_CONFIG = "icp_config"
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 4096
+
+_MISSING = object()
+
+
+class ScoringConfigCache:
+    """TTL + versioned LRU cache keyed by (namespace, key)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        # (namespace, key) -> (expires_at, namespace_version, value)
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, int, Any]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        # (namespace, key) -> generation, bumped by single-key invalidation
+        self._generations: dict[tuple[str, Hashable], int] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def version(self, namespace: str) -> int:
+        """Current version of a namespace (bumped on every invalidation)."""
+        return self._versions.get(namespace, 0)
+
+    def generation(self, namespace: str, key: Hashable) -> int:
+        """Current generation of one key (bumped on every single-key invalidation)."""
+        return self._generations.get((namespace, key), 0)
+
+    def get(self, namespace: str, key: Hashable) -> tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Returns:
+            (hit, value) — value is None on a miss; None is also a valid
+            cached value, so check ``hit``.
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is not None:
+            expires_at, version, value = entry
+            if expires_at > self._clock() and version == self.version(namespace):
+                self._entries.move_to_end((namespace, key))
+                self._count(namespace, "hits")
+                return True, value
+            del self._entries[(namespace, key)]
+        self._count(namespace, "misses")
+        return False, None
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        version: int | None = None,
+        generation: int | None = None,
+    ) -> bool:
+        """
+        Store a value.
+
+        Args:
+            namespace: Cache namespace
+            key: Key within the namespace
+            value: Value to cache (treated as read-only by readers)
+            version: Namespace version observed before the value was loaded;
+                the value is discarded if an invalidation happened since.
+            generation: Key generation observed before the value was loaded;
+                the value is discarded if the key was invalidated since.
+
+        Returns:
+            True if stored
+        """
+        current = self.version(namespace)
+        if version is not None and version != current:
+            return False
+        if generation is not None and generation != self.generation(namespace, key):
+            return False
+        self._entries[(namespace, key)] = (self._clock() + self.ttl_seconds, current, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached value or await ``loader()`` and cache its result.
+
+        Exceptions from the loader propagate and nothing is cached.
+        """
+        hit, value = self.get(namespace, key)
+        if hit:
+            return value
+        version = self.version(namespace)
+        generation = self.generation(namespace, key)
+        value = await loader()
+        self.set(namespace, key, value, version=version, generation=generation)
+        return value
+
+    def invalidate(self, namespace: str, key: Hashable | None = _MISSING) -> None:
+        """
+        Invalidate one key, or the whole namespace when no key is given.
+
+        Whole-namespace invalidation bumps the version and single-key
+        invalidation bumps the key's generation; either way a load of the
+        affected key that started before the call is not stored.
+        """
+        self._count(namespace, "invalidations")
+        if key is _MISSING:
+            self._versions[namespace] = self.version(namespace) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+            # The version bump already rejects older loads of every key.
+            for gen_key in [k for k in self._generations if k[0] == namespace]:
+                del self._generations[gen_key]
+        else:
+            self._generations[(namespace, key)] = self.generation(namespace, key) + 1
+            self._entries.pop((namespace, key), None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset counters (tests / process reset)."""
+        self._entries.clear()
+        self._versions.clear()
+        self._generations.clear()
+        self._counters.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss/invalidation counters per namespace plus totals."""
+        namespaces = {}
+        for namespace, counts in self._counters.items():
+            lookups = counts.get("hits", 0) + counts.get("misses", 0)
+            namespaces[namespace] = {
+                "hits": counts.get("hits", 0),
+                "misses": counts.get("misses", 0),
+                "invalidations": counts.get("invalidations", 0),
+                "hit_rate": counts.get("hits", 0) / lookups if lookups else 0.0,
+                "version": self.version(namespace),
+            }
+        hits = sum(ns["hits"] for ns in namespaces.values())
+        misses = sum(ns["misses"] for ns in namespaces.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": len(self._entries),
+            "namespaces": namespaces,
+        }
+
+    def _count(self, namespace: str, counter: str) -> None:
+        counts = self._counters.setdefault(namespace, {})
+        counts[counter] = counts.get(counter, 0) + 1
+
+
+_cache: ScoringConfigCache | None = None
+
+
+def get_scoring_config_cache() -> ScoringConfigCache:
+    """Get or create the process-wide scoring config cache."""
+    global _cache
+    if _cache is None:
+        _cache = ScoringConfigCache()
+    return _cache
+
+
+def invalidate_propensity_weights() -> None:
+    """Call after writing a new ceo:propensity_weights_v3 version."""
+    get_scoring_config_cache().invalidate(NS_CEO_WEIGHTS)
+
+
+def invalidate_learned_weights(client_id: Any = None) -> None:
+    """Call after writing a client's learned weights or WHO pattern (None = all clients)."""
+    cache = get_scoring_config_cache()
+    if client_id is None:
+        cache.invalidate(NS_LEARNED_WEIGHTS)
+    else:
+        cache.invalidate(NS_LEARNED_WEIGHTS, str(client_id))
+
+
+def invalidate_icp_config(campaign_id: Any = None) -> None:
+    """Call after writing or refining a campaign's icp_config (None = all campaigns)."""
+    cache = get_scoring_config_cache()
+    if campaign_id is None:
+        cache.invalidate(NS_ICP_CONFIG)
+    else:
+        cache.invalidate(NS_ICP_CONFIG, str(campaign_id))
@@ -0,0 +1,25 @@
+-- ============================================================================
+-- 20261016_abn_registry_trgm_gin.sql
+--
+-- Trigram GIN expression index for ABN name matching on abn_registry.
+--
+-- FreeEnrichment's local ABN strategies (src/pipeline/abn_name_matcher.py)
+-- AND together one `lower(legal_name) LIKE '%kw%' OR lower(trading_name) LIKE
+-- '%kw%'` per keyword and rank by pg_trgm similarity(); scripts/abn_match_sweep.py
+-- uses `lower(name) % lower($1)`. Both are only index-served by a trigram index
+-- on the lower() expressions — without it every lookup seq-scans ~2.4M rows.
+--
+-- abn_registry_trgm_gin was created by hand on production (2026-04-26); this
+-- migration records it so fresh environments get it too. IF NOT EXISTS makes it
+-- a no-op where the index is already present.
+--
+-- On a large existing table, build it outside a transaction first to avoid
+-- blocking writes:
+--   CREATE INDEX CONCURRENTLY IF NOT EXISTS abn_registry_trgm_gin ON ...
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS abn_registry_trgm_gin
+    ON public.abn_registry
+    USING gin (lower(trading_name) gin_trgm_ops, lower(legal_name) gin_trgm_ops);
@@ -0,0 +1,50 @@
+-- ============================================================================
+-- 20261016_activity_daily_rollup.sql
+--
+-- Pre-aggregated activity counts by (client, campaign, channel, action, day)
+-- for ReporterEngine campaign/client metrics.
+--
+-- activity_daily_rollup is maintained incrementally by
+-- src/services/activity_rollup_service.py (activity-rollup-flow): each refresh
+-- folds activities with watermark <= created_at < NOW() - settle lag into the
+-- rollup and advances activity_rollup_watermark in the same transaction.
+-- Readers add the raw activities past the watermark, so results are exact
+-- even when the rollup is behind; the watermark is seeded at -infinity, which
+-- makes an un-refreshed rollup degrade to the old full scan.
+--
+-- Rebuild (e.g. after a bulk activity correction):
+--   BEGIN;
+--   TRUNCATE public.activity_daily_rollup;
+--   UPDATE public.activity_rollup_watermark SET high_water = '-infinity'
+--    WHERE rollup = 'activity_daily';
+--   COMMIT;
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.activity_daily_rollup (
+    client_id       UUID NOT NULL,
+    campaign_id     UUID NOT NULL,
+    day             DATE NOT NULL,
+    channel         TEXT NOT NULL,
+    action          TEXT NOT NULL,
+    activity_count  BIGINT NOT NULL DEFAULT 0,
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (client_id, campaign_id, day, channel, action)
+);
+
+-- Campaign-scoped reads (ReporterEngine.get_campaign_metrics).
+CREATE INDEX IF NOT EXISTS idx_activity_daily_rollup_campaign_day
+    ON public.activity_daily_rollup (campaign_id, day);
+
+CREATE TABLE IF NOT EXISTS public.activity_rollup_watermark (
+    rollup      TEXT PRIMARY KEY,
+    high_water  TIMESTAMPTZ NOT NULL,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO public.activity_rollup_watermark (rollup, high_water)
+VALUES ('activity_daily', '-infinity')
+ON CONFLICT (rollup) DO NOTHING;
+
+COMMENT ON TABLE public.activity_daily_rollup IS
+    'Activity counts per client/campaign/day/channel/action, folded up to '
+    'activity_rollup_watermark.high_water. Maintained by activity-rollup-flow.';
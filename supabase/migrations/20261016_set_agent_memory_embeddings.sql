@@ -0,0 +1,19 @@
+-- RPC for bulk embedding write-back on agent_memories.
+-- Used by src/memory/organise.py backfill: one call per embedding batch instead
+-- of one PostgREST PATCH per row.
+-- rows: [{"id": "<uuid>", "embedding": [float, ...1536]}, ...]
+-- Returns the number of rows updated (ids that no longer exist are skipped).
+
+CREATE OR REPLACE FUNCTION set_agent_memory_embeddings(rows jsonb)
+RETURNS int
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE public.agent_memories am
+    SET embedding = (r->>'embedding')::vector(1536)
+    FROM jsonb_array_elements(rows) AS r
+    WHERE am.id = (r->>'id')::uuid
+    RETURNING 1
+  )
+  SELECT count(*)::int FROM updated;
+$$;
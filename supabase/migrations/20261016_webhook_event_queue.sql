@@ -0,0 +1,38 @@
+-- ============================================================================
+-- 20261016_webhook_event_queue.sql
+--
+-- Durable ingestion queue for email-provider engagement webhooks
+-- (Smartlead, Salesforge, Resend).
+--
+-- With WEBHOOK_INGEST_MODE=queue the webhook routes verify the signature,
+-- INSERT the raw payload here and return 200 immediately. The
+-- webhook-event-drain-flow (src/services/webhook_event_queue.py) claims
+-- batches with FOR UPDATE SKIP LOCKED, resolves activities with one IN
+-- query per batch, coalesces repeated opens and writes email_events.
+--
+-- A claimed row whose worker dies is re-claimable once its lease expires
+-- (claimed_at older than the drain's lease). Rows that fail max_attempts
+-- times stay unprocessed with their last error_message for inspection.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.webhook_event_queue (
+    id             BIGSERIAL PRIMARY KEY,
+    provider       TEXT NOT NULL CHECK (provider IN ('smartlead', 'salesforge', 'resend')),
+    payload        JSONB NOT NULL,
+    received_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    attempts       INT NOT NULL DEFAULT 0,
+    claimed_at     TIMESTAMPTZ,
+    processed_at   TIMESTAMPTZ,
+    outcome        TEXT,
+    error_message  TEXT
+);
+
+-- Unprocessed work index — drain claim path (oldest first).
+CREATE INDEX IF NOT EXISTS idx_webhook_event_queue_pending
+    ON public.webhook_event_queue (id)
+    WHERE processed_at IS NULL;
+
+COMMENT ON TABLE public.webhook_event_queue IS
+    'Raw email-provider webhooks awaiting batch processing. '
+    'Written by /webhooks/{smartlead,salesforge,resend}/events in queue mode; '
+    'drained by webhook-event-drain-flow.';
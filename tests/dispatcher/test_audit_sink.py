@@ -0,0 +1,283 @@
+"""Tests for the dispatcher background audit sink.
+
+Drives AuditSink with an in-memory flush_fn that can be toggled to fail, so
+batching, spill-to-JSONL, replay-on-recovery and shutdown drain are covered
+without Supabase. Also checks the interceptor/spend_tracker wiring enqueues
+instead of writing inline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+import src.dispatcher.interceptor_proxy as interceptor_proxy
+import src.dispatcher.spend_tracker as spend_tracker
+from src.dispatcher.audit_sink import AuditSink, is_permanent_error
+
+
+class _ForeignKeyViolation(Exception):
+    """asyncpg-style error carrying a Postgres SQLSTATE."""
+
+    sqlstate = "23503"
+
+
+class _Store:
+    """flush_fn stand-in: records each batch, raises while ``down``; a batch
+    containing a row with ``bad`` fails with an FK violation, like Postgres."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[dict]] = []
+        self.down = False
+
+    async def flush(self, rows: list[dict]) -> None:
+        if self.down:
+            raise ConnectionError("db unreachable")
+        if any(r.get("bad") for r in rows):
+            raise _ForeignKeyViolation("violates foreign key constraint on tenant_id")
+        self.batches.append(list(rows))
+
+    @property
+    def rows(self) -> list[dict]:
+        return [r for b in self.batches for r in b]
+
+
+def _sink(store: _Store, tmp_path: Path, **kwargs) -> AuditSink:
+    kwargs.setdefault("batch_rows", 3)
+    kwargs.setdefault("flush_interval_ms", 20)
+    kwargs.setdefault("replay_interval_s", 0.05)
+    return AuditSink("test_events", store.flush, spill_dir=tmp_path, **kwargs)
+
+
+async def _settle(seconds: float = 0.15) -> None:
+    await asyncio.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_full_batches_flush_as_multi_row_writes(tmp_path: Path) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path)
+    for i in range(7):
+        sink.enqueue({"i": i})
+    await _settle()
+    await sink.stop()
+
+    assert [r["i"] for r in store.rows] == list(range(7))
+    assert [len(b) for b in store.batches] == [3, 3, 1]
+    metrics = sink.metrics()
+    assert metrics["rows_flushed"] == 7
+    assert metrics["flushes"] == 3
+    assert metrics["queue_depth"] == 0
+    assert metrics["last_flush_ms"] is not None
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_after_interval(tmp_path: Path) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path, batch_rows=100)
+    sink.enqueue({"i": 1})
+    await _settle()
+    assert store.rows == [{"i": 1}]
+    await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_spills_and_replays_on_recovery(tmp_path: Path) -> None:
+    store = _Store()
+    store.down = True
+    sink = _sink(store, tmp_path)
+    for i in range(4):
+        sink.enqueue({"i": i})
+    await _settle()
+
+    segments = list(tmp_path.glob("test_events-*.jsonl"))
+    assert segments
+    spilled = [json.loads(line) for p in segments for line in p.read_text().splitlines()]
+    assert sorted(r["i"] for r in spilled) == [0, 1, 2, 3]
+    assert sink.metrics()["rows_spilled"] == 4
+    assert store.rows == []
+
+    store.down = False
+    await _settle()
+    await sink.stop()
+
+    assert sorted(r["i"] for r in store.rows) == [0, 1, 2, 3]
+    assert list(tmp_path.glob("test_events-*.jsonl")) == []
+    assert sink.metrics()["rows_replayed"] == 4
+
+
+def _dead_letters(tmp_path: Path) -> list[dict]:
+    path = tmp_path / "dead_letter" / "test_events.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_is_permanent_error_classifies_sqlstate() -> None:
+    assert is_permanent_error(_ForeignKeyViolation())
+    assert is_permanent_error(TypeError("not serialisable"))
+    assert not is_permanent_error(ConnectionError("reset"))
+    assert not is_permanent_error(TimeoutError())
+    serialization_failure = Exception("retry")
+    serialization_failure.code = "40001"  # type: ignore[attr-defined]
+    assert not is_permanent_error(serialization_failure)
+
+
+@pytest.mark.asyncio
+async def test_bad_row_is_dead_lettered_and_batch_retried_row_by_row(tmp_path: Path) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path)
+    sink.enqueue({"i": 0})
+    sink.enqueue({"i": 1, "bad": True})
+    sink.enqueue({"i": 2})
+    await _settle()
+    await sink.stop()
+
+    assert [r["i"] for r in store.rows] == [0, 2]
+    assert list(tmp_path.glob("test_events-*.jsonl")) == []
+    dead = _dead_letters(tmp_path)
+    assert [d["row"]["i"] for d in dead] == [1]
+    assert "_ForeignKeyViolation" in dead[0]["error"]
+    metrics = sink.metrics()
+    assert metrics["rows_spilled"] == 0
+    assert metrics["rows_dead_lettered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bad_spilled_row_does_not_block_later_segments(tmp_path: Path) -> None:
+    store = _Store()
+    store.down = True
+    sink = _sink(store, tmp_path, replay_interval_s=60)
+    await sink._flush([{"i": 0}, {"i": 1, "bad": True}, {"i": 2}])
+    await sink._flush([{"i": 3}])
+    await sink._flush([{"i": 4}, {"i": 5}])
+    assert len(list(tmp_path.glob("test_events-*.jsonl"))) == 3
+    (tmp_path / "test_events-00000000000000000000-000000.jsonl").write_text("{not json\n")
+
+    store.down = False
+    await sink._replay()
+
+    assert sorted(r["i"] for r in store.rows) == [0, 2, 3, 4, 5]
+    assert list(tmp_path.glob("test_events-*.jsonl")) == []
+    dead = _dead_letters(tmp_path)
+    assert [d["row"] for d in dead] == ["{not json", {"i": 1, "bad": True}]
+    assert sink.metrics()["rows_replayed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_mid_replay_keeps_unsent_remainder(tmp_path: Path) -> None:
+    store = _Store()
+    store.down = True
+    sink = _sink(store, tmp_path, batch_rows=2, replay_interval_s=60)
+    await sink._flush([{"i": 0}, {"i": 1}])
+    await sink._flush([{"i": 2}])
+    first, second = sorted(tmp_path.glob("test_events-*.jsonl"))
+    first.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(4)))
+
+    calls = 0
+    real_flush = store.flush
+
+    async def _flaky(rows: list[dict]) -> None:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise ConnectionError("db went away")
+        await real_flush(rows)
+
+    sink._flush_fn = _flaky
+    store.down = False
+    await sink._replay()
+
+    assert [r["i"] for r in store.rows] == [0, 1]
+    assert [json.loads(line)["i"] for line in first.read_text().splitlines()] == [2, 3]
+    assert second.exists()
+    assert _dead_letters(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_queue_overflow_spills_instead_of_dropping(tmp_path: Path) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path, max_queue=2)
+    # No running worker between these calls — the third row overflows.
+    sink._queue.put_nowait({"i": 0})
+    sink._queue.put_nowait({"i": 1})
+    sink.enqueue({"i": 2})
+    assert sink.metrics()["rows_spilled"] == 1
+    await _settle()
+    await sink.stop()
+    assert sorted(r["i"] for r in store.rows) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stop_spills_buffered_rows_when_db_down(tmp_path: Path) -> None:
+    store = _Store()
+    store.down = True
+    sink = _sink(store, tmp_path, batch_rows=100, flush_interval_ms=10_000)
+    for i in range(5):
+        sink.enqueue({"i": i})
+    await sink.stop()
+
+    spilled = [
+        json.loads(line)
+        for p in tmp_path.glob("test_events-*.jsonl")
+        for line in p.read_text().splitlines()
+    ]
+    assert sorted(r["i"] for r in spilled) == [0, 1, 2, 3, 4]
+
+    # A fresh sink (next process) replays them on start.
+    store.down = False
+    revived = _sink(store, tmp_path)
+    revived.start()
+    await _settle()
+    await revived.stop()
+    assert sorted(r["i"] for r in store.rows) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_interceptor_log_event_enqueues_without_insert_fn(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path)
+    monkeypatch.setattr(interceptor_proxy, "_events_sink", sink)
+
+    await interceptor_proxy._log_event("tenant-1", "allow", None, "m", 1, 2, 3, 4)
+    await sink.stop()
+
+    assert len(store.rows) == 1
+    row = store.rows[0]
+    assert row["decision"] == "allow"
+    assert row["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_spend_row_enqueues_when_dsn_set(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path)
+    monkeypatch.setattr(spend_tracker, "_spend_sink", sink)
+    monkeypatch.setenv(spend_tracker.SUPABASE_DSN_ENV, "postgresql://localhost/x")
+
+    ok = await spend_tracker._write_spend_row(7, "elliot", "m", 10, 5, 12, {"k": "v"})
+    await sink.stop()
+
+    assert ok is True
+    assert store.rows[0]["tenant_id"] == 7
+    assert store.rows[0]["metadata"] == {"k": "v"}
+
+
+@pytest.mark.asyncio
+async def test_spend_row_skipped_when_dsn_unset(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    store = _Store()
+    sink = _sink(store, tmp_path)
+    monkeypatch.setattr(spend_tracker, "_spend_sink", sink)
+    monkeypatch.delenv(spend_tracker.SUPABASE_DSN_ENV, raising=False)
+
+    assert await spend_tracker._write_spend_row(7, "elliot", "m", 10, 5, 12, {}) is False
+    assert sink.metrics()["rows_enqueued"] == 0
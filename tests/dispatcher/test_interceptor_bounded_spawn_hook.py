@@ -4,7 +4,7 @@ Covers the per-model-call gate in src.dispatcher.interceptor_proxy that consults
 the BoundedSpawnEnforcer via the injected accessor. Body must carry both
 ``bounded_spawn_callsign`` and ``bounded_spawn_task_id`` for the gate to fire.
 
-Borrows the FakeValkey stub pattern from test_interceptor_proxy.py.
+Borrows the fakeredis Valkey fixture pattern from test_interceptor_proxy.py.
 """
 
 from __future__ import annotations
@@ -13,40 +13,17 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
+from fakeredis import aioredis
 
 import src.dispatcher.interceptor_proxy as ip
 from src.dispatcher.bounded_spawn_enforcer import BoundedSpawnEnforcer
 
 
-class _FakeValkey:
-    """Minimal in-memory async stub matching the subset of redis we touch."""
-
-    def __init__(self) -> None:
-        self.store: dict[str, int] = {}
-
-    async def get(self, key: str) -> str | None:
-        v = self.store.get(key)
-        return str(v) if v is not None else None
-
-    async def incr(self, key: str) -> int:
-        self.store[key] = self.store.get(key, 0) + 1
-        return self.store[key]
-
-    async def incrby(self, key: str, amount: int) -> int:
-        self.store[key] = self.store.get(key, 0) + amount
-        return self.store[key]
-
-    async def expire(self, key: str, _ttl: int) -> bool:
-        return True
-
-    async def aclose(self) -> None:
-        return None
-
-
 @pytest.fixture
-def fake_valkey(monkeypatch: pytest.MonkeyPatch) -> _FakeValkey:
-    fake = _FakeValkey()
+def fake_valkey(monkeypatch: pytest.MonkeyPatch) -> aioredis.FakeRedis:
+    fake = aioredis.FakeRedis(decode_responses=True)
     monkeypatch.setattr(ip, "get_valkey_client", lambda: fake)
+    monkeypatch.setattr(ip, "_valkey_client", None)
     return fake
 
 
@@ -82,7 +59,7 @@ async def _no_insert(_row: dict) -> None:
 
 
 @pytest.mark.asyncio
-async def test_no_accessor_means_hook_is_noop(fake_valkey: _FakeValkey) -> None:
+async def test_no_accessor_means_hook_is_noop(fake_valkey: aioredis.FakeRedis) -> None:
     ip.set_bounded_spawn_enforcer_accessor(None)
     body = _valid_body(bounded_spawn_callsign="orion", bounded_spawn_task_id="t-different")
     decision = await ip.intercept_request(body, forward_fn=_fake_forward, insert_fn=_no_insert)
@@ -95,7 +72,7 @@ async def test_no_accessor_means_hook_is_noop(fake_valkey: _FakeValkey) -> None:
 
 @pytest.mark.asyncio
 async def test_missing_metadata_means_hook_is_noop(
-    fake_valkey: _FakeValkey, tmp_path: Path
+    fake_valkey: aioredis.FakeRedis, tmp_path: Path
 ) -> None:
     enforcer = _make_enforcer(tmp_path)
     enforcer.record_spawn(key="k1", callsign="orion", task_id="t-current", backend="tmux")
@@ -114,7 +91,7 @@ async def test_missing_metadata_means_hook_is_noop(
 
 
 @pytest.mark.asyncio
-async def test_matching_metadata_allows(fake_valkey: _FakeValkey, tmp_path: Path) -> None:
+async def test_matching_metadata_allows(fake_valkey: aioredis.FakeRedis, tmp_path: Path) -> None:
     enforcer = _make_enforcer(tmp_path)
     enforcer.record_spawn(key="k1", callsign="orion", task_id="t-current", backend="tmux")
     ip.set_bounded_spawn_enforcer_accessor(lambda: enforcer)
@@ -131,7 +108,9 @@ async def test_matching_metadata_allows(fake_valkey: _FakeValkey, tmp_path: Path
 
 
 @pytest.mark.asyncio
-async def test_mismatched_task_id_returns_409(fake_valkey: _FakeValkey, tmp_path: Path) -> None:
+async def test_mismatched_task_id_returns_409(
+    fake_valkey: aioredis.FakeRedis, tmp_path: Path
+) -> None:
     enforcer = _make_enforcer(tmp_path)
     enforcer.record_spawn(key="k1", callsign="orion", task_id="t-current", backend="tmux")
     ip.set_bounded_spawn_enforcer_accessor(lambda: enforcer)
@@ -160,7 +139,7 @@ async def test_mismatched_task_id_returns_409(fake_valkey: _FakeValkey, tmp_path
 
 
 @pytest.mark.asyncio
-async def test_accessor_raising_fails_open(fake_valkey: _FakeValkey) -> None:
+async def test_accessor_raising_fails_open(fake_valkey: aioredis.FakeRedis) -> None:
     def _bad_accessor() -> object:
         raise RuntimeError("synthetic accessor failure")
 
@@ -44,14 +44,10 @@ def _patch_pipeline_pass_through(monkeypatch: pytest.MonkeyPatch) -> None:
         lambda body: governance_proxy.ProxyDecision(allowed=True, reason=None),
     )
 
-    async def _spend_ok(*_args: Any, **_kwargs: Any) -> tuple[bool, int]:
-        return True, 0
+    async def _gate_ok(*_args: Any, **_kwargs: Any) -> interceptor_proxy.GateCheck:
+        return interceptor_proxy.GateCheck(spend_ok=True, spent_cents=0, rate_ok=True, count=1)
 
-    async def _rate_ok(*_args: Any, **_kwargs: Any) -> tuple[bool, int]:
-        return True, 0
-
-    monkeypatch.setattr(interceptor_proxy, "_check_spend_budget", _spend_ok)
-    monkeypatch.setattr(interceptor_proxy, "_check_rate_limit", _rate_ok)
+    monkeypatch.setattr(interceptor_proxy, "_check_gate", _gate_ok)
 
 
 # ----- disabled fail-open -----
@@ -1,15 +1,18 @@
 """Tests for KEI-210 interceptor_proxy.
 
-Mocks Valkey via a stub async client + injects forward/insert hooks so the
-unit suite needs neither a live Valkey, a live LiteLLM, nor a Supabase
-session. Covers the four decision branches (allow / deny_spend /
-deny_rate_limit / deny_governance), the error path, the health endpoint,
-and the Valkey key-shape contract.
+Mocks Valkey via fakeredis (which runs the gate's Lua script) + injects
+forward/insert hooks so the unit suite needs neither a live Valkey, a live
+LiteLLM, nor a Supabase session. Covers the four decision branches (allow /
+deny_spend / deny_rate_limit / deny_governance), the error path, the health
+endpoint, the Valkey key-shape contract, the single-round-trip gate and the
+shared LiteLLM client.
 """
 
 from __future__ import annotations
 
+import httpx
 import pytest
+from fakeredis import aioredis
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -25,40 +28,23 @@ from src.dispatcher.interceptor_proxy import (
 # ─── Fake Valkey ─────────────────────────────────────────────────────────────
 
 
-class FakeValkey:
-    """In-memory async stub matching the subset of redis.asyncio we touch."""
+class FakeValkey(aioredis.FakeRedis):
+    """fakeredis client that counts server round trips per command."""
 
-    def __init__(self, *, spend: dict[str, int] | None = None) -> None:
-        self.store: dict[str, int] = {}
-        self.expires: dict[str, int] = {}
-        if spend:
-            self.store.update(spend)
-        self.closed = False
+    def __init__(self, **kwargs) -> None:
+        super().__init__(decode_responses=True, **kwargs)
+        self.commands: list[str] = []
 
-    async def get(self, key: str) -> str | None:
-        v = self.store.get(key)
-        return str(v) if v is not None else None
-
-    async def incr(self, key: str) -> int:
-        self.store[key] = self.store.get(key, 0) + 1
-        return self.store[key]
-
-    async def incrby(self, key: str, amount: int) -> int:
-        self.store[key] = self.store.get(key, 0) + amount
-        return self.store[key]
-
-    async def expire(self, key: str, ttl: int) -> bool:
-        self.expires[key] = ttl
-        return True
-
-    async def aclose(self) -> None:
-        self.closed = True
+    async def execute_command(self, *args, **options):
+        self.commands.append(str(args[0]).upper())
+        return await super().execute_command(*args, **options)
 
 
 @pytest.fixture
 def fake_valkey(monkeypatch: pytest.MonkeyPatch) -> FakeValkey:
     fake = FakeValkey()
     monkeypatch.setattr(interceptor_proxy, "get_valkey_client", lambda: fake)
+    monkeypatch.setattr(interceptor_proxy, "_valkey_client", None)
     return fake
 
 
@@ -135,7 +121,7 @@ async def test_deny_spend_when_budget_exhausted(fake_valkey: FakeValkey) -> None
     tenant_id = VALID_BODY["tenant_id"]
     # Pre-populate spend over the starter budget
     over_budget = SPEND_BUDGET_AUD_CENTS["starter"] + 1
-    fake_valkey.store[interceptor_proxy._spend_key(tenant_id)] = over_budget
+    await fake_valkey.set(interceptor_proxy._spend_key(tenant_id), over_budget)
     inserted: list[dict] = []
 
     async def fake_insert(row: dict) -> None:
@@ -195,7 +181,7 @@ async def test_deny_governance_skips_spend_and_rate(fake_valkey: FakeValkey) ->
     assert decision.decision == "deny_governance"
     assert decision.status_code == 403
     # No spend/rate buckets should have been touched
-    assert fake_valkey.store == {}
+    assert await fake_valkey.keys() == []
 
 
 @pytest.mark.asyncio
@@ -229,7 +215,7 @@ async def test_rate_limit_uses_kei117_namespace(fake_valkey: FakeValkey) -> None
 
     await intercept_request(VALID_BODY, forward_fn=fake_forward, insert_fn=fake_insert)
     # Exactly one rl:<tenant>:<bucket> key must exist
-    rl_keys = [k for k in fake_valkey.store if k.startswith("rl:")]
+    rl_keys = await fake_valkey.keys("rl:*")
     assert len(rl_keys) == 1
     parts = rl_keys[0].split(":")
     assert parts[0] == "rl"
@@ -248,6 +234,94 @@ async def test_spend_key_uses_monthly_bucket(fake_valkey: FakeValkey) -> None:
     assert suffix[4] == "-"
 
 
+# ─── Gate round trips + shared clients ──────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_gate_is_one_round_trip_per_request(fake_valkey: FakeValkey) -> None:
+    """Spend read + rate INCR/EXPIRE ride a single EVAL; accrue is one INCRBY."""
+
+    async def fake_insert(row: dict) -> None: ...
+
+    async def fake_forward(body: dict) -> dict:
+        return {"cost_cents_aud": 5}
+
+    await intercept_request(VALID_BODY, forward_fn=fake_forward, insert_fn=fake_insert)
+    assert fake_valkey.commands == ["EVAL", "INCRBY"]
+    rl_key = (await fake_valkey.keys("rl:*"))[0]
+    assert 0 < await fake_valkey.ttl(rl_key) <= interceptor_proxy.RATE_WINDOW_SECONDS
+    assert await fake_valkey.get(interceptor_proxy._spend_key(VALID_BODY["tenant_id"])) == "5"
+
+
+@pytest.mark.asyncio
+async def test_spend_denial_does_not_consume_rate_budget(fake_valkey: FakeValkey) -> None:
+    tenant_id = VALID_BODY["tenant_id"]
+    await fake_valkey.set(
+        interceptor_proxy._spend_key(tenant_id), SPEND_BUDGET_AUD_CENTS["starter"]
+    )
+
+    async def fake_insert(row: dict) -> None: ...
+
+    async def fake_forward(body: dict) -> dict:
+        return {}
+
+    decision = await intercept_request(VALID_BODY, forward_fn=fake_forward, insert_fn=fake_insert)
+    assert decision.decision == "deny_spend"
+    assert await fake_valkey.keys("rl:*") == []
+
+
+@pytest.mark.asyncio
+async def test_zero_rate_limit_tier_denies_on_rate(fake_valkey: FakeValkey, monkeypatch) -> None:
+    monkeypatch.setitem(RATE_LIMIT_PER_MINUTE, "starter", 0)
+    gate = await interceptor_proxy._check_gate(VALID_BODY["tenant_id"], "starter")
+    assert gate.spend_ok is True
+    assert gate.rate_ok is False
+
+
+@pytest.mark.asyncio
+async def test_gate_client_is_reused_across_requests(
+    fake_valkey: FakeValkey, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    minted: list[FakeValkey] = []
+
+    def factory() -> FakeValkey:
+        minted.append(fake_valkey)
+        return fake_valkey
+
+    monkeypatch.setattr(interceptor_proxy, "get_valkey_client", factory)
+    for _ in range(3):
+        await interceptor_proxy._check_gate(VALID_BODY["tenant_id"], "starter")
+    assert len(minted) == 1
+
+
+@pytest.mark.asyncio
+async def test_forward_reuses_shared_http_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, json={"id": "r"})
+
+    monkeypatch.setattr(interceptor_proxy, "_http_client", None)
+    monkeypatch.setattr(
+        interceptor_proxy,
+        "_new_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    await interceptor_proxy.open_clients()
+    client = interceptor_proxy._http_client
+    assert client is not None
+    assert await interceptor_proxy._forward_to_litellm({"a": 1}) == {"id": "r"}
+    assert await interceptor_proxy._forward_to_litellm({"a": 2}) == {"id": "r"}
+    assert interceptor_proxy._http_client is client
+    assert client.is_closed is False
+    assert len(seen) == 2
+
+    await interceptor_proxy.close_clients()
+    assert client.is_closed is True
+    assert interceptor_proxy._http_client is None
+
+
 # ─── Decision dataclass shape ────────────────────────────────────────────────
 
 
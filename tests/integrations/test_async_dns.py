@@ -0,0 +1,135 @@
+"""Tests for the shared async DNS resolver (src/integrations/async_dns.py).
+
+The network hook ``_query`` is replaced by a counting fake, so caching,
+negative caching, TTL expiry, batch dedup and concurrency bounds are checked
+without real DNS.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import dns.exception
+import dns.resolver
+import pytest
+
+from src.integrations import async_dns
+from src.integrations.async_dns import AsyncDNSResolver, stats_delta
+
+
+class _FakeDNS:
+    """_query stand-in: answers from a zone dict, counts calls and concurrency."""
+
+    def __init__(self, zone: dict, delay: float = 0.0) -> None:
+        self.zone = zone
+        self.delay = delay
+        self.calls: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query(self, name: str, rdtype: str):
+        self.calls.append((name, rdtype))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            value = self.zone.get((name, rdtype), dns.resolver.NXDOMAIN)
+            if isinstance(value, type) and issubclass(value, Exception):
+                raise value
+            return value
+        finally:
+            self.in_flight -= 1
+
+
+def _resolver(fake: _FakeDNS, **kwargs) -> AsyncDNSResolver:
+    resolver = AsyncDNSResolver(**kwargs)
+    resolver._query = fake.query
+    return resolver
+
+
+@pytest.mark.asyncio
+async def test_positive_answers_are_cached_and_count_as_avoided():
+    fake = _FakeDNS({("acme.com.au", "MX"): (("aspmx.l.google.com",), 300)})
+    resolver = _resolver(fake)
+
+    first = await resolver.resolve("acme.com.au", "MX")
+    second = await resolver.resolve("ACME.com.au.", "mx")
+
+    assert first.ok and first.records == ("aspmx.l.google.com",)
+    assert second is first
+    assert fake.calls == [("acme.com.au", "MX")]
+    stats = resolver.stats()
+    assert stats["lookups"] == 2
+    assert stats["cache_hits"] == 1
+    assert stats["network_lookups"] == 1
+    assert stats["latency_saved_ms"] == round(first.lookup_ms, 1)
+
+
+@pytest.mark.asyncio
+async def test_nxdomain_is_negatively_cached_but_errors_are_not():
+    fake = _FakeDNS({("flaky.com.au", "A"): dns.exception.Timeout})
+    resolver = _resolver(fake)
+
+    assert (await resolver.resolve("dead.com.au", "A")).status == "nxdomain"
+    assert (await resolver.resolve("dead.com.au", "A")).status == "nxdomain"
+    assert (await resolver.resolve("flaky.com.au", "A")).status == "error"
+    assert (await resolver.resolve("flaky.com.au", "A")).status == "error"
+
+    assert fake.calls.count(("dead.com.au", "A")) == 1
+    assert fake.calls.count(("flaky.com.au", "A")) == 2
+    assert resolver.stats()["negative_hits"] == 1
+    assert resolver.stats()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_record_ttl():
+    fake = _FakeDNS({("acme.com.au", "A"): (("1.2.3.4",), 60)})
+    resolver = _resolver(fake)
+    await resolver.resolve("acme.com.au", "A")
+
+    now = async_dns.time.monotonic()
+    with patch.object(async_dns.time, "monotonic", return_value=now + 61):
+        await resolver.resolve("acme.com.au", "A")
+
+    assert len(fake.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_dedups_and_bounds_concurrency():
+    zone = {(f"d{i}.com.au", "A"): ((f"10.0.0.{i}",), 300) for i in range(20)}
+    fake = _FakeDNS(zone, delay=0.01)
+    resolver = _resolver(fake, max_concurrency=4)
+
+    queries = [(f"d{i % 20}.com.au", "A") for i in range(40)]
+    answers = await resolver.resolve_many(queries)
+
+    assert [a.records[0] for a in answers] == [f"10.0.0.{i % 20}" for i in range(40)]
+    assert len(fake.calls) == 20
+    assert fake.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_has_address_falls_back_to_aaaa_but_not_after_nxdomain():
+    fake = _FakeDNS(
+        {
+            ("v6only.com.au", "A"): dns.resolver.NoAnswer,
+            ("v6only.com.au", "AAAA"): (("2001:db8::1",), 300),
+        }
+    )
+    resolver = _resolver(fake)
+
+    assert await resolver.has_address("v6only.com.au") is True
+    assert await resolver.has_address("dead.com.au") is False
+    assert ("dead.com.au", "AAAA") not in fake.calls
+
+
+def test_stats_delta_reports_per_run_counters():
+    before = {"lookups": 10, "cache_hits": 4, "latency_saved_ms": 12.5, "cached_entries": 8}
+    after = {"lookups": 25, "cache_hits": 14, "latency_saved_ms": 40.0, "cached_entries": 11}
+    assert stats_delta(before, after) == {
+        "lookups": 15,
+        "cache_hits": 10,
+        "latency_saved_ms": 27.5,
+        "cached_entries": 11,
+    }
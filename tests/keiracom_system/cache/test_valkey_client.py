@@ -5,15 +5,20 @@ Covers:
   - cross-tenant isolation (key namespace prefix per tenant_id)
   - _enforce_tenant_prefix() rejects wrong-tenant + missing-prefix keys
   - metric emission on get() hit/miss
-  - canonical_cache_key() with vs without query_text (embedding bucket)
+  - canonical_cache_key() with vs without query_text (exact query hash)
+  - LSH bucket locality + multi-probe semantic lookup + similarity guard
 
 DI fakes — no live Redis, no live TEI sidecar.
 """
 
+import json
+import math
+import random
 from typing import Any
 
 import pytest
 
+from src.keiracom_system.cache import semantic_lsh
 from src.keiracom_system.cache.valkey_client import (
     OUTCOME_HIT,
     OUTCOME_MISS,
@@ -33,6 +38,9 @@ class _FakeRedis:
     def get(self, key: str) -> bytes | None:
         return self.store.get(key)
 
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.store.get(k) for k in keys]
+
     def set(self, key: str, value: str | bytes) -> None:
         self.set_calls.append((key, value))
         self.store[key] = value if isinstance(value, bytes) else value.encode("utf-8")
@@ -85,11 +93,15 @@ def test_canonical_cache_key_args_order_stable():
     assert k1 == k2
 
 
-def test_canonical_cache_key_includes_bucket_with_query_text():
+def test_canonical_cache_key_includes_exact_query_hash_with_query_text():
     client = ValkeyClient(redis_client=_FakeRedis(), tei_client=_fake_tei(), tenant_id="t1")
     k = client.canonical_cache_key(tool_name="search", args={}, query_text="hello world")
-    assert ":b" in k
+    assert ":q" in k and ":b" not in k
     assert k.startswith("v1:t1:search:")
+    assert k == client.canonical_cache_key(tool_name="search", args={}, query_text="hello world")
+    # _fake_tei embeds every text to the same vector, i.e. the same LSH bucket;
+    # the plain-get key must still tell the two queries apart.
+    assert k != client.canonical_cache_key(tool_name="search", args={}, query_text="hello there")
 
 
 def test_cross_tenant_keys_differ_for_same_inputs():
@@ -208,3 +220,123 @@ def test_quantise_to_bucket_deterministic():
     assert client._quantise_to_bucket(embedding, num_buckets=4096) == client._quantise_to_bucket(
         embedding, num_buckets=4096
     )
+
+
+# ---------------------------------------------------------------------------
+# LSH semantic bucket + multi-probe lookup
+# ---------------------------------------------------------------------------
+
+
+def _unit(vec: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vec))
+    return [x / norm for x in vec]
+
+
+def _near(base: list[float], noise: float, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    return _unit([x + rng.gauss(0.0, noise) for x in base])
+
+
+def _table_tei(table: dict[str, list[float]]) -> TEIClient:
+    def fake_post(url: str, payload: dict[str, Any], timeout: float) -> _HTTPResponse:
+        return _HTTPResponse(200, json.dumps([table[t] for t in payload["inputs"]]).encode())
+
+    def fake_get(url: str, timeout: float) -> _HTTPResponse:
+        return _HTTPResponse(200, b'{"status":"ok"}')
+
+    return TEIClient(http_get=fake_get, http_post=fake_post)
+
+
+_BASE = _unit([random.Random(1).gauss(0.0, 1.0) for _ in range(384)])
+
+
+def test_quantise_to_bucket_is_scale_invariant():
+    """Sign projections ignore magnitude — a normalised and raw vector share a bucket."""
+    assert ValkeyClient._quantise_to_bucket(_BASE) == ValkeyClient._quantise_to_bucket(
+        [x * 7.5 for x in _BASE]
+    )
+
+
+def test_near_duplicates_land_in_bucket_or_probe_set():
+    """Near-duplicate embeddings (cosine > 0.99) are reachable by multi-probe."""
+    bucket, margins = semantic_lsh.bucket_signature(_BASE)
+    reachable = {bucket, *semantic_lsh.probe_buckets(bucket, margins)}
+    found = 0
+    for seed in range(20):
+        near = _near(_BASE, 0.004, seed)
+        assert semantic_lsh.cosine(_BASE, near) > 0.99
+        found += semantic_lsh.bucket_signature(near)[0] in reachable
+    assert found >= 18
+
+
+def test_semantic_key_is_separate_from_canonical_key_and_probes_stay_in_tenant():
+    client = ValkeyClient(
+        redis_client=_FakeRedis(), tei_client=_table_tei({"q": _BASE}), tenant_id="t1"
+    )
+    skey = client.semantic_cache_key(tool_name="search", args={"a": 1}, query_text="q")
+    assert skey.key.startswith("v1:t1:search:") and ":b" in skey.key
+    assert skey.key != client.canonical_cache_key(tool_name="search", args={"a": 1}, query_text="q")
+    assert len(skey.probe_keys) == len(set(skey.probe_keys)) > 0
+    assert skey.key not in skey.probe_keys
+    assert all(k.startswith("v1:t1:search:") for k in skey.probe_keys)
+
+
+def test_get_semantic_hits_near_duplicate_query_from_another_agent():
+    """Agent #1 writes; agent #2 with a reworded query reads it via bucket/probe."""
+    redis_fake = _FakeRedis()
+    table = {"list hubspot companies": _BASE, "show hubspot companies": _near(_BASE, 0.004, 3)}
+    writer = ValkeyClient(redis_client=redis_fake, tei_client=_table_tei(table), tenant_id="t1")
+    reader = ValkeyClient(redis_client=redis_fake, tei_client=_table_tei(table), tenant_id="t1")
+    wkey = writer.semantic_cache_key(
+        tool_name="hubspot", args={}, query_text="list hubspot companies"
+    )
+    writer.set_semantic(wkey, "result-json", ttl_seconds=60)
+    rkey = reader.semantic_cache_key(
+        tool_name="hubspot", args={}, query_text="show hubspot companies"
+    )
+    assert reader.get_semantic(rkey) == b"result-json"
+
+
+def test_get_semantic_guard_rejects_dissimilar_entry_in_same_bucket():
+    """A bucket collision with an unrelated query must not be served."""
+    redis_fake = _FakeRedis()
+    client = ValkeyClient(
+        redis_client=redis_fake, tei_client=_table_tei({"q": _BASE}), tenant_id="t1"
+    )
+    skey = client.semantic_cache_key(tool_name="search", args={}, query_text="q")
+    # Plant an entry written by an unrelated query directly under the key.
+    other = _unit([random.Random(99).gauss(0.0, 1.0) for _ in range(384)])
+    redis_fake.store[skey.key] = semantic_lsh.pack_entry(other, b"wrong")
+    assert client.get_semantic(skey) is None
+    redis_fake.store[skey.key] = semantic_lsh.pack_entry(_BASE, b"right")
+    assert client.get_semantic(skey) == b"right"
+
+
+def test_plain_get_never_serves_a_bucket_collision():
+    """Only get_semantic() reads bucket keys; canonical keys never alias them."""
+    redis_fake = _FakeRedis()
+    other = _unit([random.Random(99).gauss(0.0, 1.0) for _ in range(384)])
+    client = ValkeyClient(
+        redis_client=redis_fake, tei_client=_table_tei({"q": _BASE}), tenant_id="t1"
+    )
+    skey = client.semantic_cache_key(tool_name="search", args={}, query_text="q")
+    # An unrelated query's result sitting in this query's LSH bucket.
+    redis_fake.store[skey.key] = semantic_lsh.pack_entry(other, b"wrong")
+    key = client.canonical_cache_key(tool_name="search", args={}, query_text="q")
+    assert client.get(key) is None
+    assert client.get_semantic(skey) is None
+
+
+def test_get_semantic_ignores_values_without_envelope_and_emits_miss():
+    redis_fake = _FakeRedis()
+    captured: list[tuple[str, dict[str, str]]] = []
+    client = ValkeyClient(
+        redis_client=redis_fake,
+        tei_client=_table_tei({"q": _BASE}),
+        tenant_id="t1",
+        metric_emitter=lambda name, tags: captured.append((name, tags)),
+    )
+    skey = client.semantic_cache_key(tool_name="search", args={}, query_text="q")
+    redis_fake.store[skey.key] = b"legacy-plain-value"
+    assert client.get_semantic(skey, tool_name="search") is None
+    assert captured[-1][1]["outcome"] == OUTCOME_MISS
@@ -0,0 +1,258 @@
+"""Tests for src/keiracom_system/embeddings/embedding_service.py.
+
+Unit tests only — TEIClient gets an injected http_post that computes
+deterministic vectors from the input text, so no TEI sidecar is needed.
+Covers: coalescing of concurrent single-text embeds, in-flight dedup,
+LRU memo + eviction, float32 output, shared (ValkeyClient) cache round trip,
+error propagation to every waiter (incl. short TEI responses), worker restart
+and the bounded result wait.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.keiracom_system.embeddings.embedding_service import EmbeddingService  # noqa: E402
+from src.keiracom_system.embeddings.tei_client import (  # noqa: E402
+    TEIClient,
+    TEIClientError,
+    _HTTPResponse,
+)
+
+DIM = 4
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 0.5, 1.0 / 3.0]
+
+
+class _FakeTEI:
+    """http_post stub: records each /embed batch; optionally fails."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[str]] = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, payload: dict, timeout: float) -> _HTTPResponse:
+        with self._lock:
+            self.batches.append(list(payload["inputs"]))
+        if self.fail:
+            return _HTTPResponse(status_code=503, body=b"overloaded")
+        body = json.dumps([_vector(t) for t in payload["inputs"]]).encode("utf-8")
+        return _HTTPResponse(status_code=200, body=body)
+
+
+class _ShortClient:
+    """TEIClient stand-in whose embed() can drop the last vector of a batch."""
+
+    dimension = DIM
+
+    def __init__(self):
+        self.drop_last = True
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        vectors = [_vector(t) for t in texts]
+        return vectors[:-1] if self.drop_last else vectors
+
+
+class _MemoryValkey:
+    """In-memory stand-in for the ValkeyClient methods EmbeddingService uses."""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    def canonical_cache_key(self, *, tool_name, args, query_text=None):
+        return f"keiracom:t1:{tool_name}:{args['model']}:{args['sha256']}"
+
+    def get(self, key, *, tool_name=None):
+        return self.store.get(key)
+
+    def set(self, key, value, *, ttl_seconds=0):
+        self.store[key] = value
+
+
+def _service(tei: _FakeTEI, **kwargs) -> EmbeddingService:
+    client = TEIClient(base_url="http://test", http_post=tei, expected_dim=DIM)
+    return EmbeddingService(client, **kwargs)
+
+
+def test_concurrent_single_text_embeds_are_coalesced():
+    tei = _FakeTEI()
+    service = _service(tei, window_ms=100, max_batch=64)
+    texts = [f"query {i}" for i in range(16)] + ["query 0"]
+    results: dict[int, np.ndarray] = {}
+    barrier = threading.Barrier(len(texts))
+
+    def _worker(i: int) -> None:
+        barrier.wait()
+        results[i] = service.embed_array([texts[i]])[0]
+
+    threads = [threading.Thread(target=_worker, args=(i,)) for i in range(len(texts))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    service.close()
+
+    assert len(tei.batches) < 4
+    assert sum(len(b) for b in tei.batches) == 16  # duplicate "query 0" embedded once
+    for i, text in enumerate(texts):
+        assert results[i].dtype == np.float32
+        np.testing.assert_allclose(results[i], _vector(text), rtol=1e-6)
+
+
+def test_embed_array_shape_dtype_and_lru_memo():
+    tei = _FakeTEI()
+    service = _service(tei, window_ms=0)
+
+    first = service.embed_array(["a", "bb", "a"])
+    again = service.embed_array(["bb"])
+    service.close()
+
+    assert first.shape == (3, DIM) and first.dtype == np.float32
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(again[0], first[1])
+    assert sum(len(b) for b in tei.batches) == 2
+    stats = service.stats()
+    assert stats["lru_hits"] == 1 and stats["tei_texts"] == 2
+    assert service.embed_array([]).shape == (0, DIM)
+
+
+def test_lru_evicts_least_recently_used():
+    tei = _FakeTEI()
+    service = _service(tei, window_ms=0, cache_size=2)
+
+    service.embed(["a"])
+    service.embed(["b"])
+    service.embed(["a"])  # touch: b is now least recently used
+    service.embed(["c"])
+    service.embed(["a"])
+    service.embed(["b"])
+    service.close()
+
+    assert [b[0] for b in tei.batches] == ["a", "b", "c", "b"]
+
+
+def test_embed_is_a_tei_client_drop_in():
+    tei = _FakeTEI()
+    service = _service(tei, window_ms=0)
+
+    vectors = service.embed(["hello"])
+    service.close()
+
+    assert isinstance(vectors, list) and isinstance(vectors[0][0], float)
+    assert len(vectors[0]) == service.dimension == DIM
+
+
+def test_shared_cache_round_trip_across_services():
+    shared = _MemoryValkey()
+    tei = _FakeTEI()
+    writer = _service(tei, window_ms=0, shared_cache=shared)
+    writer.embed_array(["shared text"])
+    writer.close()
+
+    reader = _service(tei, window_ms=0, shared_cache=shared)
+    vector = reader.embed_array(["shared text"])[0]
+    reader.close()
+
+    assert len(tei.batches) == 1
+    assert reader.stats()["shared_hits"] == 1
+    np.testing.assert_allclose(vector, _vector("shared text"), rtol=1e-6)
+
+
+def test_tei_failure_raises_for_every_waiter_and_is_not_cached():
+    tei = _FakeTEI(fail=True)
+    service = _service(tei, window_ms=50)
+    errors: list[Exception] = []
+    barrier = threading.Barrier(3)
+
+    def _worker(text: str) -> None:
+        barrier.wait()
+        try:
+            service.embed_array([text])
+        except TEIClientError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker, args=(t,)) for t in ("x", "y", "z")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+    tei.fail = False
+    assert service.embed_array(["x"]).shape == (1, DIM)
+    service.close()
+    assert service.stats()["lru_size"] == 1
+
+
+def test_short_tei_response_fails_every_waiter_and_worker_recovers():
+    client = _ShortClient()
+    service = EmbeddingService(client, window_ms=50, result_timeout_seconds=5)
+    errors: list[Exception] = []
+    barrier = threading.Barrier(3)
+
+    def _worker(text: str) -> None:
+        barrier.wait()
+        try:
+            service.embed_array([text])
+        except TEIClientError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker, args=(t,)) for t in ("x", "y", "z")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert not any(t.is_alive() for t in threads)
+    assert len(errors) == 3
+    client.drop_last = False
+    np.testing.assert_allclose(service.embed_array(["x"])[0], _vector("x"), rtol=1e-6)
+    service.close()
+
+
+def test_dead_worker_is_restarted():
+    tei = _FakeTEI()
+    service = _service(tei, window_ms=0)
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    service._worker = dead  # a coalescer thread that has exited
+
+    np.testing.assert_allclose(service.embed_array(["after"])[0], _vector("after"), rtol=1e-6)
+    assert service._worker is not dead
+    service.close()
+
+
+def test_result_wait_is_bounded():
+    release = threading.Event()
+    tei = _FakeTEI()
+
+    def _slow_post(url: str, payload: dict, timeout: float) -> _HTTPResponse:
+        release.wait(5)
+        return tei(url, payload, timeout)
+
+    client = TEIClient(base_url="http://test", http_post=_slow_post, expected_dim=DIM)
+    service = EmbeddingService(client, window_ms=0, result_timeout_seconds=0.1)
+
+    with pytest.raises(TEIClientError, match="no result within"):
+        service.embed_array(["slow"])
+    release.set()
+    service.close()
+
+
+def test_rejects_non_list_input():
+    service = _service(_FakeTEI())
+    with pytest.raises(TEIClientError):
+        service.embed_array("not a list")  # type: ignore[arg-type]
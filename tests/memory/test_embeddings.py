@@ -0,0 +1,132 @@
+"""
+FILE: tests/memory/test_embeddings.py
+PURPOSE: Unit tests for batched, cached memory embeddings and the bulk backfill.
+         Embeddings come from a local stub embedder; Supabase HTTP is mocked.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.memory import organise
+from src.memory.embeddings import OpenAIEmbedder, VectorCache, embed_texts
+
+FAKE_URL = "https://fake.supabase.co"
+
+
+class StubEmbedder:
+    """Deterministic embedder that records each request's inputs."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.calls: list[list[str]] = []
+        self.fail_on = fail_on
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        if self.fail_on in texts:
+            raise RuntimeError("stub failure")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = VectorCache(tmp_path / "vectors.sqlite3")
+    yield c
+    c.close()
+
+
+def _response(status_code=200, json_data=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.json.return_value = json_data
+    resp.text = "ok"
+    return resp
+
+
+# ---------------------------------------------------------------------------
+# embed_texts
+# ---------------------------------------------------------------------------
+
+
+class TestEmbedTexts:
+    def test_dedups_batches_and_reuses_cache(self, cache):
+        embedder = StubEmbedder()
+        texts = ["alpha", "beta", "alpha", "gamma", "delta"]
+
+        vectors, stats = embed_texts(texts, embedder, cache, batch_size=2)
+
+        assert embedder.calls == [["alpha", "beta"], ["gamma", "delta"]]
+        assert vectors[0] == vectors[2] == [5.0, 1.0]
+        assert stats == {
+            "unique": 4,
+            "cache_hits": 0,
+            "embedded": 4,
+            "requests": 2,
+            "failed": 0,
+        }
+
+        again, stats = embed_texts(["gamma", "epsilon"], embedder, cache, batch_size=2)
+        assert embedder.calls[-1] == ["epsilon"]
+        assert again == [[5.0, 1.0], [7.0, 1.0]]
+        assert stats["cache_hits"] == 1
+
+    def test_failed_batch_leaves_none_and_continues(self, cache):
+        embedder = StubEmbedder(fail_on="bad")
+
+        vectors, stats = embed_texts(["ok", "bad", "fine"], embedder, cache, batch_size=2)
+
+        assert vectors == [None, None, [4.0, 1.0]]
+        assert stats["failed"] == 2 and stats["embedded"] == 1
+
+    def test_openai_embedder_sends_one_request_in_input_order(self):
+        payload = {
+            "data": [
+                {"index": 1, "embedding": [2.0]},
+                {"index": 0, "embedding": [1.0]},
+            ],
+            "usage": {"total_tokens": 4},
+        }
+        with patch(
+            "src.memory.embeddings.httpx.post", return_value=_response(200, payload)
+        ) as post:
+            vectors = OpenAIEmbedder(api_key="sk-test")(["a", "b"])
+
+        assert vectors == [[1.0], [2.0]]
+        post.assert_called_once()
+        assert post.call_args.kwargs["json"]["input"] == ["a", "b"]
+
+
+# ---------------------------------------------------------------------------
+# backfill_embeddings_bulk
+# ---------------------------------------------------------------------------
+
+
+class TestBackfill:
+    def test_pages_by_id_and_writes_one_bulk_call_per_page(self, cache):
+        pages = [
+            [{"id": "a1", "content": "same"}, {"id": "a2", "content": "same"}],
+            [{"id": "b1", "content": "other"}],
+        ]
+        embedder = StubEmbedder()
+
+        with (
+            patch.object(organise, "SUPABASE_URL", FAKE_URL),
+            patch.object(
+                organise.httpx, "get", side_effect=[_response(200, p) for p in pages]
+            ) as get,
+            patch.object(
+                organise.httpx, "post", side_effect=[_response(200, 2), _response(200, 1)]
+            ) as post,
+        ):
+            stats = organise.backfill_embeddings_bulk(page_size=2, embedder=embedder, cache=cache)
+
+        assert "id=gt.a2" in get.call_args_list[1].args[0]
+        assert embedder.calls == [["same"], ["other"]]
+        assert [len(c.kwargs["json"]["rows"]) for c in post.call_args_list] == [2, 1]
+        assert post.call_args_list[0].args[0].endswith("/rpc/set_agent_memory_embeddings")
+        assert stats["rows"] == 3 and stats["written"] == 3
+        assert stats["requests"] == 2 and "rows_per_second" in stats
+
+    def test_backfill_embeddings_keeps_int_contract_without_api_key(self):
+        with patch.object(organise, "OPENAI_API_KEY", ""):
+            assert organise.backfill_embeddings() == 0
@@ -18,6 +18,7 @@ Coverage:
 
 from __future__ import annotations
 
+import asyncio
 import os
 from unittest.mock import MagicMock
 
@@ -205,6 +206,84 @@ def test_admit_send_no_op_when_lead_has_no_domain_or_client():
     assert snap["by_client"]["client-1"] == 0.0
 
 
+def test_release_send_undoes_admit_send():
+    snap = _empty_snapshot(spent_client=1.0, spent_domain=0.5)
+    lead = _lead()
+    flow_mod._admit_send(snap, lead, "linkedin")
+    flow_mod._release_send(snap, lead, "linkedin")
+    assert snap["by_client"]["client-1"] == pytest.approx(1.0)
+    assert snap["by_domain"]["example.com.au"] == pytest.approx(0.5)
+
+
+# ── Concurrent send lanes ───────────────────────────────────────────────────
+
+
+def _patch_flow_for_send(monkeypatch, leads: list[dict], snapshot: dict, send):
+    async def fake_get_leads(limit):
+        return {
+            "total_leads": len(leads),
+            "leads_by_channel": {"email": leads, "linkedin": [], "sms": []},
+        }
+
+    async def fake_quality_gate(campaign_id):
+        return {"passed": True}
+
+    async def fake_snapshot(client_ids, domains):
+        return snapshot
+
+    async def fake_jit(lead_id, campaign_id, client_id):
+        return {"permission_mode": "autopilot"}
+
+    def no_db():
+        raise RuntimeError("no db in tests")
+
+    monkeypatch.setattr(flow_mod, "get_leads_ready_for_outreach_task", fake_get_leads)
+    monkeypatch.setattr(flow_mod, "check_campaign_quality_gate_task", fake_quality_gate)
+    monkeypatch.setattr(flow_mod, "snapshot_outreach_spend_task", fake_snapshot)
+    monkeypatch.setattr(flow_mod, "jit_validate_outreach_task", fake_jit)
+    monkeypatch.setattr(flow_mod, "send_email_outreach_task", send)
+    monkeypatch.setattr(flow_mod, "get_db_session", no_db)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lanes_cannot_both_spend_the_last_headroom(monkeypatch):
+    """Two mailboxes, one email of headroom: the gate reserves before the send
+    awaits, so the second lane is refused even though both run concurrently."""
+    cost = flow_mod.CHANNEL_COST_AUD["email"]
+    snap = _empty_snapshot(spent_client=50.0 - cost * 1.5)
+    leads = [_lead("mb-1", lead_id="lead-A"), _lead("mb-2", lead_id="lead-B")]
+    sent: list[str] = []
+
+    async def fake_send(lead_id, campaign_id, resource, permission_mode):
+        await asyncio.sleep(0.01)
+        sent.append(lead_id)
+        return {"lead_id": lead_id, "channel": "email", "success": True}
+
+    _patch_flow_for_send(monkeypatch, leads, snap, fake_send)
+    result = await flow_mod.hourly_outreach_flow.fn(batch_size=10)
+
+    assert sent == ["lead-A"]
+    assert result["emails_sent"] == 1
+    assert result["skipped_per_customer_cap"] == 1
+    assert result["send_throughput"]["email"]["resources"] == 2
+    assert snap["by_client"]["client-1"] == pytest.approx(50.0 - cost * 0.5)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_releases_its_reservation(monkeypatch):
+    snap = _empty_snapshot(spent_client=2.0)
+    leads = [_lead("mb-1", lead_id="lead-A")]
+
+    async def fake_send(lead_id, campaign_id, resource, permission_mode):
+        return {"lead_id": lead_id, "channel": "email", "success": False, "error": "bounce"}
+
+    _patch_flow_for_send(monkeypatch, leads, snap, fake_send)
+    result = await flow_mod.hourly_outreach_flow.fn(batch_size=10)
+
+    assert result["emails_sent"] == 0
+    assert snap["by_client"]["client-1"] == pytest.approx(2.0)
+
+
 # ── Skip-row contract ───────────────────────────────────────────────────────
 
 
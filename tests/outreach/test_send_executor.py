@@ -0,0 +1,137 @@
+"""
+Tests for the per-resource concurrent send executor (src/outreach/send_executor.py).
+
+Coverage:
+    1. Sends on different resources overlap; sends on one resource never do.
+    2. Results come back per channel in batch order.
+    3. A raising send becomes a failed row without stopping its lane.
+    4. Pacer delay is applied between sends on the same resource only.
+    5. Throughput is reported per channel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.outreach.safety.send_pacer import PacerConfig, SendPacer
+from src.outreach.safety.timing_engine import Channel
+from src.outreach.send_executor import partition_by_resource, run_send_batch
+
+
+def _leads(channel: str, resources: list[str]) -> list[dict]:
+    return [
+        {"lead_id": f"{channel}-{i}", "resource": resource} for i, resource in enumerate(resources)
+    ]
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.01, fail: set[str] | None = None) -> None:
+        self.delay = delay
+        self.fail = fail or set()
+        self.active: dict[str, int] = {}
+        self.max_per_resource: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, channel: str, lead_data: dict) -> dict:
+        resource = lead_data["resource"]
+        self.active[resource] = self.active.get(resource, 0) + 1
+        self.max_per_resource[resource] = max(
+            self.max_per_resource.get(resource, 0), self.active[resource]
+        )
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if lead_data["lead_id"] in self.fail:
+                raise RuntimeError("provider exploded")
+            return {"lead_id": lead_data["lead_id"], "channel": channel, "success": True}
+        finally:
+            self.active[resource] -= 1
+            self.in_flight -= 1
+
+
+def test_partition_groups_by_channel_and_resource():
+    parts = partition_by_resource(
+        {"email": _leads("email", ["mb1", "mb2", "mb1"]), "sms": [{"lead_id": "s0"}]},
+        ("email", "sms"),
+    )
+    assert [i for i, _ in parts[("email", "mb1")]] == [0, 2]
+    assert [i for i, _ in parts[("email", "mb2")]] == [1]
+    assert list(parts[("sms", None)]) == [(0, {"lead_id": "s0"})]
+
+
+@pytest.mark.asyncio
+async def test_resources_run_concurrently_but_each_resource_is_serial():
+    rec = _Recorder()
+    leads = {
+        "email": _leads("email", ["mb1", "mb2", "mb3", "mb1", "mb2", "mb3"]),
+        "linkedin": _leads("linkedin", ["seat1", "seat1"]),
+    }
+
+    results, throughput = await run_send_batch(
+        leads, rec.send, channels=("email", "linkedin", "sms"), max_concurrent_resources=10
+    )
+
+    assert rec.max_in_flight == 4
+    assert set(rec.max_per_resource.values()) == {1}
+    assert [r["lead_id"] for r in results["email"]] == [f"email-{i}" for i in range(6)]
+    assert results["sms"] == []
+    assert throughput["email"]["sent"] == 6 and throughput["email"]["resources"] == 3
+    assert throughput["email"]["sends_per_minute"] > 0
+    assert throughput["sms"] == {
+        "attempted": 0,
+        "sent": 0,
+        "resources": 0,
+        "elapsed_s": 0.0,
+        "sends_per_minute": 0.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_applies_across_lanes():
+    rec = _Recorder()
+    leads = {"email": _leads("email", [f"mb{i}" for i in range(8)])}
+
+    await run_send_batch(leads, rec.send, channels=("email",), max_concurrent_resources=3)
+
+    assert rec.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_send_becomes_a_row_and_lane_continues():
+    rec = _Recorder(fail={"email-0"})
+    leads = {"email": _leads("email", ["mb1", "mb1"])}
+
+    results, throughput = await run_send_batch(leads, rec.send, channels=("email",))
+
+    assert results["email"][0] == {
+        "lead_id": "email-0",
+        "channel": "email",
+        "success": False,
+        "error": "provider exploded",
+    }
+    assert results["email"][1]["success"] is True
+    assert throughput["email"]["sent"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pacer_delays_only_between_sends_on_the_same_resource():
+    pacer = SendPacer(configs={Channel.EMAIL: PacerConfig(min_seconds=30, max_seconds=30)})
+    rec = _Recorder(delay=0)
+    leads = {"email": _leads("email", ["mb1", "mb2", "mb1"])}
+    real_sleep = asyncio.sleep
+    sleeps: list[float] = []
+
+    async def _fake_sleep(seconds):
+        if seconds:
+            sleeps.append(seconds)
+        await real_sleep(0)
+
+    with patch("src.outreach.send_executor.asyncio.sleep", _fake_sleep):
+        await run_send_batch(leads, rec.send, channels=("email",), pacer=pacer)
+
+    assert len(sleeps) == 1 and 29 < sleeps[0] <= 30
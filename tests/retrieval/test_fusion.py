@@ -5,8 +5,8 @@ Covers:
 - _content_key dedup-key stability + whitespace normalisation.
 - fused_recall: unions across ALL mapped fleet banks, dedups by content hash
   (higher score wins), ranks by score desc, honours top_k.
-- Fail-open at both layers: per-collection swallow inside _gather_ann_pool,
-  AND the gather-level isinstance(BaseException) guard.
+- Fail-open at both layers: per-bank swallow inside the orchestrator fan-out,
+  AND a fan-out-level failure returning an empty union.
 - Tenant context validated fail-fast before any recall fires.
 - agent_query.query() routes through fusion when the flag is on.
 """
@@ -60,7 +60,7 @@ def _patch_recall_by_bank(monkeypatch, by_bank):
     """Monkeypatch orchestrator._hindsight_recall to return canned memories per bank."""
     calls: list[str] = []
 
-    def _fake_recall(text, bank_id, *, top_k, tenant_id):
+    async def _fake_recall(text, bank_id, *, top_k, tenant_id):
         calls.append(bank_id)
         return list(by_bank.get(bank_id, []))
 
@@ -120,10 +120,10 @@ def test_fused_recall_honours_top_k(monkeypatch):
 
 
 def test_fused_recall_fail_open_on_per_bank_recall_error(monkeypatch):
-    """A bank whose _hindsight_recall raises is swallowed by _gather_ann_pool;
+    """A bank whose _hindsight_recall raises is swallowed by the fan-out;
     the surviving banks still contribute to the union."""
 
-    def _flaky_recall(text, bank_id, *, top_k, tenant_id):
+    async def _flaky_recall(text, bank_id, *, top_k, tenant_id):
         if bank_id == "fleet_decisions":
             raise RuntimeError("simulated bank outage")
         return [{"content": f"ok-{bank_id}", "score": 0.5}]
@@ -135,20 +135,29 @@ def test_fused_recall_fail_open_on_per_bank_recall_error(monkeypatch):
     assert not any("fleet_decisions" in t for t in texts)
 
 
-def test_fused_recall_fail_open_on_gather_level_exception(monkeypatch):
-    """If _gather_ann_pool itself raises for one collection, the gather-level
-    isinstance(BaseException) guard drops it and keeps the others."""
-    good = [orchestrator.RetrievedNode(text="survived", score=0.7, metadata={}, collection="Keis")]
+def test_fused_recall_fail_open_on_bank_past_deadline(monkeypatch):
+    """A bank that misses the per-bank deadline is dropped; the rest survive."""
+
+    async def _slow_bank(text, bank_id, *, top_k, tenant_id):
+        if bank_id == "fleet_decisions":
+            await asyncio.sleep(5)
+        return [{"content": f"ok-{bank_id}", "score": 0.5}] if bank_id == "fleet_keis" else []
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _slow_bank)
+    monkeypatch.setattr(orchestrator, "HINDSIGHT_BANK_DEADLINE_SECONDS", 0.1)
+    out = asyncio.run(fusion.fused_recall("q", orchestrator.FLEET_TENANT_SLUG, top_k=10))
+    assert [n.text for n in out] == ["ok-fleet_keis"]
 
-    def _selective_pool(text, collections, k_initial, weaviate_client, *, tenant_id):
-        (collection,) = collections
-        if collection == "Decisions":
-            raise RuntimeError("pool blew up")
-        return list(good) if collection == "Keis" else []
 
-    monkeypatch.setattr(orchestrator, "_gather_ann_pool", _selective_pool)
+def test_fused_recall_fail_open_on_fan_out_exception(monkeypatch):
+    """If the fan-out itself raises, fusion returns an empty union instead."""
+
+    async def _broken(*a, **kw):
+        raise RuntimeError("recall loop blew up")
+
+    monkeypatch.setattr(orchestrator, "gather_ann_pool_async", _broken)
     out = asyncio.run(fusion.fused_recall("q", orchestrator.FLEET_TENANT_SLUG, top_k=10))
-    assert [n.text for n in out] == ["survived"]
+    assert out == []
 
 
 # ---------------------------------------------------------------------------
@@ -159,7 +168,12 @@ def test_fused_recall_fail_open_on_gather_level_exception(monkeypatch):
 @pytest.mark.parametrize("bad", [None, "", "   ", "tenant/../escape"])
 def test_fused_recall_rejects_bad_tenant_before_any_recall(monkeypatch, bad):
     called = []
-    monkeypatch.setattr(orchestrator, "_hindsight_recall", lambda *a, **kw: called.append(1) or [])
+
+    async def _spy(*a, **kw):
+        called.append(1)
+        return []
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _spy)
     with pytest.raises(orchestrator.MissingTenantContextError):
         asyncio.run(fusion.fused_recall("q", bad, top_k=5))
     assert called == []
@@ -7,6 +7,8 @@ Covers:
 - _hindsight_recall: POST shape + happy path + alt response keys.
 - _gather_ann_pool: unmapped collection skipped, recall failure swallowed
   per-collection, RetrievedNode build correctness.
+- Concurrent fan-out: banks recalled in parallel, per-bank deadline with
+  partial results, per-bank reports on RetrievalOutcome, shared client.
 
 Public-API contract (RetrievedNode / RetrievalOutcome / retrieve_with_outcome
 shape) is locked by the pre-existing tests in test_agent_query.py + test_
@@ -16,11 +18,14 @@ cutover.
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import sys
+import time
 from pathlib import Path
 
+import httpx
 import pytest
 
 from src.retrieval import orchestrator
@@ -28,6 +33,21 @@ from src.retrieval import orchestrator
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
+def _mock_client(handler) -> httpx.AsyncClient:
+    """AsyncClient whose requests are answered in-process by `handler`."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _recall(text, bank_id, *, top_k, tenant_id, handler):
+    async def _run():
+        async with _mock_client(handler) as client:
+            return await orchestrator._hindsight_recall(
+                text, bank_id, top_k=top_k, tenant_id=tenant_id, client=client
+            )
+
+    return asyncio.run(_run())
+
+
 def _import_indexer_base():
     """Load scripts/orchestrator/indexer_base.py as a module so we can read its
     canonical CLASS_TO_BANK without a sys.path hack baked into the import."""
@@ -47,33 +67,25 @@ def test_bank_mapping_parity_with_indexer_base_canonical():
     assert canonical == orchestrator.HINDSIGHT_BANK_BY_CLASS
 
 
-def test_hindsight_recall_posts_to_correct_endpoint(monkeypatch):
+def test_hindsight_recall_posts_to_correct_endpoint():
     captured = []
 
-    class _FakeResp:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *a):
-            return None
-
-        def read(self):
-            return b'{"memories": [{"content": "x", "score": 0.9}]}'
-
-    def _fake_urlopen(req, timeout=None):
+    def _handler(request: httpx.Request) -> httpx.Response:
         captured.append(
             {
-                "url": req.full_url,
-                "method": req.get_method(),
-                "body": json.loads(req.data.decode()),
-                "timeout": timeout,
+                "url": str(request.url),
+                "method": request.method,
+                "body": json.loads(request.content.decode()),
             }
         )
-        return _FakeResp()
+        return httpx.Response(200, json={"memories": [{"content": "x", "score": 0.9}]})
 
-    monkeypatch.setattr(orchestrator.urlrequest, "urlopen", _fake_urlopen)
-    out = orchestrator._hindsight_recall(
-        "anchor query", "fleet_decisions", top_k=5, tenant_id=orchestrator.FLEET_TENANT_SLUG
+    out = _recall(
+        "anchor query",
+        "fleet_decisions",
+        top_k=5,
+        tenant_id=orchestrator.FLEET_TENANT_SLUG,
+        handler=_handler,
     )
     assert len(captured) == 1
     assert captured[0]["url"].endswith("/v1/default/banks/fleet_decisions/memories/recall")
@@ -82,41 +94,26 @@ def test_hindsight_recall_posts_to_correct_endpoint(monkeypatch):
     assert out == [{"content": "x", "score": 0.9}]
 
 
-def test_hindsight_recall_accepts_alt_results_key(monkeypatch):
+def test_hindsight_recall_accepts_alt_results_key():
     """Some Hindsight response shapes nest under 'results' instead of 'memories'."""
-
-    class _FakeResp:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *a):
-            return None
-
-        def read(self):
-            return b'{"results": [{"content": "y"}]}'
-
-    monkeypatch.setattr(orchestrator.urlrequest, "urlopen", lambda req, timeout=None: _FakeResp())
-    out = orchestrator._hindsight_recall(
-        "q", "fleet_keis", top_k=3, tenant_id=orchestrator.FLEET_TENANT_SLUG
+    out = _recall(
+        "q",
+        "fleet_keis",
+        top_k=3,
+        tenant_id=orchestrator.FLEET_TENANT_SLUG,
+        handler=lambda request: httpx.Response(200, json={"results": [{"content": "y"}]}),
     )
     assert out == [{"content": "y"}]
 
 
-def test_hindsight_recall_empty_response_returns_empty_list(monkeypatch):
-    class _FakeResp:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *a):
-            return None
-
-        def read(self):
-            return b"{}"
-
-    monkeypatch.setattr(orchestrator.urlrequest, "urlopen", lambda req, timeout=None: _FakeResp())
+def test_hindsight_recall_empty_response_returns_empty_list():
     assert (
-        orchestrator._hindsight_recall(
-            "q", "fleet_decisions", top_k=5, tenant_id=orchestrator.FLEET_TENANT_SLUG
+        _recall(
+            "q",
+            "fleet_decisions",
+            top_k=5,
+            tenant_id=orchestrator.FLEET_TENANT_SLUG,
+            handler=lambda request: httpx.Response(200, content=b"{}"),
         )
         == []
     )
@@ -136,7 +133,7 @@ def test_gather_ann_pool_skips_unmapped_collection(monkeypatch):
     """
     called = []
 
-    def _spy_recall(text, bank_id, *, top_k, tenant_id):
+    async def _spy_recall(text, bank_id, *, top_k, tenant_id):
         called.append((bank_id, tenant_id))
         return []
 
@@ -158,7 +155,7 @@ def test_gather_ann_pool_swallows_per_collection_failure(monkeypatch):
     didn't stop the others)."""
     calls = []
 
-    def _flaky_recall(text, bank_id, *, top_k, tenant_id):
+    async def _flaky_recall(text, bank_id, *, top_k, tenant_id):
         calls.append(bank_id)
         if bank_id == "fleet_decisions":
             raise RuntimeError("simulated failure")
@@ -183,7 +180,7 @@ def test_gather_ann_pool_builds_retrieved_nodes_with_correct_collection_tag(monk
     as its `.collection` field so the downstream citation chain stays
     consistent with the pre-cutover identity."""
 
-    def _stub_recall(text, bank_id, *, top_k, tenant_id):
+    async def _stub_recall(text, bank_id, *, top_k, tenant_id):
         return [
             {"content": f"from-{bank_id}-1", "score": 0.8, "metadata": {"src": bank_id}},
             {"content": f"from-{bank_id}-2", "score": 0.6, "metadata": {"src": bank_id}},
@@ -209,7 +206,7 @@ def test_gather_ann_pool_accepts_alt_text_and_relevance_keys(monkeypatch):
     """Memories may carry `text` instead of `content` and `relevance` instead
     of `score` depending on Hindsight response shape. Both keys supported."""
 
-    def _stub_recall(text, bank_id, *, top_k, tenant_id):
+    async def _stub_recall(text, bank_id, *, top_k, tenant_id):
         return [{"text": "alt-shape", "relevance": 0.42, "metadata": None}]
 
     monkeypatch.setattr(orchestrator, "_hindsight_recall", _stub_recall)
@@ -226,11 +223,15 @@ def test_gather_ann_pool_accepts_alt_text_and_relevance_keys(monkeypatch):
     assert pool[0].metadata == {}
 
 
+async def _no_memories(*a, **kw):
+    return []
+
+
 def test_retrieve_with_outcome_returns_empty_pool_outcome_on_no_memories(monkeypatch):
     """Public-API contract: empty pool surfaces (RetrievalOutcome((),
     bypass_rerank=False, "empty_pool", 0)) — matches the pre-cutover shape so
     agent_query.query()'s anti-hallucination guard fires identically."""
-    monkeypatch.setattr(orchestrator, "_hindsight_recall", lambda *a, **kw: [])
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _no_memories)
     outcome = orchestrator.retrieve_with_outcome(
         "anchor",
         ("Decisions", "Discoveries", "Keis"),
@@ -252,7 +253,7 @@ def test_retrieve_with_outcome_no_longer_opens_weaviate_connection(monkeypatch):
         "_connect_client",
         lambda *a, **kw: connect_calls.append(1),
     )
-    monkeypatch.setattr(orchestrator, "_hindsight_recall", lambda *a, **kw: [])
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _no_memories)
     orchestrator.retrieve_with_outcome(
         "q", ("Decisions",), tenant_id=orchestrator.FLEET_TENANT_SLUG
     )
@@ -268,35 +269,28 @@ def test_retrieve_with_outcome_no_longer_opens_weaviate_connection(monkeypatch):
 
 
 @pytest.mark.parametrize("bad", [None, "", "   ", "tenant/../escape", "tenant with spaces", 123])
-def test_hindsight_recall_rejects_missing_or_invalid_tenant_id(monkeypatch, bad):
-    """The guard fires BEFORE urlopen — assert urlopen is never called."""
+def test_hindsight_recall_rejects_missing_or_invalid_tenant_id(bad):
+    """The guard fires BEFORE any request — assert the transport is never called."""
     opened = []
-    monkeypatch.setattr(orchestrator.urlrequest, "urlopen", lambda *a, **kw: opened.append(1))
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        opened.append(1)
+        return httpx.Response(200, json={})
+
     with pytest.raises(orchestrator.MissingTenantContextError):
-        orchestrator._hindsight_recall("q", "fleet_decisions", top_k=5, tenant_id=bad)
+        _recall("q", "fleet_decisions", top_k=5, tenant_id=bad, handler=_handler)
     assert opened == []
 
 
-def test_hindsight_recall_url_embeds_tenant_slug(monkeypatch):
+def test_hindsight_recall_url_embeds_tenant_slug():
     """Customer recall path: the slug appears as the URL's tenant path segment."""
     captured: list[str] = []
 
-    class _FakeResp:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *a):
-            return None
-
-        def read(self):
-            return b'{"memories": []}'
+    def _handler(request: httpx.Request) -> httpx.Response:
+        captured.append(str(request.url))
+        return httpx.Response(200, json={"memories": []})
 
-    def _fake_urlopen(req, timeout=None):  # noqa: ARG001
-        captured.append(req.full_url)
-        return _FakeResp()
-
-    monkeypatch.setattr(orchestrator.urlrequest, "urlopen", _fake_urlopen)
-    orchestrator._hindsight_recall("q", "customer-bank-abc", top_k=5, tenant_id="tenant-uuid-123")
+    _recall("q", "customer-bank-abc", top_k=5, tenant_id="tenant-uuid-123", handler=_handler)
     assert captured == [
         f"{orchestrator.HINDSIGHT_BASE}/v1/tenant-uuid-123/banks/customer-bank-abc/memories/recall"
     ]
@@ -306,11 +300,12 @@ def test_gather_ann_pool_rejects_missing_tenant_id_upfront(monkeypatch):
     """Wire-contract violations are raised, not swallowed by the per-collection
     try/except — otherwise a malformed call would silently return empty pool."""
     recall_called = []
-    monkeypatch.setattr(
-        orchestrator,
-        "_hindsight_recall",
-        lambda *a, **kw: recall_called.append(1) or [],
-    )
+
+    async def _spy(*a, **kw):
+        recall_called.append(1)
+        return []
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _spy)
     with pytest.raises(orchestrator.MissingTenantContextError):
         orchestrator._gather_ann_pool(
             text="q",
@@ -326,3 +321,102 @@ def test_retrieve_with_outcome_requires_tenant_id_keyword():
     """Calling without tenant_id is a TypeError at call time (keyword-only required)."""
     with pytest.raises(TypeError):
         orchestrator.retrieve_with_outcome("q", ("Decisions",))  # type: ignore[call-arg]
+
+
+# ---------------------------------------------------------------------------
+# Concurrent fan-out — shared pool, per-bank deadline, partial results.
+# ---------------------------------------------------------------------------
+
+
+def test_gather_ann_pool_recalls_banks_concurrently(monkeypatch):
+    """Four banks at 200ms each finish in ~one bank's latency, not the sum."""
+
+    async def _slow_recall(text, bank_id, *, top_k, tenant_id):
+        await asyncio.sleep(0.2)
+        return [{"content": f"from-{bank_id}", "score": 0.5}]
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _slow_recall)
+    started = time.monotonic()
+    pool = orchestrator._gather_ann_pool(
+        text="q",
+        collections=("Decisions", "Keis", "Discoveries", "Codebase"),
+        k_initial=5,
+        weaviate_client=None,
+        tenant_id=orchestrator.FLEET_TENANT_SLUG,
+    )
+    assert time.monotonic() - started < 0.6
+    assert len(pool) == 4
+
+
+def test_gather_ann_pool_drops_bank_past_deadline_and_keeps_the_rest(monkeypatch):
+    async def _recall(text, bank_id, *, top_k, tenant_id):
+        if bank_id == "fleet_decisions":
+            await asyncio.sleep(5)
+        return [{"content": f"from-{bank_id}", "score": 0.5}]
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _recall)
+    monkeypatch.setattr(orchestrator, "HINDSIGHT_BANK_DEADLINE_SECONDS", 0.1)
+    report: list[orchestrator.BankRecall] = []
+    started = time.monotonic()
+    pool = orchestrator._gather_ann_pool(
+        text="q",
+        collections=("Decisions", "Keis"),
+        k_initial=5,
+        weaviate_client=None,
+        tenant_id=orchestrator.FLEET_TENANT_SLUG,
+        bank_report=report,
+    )
+    assert time.monotonic() - started < 1.0
+    assert [n.text for n in pool] == ["from-fleet_keis"]
+    assert [(r.collection, r.status, r.hits) for r in report] == [
+        ("Decisions", "timeout", 0),
+        ("Keis", "ok", 1),
+    ]
+
+
+def test_retrieve_with_outcome_reports_per_bank_latency(monkeypatch):
+    async def _recall(text, bank_id, *, top_k, tenant_id):
+        if bank_id == "fleet_keis":
+            raise RuntimeError("simulated failure")
+        await asyncio.sleep(0.05)
+        return [{"content": f"from-{bank_id}", "score": 0.5}]
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _recall)
+    monkeypatch.setattr(orchestrator, "reranker_enabled", False)
+    outcome = orchestrator.retrieve_with_outcome(
+        "q",
+        ("Decisions", "Keis", "_UnmappedSentinel_NeverMapMe"),
+        tenant_id=orchestrator.FLEET_TENANT_SLUG,
+    )
+    by_collection = {b.collection: b for b in outcome.bank_recalls}
+    assert list(by_collection) == ["Decisions", "Keis", "_UnmappedSentinel_NeverMapMe"]
+    assert by_collection["Decisions"].status == "ok"
+    assert by_collection["Decisions"].latency_ms >= 40
+    assert by_collection["Keis"].status == "error"
+    assert by_collection["_UnmappedSentinel_NeverMapMe"].bank_id is None
+    assert by_collection["_UnmappedSentinel_NeverMapMe"].status == "unmapped"
+
+
+def test_gather_ann_pool_async_usable_from_a_running_loop(monkeypatch):
+    async def _recall(text, bank_id, *, top_k, tenant_id):
+        return [{"content": f"from-{bank_id}", "score": 0.5}]
+
+    monkeypatch.setattr(orchestrator, "_hindsight_recall", _recall)
+    pool, banks = asyncio.run(
+        orchestrator.gather_ann_pool_async(
+            "q", ("Decisions",), 5, tenant_id=orchestrator.FLEET_TENANT_SLUG
+        )
+    )
+    assert [n.text for n in pool] == ["from-fleet_decisions"]
+    assert [b.status for b in banks] == ["ok"]
+
+
+def test_shared_recall_client_reused_across_calls():
+    """Keep-alive pool: every recall in the process goes through one client."""
+
+    async def _client_id():
+        return id(orchestrator._shared_recall_client())
+
+    first = orchestrator._submit_to_recall_loop(_client_id()).result()
+    second = orchestrator._submit_to_recall_loop(_client_id()).result()
+    assert first == second
@@ -0,0 +1,47 @@
+"""Tests for cohort_runner streaming mode stage chain."""
+
+import pytest
+
+from src.config.stage_parallelism import get_parallelism
+from src.intelligence.parallel import run_pipelined
+from src.orchestration import cohort_runner
+from src.orchestration.cohort_runner import COHORT_STAGES, _cohort_stages, _new_domain
+
+
+def test_cohort_stages_follow_stage_parallelism():
+    stages = _cohort_stages(dfs=None, gemini=None, bd=None, lm=None)
+    assert [s.name for s in stages] == [f"stage{i}" for i in range(2, 12)]
+    for stage, (_, key, label) in zip(stages, COHORT_STAGES, strict=True):
+        assert stage.concurrency == get_parallelism(key)
+        assert stage.label == label
+
+
+@pytest.mark.asyncio
+async def test_dropped_domains_leave_the_stream(monkeypatch):
+    calls = []
+
+    def fake(name, drop=False):
+        async def run(d, *args):
+            calls.append((name, d["domain"]))
+            if drop and d["domain"] == "chain.com.au":
+                d["dropped_at"] = name
+            d["cost_usd"] += 0.01
+            return d
+
+        return run
+
+    for i in range(2, 12):
+        monkeypatch.setattr(cohort_runner, f"_run_stage{i}", fake(f"stage{i}", drop=i == 3))
+
+    pipeline = [_new_domain("dental.com.au", "dental"), _new_domain("chain.com.au", "dental")]
+    results, stats = await run_pipelined(
+        pipeline,
+        _cohort_stages(dfs=None, gemini=None, bd=None, lm=None),
+        skip=lambda d: bool(d.get("dropped_at")),
+        should_stop=lambda: cohort_runner._check_budget(pipeline, cap=1.0),
+    )
+
+    assert [n for n, d in calls if d == "chain.com.au"] == ["stage2", "stage3"]
+    assert len([n for n, d in calls if d == "dental.com.au"]) == 10
+    assert results[1]["dropped_at"] == "stage3"
+    assert stats["stages"]["stage11"]["items"] == 1
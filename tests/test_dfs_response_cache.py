@@ -0,0 +1,216 @@
+# FILE: tests/test_dfs_response_cache.py
+# PURPOSE: Unit tests for the shared DFS response cache + DFSLabsClient wiring
+
+"""
+Unit tests for DFSResponseCache.
+
+All tests use mocks — NO live API calls. Redis is disabled (``use_redis=False``)
+or forced down so the SQLite tier is exercised against a tmp file.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.integrations import dfs_response_cache
+from src.integrations.dfs_labs_client import DFSLabsClient
+from src.integrations.dfs_response_cache import DFSResponseCache, cache_key
+
+RANK_ENDPOINT = "/v3/dataforseo_labs/google/domain_rank_overview/live"
+
+# ============================================
+# Fixtures
+# ============================================
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = DFSResponseCache(sqlite_path=tmp_path / "dfs.sqlite3", use_redis=False)
+    yield c
+    c.close()
+
+
+def make_rank_response() -> dict:
+    return {
+        "tasks": [
+            {
+                "status_code": 20000,
+                "status_message": "Ok.",
+                "result": [
+                    {"items": [{"metrics": {"organic": {"etv": 120.5, "count": 40}, "paid": {}}}]}
+                ],
+            }
+        ]
+    }
+
+
+def make_mock_http(json_data: dict) -> AsyncMock:
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.json.return_value = json_data
+    mock_resp.raise_for_status = MagicMock()
+    mock_http = AsyncMock()
+    mock_http.post = AsyncMock(return_value=mock_resp)
+    mock_http.get = AsyncMock(return_value=mock_resp)
+    return mock_http
+
+
+# ============================================
+# Keying
+# ============================================
+
+
+def test_cache_key_ignores_dict_ordering():
+    a = [{"target": "acme.com.au", "location_code": 2036, "language_code": "en"}]
+    b = [{"language_code": "en", "location_code": 2036, "target": "acme.com.au"}]
+    assert cache_key(RANK_ENDPOINT, a) == cache_key(RANK_ENDPOINT, b)
+
+
+def test_cache_key_separates_endpoints_and_payloads():
+    payload = [{"target": "acme.com.au"}]
+    other_endpoint = "/v3/backlinks/summary/live"
+    assert cache_key(RANK_ENDPOINT, payload) != cache_key(other_endpoint, payload)
+    assert cache_key(RANK_ENDPOINT, payload) != cache_key(RANK_ENDPOINT, [{"target": "b.com"}])
+
+
+# ============================================
+# Cache tiers + TTL
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_set_then_get_round_trips_value_and_cost(cache):
+    await cache.set(RANK_ENDPOINT, [{"target": "a.com"}], {"items": [1]}, Decimal("0.010"))
+    value, cost = await cache.get(RANK_ENDPOINT, [{"target": "a.com"}])
+    assert value == {"items": [1]}
+    assert cost == Decimal("0.010")
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_uncached_endpoint_is_never_stored(cache):
+    await cache.set("/v3/unknown/live", [{"x": 1}], {"items": []}, Decimal("1"))
+    assert await cache.get("/v3/unknown/live", [{"x": 1}]) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_misses_but_replay_serves_it(tmp_path):
+    cache = DFSResponseCache(
+        sqlite_path=tmp_path / "dfs.sqlite3", use_redis=False, ttls={RANK_ENDPOINT: 60}
+    )
+    await cache.set(RANK_ENDPOINT, [{"target": "a.com"}], {"items": [1]}, Decimal("0.010"))
+    with patch.object(dfs_response_cache.time, "time", return_value=10**12):
+        assert await cache.get(RANK_ENDPOINT, [{"target": "a.com"}]) is None
+        cache.replay = True
+        assert (await cache.get(RANK_ENDPOINT, [{"target": "a.com"}]))[0] == {"items": [1]}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_sqlite_and_parks_redis(tmp_path):
+    cache = DFSResponseCache(sqlite_path=tmp_path / "dfs.sqlite3")
+    get_redis = AsyncMock(side_effect=ConnectionError("redis down"))
+    with patch.object(dfs_response_cache, "get_redis", get_redis):
+        await cache.set(RANK_ENDPOINT, [{"target": "a.com"}], {"items": [1]}, Decimal("0.01"))
+        value, _ = await cache.get(RANK_ENDPOINT, [{"target": "a.com"}])
+    assert value == {"items": [1]}
+    # One failed attempt parks Redis for the cooldown.
+    assert get_redis.await_count == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_runs_off_the_event_loop(cache):
+    to_thread = AsyncMock(side_effect=lambda fn, *args: fn(*args))
+    with patch.object(dfs_response_cache.asyncio, "to_thread", to_thread):
+        await cache.set(RANK_ENDPOINT, [{"target": "a.com"}], {"items": [1]}, Decimal("0.01"))
+        value, _ = await cache.get(RANK_ENDPOINT, [{"target": "a.com"}])
+    assert value == {"items": [1]}
+    assert [c.args[0].__name__ for c in to_thread.await_args_list] == [
+        "_sqlite_set",
+        "_sqlite_get",
+    ]
+
+
+# ============================================
+# DFSLabsClient wiring
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_second_client_served_from_cache_books_cost_avoided(cache):
+    first = DFSLabsClient(login="l", password="p", response_cache=cache)
+    http = make_mock_http(make_rank_response())
+    with patch.object(first, "_get_client", return_value=http):
+        r1 = await first.domain_rank_overview("acme.com.au")
+    assert first.total_cost_usd == pytest.approx(0.010)
+
+    second = DFSLabsClient(login="l", password="p", response_cache=cache)
+    http2 = make_mock_http(make_rank_response())
+    with patch.object(second, "_get_client", return_value=http2):
+        r2 = await second.domain_rank_overview("acme.com.au")
+
+    assert r2 == r1
+    http2.post.assert_not_called()
+    assert second.total_cost_usd == 0
+    assert second.cost_avoided_usd == pytest.approx(0.010)
+    assert second.cost_avoided_aud == pytest.approx(0.0155)
+
+
+@pytest.mark.asyncio
+async def test_replay_mode_never_touches_network(cache):
+    cache.replay = True
+    client = DFSLabsClient(login="l", password="p", response_cache=cache)
+    http = make_mock_http(make_rank_response())
+    with patch.object(client, "_get_client", return_value=http):
+        assert await client.domain_rank_overview("uncached.com.au") is None
+        assert await client.get_categories() == []
+        assert await client._get_latest_available_date()
+    http.post.assert_not_called()
+    http.get.assert_not_called()
+    assert cache.stats()["replay_misses"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_no_data_responses_are_not_cached(cache):
+    client = DFSLabsClient(login="l", password="p", response_cache=cache)
+    no_data = {"tasks": [{"status_code": 40501, "status_message": "No data", "result": []}]}
+    http = make_mock_http(no_data)
+    with patch.object(client, "_get_client", return_value=http):
+        await client.domain_rank_overview("nodata.com.au")
+        await client.domain_rank_overview("nodata.com.au")
+    assert http.post.await_count == 2
+
+
+def test_get_dfs_response_cache_respects_disable_env(monkeypatch):
+    monkeypatch.setenv("DFS_RESPONSE_CACHE", "0")
+    assert dfs_response_cache.get_dfs_response_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_non_success_task_results_are_not_cached(cache):
+    client = DFSLabsClient(login="l", password="p", response_cache=cache)
+    partial = {
+        "tasks": [
+            {"status_code": 50000, "status_message": "Internal error", "result": [{"items": []}]}
+        ]
+    }
+    http = make_mock_http(partial)
+    with patch.object(client, "_get_client", return_value=http):
+        await client.domain_rank_overview("flaky.com.au")
+        await client.domain_rank_overview("flaky.com.au")
+    assert http.post.await_count == 2
+    assert cache.stats()["hits"] == 0
+
+
+def test_replay_flag_is_per_instance(monkeypatch):
+    monkeypatch.setattr(dfs_response_cache, "_caches", {})
+    monkeypatch.delenv(dfs_response_cache.DFS_CACHE_REPLAY_ENV, raising=False)
+
+    live = dfs_response_cache.get_dfs_response_cache()
+    replay = dfs_response_cache.get_dfs_response_cache(replay=True)
+
+    assert live is not replay
+    assert live.replay is False and replay.replay is True
+    assert dfs_response_cache.get_dfs_response_cache() is live
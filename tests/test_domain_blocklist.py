@@ -1,6 +1,13 @@
 """Tests for domain_blocklist utility. Directive #267"""
 
-from src.utils.domain_blocklist import is_blocked
+from src.utils.domain_blocklist import (
+    BLOCK_CATEGORIES,
+    BLOCKED_DOMAINS,
+    block_reason,
+    is_au_domain,
+    is_blocked,
+    is_blocked_many,
+)
 
 
 def test_blocks_facebook():
@@ -42,3 +49,66 @@ def test_allows_whitespace_stripped():
 def test_blocks_case_insensitive():
     assert is_blocked("Facebook.COM") is True
     assert is_blocked("INSTAGRAM.COM") is True
+
+
+# ── Reversed-label trie + batch API ──────────────────────────────────────────
+
+
+def _legacy_is_blocked(domain):
+    """The pre-trie linear scan, kept for parity checks."""
+    if not domain or not domain.strip():
+        return True
+    d = domain.lower().strip()
+    if not is_au_domain(d):
+        return True
+    if block_reason(d) == "government_tld":
+        return True
+    if d.removeprefix("www.") in BLOCKED_DOMAINS or d in BLOCKED_DOMAINS:
+        return True
+    return any(d.endswith("." + blocked) for blocked in BLOCKED_DOMAINS)
+
+
+def test_trie_matches_legacy_scan():
+    au_blocked = sorted(b for b in BLOCKED_DOMAINS if is_au_domain(b))
+    candidates = ["acme-dental.com.au", "www.acme-dental.com.au", "x.acme.net.au"]
+    for b in au_blocked:
+        first, _, rest = b.partition(".")
+        candidates += [
+            b,
+            "www." + b,
+            "shop.www." + b,
+            "my" + b,  # suffix but not on a label boundary
+            first + "x." + rest,
+            rest,
+            "a.." + b,  # empty label
+            "www.." + b,
+            "." + b,
+        ]
+    for domain in candidates:
+        assert is_blocked(domain) is _legacy_is_blocked(domain), domain
+
+
+def test_empty_labels_do_not_reach_the_trie_terminal():
+    assert is_blocked("a..1300smiles.com.au") is True
+    assert is_blocked("www..1300smiles.com.au") is True
+    assert is_blocked("acme..com.au") is False
+
+
+def test_block_reason_reports_category():
+    assert block_reason("sydneydentist.com.au") is None
+    assert block_reason("") == "empty"
+    assert block_reason("facebook.com") == "non_au_tld"
+    assert block_reason("health.nsw.gov.au") == "non_au_tld"
+    domain = next(iter(sorted(d for d in BLOCK_CATEGORIES["dental_chains"] if is_au_domain(d))))
+    assert block_reason(domain) == "dental_chains"
+    assert block_reason("booking.www." + domain.upper()) == "dental_chains"
+
+
+def test_is_blocked_many_aligns_mask_and_reasons():
+    domains = ["acme-dental.com.au", None, "facebook.com", "acme-dental.com.au", "google.com.au"]
+    mask, reasons = is_blocked_many(domains)
+    assert mask == [is_blocked(d) for d in domains]
+    assert reasons[0] is None and reasons[3] is None
+    assert reasons[1] == "empty"
+    assert reasons[2] == "non_au_tld"
+    assert reasons[4] in BLOCK_CATEGORIES
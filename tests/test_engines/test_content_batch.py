@@ -0,0 +1,260 @@
+"""
+FILE: tests/test_engines/test_content_batch.py
+PURPOSE: ContentEngine.generate_pool_content_batch against a local Message Batches stub
+PHASE: 4 (Engines)
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.engines.content import ContentEngine
+from src.integrations import anthropic_batch
+from src.integrations.anthropic import AnthropicClient
+
+BATCH_ID = "msgbatch_stub01"
+
+
+class _StubBatches(BaseHTTPRequestHandler):
+    """Minimal /v1/messages/batches: one batch, ends on the second poll."""
+
+    state: dict = {}
+
+    def log_message(self, *args):  # keep pytest output quiet
+        pass
+
+    def _send(self, status: int, body: str, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("content-type", content_type)
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def do_POST(self):
+        if self.state["fail"] == "create":
+            self._send(500, '{"error": "overloaded"}')
+            return
+        length = int(self.headers["content-length"])
+        self.state["requests"] = json.loads(self.rfile.read(length))["requests"]
+        self.state["creates"] += 1
+        self._send(200, json.dumps({"id": BATCH_ID, "processing_status": "in_progress"}))
+
+    def do_GET(self):
+        if self.path.endswith("/results"):
+            lines = []
+            for request in self.state["requests"]:
+                custom_id = request["custom_id"]
+                if custom_id in self.state["errored"]:
+                    result = {"type": "errored", "error": {"type": "overloaded_error"}}
+                else:
+                    result = {
+                        "type": "succeeded",
+                        "message": {
+                            "model": request["params"]["model"],
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": self.state["text"] or f"Hi from batch {custom_id}",
+                                }
+                            ],
+                            "usage": {"input_tokens": 1_000_000, "output_tokens": 0},
+                            "stop_reason": "end_turn",
+                        },
+                    }
+                lines.append(json.dumps({"custom_id": custom_id, "result": result}))
+            self._send(200, "\n".join(lines), "application/x-jsonl")
+            return
+        if self.state["fail"] == "poll":
+            self._send(500, '{"error": "overloaded"}')
+            return
+        self.state["polls"] += 1
+        status = "ended" if self.state["polls"] >= 2 else "in_progress"
+        self._send(200, json.dumps({"id": BATCH_ID, "processing_status": status}))
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    _StubBatches.state = {
+        "creates": 0,
+        "polls": 0,
+        "requests": [],
+        "errored": set(),
+        "text": "",
+        "fail": None,
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubBatches)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(anthropic_batch.settings, "anthropic_api_key", "test-key")
+    monkeypatch.setattr(
+        anthropic_batch.settings,
+        "anthropic_batch_api_base",
+        f"http://127.0.0.1:{server.server_port}/v1",
+    )
+    yield _StubBatches.state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def spend_tracker():
+    tracker = AsyncMock()
+    tracker.get_remaining = AsyncMock(return_value=100.0)
+    with patch("src.integrations.anthropic.ai_spend_tracker", tracker):
+        yield tracker
+
+
+@pytest.fixture
+def engine(spend_tracker):
+    content_engine = ContentEngine(anthropic_client=AnthropicClient(api_key="test-key"))
+    content_engine._get_pool_lead = AsyncMock(
+        return_value={"first_name": "Sarah", "company_name": "Acme"}
+    )
+    return content_engine
+
+
+def _items(n):
+    return [
+        {"assignment_id": uuid4(), "lead_pool_id": uuid4(), "campaign_name": "Q4"} for _ in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_submits_once_and_finishes_each_assignment(engine, stub_server, spend_tracker):
+    items = _items(3)
+    errored = str(items[1]["assignment_id"])
+    stub_server["errored"].add(errored)
+    submitted, streamed = [], []
+    interactive = {
+        "content": "Hi from complete",
+        "input_tokens": 10,
+        "output_tokens": 5,
+        "cost_aud": 0.01,
+    }
+
+    with patch.object(engine.anthropic, "complete", AsyncMock(return_value=interactive)):
+        result = await engine.generate_pool_content_batch(
+            AsyncMock(),
+            "sms",
+            items,
+            poll_interval=0.01,
+            on_submitted=AsyncMock(side_effect=submitted.append),
+            on_result=AsyncMock(side_effect=lambda cid, r: streamed.append(cid)),
+        )
+
+    assert result.success
+    assert result.data["batch_id"] == BATCH_ID and submitted == [BATCH_ID]
+    assert stub_server["creates"] == 1
+    assert [r["custom_id"] for r in stub_server["requests"]] == [
+        str(i["assignment_id"]) for i in items
+    ]
+    assert sorted(streamed) == sorted(str(i["assignment_id"]) for i in items)
+
+    messages = {cid: r.data["message"] for cid, r in result.data["results"].items()}
+    assert messages[errored] == "Hi from complete"
+    assert messages[str(items[0]["assignment_id"])].startswith("Hi from batch")
+    assert result.metadata["interactive_fallback"] == 1
+    assert result.metadata["succeeded"] == 3
+
+    # 1M haiku input tokens at the batch discount
+    batch_cost = (
+        AnthropicClient.MODEL_PRICING["claude-3-5-haiku-20241022"]["input"]
+        * AnthropicClient.BATCH_DISCOUNT
+    )
+    recorded = [c.args[0] for c in spend_tracker.add_spend.await_args_list]
+    assert recorded == [pytest.approx(batch_cost)] * 2
+
+
+@pytest.mark.asyncio
+async def test_resume_collects_results_without_resubmitting(engine, stub_server):
+    items = _items(2)
+    stub_server["requests"] = [
+        {"custom_id": str(i["assignment_id"]), "params": {"model": "claude-3-5-haiku-20241022"}}
+        for i in items
+    ]
+
+    result = await engine.generate_pool_content_batch(
+        AsyncMock(), "linkedin", items, batch_id=BATCH_ID, poll_interval=0.01
+    )
+
+    assert result.success and result.metadata["resumed"] is True
+    assert stub_server["creates"] == 0
+    assert all(r.data["message_type"] == "connection" for r in result.data["results"].values())
+
+
+@pytest.mark.asyncio
+async def test_resume_does_not_bill_results_twice(engine, stub_server, spend_tracker):
+    billed = set()
+
+    async def claim(batch_id, custom_id):
+        if (batch_id, custom_id) in billed:
+            return False
+        billed.add((batch_id, custom_id))
+        return True
+
+    spend_tracker.claim_batch_result = AsyncMock(side_effect=claim)
+    items = _items(2)
+
+    first = await engine.generate_pool_content_batch(AsyncMock(), "sms", items, poll_interval=0.01)
+    resumed = await engine.generate_pool_content_batch(
+        AsyncMock(), "sms", items, batch_id=BATCH_ID, poll_interval=0.01
+    )
+
+    assert first.metadata["cost_aud"] > 0
+    assert resumed.success and resumed.metadata["succeeded"] == 2
+    assert resumed.metadata["cost_aud"] == 0
+    assert spend_tracker.add_spend.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("fail", "batch_id", "resumable"), [("create", None, False), ("poll", BATCH_ID, True)]
+)
+async def test_batch_http_errors_fail_the_run(engine, stub_server, fail, batch_id, resumable):
+    stub_server["fail"] = fail
+
+    result = await engine.generate_pool_content_batch(
+        AsyncMock(), "sms", _items(2), poll_interval=0.01
+    )
+
+    assert not result.success and "HTTP 500" in result.error
+    assert result.metadata["batch_id"] == batch_id
+    assert result.metadata["resumable"] is resumable
+
+
+@pytest.mark.asyncio
+async def test_email_batch_results_go_through_fact_check_fallback(engine, stub_server):
+    items = _items(1)
+    stub_server["text"] = json.dumps({"subject": "Hi Sarah", "body": "Acme grew 300% this year"})
+    context = {"person": {"first_name": "Sarah"}, "company": {"name": "Acme"}}
+    with (
+        patch("src.engines.content.build_full_pool_lead_context", AsyncMock(return_value=context)),
+        patch.object(
+            engine,
+            "_fact_check_content",
+            AsyncMock(return_value={"verdict": "FAIL", "risk_level": "HIGH", "cost_aud": 0}),
+        ),
+        patch.object(engine, "_generate_safe_fallback", return_value={"subject": "s", "body": "b"}),
+    ):
+        result = await engine.generate_pool_content_batch(
+            AsyncMock(), "email", items, poll_interval=0.01
+        )
+
+    email = result.data["results"][str(items[0]["assignment_id"])]
+    assert email.success and email.metadata["safe_fallback"] is True
+    assert email.metadata["fact_check_failed"] is True
+    assert stub_server["requests"][0]["params"]["max_tokens"] == 800
+
+
+@pytest.mark.asyncio
+async def test_unprepared_leads_fail_without_a_batch(engine, stub_server):
+    engine._get_pool_lead = AsyncMock(return_value=None)
+
+    result = await engine.generate_pool_content_batch(AsyncMock(), "sms", _items(2))
+
+    assert result.data["batch_id"] is None
+    assert result.metadata["failed"] == 2
+    assert stub_server["creates"] == 0
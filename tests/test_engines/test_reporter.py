@@ -5,7 +5,9 @@ PHASE: 4 (Engines)
 TASK: ENG-012
 """
 
+from collections import Counter
 from datetime import date, datetime, timedelta, UTC
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -94,6 +96,17 @@ def create_mock_activity(
     return activity
 
 
+def mock_counts_result(activities):
+    """Mock result of the activity counts query (rows grouped by campaign/channel/action)."""
+    counts = Counter((a.campaign_id, a.channel.value, a.action) for a in activities)
+    result = MagicMock()
+    result.fetchall.return_value = [
+        SimpleNamespace(campaign_id=campaign_id, channel=channel, action=action, n=n)
+        for (campaign_id, channel, action), n in counts.items()
+    ]
+    return result
+
+
 # ============================================
 # Engine Properties Tests
 # ============================================
@@ -147,9 +160,7 @@ class TestCampaignMetrics:
             ]
 
             # Mock database query
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = activities
-            mock_db_session.execute.return_value = mock_result
+            mock_db_session.execute.return_value = mock_counts_result(activities)
 
             result = await reporter_engine.get_campaign_metrics(
                 db=mock_db_session,
@@ -199,9 +210,7 @@ class TestCampaignMetrics:
                     )
                 )
 
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = activities
-            mock_db_session.execute.return_value = mock_result
+            mock_db_session.execute.return_value = mock_counts_result(activities)
 
             result = await reporter_engine.get_campaign_metrics(
                 db=mock_db_session,
@@ -244,9 +253,7 @@ class TestCampaignMetrics:
                 ),
             ]
 
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = activities
-            mock_db_session.execute.return_value = mock_result
+            mock_db_session.execute.return_value = mock_counts_result(activities)
 
             result = await reporter_engine.get_campaign_metrics(
                 db=mock_db_session,
@@ -266,9 +273,7 @@ class TestCampaignMetrics:
     ):
         """Test campaign metrics with date range."""
         with patch.object(reporter_engine, "get_campaign_by_id", return_value=mock_campaign):
-            mock_result = MagicMock()
-            mock_result.scalars.return_value.all.return_value = []
-            mock_db_session.execute.return_value = mock_result
+            mock_db_session.execute.return_value = mock_counts_result([])
 
             start = date(2025, 1, 1)
             end = date(2025, 1, 31)
@@ -303,7 +308,7 @@ class TestClientMetrics:
             campaigns_result = MagicMock()
             campaigns_result.scalars.return_value.all.return_value = [mock_campaign]
 
-            # Mock activities query
+            # Mock activity counts query
             activities = [
                 create_mock_activity(mock_campaign.id, uuid4(), mock_client.id, "email", "sent"),
                 create_mock_activity(
@@ -311,8 +316,7 @@ class TestClientMetrics:
                 ),
                 create_mock_activity(mock_campaign.id, uuid4(), mock_client.id, "email", "replied"),
             ]
-            activities_result = MagicMock()
-            activities_result.scalars.return_value.all.return_value = activities
+            activities_result = mock_counts_result(activities)
 
             # Mock execute to return different results based on query
             mock_db_session.execute.side_effect = [campaigns_result, activities_result]
@@ -343,8 +347,7 @@ class TestClientMetrics:
                 create_mock_activity(mock_campaign.id, uuid4(), mock_client.id, "email", "sent"),
                 create_mock_activity(mock_campaign.id, uuid4(), mock_client.id, "email", "replied"),
             ]
-            activities_result = MagicMock()
-            activities_result.scalars.return_value.all.return_value = activities
+            activities_result = mock_counts_result(activities)
 
             mock_db_session.execute.side_effect = [campaigns_result, activities_result]
 
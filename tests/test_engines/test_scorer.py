@@ -27,12 +27,25 @@ from src.engines.scorer import (
     get_scorer_engine,
 )
 from src.models.base import ChannelType, LeadStatus
+from src.utils.scoring_config_cache import (
+    get_scoring_config_cache,
+    invalidate_learned_weights,
+    invalidate_propensity_weights,
+)
 
 # ============================================
 # Fixtures
 # ============================================
 
 
+@pytest.fixture(autouse=True)
+def _reset_scoring_config_cache():
+    """Keep the process-wide weight/ICP cache from leaking between tests."""
+    get_scoring_config_cache().clear()
+    yield
+    get_scoring_config_cache().clear()
+
+
 @pytest.fixture
 def mock_db_session():
     """Create mock database session."""
@@ -566,6 +579,594 @@ class TestBatchScoring:
             assert total_in_tiers == result.data["scored"]
 
 
+# ============================================
+# Columnar Batch Scoring Tests
+# ============================================
+
+
+def _pool_fixture_rows(count: int = 60) -> list[dict]:
+    """Deterministic spread of pool rows covering every scoring branch."""
+    import random
+
+    rng = random.Random(24)
+    today = date.today()
+    rows = []
+    for _ in range(count):
+        rows.append(
+            {
+                "id": uuid4(),
+                "email_status": rng.choice(["verified", "catch_all", "guessed", "risky", "", None]),
+                "phone": rng.choice(["+61400000000", None]),
+                "linkedin_url": rng.choice(["https://linkedin.com/in/x", None]),
+                "title": rng.choice(
+                    ["CEO", "Vice President Sales", "Marketing Assistant", "Intern", "", None]
+                ),
+                "seniority": rng.choice(["owner", "c_suite", "manager", "entry", "", None]),
+                "company_domain": rng.choice(["acme.com", "Buyer.com.au", "rival.io", None]),
+                "company_industry": rng.choice(["Software", "Retail", "Real Estate", "", None]),
+                "company_employee_count": rng.choice([0, 1, 3, 25, 50, 120, 500, None]),
+                "company_country": rng.choice(["Australia", "AU", "nz", "Germany", "", None]),
+                "company_is_hiring": rng.choice([True, False, None]),
+                "company_latest_funding_date": rng.choice(
+                    [
+                        today - timedelta(days=100),
+                        today - timedelta(days=500),
+                        (today - timedelta(days=359)).isoformat(),
+                        "not-a-date",
+                        None,
+                    ]
+                ),
+                "is_bounced": rng.choice([True, False]),
+                "is_unsubscribed": rng.random() < 0.1,
+                "pool_status": rng.choice(["available", "assigned", "bounced", "invalid"]),
+                "enrichment_source": rng.choice(["prospeo", "apollo", None]),
+                "enrichment_data": rng.choice(
+                    [
+                        None,
+                        {},
+                        {"abn": "123", "gmb_place_id": "p1", "dataforseo": {"rank": 3}},
+                        {
+                            "linkedin_person": {
+                                "posts": [{"text": "We're hiring! Join our team"}],
+                                "connections": 800,
+                            },
+                            "linkedin_company": {
+                                "posts": [{"text": "Excited to announce our Series A"}],
+                                "followers": 2500,
+                            },
+                        },
+                        '{"siege_waterfall_sources": ["Leadmagic", "Prospeo"], "abn_verified": true}',
+                    ]
+                ),
+            }
+        )
+    return rows
+
+
+BUYER_SIGNALS = {"buyer.com.au": (12, 3)}  # domain -> (boost, times_bought)
+
+
+class TestColumnarBatchScoring:
+    """Columnar batch mode must reproduce the per-lead scores exactly."""
+
+    @pytest.mark.asyncio
+    async def test_pool_columnar_matches_per_lead(self, scorer_engine, mock_db_session):
+        """score_pool_batch(columnar=True) writes the same breakdowns as score_pool_lead."""
+        from types import SimpleNamespace
+
+        rows = _pool_fixture_rows()
+        rows_by_id = {str(r["id"]): r for r in rows}
+        competitors = ["Rival.io"]
+
+        async def buyer_boost(db, domain):
+            signal = BUYER_SIGNALS.get((domain or "").lower())
+            if not signal:
+                return {"boost_points": 0, "reason": None}
+            return scorer_engine._buyer_boost_from_signal(*signal)
+
+        async def buyer_boosts_bulk(db, domains):
+            return {
+                d: scorer_engine._buyer_boost_from_signal(*BUYER_SIGNALS[d])
+                for d in domains
+                if d in BUYER_SIGNALS
+            }
+
+        async def enrichment_query(query, params):
+            row = rows_by_id[params["lead_pool_id"]]
+            result = MagicMock()
+            result.fetchone.return_value = SimpleNamespace(
+                enrichment_data=row["enrichment_data"],
+                enrichment_source=row["enrichment_source"],
+                email_status=row["email_status"],
+            )
+            return result
+
+        mock_db_session.execute = AsyncMock(side_effect=enrichment_query)
+
+        per_lead: dict[str, dict] = {}
+
+        async def capture_single(db, lead_pool_id, score_data, assignment_id=None):
+            per_lead[str(lead_pool_id)] = score_data
+
+        with (
+            patch.object(
+                scorer_engine,
+                "_get_pool_lead",
+                new_callable=AsyncMock,
+                side_effect=lambda db, pid: rows_by_id[str(pid)],
+            ),
+            patch.object(scorer_engine, "_get_buyer_boost", side_effect=buyer_boost),
+            patch.object(scorer_engine, "_update_pool_lead_score", side_effect=capture_single),
+        ):
+            per_lead_result = await scorer_engine.score_pool_batch(
+                db=mock_db_session,
+                lead_pool_ids=[r["id"] for r in rows],
+                competitor_domains=competitors,
+            )
+
+        columnar: dict[str, dict] = {}
+
+        async def capture_bulk(db, breakdowns):
+            columnar.update({b["lead_pool_id"]: b for b in breakdowns})
+
+        missing_id = uuid4()
+        with (
+            patch.object(
+                scorer_engine, "_load_pool_rows_bulk", new_callable=AsyncMock, return_value=rows
+            ),
+            patch.object(scorer_engine, "_load_buyer_boosts_bulk", side_effect=buyer_boosts_bulk),
+            patch.object(scorer_engine, "_bulk_update_pool_scores", side_effect=capture_bulk),
+        ):
+            columnar_result = await scorer_engine.score_pool_batch(
+                db=mock_db_session,
+                lead_pool_ids=[r["id"] for r in rows] + [missing_id],
+                competitor_domains=competitors,
+                columnar=True,
+            )
+
+        assert columnar == per_lead
+        assert columnar_result.metadata["mode"] == "columnar"
+        assert columnar_result.data["scored"] == per_lead_result.data["scored"] == len(rows)
+        assert (
+            columnar_result.data["tier_distribution"] == per_lead_result.data["tier_distribution"]
+        )
+        assert columnar_result.data["failed_leads"] == [
+            {"lead_pool_id": str(missing_id), "error": "Lead not found in pool"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_lead_columnar_matches_per_lead(self, scorer_engine, mock_db_session):
+        """_score_lead_rows_columnar reproduces score_lead, incl. learned weights and funnel."""
+        import random
+        from types import SimpleNamespace
+
+        rng = random.Random(7)
+        today = date.today()
+        learned_client, default_client = uuid4(), uuid4()
+        learned_weights = {
+            "data_quality": 0.1,
+            "authority": 0.4,
+            "company_fit": 0.2,
+            "timing": 0.2,
+            "risk": 0.1,
+        }
+        funnel_patterns = {
+            learned_client: {
+                "show_rate": {
+                    "insights": [
+                        {"type": "als_tier_impact", "tier_show_rates": {"warm": 85, "cool": 65}}
+                    ]
+                },
+                "win_rate": {"win_rate": 35},
+            }
+        }
+        leads = [
+            SimpleNamespace(
+                id=uuid4(),
+                client_id=rng.choice([learned_client, default_client]),
+                email=rng.choice(["a@acme.com", None]),
+                email_verified=rng.choice([True, False, None]),
+                phone=rng.choice(["+61400000000", None]),
+                phone_verified=rng.choice([True, False]),
+                linkedin_url=rng.choice(["https://linkedin.com/in/x", None]),
+                personal_email=rng.choice(["me@gmail.com", None]),
+                title=rng.choice(["Co-Founder", "Head of Growth", "Receptionist", "Analyst", None]),
+                domain=rng.choice(["buyer.com.au", "rival.io", "acme.com", None]),
+                organization_industry=rng.choice(["SaaS", "Hospitality", None]),
+                organization_employee_count=rng.choice([None, 2, 40, 150, 900]),
+                organization_country=rng.choice(["Australia", "usa", "France", None]),
+                organization_is_hiring=rng.choice([True, False]),
+                organization_latest_funding_date=rng.choice(
+                    [None, today - timedelta(days=30), today - timedelta(days=400)]
+                ),
+                employment_start_date=rng.choice(
+                    [None, today - timedelta(days=60), today - timedelta(days=250)]
+                ),
+                bounce_count=rng.choice([0, 0, 2]),
+                status=rng.choice([LeadStatus.ENRICHED, LeadStatus.UNSUBSCRIBED]),
+            )
+            for _ in range(50)
+        ]
+        leads_by_id = {lead.id: lead for lead in leads}
+
+        async def buyer_boost(db, domain):
+            signal = BUYER_SIGNALS.get((domain or "").lower())
+            if not signal:
+                return {"boost_points": 0, "reason": None}
+            return scorer_engine._buyer_boost_from_signal(*signal)
+
+        async def funnel_boost(db, client_id, tier):
+            patterns = funnel_patterns.get(client_id)
+            if not patterns:
+                return {"boost_points": 0, "signals": []}
+            return scorer_engine._funnel_boost_from_patterns(patterns, tier)
+
+        per_lead: dict[str, dict] = {}
+
+        async def capture_single(db, lead, score_data):
+            per_lead[str(lead.id)] = score_data
+
+        with (
+            patch.object(
+                scorer_engine,
+                "get_lead_by_id",
+                new_callable=AsyncMock,
+                side_effect=lambda db, lid: leads_by_id[lid],
+            ),
+            patch.object(
+                scorer_engine,
+                "_get_learned_weights",
+                new_callable=AsyncMock,
+                side_effect=lambda db, cid: learned_weights if cid == learned_client else None,
+            ),
+            patch.object(scorer_engine, "_get_buyer_boost", side_effect=buyer_boost),
+            patch.object(scorer_engine, "_get_funnel_boost", side_effect=funnel_boost),
+            patch.object(scorer_engine, "_update_lead_score", side_effect=capture_single),
+        ):
+            await scorer_engine.score_batch(
+                db=mock_db_session,
+                lead_ids=[lead.id for lead in leads],
+                competitor_domains=["rival.io"],
+            )
+
+        async def buyer_boosts_bulk(db, domains):
+            return {
+                d: scorer_engine._buyer_boost_from_signal(*BUYER_SIGNALS[d])
+                for d in domains
+                if d in BUYER_SIGNALS
+            }
+
+        with (
+            patch.object(
+                scorer_engine,
+                "_load_client_scoring_inputs_bulk",
+                new_callable=AsyncMock,
+                return_value=({learned_client: learned_weights}, funnel_patterns),
+            ),
+            patch.object(scorer_engine, "_load_buyer_boosts_bulk", side_effect=buyer_boosts_bulk),
+        ):
+            breakdowns = await scorer_engine._score_lead_rows_columnar(
+                mock_db_session, leads, competitor_domains=["rival.io"]
+            )
+
+        for breakdown in breakdowns:
+            expected = per_lead[breakdown["lead_id"]]
+            assert breakdown == expected
+
+    @pytest.mark.asyncio
+    async def test_learned_weights_resolve_the_same_on_both_paths(self, scorer_engine):
+        """Real weight loaders: per-lead and columnar give a lead the same breakdown,
+        including a client with two valid WHO patterns (ambiguous -> default)."""
+        from types import SimpleNamespace
+
+        stored_client, who_client, ambiguous_client = uuid4(), uuid4(), uuid4()
+        weights = {"data_quality": 0.1, "authority": 0.4, "company_fit": 0.2}
+        stored = {stored_client: weights, who_client: None, ambiguous_client: None}
+        who = [
+            SimpleNamespace(
+                client_id=who_client,
+                pattern_type="who",
+                patterns={"recommended_weights": {**weights, "timing": 0.3}},
+            ),
+            *(
+                SimpleNamespace(
+                    client_id=ambiguous_client,
+                    pattern_type="who",
+                    patterns={"recommended_weights": {**weights, "risk": r}},
+                )
+                for r in (0.1, 0.2)
+            ),
+        ]
+
+        class _Result:
+            def __init__(self, rows):
+                self.rows = rows
+
+            def __iter__(self):
+                return iter(self.rows)
+
+            def scalar_one_or_none(self):
+                assert len(self.rows) <= 1
+                return self.rows[0] if self.rows else None
+
+            def scalars(self):
+                return SimpleNamespace(all=lambda: list(self.rows))
+
+        def _bound(stmt) -> set:
+            values = set()
+            for value in stmt.compile().params.values():
+                values.update(value if isinstance(value, list | tuple) else [value])
+            return values
+
+        async def execute(stmt, *args):
+            sql = str(stmt)
+            if "FROM clients" in sql:
+                wanted = _bound(stmt)
+                return _Result(
+                    [
+                        SimpleNamespace(id=cid, propensity_learned_weights=w)
+                        for cid, w in stored.items()
+                        if cid in wanted
+                    ]
+                )
+            if "FROM conversion_patterns" in sql:
+                wanted = _bound(stmt)
+                return _Result([p for p in who if p.client_id in wanted and "who" in wanted])
+            return MagicMock()
+
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=execute)
+        leads = [
+            SimpleNamespace(
+                id=uuid4(),
+                client_id=client_id,
+                email="a@acme.com",
+                email_verified=True,
+                phone=None,
+                phone_verified=False,
+                linkedin_url="https://linkedin.com/in/x",
+                personal_email=None,
+                title="Head of Growth",
+                domain="acme.com",
+                organization_industry="SaaS",
+                organization_employee_count=40,
+                organization_country="Australia",
+                organization_is_hiring=True,
+                organization_latest_funding_date=None,
+                employment_start_date=date.today() - timedelta(days=60),
+                bounce_count=0,
+                status=LeadStatus.ENRICHED,
+            )
+            for client_id in stored
+        ]
+        no_boost = AsyncMock(return_value={"boost_points": 0, "reason": None, "signals": []})
+
+        per_lead: dict[str, dict] = {}
+
+        async def capture_single(db, lead, score_data):
+            per_lead[str(lead.id)] = score_data
+
+        with (
+            patch.object(
+                scorer_engine,
+                "get_lead_by_id",
+                new_callable=AsyncMock,
+                side_effect=lambda db, lid: next(lead for lead in leads if lead.id == lid),
+            ),
+            patch.object(scorer_engine, "_get_buyer_boost", no_boost),
+            patch.object(scorer_engine, "_get_funnel_boost", no_boost),
+            patch.object(scorer_engine, "_update_lead_score", side_effect=capture_single),
+        ):
+            await scorer_engine.score_batch(db=db, lead_ids=[lead.id for lead in leads])
+
+        get_scoring_config_cache().clear()
+        with patch.object(
+            scorer_engine, "_load_buyer_boosts_bulk", new_callable=AsyncMock, return_value={}
+        ):
+            breakdowns = await scorer_engine._score_lead_rows_columnar(db, leads)
+
+        assert len(per_lead) == len(breakdowns) == 3
+        for breakdown in breakdowns:
+            assert breakdown == per_lead[breakdown["lead_id"]]
+        sources = {b["lead_id"]: b["weights_source"] for b in breakdowns}
+        assert [sources[str(lead.id)] for lead in leads] == ["learned", "learned", "default"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_is_single_values_statement(self, scorer_engine, mock_db_session):
+        """Pool write-back is one UPDATE ... FROM (VALUES ...) and one commit."""
+        breakdowns = [
+            {
+                "lead_pool_id": str(uuid4()),
+                "propensity_score": 70,
+                "als_tier": "warm",
+                "als_components": {"data_quality": 12},
+            }
+            for _ in range(3)
+        ]
+
+        await scorer_engine._bulk_update_pool_scores(mock_db_session, breakdowns)
+
+        assert mock_db_session.execute.await_count == 1
+        assert mock_db_session.commit.await_count == 1
+        sql = str(mock_db_session.execute.await_args.args[0])
+        params = mock_db_session.execute.await_args.args[1]
+        assert "FROM (VALUES" in sql
+        assert params["id_2"] == breakdowns[2]["lead_pool_id"]
+        assert params["als_components_0"] == '{"data_quality": 12}'
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_rolls_back_before_next_chunk(self, scorer_engine, mock_db_session):
+        """A chunk that errors resets the transaction; later chunks still score."""
+        rows = _pool_fixture_rows(4)
+        mock_db_session.rollback = AsyncMock()
+        load = AsyncMock(side_effect=[RuntimeError("current transaction is aborted"), rows[2:]])
+        written: list[dict] = []
+
+        async def capture_bulk(db, breakdowns):
+            written.extend(breakdowns)
+
+        with (
+            patch("src.engines.scorer.COLUMNAR_CHUNK_SIZE", 2),
+            patch.object(scorer_engine, "_load_pool_rows_bulk", load),
+            patch.object(
+                scorer_engine, "_load_buyer_boosts_bulk", new_callable=AsyncMock, return_value={}
+            ),
+            patch.object(scorer_engine, "_bulk_update_pool_scores", side_effect=capture_bulk),
+        ):
+            result = await scorer_engine.score_pool_batch(
+                db=mock_db_session, lead_pool_ids=[r["id"] for r in rows], columnar=True
+            )
+
+        assert mock_db_session.rollback.await_count == 1
+        assert result.data["failures"] == 2
+        assert result.data["scored"] == 2
+        assert [b["lead_pool_id"] for b in written] == [str(r["id"]) for r in rows[2:]]
+
+    def test_values_chunks_respect_param_budget(self):
+        """Large write-backs split so no statement exceeds BULK_UPDATE_MAX_PARAMS."""
+        from src.engines.scorer import BULK_UPDATE_MAX_PARAMS, _values_update_chunks
+
+        columns = [("id", "uuid"), ("als_score", "integer"), ("als_tier", "text")]
+        rows = [{"id": str(i), "als_score": i, "als_tier": "cold"} for i in range(25000)]
+
+        chunks = _values_update_chunks(columns, rows)
+
+        assert sum(len(params) for _, params in chunks) == len(rows) * len(columns)
+        assert all(len(params) <= BULK_UPDATE_MAX_PARAMS for _, params in chunks)
+
+
+# ============================================
+# Weight / ICP Config Cache Tests
+# ============================================
+
+
+def _ceo_weights_result(value):
+    result = MagicMock()
+    result.fetchone.return_value = MagicMock(value=value)
+    return result
+
+
+class TestScoringConfigCache:
+    """Scorer config lookups go through the process-wide cache."""
+
+    @pytest.mark.asyncio
+    async def test_ceo_weights_queried_once_until_invalidated(self, scorer_engine, mock_db_session):
+        """Repeated lookups hit the cache; a new weights version forces a reload."""
+        mock_db_session.execute.return_value = _ceo_weights_result({"propensity": {"a": 1}})
+
+        for _ in range(5):
+            weights = await scorer_engine._get_weights_from_ceo_memory(mock_db_session)
+        assert weights == {"propensity": {"a": 1}}
+        assert mock_db_session.execute.await_count == 1
+
+        invalidate_propensity_weights()
+        mock_db_session.execute.return_value = _ceo_weights_result({"propensity": {"a": 2}})
+        weights = await scorer_engine._get_weights_from_ceo_memory(mock_db_session)
+        assert weights == {"propensity": {"a": 2}}
+        assert mock_db_session.execute.await_count == 2
+
+        stats = get_scoring_config_cache().stats()["namespaces"]["ceo_weights"]
+        assert stats["hits"] == 4
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ceo_weights_error_fallback_not_cached(self, scorer_engine, mock_db_session):
+        """A failed ceo_memory read falls back without poisoning the cache."""
+        mock_db_session.execute.side_effect = RuntimeError("db down")
+        weights = await scorer_engine._get_weights_from_ceo_memory(mock_db_session)
+        assert weights["propensity"] == {}
+
+        mock_db_session.execute.side_effect = None
+        mock_db_session.execute.return_value = _ceo_weights_result({"propensity": {"a": 1}})
+        weights = await scorer_engine._get_weights_from_ceo_memory(mock_db_session)
+        assert weights == {"propensity": {"a": 1}}
+
+    @pytest.mark.asyncio
+    async def test_learned_weights_cached_per_client(self, scorer_engine, mock_db_session):
+        """Learned weights (including 'none learned') are cached per client."""
+        client_result = MagicMock()
+        client_result.scalar_one_or_none.return_value = MagicMock(
+            propensity_learned_weights={"authority": 0.4}
+        )
+        mock_db_session.execute.return_value = client_result
+        client_id = uuid4()
+
+        first = await scorer_engine._get_learned_weights(mock_db_session, client_id)
+        second = await scorer_engine._get_learned_weights(mock_db_session, client_id)
+        assert first == second == {"authority": 0.4}
+        assert mock_db_session.execute.await_count == 1
+
+        await scorer_engine._get_learned_weights(mock_db_session, uuid4())
+        assert mock_db_session.execute.await_count == 2
+
+        invalidate_learned_weights(client_id)
+        await scorer_engine._get_learned_weights(mock_db_session, client_id)
+        assert mock_db_session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_loader_reads_only_learned_weight_cache_misses(
+        self, scorer_engine, mock_db_session
+    ):
+        """The columnar loader shares the per-client cache with _get_learned_weights."""
+        from types import SimpleNamespace
+
+        first, second = uuid4(), uuid4()
+        client_queries: list[set] = []
+
+        async def execute(stmt, *args):
+            if "FROM clients" in str(stmt):
+                wanted = {
+                    v
+                    for value in stmt.compile().params.values()
+                    for v in (value if isinstance(value, list) else [value])
+                }
+                client_queries.append(wanted)
+                return [
+                    SimpleNamespace(id=cid, propensity_learned_weights={"authority": 0.4})
+                    for cid in wanted
+                ]
+            return []
+
+        mock_db_session.execute = AsyncMock(side_effect=execute)
+
+        learned, _ = await scorer_engine._load_client_scoring_inputs_bulk(
+            mock_db_session, [first, second]
+        )
+        assert learned == {first: {"authority": 0.4}, second: {"authority": 0.4}}
+        assert client_queries == [{first, second}]
+
+        await scorer_engine._load_client_scoring_inputs_bulk(mock_db_session, [first, second])
+        assert len(client_queries) == 1  # both cached
+
+        invalidate_learned_weights(second)
+        await scorer_engine._load_client_scoring_inputs_bulk(mock_db_session, [first, second])
+        assert client_queries[-1] == {second}
+
+        # The per-lead path reads the same cache entry
+        mock_db_session.execute.reset_mock()
+        assert await scorer_engine._get_learned_weights(mock_db_session, first) == {
+            "authority": 0.4
+        }
+        assert mock_db_session.execute.await_count == 0
+        stats = get_scoring_config_cache().stats()["namespaces"]["learned_weights"]
+        assert stats["hits"] == 4 and stats["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_icp_config_cached_per_campaign(self, scorer_engine, mock_db_session):
+        """Campaign ICP config is read once per campaign."""
+        icp_result = MagicMock()
+        icp_result.fetchone.return_value = MagicMock(
+            icp_config={"employee_range": [5, 50], "countries": ["AU"]}
+        )
+        mock_db_session.execute.return_value = icp_result
+        campaign_id = uuid4()
+
+        for _ in range(3):
+            config = await scorer_engine._get_icp_config(mock_db_session, campaign_id)
+        assert config["countries"] == ["AU"]
+        assert mock_db_session.execute.await_count == 1
+
+
 # ============================================
 # VERIFICATION CHECKLIST
 # ============================================
@@ -581,3 +1182,5 @@ class TestBatchScoring:
 # [x] Test full scoring flow
 # [x] Test batch scoring
 # [x] Test tier distribution calculation
+# [x] Test columnar batch parity (pool + lead paths)
+# [x] Test weight/ICP config caching and invalidation
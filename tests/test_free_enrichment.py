@@ -8,6 +8,8 @@ import dns.resolver
 import httpx
 import pytest
 
+from src.integrations import async_dns
+from src.integrations.async_dns import AsyncDNSResolver
 from src.pipeline.free_enrichment import FreeEnrichment
 
 
@@ -28,11 +30,20 @@ def make_fe(conn: MagicMock | None = None) -> FreeEnrichment:
 # ─── Test 1: DNS precheck returns False for dead domain ───────────────────────
 
 
-def test_dns_precheck_skips_dead_domain():
+@pytest.fixture
+def dns_resolver(monkeypatch: pytest.MonkeyPatch) -> AsyncDNSResolver:
+    """Fresh shared resolver per test so cached answers don't leak between tests."""
+    resolver = AsyncDNSResolver()
+    monkeypatch.setattr(async_dns, "_resolver", resolver)
+    return resolver
+
+
+@pytest.mark.asyncio
+async def test_dns_precheck_skips_dead_domain(dns_resolver):
     """_dns_precheck returns False when NXDOMAIN is raised for 'A' record."""
     fe = make_fe()
-    with patch("dns.resolver.Resolver.resolve", side_effect=dns.resolver.NXDOMAIN):
-        result = fe._dns_precheck("dead.com.au")
+    with patch.object(dns_resolver, "_query", AsyncMock(side_effect=dns.resolver.NXDOMAIN)):
+        result = await fe._dns_precheck("dead.com.au")
     assert result is False
 
 
@@ -86,20 +97,18 @@ def test_spider_extracts_team_page_urls():
 # ─── Test 6: DNS detects Google MX ───────────────────────────────────────────
 
 
-def test_dns_detects_google_mx():
+@pytest.mark.asyncio
+async def test_dns_detects_google_mx(dns_resolver):
     """_enrich_dns identifies google MX provider from exchange hostname."""
     fe = make_fe()
-    mock_mx = MagicMock()
-    mock_mx.exchange = MagicMock()
-    mock_mx.exchange.__str__ = lambda self: "aspmx.l.google.com."
 
-    def resolve_side_effect(domain, rdtype):
+    async def query(domain, rdtype):
         if rdtype == "MX":
-            return [mock_mx]
-        raise Exception("no record")
+            return ("aspmx.l.google.com",), 300
+        raise dns.resolver.NoAnswer
 
-    with patch("dns.resolver.Resolver.resolve", side_effect=resolve_side_effect):
-        result = fe._enrich_dns("example.com.au")
+    with patch.object(dns_resolver, "_query", side_effect=query):
+        result = await fe._enrich_dns("example.com.au")
 
     assert result["dns_mx_provider"] == "google"
 
@@ -107,19 +116,18 @@ def test_dns_detects_google_mx():
 # ─── Test 7: DNS detects SPF ──────────────────────────────────────────────────
 
 
-def test_dns_detects_spf():
+@pytest.mark.asyncio
+async def test_dns_detects_spf(dns_resolver):
     """_enrich_dns sets dns_has_spf=True when SPF TXT record is present."""
     fe = make_fe()
-    mock_txt = MagicMock()
-    mock_txt.__str__ = lambda self: "v=spf1 include:_spf.google.com ~all"
 
-    def resolve_side_effect(domain, rdtype):
+    async def query(domain, rdtype):
         if rdtype == "TXT" and "domainkey" not in domain:
-            return [mock_txt]
-        raise Exception("no record")
+            return ("v=spf1 include:_spf.google.com ~all",), 300
+        raise dns.resolver.NoAnswer
 
-    with patch("dns.resolver.Resolver.resolve", side_effect=resolve_side_effect):
-        result = fe._enrich_dns("example.com.au")
+    with patch.object(dns_resolver, "_query", side_effect=query):
+        result = await fe._enrich_dns("example.com.au")
 
     assert result["dns_has_spf"] is True
 
@@ -127,17 +135,18 @@ def test_dns_detects_spf():
 # ─── Test 8: DNS detects DKIM ─────────────────────────────────────────────────
 
 
-def test_dns_detects_dkim():
+@pytest.mark.asyncio
+async def test_dns_detects_dkim(dns_resolver):
     """_enrich_dns sets dns_has_dkim=True when DKIM selector TXT record exists."""
     fe = make_fe()
 
-    def resolve_side_effect(domain, rdtype):
+    async def query(domain, rdtype):
         if "google._domainkey" in domain and rdtype == "TXT":
-            return [MagicMock()]
-        raise Exception("no record")
+            return ("v=DKIM1; k=rsa; p=abc",), 300
+        raise dns.resolver.NoAnswer
 
-    with patch("dns.resolver.Resolver.resolve", side_effect=resolve_side_effect):
-        result = fe._enrich_dns("example.com.au")
+    with patch.object(dns_resolver, "_query", side_effect=query):
+        result = await fe._enrich_dns("example.com.au")
 
     assert result["dns_has_dkim"] is True
 
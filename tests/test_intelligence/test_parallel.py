@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from src.intelligence.parallel import run_parallel
+from src.intelligence.parallel import PipelineStage, run_parallel, run_pipelined
 
 
 @pytest.mark.asyncio
@@ -55,3 +55,73 @@ async def test_empty_input():
 
     results = await run_parallel([], noop, label="test")
     assert results == []
+
+
+def _stage(name, delays, log, concurrency=2):
+    async def run(item):
+        log.append((name, item["id"], "start"))
+        await asyncio.sleep(delays.get(item["id"], 0.0))
+        item[name] = True
+        log.append((name, item["id"], "end"))
+        return item
+
+    return PipelineStage(name, run, concurrency=concurrency, label=name)
+
+
+@pytest.mark.asyncio
+async def test_pipelined_items_advance_without_stage_barrier():
+    log = []
+    items = [{"id": i} for i in range(3)]
+    stages = [_stage("a", {0: 0.2}, log), _stage("b", {}, log)]
+
+    results, stats = await run_pipelined(items, stages)
+
+    assert all(r["a"] and r["b"] for r in results)
+    # Item 1 finished stage b while item 0 was still in stage a.
+    assert log.index(("b", 1, "end")) < log.index(("a", 0, "end"))
+    assert stats["stages"]["a"]["items"] == 3
+    assert stats["barrier_estimate_s"] >= stats["stages"]["a"]["barrier_makespan_s"]
+    assert stats["stopped"] is False
+
+
+@pytest.mark.asyncio
+async def test_pipelined_skip_and_error_isolation():
+    async def drop_odd(item):
+        if item["id"] == 3:
+            raise ValueError("boom")
+        item["dropped"] = item["id"] % 2 == 1
+        return item
+
+    async def mark(item):
+        item["marked"] = True
+        return item
+
+    items = [{"id": i} for i in range(5)]
+    results, stats = await run_pipelined(
+        items,
+        [PipelineStage("gate", drop_odd, 2), PipelineStage("mark", mark, 2)],
+        skip=lambda d: d.get("dropped"),
+    )
+
+    assert [r.get("marked", False) for r in results] == [True, False, True, True, True]
+    assert stats["stages"]["gate"]["failures"] == 1
+    assert stats["stages"]["mark"]["items"] == 4
+
+
+@pytest.mark.asyncio
+async def test_pipelined_stop_halts_new_stage_work():
+    spent = []
+
+    async def spend(item):
+        spent.append(item)
+        return item
+
+    results, stats = await run_pipelined(
+        list(range(10)),
+        [PipelineStage("pay", spend, 1), PipelineStage("pay_again", spend, 1)],
+        should_stop=lambda: len(spent) >= 3,
+    )
+
+    assert stats["stopped"] is True
+    assert len(spent) == 3
+    assert results == list(range(10))
@@ -0,0 +1,190 @@
+# FILE: tests/test_llm_response_cache.py
+# PURPOSE: Unit tests for the LLM response cache + AnthropicClient.complete wiring
+
+"""
+Unit tests for LLMResponseCache.
+
+All tests use mocks — NO live API calls. Redis is disabled (``use_redis=False``)
+or forced down so the SQLite tier is exercised against a tmp file.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.integrations import llm_response_cache
+from src.integrations.anthropic import AnthropicClient
+from src.integrations.llm_response_cache import LLMResponseCache, cache_key
+
+HAIKU = "claude-3-5-haiku-20241022"
+
+# ============================================
+# Fixtures
+# ============================================
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMResponseCache(sqlite_path=tmp_path / "llm.sqlite3", use_redis=False)
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def spend_tracker():
+    tracker = AsyncMock()
+    tracker.get_remaining = AsyncMock(return_value=100.0)
+    with patch("src.integrations.anthropic.ai_spend_tracker", tracker):
+        yield tracker
+
+
+@pytest.fixture
+def client(cache, spend_tracker):
+    c = AnthropicClient(api_key="test-key")
+    c._response_cache = cache
+    response = SimpleNamespace(
+        content=[SimpleNamespace(text='{"intent": "interested"}')],
+        model=HAIKU,
+        usage=SimpleNamespace(input_tokens=1_000_000, output_tokens=0, cache_read_input_tokens=0),
+        stop_reason="end_turn",
+    )
+    c._client = MagicMock()
+    c._client.messages.create = AsyncMock(return_value=response)
+    return c
+
+
+# ============================================
+# Keying
+# ============================================
+
+
+def test_cache_key_covers_every_request_field():
+    base = cache_key(HAIKU, "sys", "prompt", 0.0, 200)
+    assert base == cache_key(HAIKU, "sys", "prompt", 0, 200)
+    assert base != cache_key("claude-sonnet-4-20250514", "sys", "prompt", 0.0, 200)
+    assert base != cache_key(HAIKU, "other", "prompt", 0.0, 200)
+    assert base != cache_key(HAIKU, "sys", "prompt", 0.0, 300)
+
+
+# ============================================
+# Cache tiers, TTL, eviction
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_sqlite_round_trip_and_expiry(cache):
+    await cache.set("k", HAIKU, {"content": "x"})
+    assert await cache.get("k") == {"content": "x"}
+
+    cache.ttl = -1
+    await cache.set("stale", HAIKU, {"content": "y"})
+    assert await cache.get("stale") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_eviction_keeps_the_most_recently_used(cache):
+    cache.max_entries = 2
+    await cache.set("a", HAIKU, {"content": "a"})
+    time.sleep(0.01)
+    await cache.set("b", HAIKU, {"content": "b"})
+    time.sleep(0.01)
+    await cache.get("a")  # touch: b is now least recently used
+    time.sleep(0.01)
+    await cache.set("c", HAIKU, {"content": "c"})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None and await cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_runs_off_the_event_loop_and_uses_the_lru_index(cache):
+    to_thread = AsyncMock(side_effect=lambda fn, *args: fn(*args))
+    with patch.object(llm_response_cache.asyncio, "to_thread", to_thread):
+        await cache.set("k", HAIKU, {"content": "x"})
+        assert await cache.get("k") == {"content": "x"}
+    assert [c.args[0].__name__ for c in to_thread.await_args_list] == [
+        "_sqlite_set",
+        "_sqlite_get",
+    ]
+
+    plan = cache._conn().execute(
+        "EXPLAIN QUERY PLAN SELECT key FROM llm_response_cache ORDER BY last_used DESC LIMIT 1"
+    )
+    assert "llm_response_cache_last_used" in " ".join(str(row) for row in plan)
+
+
+@pytest.mark.asyncio
+async def test_eviction_only_runs_past_max_entries_and_survives_reopen(tmp_path):
+    path = tmp_path / "llm.sqlite3"
+    first = LLMResponseCache(sqlite_path=path, use_redis=False, max_entries=2)
+    await first.set("a", HAIKU, {"content": "a"})
+    time.sleep(0.01)
+    await first.set("b", HAIKU, {"content": "b"})
+    time.sleep(0.01)
+    await first.set("a", HAIKU, {"content": "a2"})  # replace: still 2 rows, nothing evicted
+    assert await first.get("b") is not None
+    first.close()
+
+    reopened = LLMResponseCache(sqlite_path=path, use_redis=False, max_entries=2)
+    time.sleep(0.01)
+    await reopened.set("c", HAIKU, {"content": "c"})
+    assert await reopened.get("a") is None  # least recently used after b was read
+    assert await reopened.get("b") is not None and await reopened.get("c") is not None
+    rows = reopened._conn().execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+    assert rows == 2
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_eviction_trims_below_the_cap_in_one_pass(cache):
+    cache.max_entries = 20
+    for i in range(21):
+        await cache.set(f"k{i}", HAIKU, {"content": i})
+    count = cache._conn().execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+    assert count == 18  # trimmed to 90% of the cap, newest kept
+    assert await cache.get("k20") is not None and await cache.get("k2") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_parks_redis_and_falls_back_to_sqlite(tmp_path):
+    c = LLMResponseCache(sqlite_path=tmp_path / "llm.sqlite3")
+    with patch.object(
+        llm_response_cache, "get_redis", AsyncMock(side_effect=ConnectionError("down"))
+    ) as get_redis:
+        await c.set("k", HAIKU, {"content": "x"})
+        assert await c.get("k") == {"content": "x"}
+    assert get_redis.await_count == 1
+    c.close()
+
+
+# ============================================
+# AnthropicClient.complete wiring
+# ============================================
+
+
+@pytest.mark.asyncio
+async def test_repeat_deterministic_call_is_served_from_cache(client, spend_tracker):
+    first = await client.complete("classify", system="sys", temperature=0.0, cache=True)
+    second = await client.complete("classify", system="sys", temperature=0.0, cache=True)
+
+    client._client.messages.create.assert_awaited_once()
+    spend_tracker.add_spend.assert_awaited_once()
+    assert second["content"] == first["content"]
+    assert second["cache_hit"] is True and second["cost_aud"] == 0.0
+    assert second["cost_saved_aud"] == pytest.approx(first["cost_aud"])
+    assert client._response_cache.stats()["aud_saved"] == pytest.approx(first["cost_aud"])
+    assert client._response_cache.stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("temperature", "use_cache"), [(0.7, True), (0.0, False)])
+async def test_cache_bypass(client, temperature, use_cache):
+    for _ in range(2):
+        result = await client.complete("write", temperature=temperature, cache=use_cache)
+        assert "cache_hit" not in result
+
+    assert client._client.messages.create.await_count == 2
+    assert client._response_cache.stats()["hits"] == 0
@@ -0,0 +1,123 @@
+"""
+Tests for ABNNameMatcher — ranked keyword-intersection matching on abn_registry.
+
+Covers:
+  - SQL shape: lower(...) LIKE per keyword (index-servable), similarity ranking
+  - rank_candidates: confidence tier beats state match, state breaks tier ties
+  - match_many: one UNION ALL round trip per chunk, results aligned with queries
+  - FreeEnrichment._local_abn_match reuses run()-batch prefetched candidates
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.pipeline import abn_name_matcher
+from src.pipeline.abn_name_matcher import (
+    ABNNameMatcher,
+    ABNQuery,
+    clean_registry_name,
+    rank_candidates,
+)
+from src.pipeline.free_enrichment import FreeEnrichment
+
+
+class _Ctx:
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+
+    async def __aenter__(self) -> Any:
+        return self._conn
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+def _row(name: str, state: str = "NSW", similarity: float = 0.5, **extra: Any) -> dict:
+    return {
+        "abn": "12345678901",
+        "legal_name": name,
+        "trading_name": None,
+        "gst_registered": True,
+        "entity_type": "Australian Private Company",
+        "registration_date": None,
+        "state": state,
+        "name_similarity": similarity,
+        **extra,
+    }
+
+
+def test_clean_registry_name_strips_entity_noise():
+    assert clean_registry_name("THE TRUSTEE FOR PYMBLE DENTAL PTY LTD") == "PYMBLE DENTAL"
+
+
+@pytest.mark.asyncio
+async def test_match_builds_index_servable_like_query():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    await ABNNameMatcher(lambda: _Ctx(conn)).match(ABNQuery.of(["Dentists", "pymble"]))
+
+    sql, *params = conn.fetch.await_args.args
+    assert params == ["dentists pymble", "%dentists%", "%pymble%"]
+    assert "lower(legal_name) LIKE $2 OR lower(trading_name) LIKE $2" in sql
+    assert "lower(legal_name) LIKE $3 OR lower(trading_name) LIKE $3" in sql
+    assert "ORDER BY name_similarity DESC" in sql
+    assert "%" not in sql.replace("LIKE", "")
+
+
+def test_rank_prefers_confidence_tier_then_state():
+    query = ABNQuery.of(["pymble", "dental"], state_hint="NSW")
+    rows = [
+        _row("Haircuts Unlimited", state="NSW", similarity=0.9),
+        _row("Pymble Dental Pty Ltd", state="QLD", similarity=0.4),
+        _row("Pymble Dental", state="NSW", similarity=0.3),
+    ]
+    ranked = rank_candidates(query, rows)
+    assert [c.row["state"] for c in ranked[:2]] == ["NSW", "QLD"]
+    assert ranked[0].row["legal_name"] == "Pymble Dental"
+    assert ranked[-1].row["legal_name"] == "Haircuts Unlimited"
+
+
+@pytest.mark.asyncio
+async def test_match_many_is_one_round_trip_per_chunk(monkeypatch):
+    monkeypatch.setattr(abn_name_matcher, "BATCH_QUERIES", 2)
+    queries = [
+        ABNQuery.of(["pymble", "dental"]),
+        ABNQuery.of([]),
+        ABNQuery.of(["melton", "dental"]),
+        ABNQuery.of(["avenue", "dental"]),
+    ]
+
+    async def fetch(sql: str, *params: Any) -> list[dict]:
+        rows = []
+        if "0 AS query_idx" in sql:
+            rows.append(_row("Pymble Dental", query_idx=0))
+        if "3 AS query_idx" in sql:
+            rows.append(_row("Avenue Dental", query_idx=3))
+        return rows
+
+    conn = MagicMock()
+    conn.fetch = AsyncMock(side_effect=fetch)
+    results = await ABNNameMatcher(lambda: _Ctx(conn)).match_many(queries)
+
+    assert conn.fetch.await_count == 2
+    assert "UNION ALL" in conn.fetch.await_args_list[0].args[0]
+    assert [len(r) for r in results] == [1, 0, 0, 1]
+    assert results[3][0].row["legal_name"] == "Avenue Dental"
+
+
+@pytest.mark.asyncio
+async def test_local_abn_match_uses_prefetched_candidates():
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    fe = FreeEnrichment(conn)
+    query = ABNQuery.of(["pymble", "dental"], "NSW")
+    fe._abn_prefetch = {query: rank_candidates(query, [_row("Pymble Dental")])}
+
+    row = await fe._local_abn_match(["pymble", "dental"], "NSW")
+
+    assert row["legal_name"] == "Pymble Dental"
+    conn.fetch.assert_not_awaited()
@@ -24,9 +24,9 @@ def _make_pool_mock() -> MagicMock:
 def _make_fe(spider=None, dns=None, abn=None):
     pool = _make_pool_mock()
     fe = FreeEnrichment(pool)
-    fe._dns_precheck = MagicMock(return_value=True)
+    fe._dns_precheck = AsyncMock(return_value=True)
     fe._scrape_website = AsyncMock(return_value=spider or {"title": "Test Dental"})
-    fe._enrich_dns = MagicMock(return_value=dns or {"has_spf": True})
+    fe._enrich_dns = AsyncMock(return_value=dns or {"has_spf": True})
     fe._match_abn = AsyncMock(return_value=abn or {"abn_matched": False})
     return fe
 
@@ -58,7 +58,7 @@ async def test_returns_none_on_exception():
     pool = _make_pool_mock()
     fe = FreeEnrichment(pool)
     fe._scrape_website = AsyncMock(side_effect=Exception("Spider down"))
-    fe._enrich_dns = MagicMock(return_value={})
+    fe._enrich_dns = AsyncMock(return_value={})
     fe._match_abn = AsyncMock(return_value={"abn_matched": False})
     assert await fe.enrich("broken.com.au") is None
 
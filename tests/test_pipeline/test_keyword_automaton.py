@@ -0,0 +1,107 @@
+"""Tests for the Aho-Corasick keyword automaton behind _extract_domain_keywords.
+
+Parity is checked against the legacy sorted-scan _semantic_split (reproduced
+below with equal-length ties resolved leftmost, the automaton's documented
+rule) over the lexicon examples and a seeded synthetic domain corpus.
+"""
+
+from __future__ import annotations
+
+import pickle
+import random
+
+import pytest
+
+from src.pipeline.free_enrichment import FreeEnrichment, _semantic_split
+from src.pipeline.keyword_automaton import (
+    LEXICON_AUTOMATON,
+    LEXICON_TERMS,
+    KeywordAutomaton,
+    automaton_for,
+)
+
+
+def _legacy_split(text: str, known_terms: frozenset[str]) -> list[str]:
+    """Pre-automaton algorithm: scan every term longest-first with str.find."""
+    if len(text) < 3:
+        return []
+    matches = []
+    for term in known_terms:
+        idx = text.find(term)
+        if idx >= 0:
+            matches.append((idx, term))
+    if not matches:
+        return [text]
+    idx, term = min(matches, key=lambda m: (-len(m[1]), m[0]))
+    before = text[:idx]
+    after = text[idx + len(term) :]
+    result = []
+    if len(before) >= 3:
+        result.extend(_legacy_split(before, known_terms))
+    result.append(term)
+    if len(after) >= 3:
+        result.extend(_legacy_split(after, known_terms))
+    return result
+
+
+def _synthetic_parts(n: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    terms = sorted(LEXICON_TERMS)
+    noise = ["xyz", "qq", "abc", "bros", "co", "hq", "one", "best", "a", "the"]
+    parts = []
+    for _ in range(n):
+        pieces = [rng.choice(terms) for _ in range(rng.randint(1, 3))]
+        for _ in range(rng.randint(0, 2)):
+            pieces.insert(rng.randint(0, len(pieces)), rng.choice(noise))
+        parts.append("".join(pieces))
+    return parts
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "theavenuedental",
+        "meltondentalhouse",
+        "sydneycriminallawyers",
+        "glenferriedental",
+        "dentistsatpymble",
+        "zzzzzz",
+        "ab",
+    ],
+)
+def test_segment_matches_legacy_on_known_examples(text: str) -> None:
+    assert LEXICON_AUTOMATON.segment(text) == _legacy_split(text, LEXICON_TERMS)
+
+
+def test_segment_parity_over_synthetic_corpus() -> None:
+    for part in _synthetic_parts(3000):
+        assert LEXICON_AUTOMATON.segment(part) == _legacy_split(part, LEXICON_TERMS), part
+
+
+def test_find_all_reports_every_overlapping_occurrence() -> None:
+    automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+    assert sorted(automaton.find_all("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_custom_term_set_builds_its_own_automaton() -> None:
+    custom = frozenset({"blue", "bluewater", "water"})
+    assert automaton_for(custom) is not LEXICON_AUTOMATON
+    assert _semantic_split("bigbluewaterco", custom) == ["big", "bluewater"]
+    assert automaton_for(LEXICON_TERMS) is LEXICON_AUTOMATON
+
+
+def test_automaton_pickles() -> None:
+    restored = pickle.loads(pickle.dumps(LEXICON_AUTOMATON))
+    assert restored.segment("meltondentalhouse") == LEXICON_AUTOMATON.segment("meltondentalhouse")
+
+
+def test_extract_domain_keywords_unchanged_for_documented_examples() -> None:
+    assert FreeEnrichment._extract_domain_keywords("meltondentalhouse.com.au") == [
+        "melton",
+        "dental",
+        "house",
+    ]
+    assert FreeEnrichment._extract_domain_keywords("happy-dentistry.com.au") == [
+        "happy",
+        "dentistry",
+    ]
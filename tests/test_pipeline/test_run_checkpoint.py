@@ -0,0 +1,215 @@
+"""Tests for per-domain stage checkpoints (src/pipeline/run_checkpoint.py)."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.intelligence.parallel import run_pipelined
+from src.orchestration import cohort_runner
+from src.orchestration.cohort_runner import _cohort_stages, _new_domain
+from src.pipeline import run_checkpoint
+from src.pipeline.run_checkpoint import (
+    RunCheckpointStore,
+    checkpoint_path,
+    run_checkpointed,
+)
+
+
+async def _stage2(domain_data: dict, dfs) -> dict:
+    domain_data["stage2"] = {"serp_abn": "12345678901", "dfs": dfs}
+    domain_data["cost_usd"] += 0.01
+    return domain_data
+
+
+async def _stage8(domain_data: dict, dfs, bd=None, lm=None) -> dict:
+    domain_data["stage8_verify"] = {"ok": True}
+    domain_data["stage8_contacts"] = {"email": {"email": "jane@acme.com.au"}}
+    domain_data["cost_usd"] += 0.05
+    return domain_data
+
+
+@pytest.mark.asyncio
+async def test_recorded_stages_rehydrate_after_reopen(tmp_path):
+    path = checkpoint_path(tmp_path)
+    store = RunCheckpointStore(path)
+    store.record_run({"domains": [["acme.com.au", "dental"]]})
+    d = _new_domain("acme.com.au", "dental")
+    d = await run_checkpointed(store, "stage2", d, _stage2, "dfs")
+    d = await run_checkpointed(store, "stage8", d, _stage8, "dfs", bd="bd", lm="lm")
+    store.close()
+
+    resumed = RunCheckpointStore.open_existing(path)
+    fresh = resumed.rehydrate(_new_domain("acme.com.au", "dental"))
+
+    assert resumed.run_meta == {"domains": [["acme.com.au", "dental"]]}
+    assert resumed.completed_stages("acme.com.au") == {"stage2", "stage8"}
+    assert fresh["stage2"] == {"serp_abn": "12345678901", "dfs": "dfs"}
+    assert fresh["stage8_contacts"]["email"]["email"] == "jane@acme.com.au"
+    assert fresh["cost_usd"] == pytest.approx(0.06)
+    assert resumed.stats()["records_loaded"] == 3
+    resumed.close()
+
+
+@pytest.mark.asyncio
+async def test_completed_stage_is_skipped_on_resume(tmp_path):
+    store = RunCheckpointStore(checkpoint_path(tmp_path))
+    await run_checkpointed(store, "stage2", _new_domain("acme.com.au", "dental"), _stage2, "dfs")
+
+    calls = []
+
+    async def _spy(domain_data, dfs):
+        calls.append(domain_data["domain"])
+        return domain_data
+
+    d = store.rehydrate(_new_domain("acme.com.au", "dental"))
+    await run_checkpointed(store, "stage2", d, _spy, "dfs")
+    await run_checkpointed(store, "stage2", _new_domain("other.com.au", "dental"), _spy, "dfs")
+
+    assert calls == ["other.com.au"]
+    assert store.stats()["stages_skipped"] == 1
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_without_store_is_a_plain_call():
+    d = await run_checkpointed(None, "stage2", _new_domain("acme.com.au", "dental"), _stage2, "x")
+    assert d["stage2"]["dfs"] == "x"
+
+
+def test_run_meta_is_written_once(tmp_path):
+    store = RunCheckpointStore(checkpoint_path(tmp_path))
+    store.record_run({"domains": [["a.com.au", "dental"]]})
+    store.record_run({"domains": [["b.com.au", "dental"]]})
+    store.close()
+
+    assert RunCheckpointStore(checkpoint_path(tmp_path)).run_meta == {
+        "domains": [["a.com.au", "dental"]]
+    }
+
+
+def test_open_existing_requires_a_checkpoint(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        RunCheckpointStore.open_existing(tmp_path / "missing" / "checkpoint.sqlite3")
+
+
+def test_stage_outputs_rehydrate_with_their_types(tmp_path):
+    path = checkpoint_path(tmp_path)
+    store = RunCheckpointStore(path)
+    d = _new_domain("acme.com.au", "dental")
+    stage4 = {
+        "fetched_at": datetime(2026, 10, 16, 9, 30, tzinfo=UTC),
+        "abn_registered": date(2019, 3, 1),
+        "spend": Decimal("0.0325"),
+        "bu_id": uuid4(),
+        "rank_range": (3, 7),
+        "tags": {"dental", "chain"},
+        "nested": [{"at": datetime(2026, 1, 1, tzinfo=UTC)}],
+    }
+    d["stage4"] = stage4
+    assert store.record_stage(d, "stage4") is True
+    store.close()
+
+    fresh = RunCheckpointStore(path).rehydrate(_new_domain("acme.com.au", "dental"))
+    assert fresh["stage4"] == stage4
+
+
+def test_unsupported_type_leaves_stage_unrecorded(tmp_path):
+    store = RunCheckpointStore(checkpoint_path(tmp_path))
+    d = _new_domain("acme.com.au", "dental")
+    d["stage2"] = {"client": object()}
+
+    assert store.record_stage(d, "stage2") is False
+    assert not store.is_done("acme.com.au", "stage2")
+    assert store.stats()["records_written"] == 0
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_resume_after_budget_kill_makes_progress(tmp_path, monkeypatch):
+    """Rehydrated spend already exceeds the cap; only new spend counts on resume."""
+    calls = []
+
+    def fake(name):
+        async def run(d, *args):
+            calls.append(name)
+            d["cost_usd"] += 2.0 if name == "stage2" else 0.01
+            return d
+
+        return run
+
+    for i in range(2, 12):
+        monkeypatch.setattr(cohort_runner, f"_run_stage{i}", fake(f"stage{i}"))
+    path = checkpoint_path(tmp_path)
+    cap = 1.0
+
+    # First run: Stage 2 spend trips the cap and the run is killed.
+    store = RunCheckpointStore(path)
+    pipeline = [_new_domain("acme.com.au", "dental")]
+    _, stats = await run_pipelined(
+        pipeline,
+        _cohort_stages(None, None, None, None, checkpoint=store),
+        should_stop=lambda: cohort_runner._check_budget(pipeline, cap),
+    )
+    store.close()
+    assert stats["stopped"] and calls == ["stage2"]
+
+    # Resume: same cap, rehydrated $2.00 is the baseline.
+    store = RunCheckpointStore.open_existing(path)
+    pipeline = [store.rehydrate(_new_domain("acme.com.au", "dental"))]
+    baseline = sum(d["cost_usd"] for d in pipeline)
+    results, stats = await run_pipelined(
+        pipeline,
+        _cohort_stages(None, None, None, None, checkpoint=store),
+        should_stop=lambda: cohort_runner._check_budget(pipeline, cap, baseline),
+    )
+    store.close()
+
+    assert not stats["stopped"]
+    assert calls == ["stage2"] + [f"stage{i}" for i in range(3, 12)]
+    assert results[0]["cost_usd"] == pytest.approx(2.09)
+
+
+@pytest.mark.asyncio
+async def test_stage_that_reports_an_error_is_retried_on_resume(tmp_path):
+    path = checkpoint_path(tmp_path)
+    store = RunCheckpointStore(path)
+
+    async def _failing(domain_data, dfs):
+        domain_data["errors"].append("stage2: SERP timeout")
+        domain_data["stage2"] = {}
+        return domain_data
+
+    d = _new_domain("acme.com.au", "dental")
+    d["errors"].append("stage8_suppressed: jane@acme.com.au suppressed (unsubscribed)")
+    d = await run_checkpointed(store, "stage2", d, _failing, "dfs")
+    assert not store.is_done("acme.com.au", "stage2")
+    assert store.stats()["records_written"] == 0
+    store.close()
+
+    resumed = RunCheckpointStore.open_existing(path)
+    d = await run_checkpointed(resumed, "stage2", d, _stage2, "dfs")
+    assert resumed.is_done("acme.com.au", "stage2")
+    assert d["errors"] == ["stage8_suppressed: jane@acme.com.au suppressed (unsubscribed)"]
+    resumed.close()
+
+
+@pytest.mark.asyncio
+async def test_stage_records_are_written_off_the_event_loop(tmp_path, monkeypatch):
+    offloaded = []
+    to_thread = run_checkpoint.asyncio.to_thread
+
+    async def _spy(fn, *args):
+        offloaded.append(fn.__name__)
+        return await to_thread(fn, *args)
+
+    monkeypatch.setattr(run_checkpoint.asyncio, "to_thread", _spy)
+    store = RunCheckpointStore(checkpoint_path(tmp_path))
+    await run_checkpointed(store, "stage2", _new_domain("acme.com.au", "dental"), _stage2, "dfs")
+
+    assert offloaded == ["_append"]
+    assert store.is_done("acme.com.au", "stage2")
+    store.close()
@@ -0,0 +1,124 @@
+"""Tests for the activity count rollup (src/services/activity_rollup_service.py)."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services import activity_rollup_service as rollup
+from src.services.activity_rollup_service import (
+    ActivityCount,
+    check_rollup_parity,
+    fetch_activity_counts,
+    refresh_activity_rollup,
+)
+
+T0 = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+def _watermark(low, cutoff):
+    result = MagicMock()
+    result.fetchone.return_value = SimpleNamespace(low=low, cutoff=cutoff)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_refresh_folds_one_bounded_slice_and_moves_watermark(mock_session):
+    upsert = MagicMock(rowcount=12)
+    mock_session.execute.side_effect = [
+        _watermark(T0, T0 + timedelta(days=30)),
+        upsert,
+        MagicMock(),
+    ]
+
+    step = await refresh_activity_rollup(mock_session, max_span=timedelta(days=7))
+
+    assert step == {"from": T0, "to": T0 + timedelta(days=7), "groups": 12, "caught_up": False}
+    fold_params = mock_session.execute.await_args_list[1].args[1]
+    assert fold_params == {"low": T0, "high": T0 + timedelta(days=7)}
+    watermark_params = mock_session.execute.await_args_list[2].args[1]
+    assert watermark_params["high"] == T0 + timedelta(days=7)
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_stops_at_the_settle_cutoff(mock_session):
+    cutoff = T0 + timedelta(hours=3)
+    mock_session.execute.side_effect = [_watermark(T0, cutoff), MagicMock(rowcount=2), MagicMock()]
+
+    step = await refresh_activity_rollup(mock_session)
+
+    assert step["to"] == cutoff and step["caught_up"] is True
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_a_noop_when_caught_up_or_empty(mock_session):
+    mock_session.execute.side_effect = [_watermark(T0, T0), _watermark(None, T0)]
+
+    assert (await refresh_activity_rollup(mock_session))["caught_up"] is True
+    assert (await refresh_activity_rollup(mock_session))["groups"] == 0
+    assert mock_session.rollback.await_count == 2
+    mock_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_requires_the_watermark_row(mock_session):
+    result = MagicMock()
+    result.fetchone.return_value = None
+    mock_session.execute.return_value = result
+
+    with pytest.raises(RuntimeError, match="activity_daily"):
+        await refresh_activity_rollup(mock_session)
+
+
+@pytest.mark.asyncio
+async def test_fetch_filters_both_rollup_and_tail(mock_session):
+    campaign_id = uuid4()
+    result = MagicMock()
+    result.fetchall.return_value = [
+        SimpleNamespace(campaign_id=campaign_id, channel="email", action="sent", n=7)
+    ]
+    mock_session.execute.return_value = result
+
+    counts = await fetch_activity_counts(
+        mock_session, date(2026, 10, 1), date(2026, 10, 7), campaign_id=campaign_id
+    )
+
+    assert counts == [ActivityCount(campaign_id, "email", "sent", 7)]
+    sql = str(mock_session.execute.await_args.args[0])
+    assert sql.count("campaign_id = :campaign_id") == 2
+    assert "client_id = :client_id" not in sql
+    assert mock_session.execute.await_args.args[1]["campaign_id"] == campaign_id
+
+
+@pytest.mark.asyncio
+async def test_parity_reports_each_mismatched_group(mock_session):
+    c1 = uuid4()
+    rolled = [ActivityCount(c1, "email", "sent", 10), ActivityCount(c1, "email", "opened", 4)]
+    raw = [ActivityCount(c1, "email", "sent", 10), ActivityCount(c1, "sms", "sent", 1)]
+
+    with (
+        patch.object(rollup, "fetch_activity_counts", AsyncMock(return_value=rolled)),
+        patch.object(rollup, "scan_activity_counts", AsyncMock(return_value=raw)),
+    ):
+        parity = await check_rollup_parity(mock_session, date(2026, 10, 1), date(2026, 10, 2))
+
+    assert parity["match"] is False
+    assert (parity["rollup_total"], parity["raw_total"]) == (14, 11)
+    assert [(m["channel"], m["action"], m["rollup"], m["raw"]) for m in parity["mismatches"]] == [
+        ("email", "opened", 4, 0),
+        ("sms", "sent", 0, 1),
+    ]
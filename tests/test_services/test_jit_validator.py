@@ -457,6 +457,31 @@ class TestJITValidatorByEmail:
         assert result.block_code == "lead_not_found"
 
 
+def _bulk_row(pool_lead: dict, assignment: dict | None) -> MagicMock:
+    """Row of the set-based pool + assignment query."""
+    data = {**pool_lead, "is_assigned": assignment is not None}
+    data.update({k: v for k, v in (assignment or {}).items() if k not in ("id", "status")})
+    for field in ("total_touches", "cooling_until", "has_replied", "reply_intent"):
+        data.setdefault(field, None)
+    data.setdefault("max_touches", 10)
+    data.setdefault("last_contacted_at", None)
+    data.setdefault("channels_used", [])
+    return MagicMock(_mapping=data)
+
+
+def _client_gate_results(today_count: int = 5) -> list[MagicMock]:
+    """Rate limit, warmup and physical address query results (all passing)."""
+    rate_result = MagicMock()
+    rate_result.fetchone.return_value = (today_count,)
+    warmup_result = MagicMock()
+    warmup_result.fetchone.return_value = MagicMock(created_at=datetime.now() - timedelta(days=30))
+    branding_result = MagicMock()
+    branding_result.fetchone.return_value = MagicMock(
+        branding={"address": "123 Main St, Sydney NSW 2000, AU"}
+    )
+    return [rate_result, warmup_result, branding_result]
+
+
 class TestJITValidatorBatch:
     """Tests for batch validation."""
 
@@ -466,45 +491,131 @@ class TestJITValidatorBatch:
     ):
         """Test batch validation of multiple leads."""
         client_id = uuid4()
-        leads = [
-            {"lead_pool_id": uuid4()},
-            {"lead_pool_id": uuid4()},
-            {"lead_pool_id": uuid4()},
-        ]
+        pool_ids = [uuid4(), uuid4(), uuid4()]
+        leads = [{"lead_pool_id": pool_id} for pool_id in pool_ids]
 
-        # Mock all validations passing
         pool_result = MagicMock()
-        pool_result.fetchone.return_value = MagicMock(_mapping=valid_pool_lead)
-
-        assign_result = MagicMock()
-        assign_result.fetchone.return_value = MagicMock(_mapping=valid_assignment)
-
-        rate_result = MagicMock()
-        rate_result.fetchone.return_value = MagicMock(count=5)
-
-        warmup_result = MagicMock()
-        warmup_result.fetchone.return_value = MagicMock(
-            created_at=datetime.now() - timedelta(days=30)
-        )
+        pool_result.fetchall.return_value = [
+            _bulk_row(
+                {**valid_pool_lead, "id": pool_id, "email": f"lead{i}@example.com"},
+                valid_assignment,
+            )
+            for i, pool_id in enumerate(pool_ids)
+        ]
+        suppression_result = MagicMock()
+        suppression_result.fetchall.return_value = []
 
-        # Each lead needs 4 db calls
         mock_session.execute.side_effect = [
             pool_result,
-            assign_result,
-            rate_result,
-            warmup_result,
-            pool_result,
-            assign_result,
-            rate_result,
-            warmup_result,
-            pool_result,
-            assign_result,
-            rate_result,
-            warmup_result,
+            suppression_result,
+            *_client_gate_results(),
         ]
 
         results = await jit_validator.batch_validate(leads, client_id, "email")
 
         assert len(results) == 3
-        for _lead_id, result in results.items():
+        for pool_id in pool_ids:
+            result = results[str(pool_id)]
             assert isinstance(result, JITValidationResult)
+            assert result.is_valid is True
+            assert result.lead_pool_id == pool_id
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_constant_queries_and_same_ladder(
+        self, jit_validator, mock_session, valid_pool_lead, valid_assignment
+    ):
+        """Every rung of validate()'s ladder is applied in memory, in the same order."""
+        client_id = uuid4()
+        ids = {
+            name: uuid4()
+            for name in (
+                "missing",
+                "bounced",
+                "suppressed",
+                "unassigned",
+                "maxed",
+                "cooling",
+                "ok",
+            )
+        }
+
+        def lead(name: str, **overrides) -> dict:
+            return {**valid_pool_lead, "id": ids[name], "email": f"{name}@Example.com", **overrides}
+
+        pool_result = MagicMock()
+        pool_result.fetchall.return_value = [
+            _bulk_row(lead("bounced", is_bounced=True), valid_assignment),
+            _bulk_row(lead("suppressed"), valid_assignment),
+            _bulk_row(lead("unassigned"), None),
+            _bulk_row(lead("maxed"), {**valid_assignment, "total_touches": 10}),
+            _bulk_row(
+                lead("cooling"),
+                {**valid_assignment, "cooling_until": datetime.now() + timedelta(days=1)},
+            ),
+            _bulk_row(lead("ok"), valid_assignment),
+        ]
+        suppression_result = MagicMock()
+        suppression_result.fetchall.return_value = [
+            MagicMock(
+                email="suppressed@example.com",
+                suppressed=True,
+                reason="competitor",
+                details=None,
+            )
+        ]
+
+        mock_session.execute.side_effect = [
+            pool_result,
+            suppression_result,
+            *_client_gate_results(),
+        ]
+
+        results = await jit_validator.batch_validate(
+            [{"lead_pool_id": str(pool_id)} for pool_id in ids.values()],
+            client_id,
+            "email",
+        )
+
+        codes = {name: results[str(pool_id)].block_code for name, pool_id in ids.items()}
+        assert codes == {
+            "missing": "lead_not_found",
+            "bounced": "bounced_globally",
+            "suppressed": "suppressed_competitor",
+            "unassigned": "not_assigned",
+            "maxed": "max_touches_reached",
+            "cooling": "cooling_period",
+            "ok": None,
+        }
+        assert results[str(ids["ok"])].is_valid is True
+        # pool+assignment, suppression, rate limit, warmup, address — independent of batch size
+        assert mock_session.execute.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_rate_limit_blocks_all_eligible(
+        self, jit_validator, mock_session, valid_pool_lead, valid_assignment
+    ):
+        """Client-level gates are evaluated once and applied to every eligible lead."""
+        pool_ids = [uuid4(), uuid4()]
+        pool_result = MagicMock()
+        pool_result.fetchall.return_value = [
+            _bulk_row({**valid_pool_lead, "id": pool_id}, valid_assignment) for pool_id in pool_ids
+        ]
+        suppression_result = MagicMock()
+        suppression_result.fetchall.return_value = []
+        rate_result = MagicMock()
+        rate_result.fetchone.return_value = (17,)
+
+        mock_session.execute.side_effect = [pool_result, suppression_result, rate_result]
+
+        results = await jit_validator.batch_validate(
+            [{"lead_pool_id": pool_id} for pool_id in pool_ids], uuid4(), "linkedin"
+        )
+
+        assert {r.block_code for r in results.values()} == {"rate_limit_linkedin"}
+        assert mock_session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_empty(self, jit_validator, mock_session):
+        """No lead_pool_ids means no queries."""
+        assert await jit_validator.batch_validate([{}], uuid4(), "email") == {}
+        mock_session.execute.assert_not_called()
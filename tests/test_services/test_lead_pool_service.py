@@ -289,3 +289,80 @@ class TestLeadPoolServiceBulk:
         # bulk_create returns tuple (created_count, updated_count)
         assert created == 3
         assert updated == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_counts_from_xmax(self, pool_service, mock_session, sample_pool_lead):
+        """Bulk mode reports created/updated from RETURNING (xmax = 0)."""
+        leads = [{**sample_pool_lead, "email": f"lead{i}@example.com"} for i in range(3)]
+
+        upsert_result = MagicMock()
+        upsert_result.fetchall.return_value = [
+            MagicMock(inserted=True),
+            MagicMock(inserted=False),
+            MagicMock(inserted=True),
+        ]
+        mock_session.execute.return_value = upsert_result
+
+        created, updated = await pool_service.bulk_create(leads, bulk=True)
+
+        assert (created, updated) == (2, 1)
+        assert mock_session.execute.await_count == 1
+        mock_session.commit.assert_awaited_once()
+
+        query = str(mock_session.execute.await_args.args[0])
+        params = mock_session.execute.await_args.args[1]
+        assert "ON CONFLICT (email) DO UPDATE" in query
+        assert "RETURNING (xmax = 0) AS inserted" in query
+        # Defaulted fields never overwrite stored values on conflict
+        assert "email_status = COALESCE(NULLIF(EXCLUDED.email_status, 'unknown')" in query
+        assert "title = COALESCE(EXCLUDED.title, lead_pool.title)" in query
+        assert params["email_0"] == "lead0@example.com"
+        assert params["email_status_2"] == "verified"
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_merges_duplicate_emails(
+        self, pool_service, mock_session, sample_pool_lead
+    ):
+        """Repeated emails collapse into one row and count as updates."""
+        leads = [
+            {**sample_pool_lead, "email": "John@Example.com ", "title": "CEO"},
+            {**sample_pool_lead, "email": "john@example.com", "title": "Founder", "phone": None},
+            {"first_name": "No Email"},
+        ]
+        upsert_result = MagicMock()
+        upsert_result.fetchall.return_value = [MagicMock(inserted=True)]
+        mock_session.execute.return_value = upsert_result
+
+        created, updated = await pool_service.bulk_upsert(leads)
+
+        assert (created, updated) == (1, 1)
+        params = mock_session.execute.await_args.args[1]
+        assert params["email_0"] == "john@example.com"
+        assert params["title_0"] == "Founder"
+        assert params["phone_0"] == sample_pool_lead["phone"]
+        assert "email_1" not in params
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_chunks(self, pool_service, mock_session, sample_pool_lead):
+        """Each chunk is one statement and one commit."""
+        leads = [{**sample_pool_lead, "email": f"lead{i}@example.com"} for i in range(5)]
+
+        def upsert_result(query, params):
+            result = MagicMock()
+            rows = sum(1 for key in params if key.startswith("email_status_"))
+            result.fetchall.return_value = [MagicMock(inserted=True)] * rows
+            return result
+
+        mock_session.execute.side_effect = upsert_result
+
+        created, updated = await pool_service.bulk_upsert(leads, chunk_size=2)
+
+        assert (created, updated) == (5, 0)
+        assert mock_session.execute.await_count == 3
+        assert mock_session.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_empty(self, pool_service, mock_session):
+        """No rows with an email means no statements."""
+        assert await pool_service.bulk_upsert([{"first_name": "x"}]) == (0, 0)
+        mock_session.execute.assert_not_called()
@@ -0,0 +1,179 @@
+"""Tests for the durable webhook ingestion queue (src/services/webhook_event_queue.py)."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.services import webhook_event_queue as queue
+from src.services.webhook_event_queue import drain_webhook_events, enqueue_webhook_event, plan_batch
+
+
+def _smartlead(row_id: int, event: str, message: str, at: str, event_id: str | None = None):
+    return {
+        "id": row_id,
+        "provider": "smartlead",
+        "payload": {
+            "event_type": event,
+            "message_id": message,
+            "event_id": event_id or f"ev-{row_id}",
+            "timestamp": at,
+            "lead_email": "jane@acme.com.au",
+        },
+    }
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+def test_plan_batch_drops_redeliveries_and_coalesces_open_bursts():
+    rows = [
+        _smartlead(1, "email_opened", "m1", "2026-10-16T01:00:30+00:00"),
+        _smartlead(2, "email_opened", "m1", "2026-10-16T01:00:00+00:00"),
+        _smartlead(3, "email_opened", "m1", "2026-10-16T01:00:40+00:00"),
+        _smartlead(4, "email_opened", "m1", "2026-10-16T02:00:00+00:00"),
+        _smartlead(5, "email_opened", "m2", "2026-10-16T01:00:10+00:00"),
+        _smartlead(6, "email_clicked", "m1", "2026-10-16T01:00:05+00:00", event_id="ev-1"),
+        _smartlead(7, "email_clicked", "m1", "2026-10-16T01:00:06+00:00"),
+        _smartlead(8, "email_clicked", "", "2026-10-16T01:00:06+00:00"),
+        {"id": 9, "provider": "smartlead", "payload": {"message_id": "m1"}},
+    ]
+
+    work, skipped, failed = plan_batch(rows)
+
+    assert [row_id for row_id, _, _ in work] == [2, 4, 5, 7]
+    assert skipped == {
+        1: "coalesced",
+        3: "coalesced",
+        6: "duplicate",
+        8: "ignored:no_message_id",
+        9: "ignored:unknown_event_type",
+    }
+    assert failed == {}
+
+
+def test_plan_batch_fails_only_unparseable_rows_and_reads_epoch_ms():
+    rows = [
+        _smartlead(1, "email_opened", "m1", 1_760_576_400_000),  # epoch ms
+        _smartlead(2, "email_opened", "m1", 1_760_576_430),  # epoch s, 30s later
+        _smartlead(3, "email_opened", "m2", 1e30),  # out of range
+        {"id": 4, "provider": "smartlead", "payload": ["not", "a", "dict"]},
+        _smartlead(5, "email_clicked", "m3", "2026-10-16T01:00:00+00:00"),
+    ]
+
+    work, skipped, failed = plan_batch(rows)
+
+    assert [row_id for row_id, _, _ in work] == [1, 5]
+    assert skipped == {2: "coalesced"}
+    assert sorted(failed) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_inserts_raw_payload_and_commits(mock_session):
+    mock_session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=42))
+
+    row_id = await enqueue_webhook_event(mock_session, "resend", {"type": "email.opened"})
+
+    assert row_id == 42
+    params = mock_session.execute.await_args.args[1]
+    assert params["provider"] == "resend"
+    assert json.loads(params["payload"]) == {"type": "email.opened"}
+    mock_session.commit.assert_awaited_once()
+
+    with pytest.raises(ValueError):
+        await enqueue_webhook_event(mock_session, "postmark", {})
+
+
+@pytest.mark.asyncio
+async def test_drain_resolves_activities_once_and_records_each_surviving_event(mock_session):
+    rows = [
+        _smartlead(1, "email_opened", "m1", "2026-10-16T01:00:00+00:00"),
+        _smartlead(2, "email_opened", "m1", "2026-10-16T01:00:20+00:00"),
+        _smartlead(3, "email_opened", "m2", "2026-10-16T01:00:00+00:00"),
+        _smartlead(4, "email_replied", "m2", "2026-10-16T01:05:00+00:00"),
+        _smartlead(5, "email_clicked", "gone", "2026-10-16T01:05:00+00:00"),
+    ]
+    activities = {"m1": SimpleNamespace(id=uuid4()), "m2": SimpleNamespace(id=uuid4())}
+    service = MagicMock()
+    service.find_activities_by_provider_ids = AsyncMock(return_value=activities)
+    service.record_open = AsyncMock()
+    service.record_click = AsyncMock()
+    reply_handler = AsyncMock()
+
+    with (
+        patch.object(queue, "claim_webhook_events", AsyncMock(return_value=rows)),
+        patch.object(queue, "complete_webhook_events", AsyncMock()) as complete,
+        patch.object(queue, "EmailEventsService", return_value=service),
+    ):
+        stats = await drain_webhook_events(mock_session, reply_handler, batch_size=10)
+
+    service.find_activities_by_provider_ids.assert_awaited_once_with(["m1", "m2", "m2", "gone"])
+    assert [c.kwargs["activity_id"] for c in service.record_open.await_args_list] == [
+        activities["m1"].id,
+        activities["m2"].id,
+    ]
+    service.record_click.assert_not_awaited()
+    reply_handler.assert_awaited_once()
+    assert reply_handler.await_args.args[1] == "smartlead"
+    assert complete.await_args.args[1] == {
+        1: "processed",
+        2: "coalesced",
+        3: "processed",
+        4: "processed",
+        5: "ignored:activity_not_found",
+    }
+    assert stats == {
+        "claimed": 5,
+        "recorded": 2,
+        "replies": 1,
+        "duplicates": 0,
+        "coalesced": 1,
+        "ignored": 1,
+        "failed": 0,
+        "activity_lookups": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_event_is_left_for_retry_and_batch_continues(mock_session):
+    rows = [
+        _smartlead(1, "email_opened", "m1", "2026-10-16T01:00:00+00:00"),
+        _smartlead(2, "email_opened", "m2", "2026-10-16T01:00:00+00:00"),
+    ]
+    activities = {"m1": SimpleNamespace(id=uuid4()), "m2": SimpleNamespace(id=uuid4())}
+    service = MagicMock()
+    service.find_activities_by_provider_ids = AsyncMock(return_value=activities)
+    service.record_open = AsyncMock(side_effect=[RuntimeError("deadlock detected"), None])
+
+    with (
+        patch.object(queue, "claim_webhook_events", AsyncMock(return_value=rows)),
+        patch.object(queue, "complete_webhook_events", AsyncMock()) as complete,
+        patch.object(queue, "EmailEventsService", return_value=service),
+    ):
+        stats = await drain_webhook_events(mock_session)
+
+    mock_session.rollback.assert_awaited_once()
+    assert complete.await_args.args[1:] == ({2: "processed"}, {1: "deadlock detected"})
+    assert stats["failed"] == 1 and stats["recorded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_queue_does_no_lookups(mock_session):
+    with (
+        patch.object(queue, "claim_webhook_events", AsyncMock(return_value=[])),
+        patch.object(queue, "complete_webhook_events", AsyncMock()) as complete,
+    ):
+        stats = await drain_webhook_events(mock_session)
+
+    assert stats["claimed"] == 0 and stats["activity_lookups"] == 0
+    complete.assert_not_awaited()
@@ -1,18 +1,31 @@
-"""Tests for SuppressionManager — in-memory v1."""
+"""Tests for SuppressionManager — in-memory store and snapshot suppression index."""
 
+import re
+
+import httpx
 import pytest
 
-from src.pipeline.suppression_manager import SuppressionManager, _store, _lock
+from src.pipeline import suppression_manager as sm
+from src.pipeline.suppression_manager import SuppressionManager, _lock, _store
+
+_INITIAL_INDEX_STATE = dict(sm._index_state)
 
 
 @pytest.fixture(autouse=True)
-def clear_store():
-    """Reset in-memory store between tests."""
+def clear_store(monkeypatch):
+    """Reset in-memory store and index state between tests.
+
+    Supabase is unconfigured by default, so the in-memory store is the whole
+    suppression list; index tests opt back in via fake_table.
+    """
+    monkeypatch.delenv("SUPABASE_URL", raising=False)
     with _lock:
         _store.clear()
+        sm._index_state.update(_INITIAL_INDEX_STATE)
     yield
     with _lock:
         _store.clear()
+        sm._index_state.update(_INITIAL_INDEX_STATE)
 
 
 # ---------------------------------------------------------------------------
@@ -125,3 +138,248 @@ def test_stats_shape_populated():
     assert stats["by_reason"]["unsubscribe"] == 1
     assert stats["by_channel"]["email"] == 2
     assert stats["by_channel"]["all"] == 1
+
+
+# ---------------------------------------------------------------------------
+# suppression index (snapshot + watermark refresh)
+# ---------------------------------------------------------------------------
+
+
+def _row(email: str, ts: str, reason: str = "bounce") -> dict:
+    return {
+        "email": email,
+        "reason": reason,
+        "channel": "all",
+        "source": "system",
+        "suppressed_at": ts,
+    }
+
+
+@pytest.fixture
+def fake_table(monkeypatch):
+    """Stand-in for suppression_list; records the `since` bound of every fetch."""
+    table: list[dict] = []
+    fetches: list[str | None] = []
+
+    async def fetch_since(since):
+        fetches.append(since)
+        if since is None:
+            return list(table)
+        return [row for row in table if sm._parse_ts(row["suppressed_at"]) >= sm._parse_ts(since)]
+
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "test-key")
+    monkeypatch.setattr(sm, "_db_fetch_since", fetch_since)
+    return table, fetches
+
+
+def test_snapshot_loaded_once_then_checks_are_in_memory(fake_table):
+    table, fetches = fake_table
+    table.append(_row("Snap@Example.com", "2026-01-01T00:00:00+00:00"))
+
+    for _ in range(1000):
+        SuppressionManager.check_before_outreach("someone@example.com")
+    check = SuppressionManager.check_before_outreach("snap@example.com")
+
+    assert check["suppressed"] is True
+    assert check["reason"] == "bounce"
+    assert fetches == [None]
+    assert SuppressionManager.get_index_status()["loaded"] is True
+
+
+def test_bulk_check_is_authoritative_after_snapshot(fake_table):
+    table, _ = fake_table
+    table.extend(_row(f"s{i}@x.com", "2026-01-01T00:00:00+00:00") for i in range(50))
+
+    emails = [f"s{i}@x.com" for i in range(100)]
+    result = SuppressionManager.bulk_check(emails)
+
+    assert sum(result.values()) == 50
+    assert result["s0@x.com"] is True
+    assert result["s99@x.com"] is False
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_uses_watermark(fake_table):
+    table, fetches = fake_table
+    table.append(_row("old@x.com", "2026-01-01T00:00:00+00:00"))
+    await SuppressionManager.refresh_index()
+
+    table.append(_row("new@x.com", "2026-01-02T00:00:00.500000+00:00"))
+    result = await SuppressionManager.refresh_index()
+
+    # old@x.com is re-read by the overlap window and deduped by email
+    assert result == {"ok": True, "full": False, "rows": 2, "total": 2}
+    assert fetches == [None, "2025-12-31T23:55:00+00:00"]
+    assert sm._index_state["watermark"] == "2026-01-02T00:00:00.500000+00:00"
+    assert SuppressionManager.bulk_check(["new@x.com"]) == {"new@x.com": True}
+
+
+@pytest.mark.asyncio
+async def test_full_rebuild_drops_deleted_rows_keeps_pending_local_writes(fake_table):
+    table, _ = fake_table
+    table.append(_row("gone@x.com", "2026-01-01T00:00:00+00:00"))
+    await SuppressionManager.refresh_index()
+
+    table.clear()  # deleted by another process
+    SuppressionManager.add_to_suppression("local@x.com", reason="manual")  # not yet in DB
+    await SuppressionManager.refresh_index(full=True)
+
+    assert SuppressionManager.bulk_check(["gone@x.com", "local@x.com"]) == {
+        "gone@x.com": False,
+        "local@x.com": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_keeps_snapshot(fake_table, monkeypatch):
+    table, _ = fake_table
+    table.append(_row("kept@x.com", "2026-01-01T00:00:00+00:00"))
+    await SuppressionManager.refresh_index()
+
+    async def failing(watermark):
+        return None
+
+    monkeypatch.setattr(sm, "_db_fetch_since", failing)
+    result = await SuppressionManager.refresh_index(full=True)
+
+    assert result["ok"] is False
+    assert SuppressionManager.check_before_outreach("kept@x.com")["suppressed"] is True
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_picks_up_rows_at_or_just_behind_watermark(fake_table):
+    table, _ = fake_table
+    table.append(_row("first@x.com", "2026-01-01T00:00:00+00:00"))
+    await SuppressionManager.refresh_index()
+
+    table.append(_row("tie@x.com", "2026-01-01T00:00:00+00:00"))  # equal to watermark
+    table.append(_row("late@x.com", "2025-12-31T23:59:00+00:00"))  # committed late
+    await SuppressionManager.refresh_index()
+
+    assert SuppressionManager.bulk_check(["tie@x.com", "late@x.com"]) == {
+        "tie@x.com": True,
+        "late@x.com": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_snapshot_pages_by_keyset_so_mid_read_deletes_skip_nothing(monkeypatch):
+    table = sorted(
+        [
+            _row("a@x.com", "2026-01-01T00:00:00+00:00"),
+            _row("b@x.com", "2026-01-01T00:00:00+00:00"),  # ties a@ on suppressed_at
+            _row("c@x.com", "2026-01-02T00:00:00+00:00"),
+            _row("d@x.com", "2026-01-03T00:00:00+00:00"),
+            _row("e@x.com", "2026-01-04T00:00:00+00:00"),
+        ],
+        key=lambda r: (r["suppressed_at"], r["email"]),
+    )
+    after = re.compile(
+        r'\(suppressed_at\.gt\."(.+?)",and\(suppressed_at\.eq\."\1",email\.gt\."(.+?)"\)\)'
+    )
+
+    class _Resp:
+        status_code = 200
+
+        def __init__(self, rows):
+            self._rows = rows
+
+        def json(self):
+            return self._rows
+
+    class _Client:
+        def __init__(self, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def get(self, url, params, headers):
+            rows = list(table)
+            if "or" in params:
+                ts, email = after.fullmatch(params["or"]).groups()
+                rows = [r for r in rows if (r["suppressed_at"], r["email"]) > (ts, email)]
+            offset = int(params.get("offset", 0))
+            page = rows[offset : offset + int(params["limit"])]
+            if len(table) == 5:
+                table.pop(0)  # another process deletes a@ after the first page
+            return _Resp(page)
+
+    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_KEY", "test-key")
+    monkeypatch.setattr(sm, "SNAPSHOT_PAGE_SIZE", 2)
+    monkeypatch.setattr(httpx, "AsyncClient", _Client)
+
+    rows = await sm._db_fetch_since(None)
+
+    assert [r["email"] for r in rows] == ["a@x.com", "b@x.com", "c@x.com", "d@x.com", "e@x.com"]
+
+
+@pytest.mark.asyncio
+async def test_full_rebuild_swaps_snapshot_under_alias(fake_table):
+    from src.pipeline import compliance_handler as ch
+
+    table, _ = fake_table
+    table.append(_row("a@x.com", "2026-01-01T00:00:00+00:00"))
+    await SuppressionManager.refresh_index()
+    table.append(_row("b@x.com", "2026-01-01T00:00:00+00:00"))
+    await SuppressionManager.refresh_index(full=True)
+
+    assert ch._SUPPRESSION is _store
+    assert sorted(ch._SUPPRESSION) == ["a@x.com", "b@x.com"]
+
+
+@pytest.mark.asyncio
+async def test_check_inside_running_loop_never_blocks_and_never_fails_open(fake_table):
+    """Sync check from async code (cohort_runner) must not block the running loop."""
+    table, fetches = fake_table
+    table.append(_row("async@x.com", "2026-01-01T00:00:00+00:00"))
+
+    check = SuppressionManager.check_before_outreach("other@x.com")
+
+    assert check["suppressed"] is True and check["authoritative"] is False
+    assert fetches == []  # load scheduled, not run inline
+    await sm._index_state["task"]
+    assert SuppressionManager.check_before_outreach("other@x.com")["suppressed"] is False
+    assert SuppressionManager.check_before_outreach("async@x.com")["suppressed"] is True
+    assert fetches == [None]
+
+
+def test_unloaded_index_falls_back_to_db_lookup(fake_table, monkeypatch):
+    async def failing(since):
+        return None
+
+    async def db_check(email):
+        return True, (_row(email, "2026-01-01T00:00:00+00:00") if email == "db@x.com" else None)
+
+    monkeypatch.setattr(sm, "_db_fetch_since", failing)
+    monkeypatch.setattr(sm, "_db_check", db_check)
+
+    assert SuppressionManager.check_before_outreach("db@x.com")["suppressed"] is True
+    assert SuppressionManager.check_before_outreach("clean@x.com")["suppressed"] is False
+    assert SuppressionManager.bulk_check(["db@x.com", "clean@x.com"]) == {
+        "db@x.com": True,
+        "clean@x.com": False,
+    }
+
+
+def test_unloaded_index_and_db_down_blocks_send(fake_table, monkeypatch):
+    async def failing(since):
+        return None
+
+    async def db_down(email):
+        return False, None
+
+    monkeypatch.setattr(sm, "_db_fetch_since", failing)
+    monkeypatch.setattr(sm, "_db_check", db_down)
+
+    check = SuppressionManager.check_before_outreach("unknown@x.com")
+    assert check["suppressed"] is True and check["authoritative"] is False
+    assert SuppressionManager.bulk_check(["a@x.com", "b@x.com"]) == {
+        "a@x.com": True,
+        "b@x.com": True,
+    }
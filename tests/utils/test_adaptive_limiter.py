@@ -0,0 +1,123 @@
+"""Tests for the per-provider AIMD concurrency limiter (src/utils/adaptive_limiter.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import adaptive_limiter
+from src.utils.adaptive_limiter import (
+    AdaptiveLimiter,
+    get_limiter,
+    limiter_snapshots,
+    reset_limiters,
+)
+
+
+def _healthy(limiter: AdaptiveLimiter, n: int, latency: float = 0.1) -> None:
+    for _ in range(n):
+        limiter.observe(latency, 200)
+
+
+def test_limit_grows_by_one_per_healthy_window_up_to_ceiling():
+    limiter = AdaptiveLimiter("p", initial=4, ceiling=6)
+
+    _healthy(limiter, 4)
+    assert limiter.limit == 5
+    _healthy(limiter, 5)
+    assert limiter.limit == 6
+    _healthy(limiter, 50)
+    assert limiter.limit == 6
+    assert [d["reason"] for d in limiter.decisions] == ["healthy", "healthy"]
+
+
+def test_429_halves_once_per_cooldown_and_respects_floor():
+    limiter = AdaptiveLimiter("p", initial=20, ceiling=30, floor=4, cooldown_s=2.0)
+
+    limiter.observe(0.1, 429)
+    limiter.observe(0.1, 503)
+    assert limiter.limit == 10
+    assert limiter.congestion_signals == 2
+
+    now = adaptive_limiter.time.monotonic()
+    with patch.object(adaptive_limiter.time, "monotonic", return_value=now + 3):
+        limiter.observe(0.1, 502)
+    with patch.object(adaptive_limiter.time, "monotonic", return_value=now + 6):
+        limiter.observe(0.1, timeout=True)
+    assert limiter.limit == 4
+    assert [d["reason"] for d in limiter.decisions] == ["429", "5xx", "timeout"]
+
+
+def test_rising_p95_cuts_the_limit():
+    limiter = AdaptiveLimiter("p", initial=20, ceiling=30, latency_tolerance=2.0)
+    _healthy(limiter, 20, latency=0.1)
+    assert limiter.limit == 21
+
+    _healthy(limiter, 21, latency=0.5)
+
+    assert limiter.limit == 10
+    assert limiter.decisions[-1]["reason"] == "p95"
+
+
+def test_non_integer_status_is_not_congestion():
+    limiter = AdaptiveLimiter("p", initial=1, ceiling=2)
+    limiter.observe(0.1, status=object())  # type: ignore[arg-type]
+    assert limiter.congestion_signals == 0 and limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_slots_follow_the_current_limit():
+    limiter = AdaptiveLimiter("p", initial=2, ceiling=4)
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def call():
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(call()) for _ in range(6)]
+    await asyncio.sleep(0)
+    assert running == 2 and limiter.snapshot()["waiting"] == 4
+
+    _healthy(limiter, 2)  # limit 2 -> 3 admits one waiter immediately
+    await asyncio.sleep(0)
+    assert running == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 3 and limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = AdaptiveLimiter("p", initial=1, ceiling=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+def test_registry_shares_one_limiter_per_provider():
+    reset_limiters()
+    try:
+        dfs = get_limiter("dataforseo")
+        assert get_limiter("dataforseo") is dfs
+        assert (dfs.limit, dfs.ceiling, dfs.floor) == (28, 30, 4)
+        assert list(limiter_snapshots()) == ["dataforseo"]
+        with pytest.raises(KeyError):
+            get_limiter("unknown_provider")
+    finally:
+        reset_limiters()
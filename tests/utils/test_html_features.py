@@ -0,0 +1,104 @@
+"""Tests for the single-pass homepage feature extractor (src/utils/html_features.py)."""
+
+from __future__ import annotations
+
+from src.utils.html_features import EMAIL_RE, _find_emails, extract_html_features
+
+PAGE = """<!DOCTYPE html>
+<html><HEAD>
+<title> Pymble Dental | Family Dentist </title>
+<meta name="generator" content="WordPress 6.4">
+<meta content="Gentle dental care in Pymble NSW" name="description">
+<script src="/wp-includes/js/jquery.min.js"></script>
+<script>gtag('config', 'AW-123456'); fbq('init', '42');</script>
+<script type="application/ld+json">
+{"@graph": [{"@type": "Dentist", "address": {"streetAddress": "1 Main Rd",
+ "addressLocality": "Pymble", "addressRegion": "NSW", "postalCode": "2073"}}]}
+</script>
+<style>.hero { color: red }</style>
+</HEAD>
+<body>
+<header><nav>Home</nav></header>
+<H1>Welcome to <b>Pymble</b> Dental</H1>
+<p>Call 02 9876 5432 or +61 412 345 678.</p>
+<a href="mailto:Info@PymbleDental.com.au">Info@PymbleDental.com.au</a>
+<p>Bookings: Reception@PymbleDental.com.au</p>
+<a href="https://linkedin.com/company/pymble-dental">LinkedIn</a>
+<script>var hidden = "do not show";</script>
+</body></html>
+"""
+
+
+def test_extracts_every_signal_in_one_call():
+    f = extract_html_features(PAGE)
+
+    assert f.title == "Pymble Dental | Family Dentist"
+    assert f.meta_description == "Gentle dental care in Pymble NSW"
+    assert f.first_h1 == "Welcome to Pymble Dental"
+    assert f.cms == "wordpress"
+    assert f.tech_stack == ["jquery"]
+    assert "google_analytics" in f.trackers and "facebook_pixel" in f.trackers
+    assert f.ad_tags() == {
+        "has_google_ads_tag": True,
+        "has_meta_pixel": True,
+        "has_any_ad_tag": True,
+    }
+    assert f.jsonld_address == {
+        "street": "1 Main Rd",
+        "suburb": "Pymble",
+        "state": "NSW",
+        "postcode": "2073",
+    }
+    assert f.company_phone == "0298765432"
+    assert f.linkedin_company == "https://www.linkedin.com/company/pymble-dental"
+
+
+def test_visible_text_excludes_head_scripts_and_styles():
+    text = extract_html_features(PAGE).visible_text(3000)
+
+    assert text.startswith("Title: Pymble Dental | Family Dentist\n")
+    assert "H1: Welcome to Pymble Dental" in text
+    assert "Home Welcome to Pymble Dental" in text
+    assert "do not show" not in text
+    assert "color: red" not in text
+    assert "gtag" not in text
+
+
+def test_emails_feed_both_contact_views():
+    f = extract_html_features(PAGE)
+
+    assert f.contact_emails(["mailto:owner@pymbledental.com.au"]) == [
+        "owner@pymbledental.com.au",
+        "reception@pymbledental.com.au",
+    ]
+    assert f.contact_data()["company_email"] == "reception@pymbledental.com.au"
+
+
+def test_cms_asset_path_fallback_is_case_sensitive_like_before():
+    assert extract_html_features('<link href="/wp-content/x.css">').cms == "wordpress"
+    assert extract_html_features('<link href="/WP-CONTENT/x.css">').cms is None
+
+
+def test_page_is_capped_before_parsing():
+    html = "<title>Cap</title>" + "x" * 100 + "hotjar"
+    f = extract_html_features(html, max_bytes=50)
+
+    assert f.truncated is True
+    assert f.title == "Cap"
+    assert f.trackers == []
+
+
+def test_empty_html_gives_empty_features():
+    f = extract_html_features("")
+    assert f.title is None and f.cms is None and f.emails == []
+    assert f.ad_tags()["has_any_ad_tag"] is False
+
+
+def test_email_scan_matches_findall_on_adjacent_and_run_on_addresses():
+    for text in (
+        "+@b.ax%b@q.au",
+        "a@b.com.au-foo@bar.com",
+        "x" * 5000 + "@acme.com.au",
+        "@@a@b.co",
+    ):
+        assert _find_emails(text) == EMAIL_RE.findall(text)
@@ -0,0 +1,153 @@
+"""Tests for src/utils/scoring_config_cache — TTL + versioned scorer config cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.utils.scoring_config_cache import ScoringConfigCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hit_and_miss_counters():
+    cache = ScoringConfigCache()
+    assert cache.get("ns", "k") == (False, None)
+    cache.set("ns", "k", {"a": 1})
+    assert cache.get("ns", "k") == (True, {"a": 1})
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["namespaces"]["ns"]["hits"] == 1
+
+
+def test_none_is_a_cacheable_value():
+    cache = ScoringConfigCache()
+    cache.set("ns", "k", None)
+    assert cache.get("ns", "k") == (True, None)
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ScoringConfigCache(ttl_seconds=10, clock=clock)
+    cache.set("ns", "k", 1)
+    clock.now = 9.9
+    assert cache.get("ns", "k")[0] is True
+    clock.now = 10.0
+    assert cache.get("ns", "k")[0] is False
+
+
+def test_namespace_invalidation_bumps_version_and_drops_entries():
+    cache = ScoringConfigCache()
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+    cache.set("other", "a", 3)
+
+    cache.invalidate("ns")
+
+    assert cache.version("ns") == 1
+    assert cache.get("ns", "a")[0] is False
+    assert cache.get("ns", "b")[0] is False
+    assert cache.get("other", "a") == (True, 3)
+    assert cache.stats()["namespaces"]["ns"]["invalidations"] == 1
+
+
+def test_key_invalidation_leaves_siblings():
+    cache = ScoringConfigCache()
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+    cache.invalidate("ns", "a")
+    assert cache.get("ns", "a")[0] is False
+    assert cache.get("ns", "b") == (True, 2)
+
+
+def test_lru_eviction_bounds_size():
+    cache = ScoringConfigCache(max_entries=2)
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+    cache.get("ns", "a")  # a becomes most recent
+    cache.set("ns", "c", 3)
+    assert cache.get("ns", "b")[0] is False
+    assert cache.get("ns", "a")[0] is True
+    assert cache.get("ns", "c")[0] is True
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_calls_loader_once():
+    cache = ScoringConfigCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return {"w": calls}
+
+    assert await cache.get_or_load("ns", "k", loader) == {"w": 1}
+    assert await cache.get_or_load("ns", "k", loader) == {"w": 1}
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_cached():
+    cache = ScoringConfigCache()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return "stale"
+
+    task = asyncio.create_task(cache.get_or_load("ns", "k", slow_loader))
+    await started.wait()
+    cache.invalidate("ns")  # new version written while the old one was loading
+    release.set()
+
+    assert await task == "stale"
+    assert cache.get("ns", "k")[0] is False
+
+
+@pytest.mark.asyncio
+async def test_load_racing_a_key_invalidation_is_not_cached():
+    cache = ScoringConfigCache()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return "stale"
+
+    task = asyncio.create_task(cache.get_or_load("ns", "k", slow_loader))
+    sibling = asyncio.create_task(cache.get_or_load("ns", "other", slow_loader))
+    await started.wait()
+    cache.invalidate("ns", "k")  # only "k" was rewritten while loading
+    release.set()
+
+    assert await task == "stale"
+    assert await sibling == "stale"
+    assert cache.get("ns", "k")[0] is False
+    assert cache.get("ns", "other") == (True, "stale")
+    assert cache.generation("ns", "k") == 1
+    assert cache.version("ns") == 0
+
+
+@pytest.mark.asyncio
+async def test_loader_errors_are_not_cached():
+    cache = ScoringConfigCache()
+
+    async def failing():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("ns", "k", failing)
+    assert cache.stats()["entries"] == 0